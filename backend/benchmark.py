@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for SpeakEasy backend optimizations.
+
+Usage:
+    python benchmark.py quantization --audio sample.wav
+    python benchmark.py quantization --model-type canary --model-name nvidia/canary-1b-v2
+    python benchmark.py batching --device cuda --clients 8 --batch-sizes 1 2 4 8
+    python benchmark.py mic-start --runs 10 --pre-roll-ms 300
+    python benchmark.py capture-stress --seconds 30 --workers 4
+    python benchmark.py spill-memory --minutes 120 --speed 60
+    python benchmark.py file-decode --audio podcast.mp3
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def current_rss_mb():
+    """Get the current resident set size of this process in MB, if available."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024**2)
+    except ImportError:
+        pass
+
+    try:
+        import os
+
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024**2)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def load_audio(path, sample_rate=16000):
+    """Load an audio file as 16kHz mono float32, or synthesize 30s of noise."""
+    import numpy as np
+
+    if not path:
+        print("[INFO] No --audio given, using 30s of synthetic audio (RTF only, text is noise)")
+        rng = np.random.default_rng(0)
+        return (rng.standard_normal(30 * sample_rate) * 0.05).astype(np.float32)
+
+    from faster_whisper.audio import decode_audio
+
+    return decode_audio(path, sampling_rate=sample_rate)
+
+
+def measure_rtf(wrapper, audio, runs, sample_rate=16000):
+    """Transcribe `audio` `runs` times (after one warm-up) and return (best RTF, text)."""
+    audio_seconds = len(audio) / sample_rate
+    result = wrapper.transcribe(audio, sample_rate=sample_rate)  # warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = wrapper.transcribe(audio, sample_rate=sample_rate)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / audio_seconds, result.text
+
+
+def bench_quantization(args):
+    """Compare fp32 and dynamic int8 NeMo encoders on CPU (RTF and memory)."""
+    from speakeasy.core.models import ModelWrapper, module_nbytes
+
+    audio = load_audio(args.audio)
+    rows = []
+
+    for compute_type in ("float32", "int8"):
+        gc.collect()
+        rss_before = current_rss_mb()
+        wrapper = ModelWrapper(
+            model_type=args.model_type,
+            model_name=args.model_name,
+            device="cpu",
+            compute_type=compute_type,
+        )
+        load_start = time.perf_counter()
+        wrapper.load()
+        load_s = time.perf_counter() - load_start
+        rss_after = current_rss_mb()
+
+        rtf, text = measure_rtf(wrapper, audio, args.runs)
+        rows.append(
+            {
+                "compute_type": compute_type,
+                "load_s": load_s,
+                "encoder_mb": module_nbytes(wrapper._model.encoder) / (1024**2),
+                "rss_delta_mb": (rss_after - rss_before)
+                if rss_before is not None and rss_after is not None
+                else None,
+                "rtf": rtf,
+                "text": text,
+            }
+        )
+        wrapper.unload()
+        del wrapper
+
+    print(f"\n[RESULT] {args.model_type}/{args.model_name} on CPU, {len(audio) / 16000:.1f}s audio")
+    print(f"{'compute':<10}{'load s':>9}{'encoder MB':>12}{'RSS +MB':>10}{'RTF':>8}")
+    for row in rows:
+        rss = f"{row['rss_delta_mb']:.0f}" if row["rss_delta_mb"] is not None else "n/a"
+        print(
+            f"{row['compute_type']:<10}{row['load_s']:>9.1f}{row['encoder_mb']:>12.0f}"
+            f"{rss:>10}{row['rtf']:>8.3f}"
+        )
+
+    fp32, int8 = rows
+    print(f"\nSpeedup (RTF): {fp32['rtf'] / int8['rtf']:.2f}x")
+    print(f"Encoder size reduction: {fp32['encoder_mb'] / max(int8['encoder_mb'], 1e-6):.2f}x")
+    if fp32["text"] != int8["text"]:
+        print("\n[WARN] Transcripts differ between fp32 and int8:")
+        print(f"  fp32: {fp32['text'][:200]}")
+        print(f"  int8: {int8['text'][:200]}")
+    return 0
+
+
+def bench_batching(args):
+    """Measure aggregate throughput of concurrent clients for several max batch sizes."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from speakeasy.core.models import ModelWrapper
+    from speakeasy.core.scheduler import InferenceScheduler
+
+    audio = load_audio(args.audio)[: int(args.clip_seconds * 16000)]
+    wrapper = ModelWrapper(
+        model_type=args.model_type,
+        model_name=args.model_name,
+        device=args.device,
+        compute_type=args.compute_type,
+    )
+    wrapper.load()
+    wrapper.transcribe(audio)  # warm-up
+
+    total_requests = args.clients * args.requests
+    print(
+        f"\n[RESULT] {args.model_type}/{args.model_name} on {args.device}, "
+        f"{args.clients} clients x {args.requests} requests of {len(audio) / 16000:.1f}s"
+    )
+    print(f"{'max batch':<11}{'wall s':>8}{'audio s/s':>11}{'avg batch':>11}{'avg wait ms':>13}")
+
+    for batch_size in args.batch_sizes:
+        scheduler = InferenceScheduler(
+            lambda: wrapper, max_batch_size=batch_size, max_wait_ms=args.max_wait_ms
+        )
+
+        def client(_):
+            for _ in range(args.requests):
+                scheduler.transcribe(audio)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            list(pool.map(client, range(args.clients)))
+        wall_s = time.perf_counter() - start
+        metrics = scheduler.get_metrics()
+        scheduler.close()
+
+        throughput = total_requests * len(audio) / 16000 / wall_s
+        print(
+            f"{batch_size:<11}{wall_s:>8.2f}{throughput:>11.1f}"
+            f"{metrics['avg_batch_size']:>11.2f}{metrics['avg_queue_wait_ms']:>13.1f}"
+        )
+
+    wrapper.unload()
+    return 0
+
+
+def bench_mic_start(args):
+    """Hotkey-to-first-audio latency of a fresh input stream vs a warm microphone."""
+    import statistics
+
+    from speakeasy.core.transcriber import TranscriberService
+
+    service = TranscriberService()
+    # Recording needs a loaded model; the smallest one keeps this quick
+    service.load_model(model_type="whisper", model_name="tiny", device="cpu")
+    if args.device_name:
+        service.set_device(args.device_name)
+
+    print(f"\n[RESULT] start_recording() to first captured audio, {args.runs} runs")
+    print(f"{'mode':<18}{'min ms':>9}{'median ms':>11}{'max ms':>9}{'pre-roll ms':>13}")
+
+    for warm in (False, True):
+        service.configure_warm_mic(warm, pre_roll_ms=args.pre_roll_ms)
+        if warm:
+            time.sleep(args.pre_roll_ms / 1000 + 0.1)  # Let the ring fill
+        latencies = []
+        for _ in range(args.runs):
+            service.start_recording()
+            deadline = time.perf_counter() + 2.0
+            while service.start_latency_ms is None and time.perf_counter() < deadline:
+                time.sleep(0.001)
+            if service.start_latency_ms is not None:
+                latencies.append(service.start_latency_ms)
+            service.cancel_recording()
+            time.sleep(args.gap_ms / 1000)
+
+        if not latencies:
+            print(f"{'warm' if warm else 'cold':<18}  no audio captured (check the input device)")
+            continue
+        pre_roll = args.pre_roll_ms if warm else 0.0
+        print(
+            f"{'warm (pre-roll)' if warm else 'cold (new stream)':<18}"
+            f"{min(latencies):>9.1f}{statistics.median(latencies):>11.1f}"
+            f"{max(latencies):>9.1f}{pre_roll:>13.0f}"
+        )
+
+    service.cleanup()
+    return 0
+
+
+def bench_capture_stress(args):
+    """Audio lost while batch inference saturates the backend, in-process vs capture process."""
+    import threading
+
+    from speakeasy.core.capture import parse_latency
+    from speakeasy.core.scheduler import Priority
+    from speakeasy.core.transcriber import TranscriberService
+
+    service = TranscriberService()
+    service.load_model(model_type="whisper", model_name=args.model_name, device="cpu")
+    if args.device_name:
+        service.set_device(args.device_name)
+    if args.blocksize or args.latency:
+        service.configure_capture(args.blocksize, latency=parse_latency(args.latency))
+    audio = load_audio(args.audio)
+
+    print(f"\n[RESULT] {args.seconds:.0f}s recording during {args.workers} batch transcriptions")
+    print(
+        f"{'capture':<14}{'blocks':>8}{'overflows':>11}{'dropped s':>11}"
+        f"{'cb max us':>11}{'jitter max ms':>15}{'batch jobs':>12}"
+    )
+
+    for isolated in (False, True):
+        service.configure_warm_mic(True, pre_roll_ms=0, isolated=isolated)
+        stop = threading.Event()
+        jobs = [0]
+
+        def batch_worker():
+            while not stop.is_set():
+                service.transcribe(audio, priority=Priority.BATCH)
+                jobs[0] += 1
+
+        workers = [threading.Thread(target=batch_worker, daemon=True) for _ in range(args.workers)]
+        for worker in workers:
+            worker.start()
+        time.sleep(1.0)  # Let the load build up
+
+        service.start_recording()
+        time.sleep(args.seconds)
+        service.stop_recording()
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+        stats = service.capture_telemetry
+        expected = args.seconds * service._warm_mic.samplerate
+        captured = stats["captured_seconds"] * service._warm_mic.samplerate
+        process = stats.get("process", {})
+        dropped = process.get("dropped_samples", 0) / service._warm_mic.samplerate
+        overflows = process.get("overflows", stats["overflows"])
+        print(
+            f"{'process' if isolated else 'in-process':<14}{stats['callbacks']:>8}"
+            f"{overflows:>11}{dropped:>11.2f}{stats['callback_max_us']:>11.0f}"
+            f"{stats['jitter_max_ms']:>15.1f}{jobs[0]:>12}"
+        )
+        if abs(captured - expected) > 0.05 * expected:
+            print(f"  [WARN] captured {captured / expected:.0%} of the wall-clock duration")
+
+    service.cleanup()
+    return 0
+
+
+def bench_spill_memory(args):
+    """Memory over a long recording with disk spill, then reading it back chunk by chunk."""
+    import numpy as np
+
+    from speakeasy.core.transcriber import TranscriberService
+
+    service = TranscriberService()
+    # Recording needs a loaded model; the smallest one keeps this quick
+    service.load_model(model_type="whisper", model_name="tiny", device="cpu")
+    service.configure_spill(not args.no_spill, after_s=args.spill_after_s)
+
+    rng = np.random.default_rng(0)
+    second = (rng.standard_normal(16000) * 0.05).astype(np.float32)
+    total_s = int(args.minutes * 60)
+    report_every = max(1, total_s // 12)
+
+    print(f"\n[RESULT] {args.minutes:.0f} min recording at {args.speed:.0f}x real time")
+    print(f"{'recorded min':>13}{'RSS MB':>9}")
+    service.start_external_recording()
+    start = time.perf_counter()
+    for i in range(total_s):
+        service.push_audio(second.copy())  # A live capture delivers new buffers
+        # Pace the pushes so the spill thread keeps up as it would with a live microphone
+        delay = start + (i + 1) / args.speed - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        if (i + 1) % report_every == 0:
+            rss = current_rss_mb()
+            print(f"{(i + 1) / 60:>13.1f}{rss if rss is not None else float('nan'):>9.0f}")
+
+    recording = service.stop_recording()
+    audio = recording.audio_data
+    peak = current_rss_mb() or 0.0
+    chunk = service.CHUNK_SIZE_SAMPLES
+    for offset in range(0, len(audio), chunk):
+        audio[offset : offset + chunk]
+        peak = max(peak, current_rss_mb() or 0.0)
+    print(f"Read back {len(audio) / 16000 / 60:.0f} min in 2 min chunks, peak RSS {peak:.0f} MB")
+
+    del recording, audio
+    service.cleanup()
+    return 0
+
+
+def bench_file_decode(args):
+    """Time to first chunk and peak memory, streaming decode vs whole-file decode."""
+    import tempfile
+
+    import numpy as np
+
+    from speakeasy.core.audio_file import AudioFileStream
+    from speakeasy.core.transcriber import TranscriberService
+
+    path = args.audio
+    if not path:
+        import soundfile as sf
+
+        # 16-bit 44.1kHz WAV, written a minute at a time
+        print(f"[INFO] No --audio given, writing {args.minutes:.0f} min of synthetic audio")
+        path = str(Path(tempfile.mkdtemp()) / "synthetic.wav")
+        rng = np.random.default_rng(0)
+        with sf.SoundFile(path, "w", samplerate=44100, channels=1, subtype="PCM_16") as f:
+            for _ in range(int(args.minutes)):
+                f.write((rng.standard_normal(60 * 44100) * 0.05).astype(np.float32))
+
+    chunk = TranscriberService.BATCH_CHUNK_SIZE_SAMPLES
+    baseline = current_rss_mb() or 0.0
+
+    start = time.perf_counter()
+    stream = AudioFileStream(path)
+    first_chunk_s, peak, decoded = None, baseline, 0
+    for audio in stream.chunks(chunk):
+        if first_chunk_s is None:
+            first_chunk_s = time.perf_counter() - start
+        decoded += len(audio)
+        peak = max(peak, current_rss_mb() or 0.0)
+    stream_s = time.perf_counter() - start
+    stream_peak = peak - baseline
+    del audio
+
+    gc.collect()
+    start = time.perf_counter()
+    audio = AudioFileStream(path).read()
+    whole_s = time.perf_counter() - start
+    whole_peak = (current_rss_mb() or 0.0) - baseline
+
+    print(f"\n[RESULT] {decoded / 16000 / 60:.1f} min ({stream.backend}), 1 min chunks")
+    print(f"{'decode':<10}{'first chunk s':>15}{'total s':>10}{'RSS +MB':>10}")
+    print(f"{'streaming':<10}{first_chunk_s or 0.0:>15.2f}{stream_s:>10.2f}{stream_peak:>10.0f}")
+    print(f"{'whole':<10}{whole_s:>15.2f}{whole_s:>10.2f}{whole_peak:>10.0f}")
+    del audio
+    return 0
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="SpeakEasy backend benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    quant = subparsers.add_parser("quantization", help="fp32 vs int8 NeMo encoder on CPU")
+    quant.add_argument("--model-type", default="parakeet", choices=["parakeet", "canary"])
+    quant.add_argument("--model-name", default="nvidia/parakeet-tdt-0.6b-v3")
+    quant.add_argument("--audio", default=None, help="Audio file to transcribe")
+    quant.add_argument("--runs", type=int, default=3)
+    quant.set_defaults(func=bench_quantization)
+
+    batching = subparsers.add_parser("batching", help="throughput vs micro-batch size")
+    batching.add_argument("--model-type", default="parakeet")
+    batching.add_argument("--model-name", default="nvidia/parakeet-tdt-0.6b-v3")
+    batching.add_argument("--device", default="cuda", choices=["cuda", "cpu"])
+    batching.add_argument("--compute-type", default=None)
+    batching.add_argument("--audio", default=None, help="Audio file to transcribe")
+    batching.add_argument("--clip-seconds", type=float, default=5.0)
+    batching.add_argument("--clients", type=int, default=8)
+    batching.add_argument("--requests", type=int, default=4, help="Requests per client")
+    batching.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    batching.add_argument("--max-wait-ms", type=float, default=20.0)
+    batching.set_defaults(func=bench_batching)
+
+    mic = subparsers.add_parser("mic-start", help="recording start latency, cold vs warm mic")
+    mic.add_argument("--device-name", default=None, help="Input device (default: system)")
+    mic.add_argument("--runs", type=int, default=10)
+    mic.add_argument("--pre-roll-ms", type=float, default=300.0)
+    mic.add_argument("--gap-ms", type=float, default=500.0, help="Pause between recordings")
+    mic.set_defaults(func=bench_mic_start)
+
+    stress = subparsers.add_parser(
+        "capture-stress", help="input overflows under batch inference, in-process vs isolated"
+    )
+    stress.add_argument("--device-name", default=None, help="Input device (default: system)")
+    stress.add_argument("--model-name", default="tiny", help="Whisper model for the batch load")
+    stress.add_argument("--audio", default=None, help="Audio file for the batch jobs")
+    stress.add_argument("--seconds", type=float, default=30.0, help="Recording length")
+    stress.add_argument("--workers", type=int, default=4, help="Concurrent batch transcriptions")
+    stress.add_argument("--blocksize", type=int, default=0)
+    stress.add_argument("--latency", default=None, help='"low", "high" or seconds')
+    stress.set_defaults(func=bench_capture_stress)
+
+    spill = subparsers.add_parser("spill-memory", help="memory over a long spilled recording")
+    spill.add_argument("--minutes", type=float, default=120.0)
+    spill.add_argument("--speed", type=float, default=60.0, help="Multiple of real time")
+    spill.add_argument("--spill-after-s", type=float, default=60.0)
+    spill.add_argument("--no-spill", action="store_true", help="Keep the recording in RAM")
+    spill.set_defaults(func=bench_spill_memory)
+
+    decode = subparsers.add_parser("file-decode", help="streaming vs whole-file audio decode")
+    decode.add_argument("--audio", default=None, help="Audio file to decode")
+    decode.add_argument("--minutes", type=float, default=60.0, help="Length of synthetic audio")
+    decode.set_defaults(func=bench_file_decode)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
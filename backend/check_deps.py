@@ -26,6 +26,7 @@ def get_required_packages():
         "uvicorn": "uvicorn",
         "websockets": "websockets",
         "slowapi": "slowapi",
+        "python-multipart": "multipart",
         "sounddevice": "sounddevice",
         "numpy": "numpy",
         "scipy": "scipy",
@@ -0,0 +1,298 @@
+"""
+On-disk cache of decoded audio files.
+
+Retrying a failed batch file, or transcribing the same corpus again with
+another model, used to decode and resample every file from scratch. The
+cache keeps the decoded 16 kHz mono float32 samples as .npy files in
+~/.speakeasy/audio_cache, keyed by the source's path, size and modification
+time (a changed file gets a new key), and returns them memory-mapped, so a
+hit costs neither decoding nor loading the file into RAM. The total size is
+kept under a budget by evicting the least recently used entries.
+
+On a miss the entry is written by a CacheWriter while the file is decoded
+for transcription, and only becomes visible once the whole file has been
+decoded, so caching never delays the first chunk.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+logger = logging.getLogger(__name__)
+
+# Bump when the decoding changes, so old entries are never read
+CACHE_VERSION = 1
+DEFAULT_AUDIO_CACHE_MB = 2048
+
+
+def get_audio_cache_dir() -> Path:
+    """Get the directory for decoded audio."""
+    return Path.home() / ".speakeasy" / "audio_cache"
+
+
+class DecodedAudioCache:
+    """Decoded audio files stored as memory-mappable .npy, with LRU eviction."""
+
+    def __init__(self, directory: Optional[str | Path] = None, max_bytes: int = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Where entries are stored (default: ~/.speakeasy/audio_cache)
+            max_bytes: Total size budget (default: DEFAULT_AUDIO_CACHE_MB)
+        """
+        self.directory = Path(directory) if directory else get_audio_cache_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or DEFAULT_AUDIO_CACHE_MB * 1024**2
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _entry(self, path: str, sample_rate: int) -> Path:
+        """Cache file for a source file in its current version."""
+        st = os.stat(path)
+        source = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+        source += f"|{sample_rate}|{CACHE_VERSION}"
+        return self.directory / f"{hashlib.sha1(source.encode()).hexdigest()}.npy"
+
+    def get(self, path: str, sample_rate: int) -> Optional[np.ndarray]:
+        """
+        Decoded samples of `path`, or None if it isn't cached.
+
+        The array is a copy-on-write memory map: pages are read on access and
+        writes stay private to this process.
+        """
+        entry = self._entry(path, sample_rate)
+        try:
+            audio = np.load(entry, mmap_mode="c")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable audio cache entry {entry.name}: {e}")
+            self._remove(entry)
+            self.misses += 1
+            return None
+
+        # The modification time orders entries for eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self.hits += 1
+        return audio
+
+    def writer(
+        self, path: str, sample_rate: int, expected_samples: int = 0
+    ) -> Optional["CacheWriter"]:
+        """
+        Start an entry for `path`, filled block by block while it is decoded.
+
+        Returns None if `expected_samples` alone exceeds the budget.
+
+        Args:
+            path: Source file
+            sample_rate: Sample rate of the blocks
+            expected_samples: Estimated length, checked against the budget
+        """
+        if expected_samples * 4 > self.max_bytes:
+            logger.info(f"Not caching {path}: larger than the audio cache budget")
+            return None
+        return CacheWriter(self, path, self._entry(path, sample_rate), sample_rate)
+
+    def store(
+        self,
+        path: str,
+        sample_rate: int,
+        blocks: Iterable[np.ndarray],
+        expected_samples: int = 0,
+    ) -> Optional[np.ndarray]:
+        """
+        Write decoded blocks of `path` to the cache and return them mapped.
+
+        Blocks are written as they arrive, so memory use doesn't depend on the
+        file's length. Nothing is stored (and None is returned, with `blocks`
+        not consumed) if `expected_samples` alone exceeds the budget; None is
+        also returned if the blocks turn out not to fit, or can't be written.
+
+        Args:
+            path: Source file
+            sample_rate: Sample rate of the blocks
+            blocks: float32 mono blocks of the whole file
+            expected_samples: Estimated length, checked against the budget
+        """
+        writer = self.writer(path, sample_rate, expected_samples)
+        if writer is None:
+            return None
+        try:
+            for block in blocks:
+                if not writer.write(block):
+                    return None
+        except BaseException:
+            writer.discard()
+            raise
+        if not writer.samples:
+            # An empty array can't be memory-mapped
+            writer.discard()
+            return np.zeros(0, dtype=np.float32)
+        if not writer.commit():
+            return None
+        return np.load(writer.entry, mmap_mode="c")
+
+    def _evict(self, keep: Path) -> bool:
+        """
+        Delete the least recently used entries until the cache fits its budget.
+
+        `keep` goes last, only if it doesn't fit on its own. Returns whether it
+        is still cached.
+        """
+        with self._lock:
+            entries = []
+            for entry in self.directory.glob("*.npy"):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry == keep, st.st_mtime, st.st_size, entry))
+            total = sum(size for _, _, size, _ in entries)
+            for is_kept, _, size, entry in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if self._remove(entry):
+                    total -= size
+                    if is_kept:
+                        logger.info(f"Dropped {entry.name}: larger than the audio cache budget")
+                        return False
+            return True
+
+    def _remove(self, entry: Path) -> bool:
+        """Delete an entry (fails on Windows while it is mapped)."""
+        try:
+            entry.unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            logger.debug(f"Could not remove audio cache entry {entry.name}: {e}")
+            return False
+
+    def stats(self) -> dict:
+        """Entries, size and hit counts, for the metrics endpoint."""
+        sizes = []
+        for entry in self.directory.glob("*.npy"):
+            try:
+                sizes.append(entry.stat().st_size)
+            except OSError:
+                continue
+        return {
+            "entries": len(sizes),
+            "size_mb": round(sum(sizes) / 1024**2, 1),
+            "max_mb": round(self.max_bytes / 1024**2, 1),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class CacheWriter:
+    """
+    A cache entry being written, one decoded block at a time.
+
+    The file is opened on the first block and stays a temporary file until
+    commit(). Failing writes, or growing past the budget, drop the entry
+    without raising, so caching never fails a transcription.
+    """
+
+    def __init__(self, cache: DecodedAudioCache, path: str, entry: Path, sample_rate: int):
+        """
+        Initialize the writer (see DecodedAudioCache.writer).
+
+        Args:
+            cache: The cache the entry belongs to
+            path: Source file
+            entry: Final location of the entry
+            sample_rate: Sample rate of the blocks
+        """
+        self.cache = cache
+        self.path = path
+        self.entry = entry
+        self.sample_rate = sample_rate
+        self.samples = 0
+        self.dropped = False
+        self._partial = entry.with_name(
+            f"{entry.stem}.{os.getpid()}.{threading.get_ident()}.{id(self)}.tmp"
+        )
+        self._file: Optional[BinaryIO] = None
+        self._data_offset = 0
+
+    def write(self, block: np.ndarray) -> bool:
+        """Append a float32 block; returns False once the entry has been dropped."""
+        if self.dropped:
+            return False
+        try:
+            if self._file is None:
+                self._file = open(self._partial, "wb")
+                # numpy pads the header so a longer shape fits in place
+                npy_format.write_array_header_1_0(self._file, self._header(0))
+                self._data_offset = self._file.tell()
+            self._file.write(np.ascontiguousarray(block, dtype="<f4").tobytes())
+        except OSError as e:
+            logger.warning(f"Not caching {self.path}: {e}")
+            self.discard()
+            return False
+        self.samples += len(block)
+        if self.samples * 4 > self.cache.max_bytes:
+            logger.info(f"Not caching {self.path}: larger than the audio cache budget")
+            self.discard()
+            return False
+        return True
+
+    def commit(self) -> bool:
+        """
+        Make the entry visible and evict older ones to fit the budget.
+
+        Returns:
+            Whether the entry is now cached
+        """
+        if self.dropped or self._file is None:
+            self.discard()
+            return False
+        f, self._file = self._file, None
+        try:
+            with f:
+                f.seek(0)
+                npy_format.write_array_header_1_0(f, self._header(self.samples))
+                if f.tell() != self._data_offset:
+                    raise ValueError("header size changed")
+            os.replace(self._partial, self.entry)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Not caching {self.path}: {e}")
+            self.discard()
+            return False
+
+        logger.debug(
+            f"Cached decoded audio of {self.path} ({self.samples / self.sample_rate:.0f}s)"
+        )
+        return self.cache._evict(keep=self.entry)
+
+    def discard(self) -> None:
+        """Drop the entry (e.g. the file wasn't decoded to the end)."""
+        self.dropped = True
+        f, self._file = self._file, None
+        if f is not None:
+            try:
+                f.close()
+            except OSError:
+                pass
+        self.cache._remove(self._partial)
+
+    def _header(self, samples: int) -> dict:
+        return {
+            "descr": npy_format.dtype_to_descr(np.dtype("<f4")),
+            "fortran_order": False,
+            "shape": (samples,),
+        }
@@ -0,0 +1,252 @@
+"""
+Streaming decode of audio files.
+
+Decoding a whole file into one array (faster_whisper's decode_audio, or
+soundfile plus an FFT resample) needs the full signal in memory before the
+first chunk can be transcribed: about 700 MB for three hours of audio.
+AudioFileStream decodes frame by frame with PyAV (installed with
+faster-whisper), or in blocks with soundfile when PyAV is missing, resamples
+as it goes and yields fixed-size 16 kHz mono chunks, so memory is bounded by
+the chunk size and transcription starts after the first chunk is decoded.
+
+A stream can also copy its blocks to a cache writer (see audio_cache.py) as
+they are decoded, committing the entry only if the file is read to the end.
+Besides a path it accepts an open, seekable binary file (such as an upload
+Starlette has already spooled), which is read in place.
+"""
+
+import logging
+from collections.abc import Iterator
+from math import ceil, gcd
+from typing import TYPE_CHECKING, BinaryIO, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from .audio_cache import CacheWriter
+
+logger = logging.getLogger(__name__)
+
+# Frames read per soundfile block (before resampling)
+READ_BLOCK_FRAMES = 65536
+
+
+class StreamingResampler:
+    """
+    Polyphase resampler fed one block at a time.
+
+    Produces the same samples as scipy.signal.resample_poly over the whole
+    signal: each block is filtered with `margin` input samples of context on
+    both sides, and input is consumed in multiples of the decimation factor so
+    block outputs line up exactly. The last `margin` samples are held back
+    until more input (or flush()) arrives.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int):
+        """
+        Initialize the resampler.
+
+        Args:
+            in_rate: Sample rate of the input blocks
+            out_rate: Sample rate of the output
+        """
+        divisor = gcd(in_rate, out_rate)
+        self.up, self.down = out_rate // divisor, in_rate // divisor
+        # resample_poly's default filter spans 10 * max(up, down) upsampled taps per side
+        half_width = ceil(10 * max(self.up, self.down) / self.up) + 1
+        self.margin = self.down * ceil(half_width / self.down)
+        # Left context starts as zeros, like resample_poly's padding
+        self._buffer = np.zeros(self.margin, dtype=np.float32)
+        self._consumed = 0  # Input samples whose output has been produced
+        self._received = 0
+
+    def process(self, samples: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Resample a block (may return fewer samples than the block holds)."""
+        self._received += len(samples)
+        if self.up == self.down:
+            return samples.astype(np.float32, copy=False)
+        self._buffer = np.concatenate((self._buffer, samples.astype(np.float32, copy=False)))
+        ready = len(self._buffer) - 2 * self.margin
+        ready -= ready % self.down
+        if ready <= 0:
+            return np.zeros(0, dtype=np.float32)
+        return self._emit(ready)
+
+    def flush(self) -> NDArray[np.float32]:
+        """Resample the held-back input (end of the signal)."""
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+        remaining = len(self._buffer) - self.margin
+        total_out = -(-self._received * self.up // self.down)
+        wanted = total_out - self._consumed * self.up // self.down
+        if remaining <= 0 or wanted <= 0:
+            return np.zeros(0, dtype=np.float32)
+        # Right context is zeros, and the span is padded to a multiple of `down`
+        padded = remaining + (-remaining) % self.down
+        self._buffer = np.concatenate(
+            (self._buffer, np.zeros(padded - remaining + self.margin, dtype=np.float32))
+        )
+        return self._emit(padded)[:wanted]
+
+    def _emit(self, count: int) -> NDArray[np.float32]:
+        """Resample `count` input samples after the left context and drop them."""
+        import scipy.signal
+
+        window = self._buffer[: count + 2 * self.margin]
+        filtered = scipy.signal.resample_poly(window, self.up, self.down)
+        skip = self.margin * self.up // self.down
+        out = filtered[skip : skip + count * self.up // self.down].astype(np.float32)
+        self._buffer = self._buffer[count:]
+        self._consumed += count
+        return out
+
+
+class AudioFileStream:
+    """
+    Audio file read as a sequence of mono float32 chunks at `sample_rate`.
+
+    len() is the length estimated from the file's metadata (0 when the
+    container doesn't report a duration); chunks() decodes lazily, read()
+    decodes the whole file. A `cache_writer`, if set, receives the blocks of
+    the next decode and is committed if it reaches the end of the file
+    (discarded otherwise).
+    """
+
+    def __init__(self, path: "str | BinaryIO", sample_rate: int = 16000):
+        """
+        Open the file and read its duration.
+
+        Args:
+            path: Path to the audio file, or an open seekable binary file
+            sample_rate: Sample rate of the returned audio
+
+        Raises:
+            Exception: If the file can't be opened by PyAV or soundfile
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.cache_writer: Optional["CacheWriter"] = None
+        try:
+            import av  # noqa: F401
+
+            self.backend = "av"
+        except ImportError:
+            logger.warning("PyAV not found, decoding audio files with soundfile")
+            self.backend = "soundfile"
+        self.duration_seconds = self._probe_duration()
+
+    def __len__(self) -> int:
+        return round(self.duration_seconds * self.sample_rate)
+
+    def _source(self) -> "str | BinaryIO":
+        """The path, or the file rewound for a new reader."""
+        if not isinstance(self.path, str):
+            self.path.seek(0)
+        return self.path
+
+    def _probe_duration(self) -> float:
+        """Duration from the container metadata, without decoding."""
+        if self.backend == "soundfile":
+            import soundfile as sf
+
+            info = sf.info(self._source())
+            return info.frames / info.samplerate
+
+        import av
+
+        with av.open(self._source(), metadata_errors="ignore") as container:
+            if container.duration is not None:
+                return container.duration / av.time_base
+            stream = container.streams.audio[0]
+            if stream.duration is not None and stream.time_base is not None:
+                return float(stream.duration * stream.time_base)
+        return 0.0
+
+    def chunks(self, chunk_samples: int) -> Iterator[NDArray[np.float32]]:
+        """
+        Yield chunks of `chunk_samples` samples (the last one may be shorter).
+
+        Only the chunk being filled is held in memory. Closing the generator
+        closes the file.
+        """
+        pending: list[NDArray[np.float32]] = []
+        filled = 0
+        blocks = self._blocks()
+        try:
+            for block in blocks:
+                while len(block):
+                    take = min(len(block), chunk_samples - filled)
+                    pending.append(block[:take])
+                    filled += take
+                    block = block[take:]
+                    if filled == chunk_samples:
+                        yield np.concatenate(pending)
+                        pending, filled = [], 0
+        finally:
+            blocks.close()
+        if filled:
+            yield np.concatenate(pending)
+
+    def read(self) -> NDArray[np.float32]:
+        """Decode the whole file."""
+        blocks = list(self._blocks())
+        if not blocks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(blocks)
+
+    def _blocks(self) -> Iterator[NDArray[np.float32]]:
+        """Decoded, resampled blocks of varying size."""
+        blocks = self._decode_av() if self.backend == "av" else self._decode_soundfile()
+        # Only the first decode feeds the cache
+        writer, self.cache_writer = self.cache_writer, None
+        if writer is None:
+            yield from blocks
+            return
+
+        complete = False
+        try:
+            for block in blocks:
+                writer.write(block)
+                yield block
+            complete = True
+        finally:
+            blocks.close()
+            if complete:
+                writer.commit()
+            else:
+                writer.discard()
+
+    def _decode_av(self) -> Iterator[NDArray[np.float32]]:
+        """Decode with PyAV; its resampler keeps state across frames."""
+        import av
+
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=self.sample_rate)
+        with av.open(self._source(), metadata_errors="ignore") as container:
+            frames = container.decode(audio=0)
+            try:
+                for frame in frames:
+                    # Let PyAV regenerate timestamps (some files have none or bad ones)
+                    frame.pts = None
+                    for resampled in resampler.resample(frame):
+                        yield resampled.to_ndarray().reshape(-1)
+            except av.error.InvalidDataError as e:
+                # Like faster_whisper: keep what was decoded before a corrupt packet
+                logger.warning(f"Stopped decoding {self.path} at invalid data: {e}")
+            for resampled in resampler.resample(None):
+                yield resampled.to_ndarray().reshape(-1)
+
+    def _decode_soundfile(self) -> Iterator[NDArray[np.float32]]:
+        """Decode with soundfile in blocks, resampling each with a polyphase filter."""
+        import soundfile as sf
+
+        with sf.SoundFile(self._source()) as f:
+            resampler = StreamingResampler(f.samplerate, self.sample_rate)
+            for block in f.blocks(blocksize=READ_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                out = resampler.process(block.mean(axis=1))
+                if len(out):
+                    yield out
+            out = resampler.flush()
+            if len(out):
+                yield out
+
@@ -0,0 +1,175 @@
+"""
+Decoding of audio frames streamed by remote clients.
+
+Thin clients send microphone audio over a binary WebSocket as raw PCM16 or
+Opus packets. Each frame is decoded, mixed down to mono and resampled to
+16 kHz as it arrives, so the capture buffer only ever holds model-ready audio.
+The resampler keeps its filter state from frame to frame, so the output is
+continuous across frame boundaries.
+"""
+
+import logging
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from .audio_file import StreamingResampler
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE = 16000
+
+
+class AudioFormat(str, Enum):
+    """Encoding of streamed audio frames."""
+
+    PCM16 = "pcm16"  # Signed 16-bit little-endian, interleaved channels
+    OPUS = "opus"  # One Opus packet per frame (decoded with PyAV)
+
+
+class FrameDecoder:
+    """
+    Turns streamed audio frames into float32 mono samples at 16 kHz.
+
+    PCM16 frames may split a sample (or a multi-channel sample group) across
+    messages; the leftover bytes are kept for the next frame. Resampling
+    holds back a few milliseconds of audio as filter context; flush() returns
+    it at the end of an utterance.
+    """
+
+    def __init__(
+        self,
+        audio_format: AudioFormat = AudioFormat.PCM16,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        channels: int = 1,
+        target_rate: int = TARGET_SAMPLE_RATE,
+    ):
+        """
+        Initialize the decoder.
+
+        Args:
+            audio_format: Encoding of incoming frames
+            sample_rate: Sample rate the client captures at (PCM16 only; Opus
+                packets carry their own rate)
+            channels: Number of interleaved channels
+            target_rate: Output sample rate
+
+        Raises:
+            ValueError: If the parameters are out of range
+            RuntimeError: If Opus is requested but PyAV is not installed
+        """
+        if not 8000 <= sample_rate <= 192000:
+            raise ValueError(f"Unsupported sample rate: {sample_rate}")
+        if not 1 <= channels <= 8:
+            raise ValueError(f"Unsupported channel count: {channels}")
+
+        self.audio_format = AudioFormat(audio_format)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.target_rate = target_rate
+
+        self._remainder = b""
+        self._resampler: Optional[StreamingResampler] = None
+        self._resampler_rate: Optional[int] = None
+        self._codec: Optional[Any] = None
+        if self.audio_format == AudioFormat.OPUS:
+            self._codec = self._create_opus_codec()
+
+    def _create_opus_codec(self) -> Any:
+        """Create a PyAV Opus decoder (PyAV is installed with faster-whisper)."""
+        try:
+            import av
+        except ImportError as e:
+            raise RuntimeError(
+                "Opus streaming requires PyAV. Please install it with: pip install av"
+            ) from e
+
+        codec = av.CodecContext.create("opus", "r")
+        codec.sample_rate = 48000
+        codec.layout = "stereo" if self.channels == 2 else "mono"
+        return codec
+
+    def decode(self, payload: bytes) -> "NDArray[np.float32]":
+        """
+        Decode one frame.
+
+        Args:
+            payload: Raw bytes of one WebSocket message
+
+        Returns:
+            Float32 mono samples at the target rate (may be empty)
+        """
+        if self.audio_format == AudioFormat.OPUS:
+            return self._decode_opus(payload)
+        return self._decode_pcm16(payload)
+
+    def _decode_pcm16(self, payload: bytes) -> "NDArray[np.float32]":
+        """Decode interleaved little-endian PCM16."""
+        data = self._remainder + payload
+        group = 2 * self.channels
+        usable = len(data) - len(data) % group
+        self._remainder = data[usable:]
+        if not usable:
+            return np.zeros(0, dtype=np.float32)
+
+        samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+        if self.channels > 1:
+            samples = samples.reshape(-1, self.channels).mean(axis=1)
+        return self._resample(samples, self.sample_rate)
+
+    def _decode_opus(self, payload: bytes) -> "NDArray[np.float32]":
+        """Decode one Opus packet."""
+        import av
+
+        chunks = []
+        rate = self.target_rate
+        for frame in self._codec.decode(av.Packet(payload)):
+            rate = frame.sample_rate
+            raw = frame.to_ndarray()
+            samples = raw.astype(np.float32)
+            if frame.format.is_planar:
+                samples = samples.mean(axis=0)
+            else:
+                # Packed layout: a single row of interleaved channels
+                samples = samples.reshape(-1, len(frame.layout.channels)).mean(axis=1)
+            if np.issubdtype(raw.dtype, np.integer):
+                samples /= 32768.0
+            chunks.append(samples)
+
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return self._resample(np.concatenate(chunks), rate)
+
+    def flush(self) -> "NDArray[np.float32]":
+        """
+        End the utterance: return the audio held back by the resampler.
+
+        The next frame starts a new signal (fresh filter state).
+        """
+        self._remainder = b""
+        resampler, self._resampler = self._resampler, None
+        self._resampler_rate = None
+        if resampler is None:
+            return np.zeros(0, dtype=np.float32)
+        return resampler.flush()
+
+    def _resample(self, samples: "NDArray[np.float32]", rate: int) -> "NDArray[np.float32]":
+        """Resample one frame to the target rate, continuing the previous frames."""
+        if rate == self.target_rate and self._resampler is None:
+            return samples.astype(np.float32, copy=False)
+
+        head = np.zeros(0, dtype=np.float32)
+        if rate != self._resampler_rate:
+            # Opus packets can change rate mid-stream: finish the old signal first
+            head = self.flush()
+            if rate == self.target_rate:
+                return np.concatenate((head, samples.astype(np.float32, copy=False)))
+            self._resampler = StreamingResampler(rate, self.target_rate)
+            self._resampler_rate = rate
+
+        resampled = self._resampler.process(samples)
+        return np.concatenate((head, resampled)) if len(head) else resampled
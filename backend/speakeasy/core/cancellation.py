@@ -0,0 +1,81 @@
+"""
+Cooperative cancellation and deadlines for in-flight transcriptions.
+
+A CancellationToken is passed down with a transcription request and checked
+between units of work: chunks of a long recording, Voxtral's 30s windows and
+Whisper's lazily decoded segments. Cancelling (or passing the deadline) makes
+the next check raise, so the model is released within one unit of work.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TranscriptionCancelledError(RuntimeError):
+    """Raised when a transcription is stopped through its cancellation token."""
+
+
+class DeadlineExceededError(TranscriptionCancelledError):
+    """Raised when a transcription runs past its deadline."""
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag with an optional deadline.
+
+    The token is cancelled explicitly with cancel() or implicitly once the
+    deadline passes. Workers call check() between units of work.
+    """
+
+    def __init__(self, timeout_s: Optional[float] = None):
+        """
+        Initialize the token.
+
+        Args:
+            timeout_s: Optional time budget in seconds, counted from now
+        """
+        self.timeout_s = timeout_s
+        self.deadline = time.monotonic() + timeout_s if timeout_s else None
+        self._event = threading.Event()
+        self._reason = "Transcription cancelled"
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether work should stop (cancelled or past the deadline)."""
+        return self._event.is_set() or self.expired
+
+    def remaining_s(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """
+        Request cancellation; in-flight work stops at its next check.
+
+        Args:
+            reason: Optional message for the raised TranscriptionCancelledError
+        """
+        if reason:
+            self._reason = reason
+        self._event.set()
+
+    def check(self) -> None:
+        """
+        Raise if work should stop.
+
+        Raises:
+            TranscriptionCancelledError: If the token was cancelled
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self._event.is_set():
+            raise TranscriptionCancelledError(self._reason)
+        if self.expired:
+            raise DeadlineExceededError(f"Transcription timed out after {self.timeout_s:g}s")
@@ -0,0 +1,135 @@
+"""
+Capture-pipeline telemetry for the real-time audio callback.
+
+The stream callback runs on PortAudio's real-time thread, where taking a lock
+or calling into logging can delay it long enough to overflow the input
+buffer. CaptureTelemetry is written only by the callback (plain attribute
+updates, no locks, no I/O) and read by other threads as a best-effort
+snapshot: through the API while recording and in the log at stop.
+"""
+
+import math
+import time
+from typing import Optional
+
+# Callbacks slower than this fraction of the block period risk overflows
+SLOW_CALLBACK_FRACTION = 0.5
+
+
+class CaptureTelemetry:
+    """Per-recording statistics of the audio callback (single writer)."""
+
+    def __init__(self, samplerate: int = 16000, max_samples: Optional[int] = None):
+        """
+        Initialize empty statistics.
+
+        Args:
+            samplerate: Rate of the captured audio
+            max_samples: Recording capacity, for the buffer fill level
+        """
+        self.samplerate = samplerate
+        self.max_samples = max_samples
+        self.callbacks = 0
+        self.samples = 0  # Samples buffered so far
+        self.overflows = 0
+        self.underflows = 0
+        self.slow_callbacks = 0
+        self.callback_total_s = 0.0
+        self.callback_max_s = 0.0
+        self.jitter_total_s = 0.0
+        self.jitter_max_s = 0.0
+        self.first_block_at: Optional[float] = None
+        self._last_block_at: Optional[float] = None
+        self._last_frames = 0
+
+    def record(self, frames: int, status, started: float) -> None:
+        """
+        Record one callback (called at the end of the callback).
+
+        Args:
+            frames: Frames delivered in the block
+            status: sounddevice CallbackFlags (or None)
+            started: time.perf_counter() at the start of the callback
+        """
+        now = time.perf_counter()
+        duration = now - started
+        self.callbacks += 1
+        self.samples += frames
+        self.callback_total_s += duration
+        if duration > self.callback_max_s:
+            self.callback_max_s = duration
+        if duration > SLOW_CALLBACK_FRACTION * frames / self.samplerate:
+            self.slow_callbacks += 1
+
+        if status:
+            if status.input_overflow:
+                self.overflows += 1
+            if status.input_underflow:
+                self.underflows += 1
+
+        # Jitter: deviation of the block arrival interval from the previous block's duration
+        if self._last_block_at is None:
+            self.first_block_at = started
+        else:
+            jitter = abs((started - self._last_block_at) - self._last_frames / self.samplerate)
+            self.jitter_total_s += jitter
+            if jitter > self.jitter_max_s:
+                self.jitter_max_s = jitter
+        self._last_block_at = started
+        self._last_frames = frames
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        callbacks = self.callbacks
+        intervals = max(0, callbacks - 1)
+        fill_percent = (
+            round(100 * self.samples / self.max_samples, 2)
+            if self.max_samples
+            else None
+        )
+        return {
+            "callbacks": callbacks,
+            "captured_seconds": round(self.samples / self.samplerate, 3),
+            "overflows": self.overflows,
+            "underflows": self.underflows,
+            "slow_callbacks": self.slow_callbacks,
+            "callback_avg_us": (
+                round(1e6 * self.callback_total_s / callbacks, 1) if callbacks else 0.0
+            ),
+            "callback_max_us": round(1e6 * self.callback_max_s, 1),
+            "jitter_avg_ms": (
+                round(1e3 * self.jitter_total_s / intervals, 3) if intervals else 0.0
+            ),
+            "jitter_max_ms": round(1e3 * self.jitter_max_s, 3),
+            "buffer_fill_percent": fill_percent,
+        }
+
+    def summary(self) -> str:
+        """One-line description for the log."""
+        d = self.to_dict()
+        text = (
+            f"{d['callbacks']} blocks, {d['overflows']} overflows, {d['underflows']} underflows, "
+            f"callback avg {d['callback_avg_us']:.0f}us / max {d['callback_max_us']:.0f}us, "
+            f"jitter max {d['jitter_max_ms']:.1f}ms"
+        )
+        if d["buffer_fill_percent"] is not None:
+            text += f", buffer {d['buffer_fill_percent']:.1f}% full"
+        return text
+
+
+def parse_latency(value: Optional[str]):
+    """
+    Convert a latency setting for sounddevice.
+
+    Args:
+        value: "low", "high", a number of seconds, or None for the default
+
+    Returns:
+        "low"/"high", seconds as float, or None
+    """
+    if value is None or value in ("low", "high"):
+        return value
+    seconds = float(value)
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise ValueError(f"Invalid latency: {value}")
+    return seconds
@@ -0,0 +1,288 @@
+"""
+Microphone capture isolated in a child process.
+
+The input stream callback normally runs in the backend process, next to the
+event loop and PyTorch/CTranslate2 inference. Under GIL pressure or CPU
+saturation (a batch job, the grammar model) the callback is delayed and
+PortAudio drops input blocks. A CaptureProcess runs the stream in a small
+child process at raised priority that writes into a shared memory ring
+(see speakeasy.utils.capture_child); it never waits on this process.
+
+Here a drain thread copies new samples out of the ring every
+DRAIN_INTERVAL_S and delivers them like stream blocks, so it is a drop-in
+for WarmMicrophone: a stall in this process only delays the copy, and audio
+is lost only if the stall exceeds the ring (`ring_s`, 30s by default).
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from ..utils.capture_child import (
+    CALLBACKS,
+    HEADER_LEN,
+    OVERFLOWS,
+    UNDERFLOWS,
+    WRITTEN,
+    buffer_views,
+    capture_main,
+)
+from .warm_mic import DEFAULT_PRE_ROLL_MS, BlockSink, PreRollSink
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RING_S = 30.0
+DRAIN_INTERVAL_S = 0.02
+STARTUP_TIMEOUT_S = 10.0
+SHUTDOWN_TIMEOUT_S = 5.0
+
+
+class BlockStatus:
+    """Status flags passed with drained blocks (like sounddevice.CallbackFlags)."""
+
+    def __init__(self, input_overflow: bool = False, input_underflow: bool = False):
+        self.input_overflow = input_overflow
+        self.input_underflow = input_underflow
+
+    def __bool__(self) -> bool:
+        return self.input_overflow or self.input_underflow
+
+
+class CaptureProcess:
+    """
+    Always-open input stream running in a child process.
+
+    Same interface as WarmMicrophone: attach()/detach() a sink, which receives
+    the pre-roll and then every new block (on the drain thread).
+    """
+
+    def __init__(
+        self,
+        device_id: Optional[int],
+        samplerate: int,
+        channels: int = 1,
+        pre_roll_s: float = DEFAULT_PRE_ROLL_MS / 1000,
+        blocksize: int = 0,
+        latency: Optional[str | float] = None,
+        ring_s: float = DEFAULT_RING_S,
+    ):
+        """
+        Initialize the capture process (started by open()).
+
+        Args:
+            device_id: PortAudio device index, or None for the default input
+            samplerate: Native sample rate of the device
+            channels: Number of input channels (the first one is captured)
+            pre_roll_s: Audio from before attach() delivered to each recording
+            blocksize: Frames per callback (0 lets PortAudio choose)
+            latency: Stream latency ("low", "high", seconds, or None for the default)
+            ring_s: Shared ring length, the longest stall of this process without loss
+        """
+        self.device_id = device_id
+        self.samplerate = samplerate
+        self.channels = channels
+        self.pre_roll_s = max(0.0, pre_roll_s)
+        self.blocksize = blocksize
+        self.latency = latency
+        self.ring_len = int(max(ring_s, self.pre_roll_s + 1.0) * samplerate)
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._header: Optional[np.ndarray] = None
+        self._ring: Optional[np.ndarray] = None
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._stop = None  # Event that ends the child
+
+        self._read_pos = 0  # Next sample to deliver
+        self._seen_overflows = 0
+        self._seen_underflows = 0
+        self.dropped = 0  # Samples overwritten before this process could read them
+
+        self._sink: Optional[BlockSink] = None
+        self._pending: Optional[tuple[BlockSink, Optional[PreRollSink]]] = None
+        self._lock = threading.Lock()
+        self._drainer: Optional[threading.Thread] = None
+        self._drain_stop = threading.Event()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the capture process is running."""
+        return self._process is not None
+
+    def open(self) -> None:
+        """
+        Start the capture process and wait until its stream is running.
+
+        Raises:
+            RuntimeError: If the stream can't be opened in the child
+        """
+        if self._process is not None:
+            return
+        self._create_buffer()
+
+        ctx = multiprocessing.get_context("spawn")
+        ready, self._stop, errors = ctx.Event(), ctx.Event(), ctx.Queue()
+        self._process = ctx.Process(
+            target=capture_main,
+            args=(
+                self._shm.name,
+                self.ring_len,
+                self.device_id,
+                self.samplerate,
+                self.channels,
+                self.blocksize,
+                self.latency,
+                ready,
+                self._stop,
+                errors,
+            ),
+            name="speakeasy-capture",
+            daemon=True,
+        )
+        self._process.start()
+
+        # The child exits early (with a message) if the stream can't be opened
+        deadline = time.monotonic() + STARTUP_TIMEOUT_S
+        while not ready.wait(0.05):
+            if not self._process.is_alive() or time.monotonic() > deadline:
+                try:
+                    error = errors.get(timeout=1)
+                except Exception:
+                    error = "timed out"
+                self.close()
+                raise RuntimeError(f"Capture process failed to start: {error}")
+
+        self._drain_stop.clear()
+        self._drainer = threading.Thread(target=self._drain, name="capture-drain", daemon=True)
+        self._drainer.start()
+        logger.info(
+            f"Capture process {self._process.pid} open (device={self.device_id}, "
+            f"{self.samplerate}Hz, pre-roll {self.pre_roll_s * 1000:.0f}ms)"
+        )
+
+    def close(self) -> None:
+        """Stop the capture process and release the shared memory."""
+        self.detach()
+        self._drain_stop.set()
+        if self._drainer is not None:
+            self._drainer.join(timeout=SHUTDOWN_TIMEOUT_S)
+            self._drainer = None
+
+        process, self._process = self._process, None
+        if process is not None:
+            self._stop.set()
+            process.join(SHUTDOWN_TIMEOUT_S)
+            if process.is_alive():
+                logger.warning("Capture process did not exit, terminating it")
+                process.terminate()
+                process.join(SHUTDOWN_TIMEOUT_S)
+            logger.info("Capture process closed")
+
+        if self._shm is not None:
+            self._header = self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def attach(self, sink: BlockSink, on_pre_roll: Optional[PreRollSink] = None) -> int:
+        """
+        Start delivering audio to `sink`, beginning with the pre-roll.
+
+        Returns immediately; the next drain delivers the pre-roll to
+        `on_pre_roll`, then new blocks to `sink`.
+
+        Returns:
+            Number of pre-roll samples currently available
+        """
+        with self._lock:
+            self._pending = (sink, on_pre_roll)
+        return self.pre_roll_available()
+
+    def detach(self) -> None:
+        """Stop delivering audio to the current sink (the capture keeps running)."""
+        with self._lock:
+            self._pending = None
+            self._sink = None
+
+    def pre_roll_available(self) -> int:
+        """Number of pre-roll samples in the ring."""
+        return min(self._read_pos, int(self.pre_roll_s * self.samplerate))
+
+    def stats(self) -> dict:
+        """Counters of the child's stream, for the telemetry."""
+        header = self._header
+        if header is None:
+            return {"running": False}
+        return {
+            "running": self._process is not None and self._process.is_alive(),
+            "pid": self._process.pid if self._process is not None else None,
+            "callbacks": int(header[CALLBACKS]),
+            "overflows": int(header[OVERFLOWS]),
+            "underflows": int(header[UNDERFLOWS]),
+            "dropped_samples": self.dropped,
+        }
+
+    def _create_buffer(self) -> None:
+        """Allocate the shared header and ring."""
+        self._shm = shared_memory.SharedMemory(create=True, size=HEADER_LEN * 8 + self.ring_len * 4)
+        self._header, self._ring = buffer_views(self._shm.buf, self.ring_len)
+        self._header[:] = 0
+        self._read_pos = 0
+
+    def _read(self, start: int, end: int) -> np.ndarray:
+        """Copy samples [start, end) out of the ring."""
+        size = self.ring_len
+        first, last = start % size, end % size
+        if end - start == 0:
+            return np.zeros(0, dtype=np.float32)
+        if first < last:
+            return self._ring[first:last].copy()
+        return np.concatenate((self._ring[first:], self._ring[:last]))
+
+    def _drain(self) -> None:
+        """Drain thread: deliver new samples until closed."""
+        reported_exit = False
+        while not self._drain_stop.wait(DRAIN_INTERVAL_S):
+            self._deliver()
+            process = self._process
+            if process is not None and not process.is_alive() and not reported_exit:
+                logger.error(f"Capture process exited unexpectedly (code {process.exitcode})")
+                reported_exit = True
+
+    def _deliver(self) -> None:
+        """Copy out what the child wrote since the last drain and forward it."""
+        with self._lock:
+            written = int(self._header[WRITTEN])
+            lost = written - self._read_pos - self.ring_len
+            if lost > 0:
+                # This process stalled longer than the ring holds
+                self.dropped += lost
+                self._read_pos += lost
+
+            pending = self._pending
+            if pending is not None:
+                self._pending = None
+                sink, on_pre_roll = pending
+                available = self.pre_roll_available()
+                if on_pre_roll is not None and available:
+                    on_pre_roll(self._read(self._read_pos - available, self._read_pos))
+                self._sink = sink
+
+            if written == self._read_pos:
+                return
+            block = self._read(self._read_pos, written)
+            self._read_pos = written
+
+            overflows, underflows = int(self._header[OVERFLOWS]), int(self._header[UNDERFLOWS])
+            status = BlockStatus(
+                input_overflow=lost > 0 or overflows > self._seen_overflows,
+                input_underflow=underflows > self._seen_underflows,
+            )
+            self._seen_overflows, self._seen_underflows = overflows, underflows
+
+            if self._sink is not None:
+                self._sink(block.reshape(-1, 1), len(block), {}, status)
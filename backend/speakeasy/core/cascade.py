@@ -0,0 +1,322 @@
+"""
+Confidence-gated model cascade.
+
+A small, fast Whisper model transcribes everything first. Segments it is
+unsure about (low avg_logprob) are re-decoded with a larger, more accurate
+model and spliced back into the transcript, so the large model only runs on
+the fraction of audio that needs it. As in faster-whisper, a segment with a
+high no_speech_prob and a low avg_logprob is silence: it is dropped rather
+than escalated, since the large model would only spend time hallucinating
+text for it.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from .models import ModelType, TranscriptionResult, TranscriptionSegment
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .cancellation import CancellationToken
+    from .models import ModelWrapper
+
+logger = logging.getLogger(__name__)
+
+# faster-whisper's own fallback thresholds
+DEFAULT_LOGPROB_THRESHOLD = -0.7
+DEFAULT_NO_SPEECH_THRESHOLD = 0.6
+
+
+@dataclass
+class CascadeMetrics:
+    """Cumulative cascade statistics."""
+
+    requests: int = 0
+    escalated_requests: int = 0
+    segments: int = 0
+    escalated_segments: int = 0
+    silent_segments: int = 0
+    audio_s: float = 0.0
+    escalated_audio_s: float = 0.0
+    fast_ms: float = 0.0
+    accurate_ms: float = 0.0
+    # For requests seen once the accurate model's speed is known: the cascade's
+    # actual time and the estimated time of the accurate model alone
+    compared_ms: float = 0.0
+    accurate_only_ms: float = 0.0
+    accurate_rtf: Optional[float] = None
+
+    @property
+    def escalated_fraction(self) -> float:
+        """Fraction of audio (by duration) that was re-decoded by the accurate model."""
+        return self.escalated_audio_s / self.audio_s if self.audio_s else 0.0
+
+    @property
+    def latency_saved_ms(self) -> Optional[float]:
+        """Estimated latency saved versus running the accurate model on everything."""
+        if self.accurate_rtf is None:
+            return None
+        return self.accurate_only_ms - self.compared_ms
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        saved = self.latency_saved_ms
+        return {
+            "requests": self.requests,
+            "escalated_requests": self.escalated_requests,
+            "segments": self.segments,
+            "escalated_segments": self.escalated_segments,
+            "silent_segments": self.silent_segments,
+            "audio_s": round(self.audio_s, 2),
+            "escalated_audio_s": round(self.escalated_audio_s, 2),
+            "escalated_fraction": round(self.escalated_fraction, 4),
+            "fast_ms": round(self.fast_ms, 1),
+            "accurate_ms": round(self.accurate_ms, 1),
+            "accurate_rtf": round(self.accurate_rtf, 4) if self.accurate_rtf is not None else None,
+            "latency_saved_ms": round(saved, 1) if saved is not None else None,
+        }
+
+
+class CascadeTranscriber:
+    """
+    Two-stage transcriber: fast Whisper first, accurate model on low-confidence spans.
+
+    Exposes the same transcribe() signature as ModelWrapper so it can be used
+    anywhere a model is.
+    """
+
+    # Smoothing factor for the accurate model's real-time factor estimate
+    RTF_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        fast: "ModelWrapper",
+        accurate: "ModelWrapper",
+        logprob_threshold: float = DEFAULT_LOGPROB_THRESHOLD,
+        no_speech_threshold: float = DEFAULT_NO_SPEECH_THRESHOLD,
+        padding_s: float = 0.2,
+    ):
+        """
+        Initialize the cascade.
+
+        Args:
+            fast: Loaded Whisper model used for the first pass
+            accurate: Loaded model used to re-decode low-confidence spans
+            logprob_threshold: Segments with avg_logprob below this are escalated
+            no_speech_threshold: Segments with no_speech_prob above this (and a low
+                avg_logprob) are silence and dropped
+            padding_s: Audio context added on both sides of an escalated span; it
+                never reaches into a neighbouring segment that is kept, whose
+                words would otherwise be transcribed twice
+        """
+        if fast.model_type != ModelType.WHISPER:
+            raise ValueError("The fast cascade model must be a Whisper model")
+
+        self.fast = fast
+        self.accurate = accurate
+        self.logprob_threshold = logprob_threshold
+        self.no_speech_threshold = no_speech_threshold
+        self.padding_s = padding_s
+
+        self._metrics = CascadeMetrics()
+        self._metrics_lock = threading.Lock()
+
+    @property
+    def model_name(self) -> str:
+        """Name reported for results produced by the cascade."""
+        return f"{self.fast.model_name}+{self.accurate.model_name}"
+
+    @property
+    def cache_signature(self) -> str:
+        """The models and thresholds a transcript depends on (for the result cache)."""
+        return (
+            f"{self.model_name}:logprob={self.logprob_threshold}:"
+            f"no_speech={self.no_speech_threshold}:padding={self.padding_s}"
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether both models are loaded."""
+        return self.fast.is_loaded and self.accurate.is_loaded
+
+    def get_metrics(self) -> dict:
+        """Get a snapshot of the cumulative cascade metrics."""
+        with self._metrics_lock:
+            return self._metrics.to_dict()
+
+    def is_silence(self, segment: TranscriptionSegment) -> bool:
+        """Check whether a segment is silence (faster-whisper's no-speech rule)."""
+        return (
+            segment.no_speech_prob is not None
+            and segment.no_speech_prob > self.no_speech_threshold
+            and segment.avg_logprob is not None
+            and segment.avg_logprob < self.logprob_threshold
+        )
+
+    def is_low_confidence(self, segment: TranscriptionSegment) -> bool:
+        """Check whether a segment should be re-decoded by the accurate model."""
+        return (
+            segment.avg_logprob is not None
+            and segment.avg_logprob < self.logprob_threshold
+            and not self.is_silence(segment)
+        )
+
+    def _group_spans(self, segments: list[TranscriptionSegment]) -> list[tuple[int, int]]:
+        """Group consecutive low-confidence segments into [first, last] index spans."""
+        spans: list[tuple[int, int]] = []
+        for i, segment in enumerate(segments):
+            if not self.is_low_confidence(segment):
+                continue
+            if spans and spans[-1][1] == i - 1:
+                spans[-1] = (spans[-1][0], i)
+            else:
+                spans.append((i, i))
+        return spans
+
+    def _span_bounds(
+        self,
+        segments: list[TranscriptionSegment],
+        silent: list[bool],
+        first: int,
+        last: int,
+        audio_s: float,
+    ) -> tuple[float, float]:
+        """Padded start and end (seconds) of an escalated span, clipped to its kept neighbours."""
+        start = max(0.0, segments[first].start - self.padding_s)
+        end = min(audio_s, segments[last].end + self.padding_s)
+        # Spans are maximal, so a neighbour is either kept or dropped as silence
+        if first > 0 and not silent[first - 1]:
+            start = min(segments[first].start, max(start, segments[first - 1].end))
+        if last + 1 < len(segments) and not silent[last + 1]:
+            end = max(segments[last].end, min(end, segments[last + 1].start))
+        return start, end
+
+    def transcribe(
+        self,
+        audio_data: "NDArray[np.float32]",
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        cancel_token: Optional["CancellationToken"] = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe audio with the fast model, escalating low-confidence spans.
+
+        Args:
+            audio_data: Numpy array of audio samples (float32, mono)
+            sample_rate: Sample rate in Hz (default 16000)
+            language: Language code or 'auto' for auto-detection
+            instruction: Optional instruction passed to the accurate model
+            cancel_token: Optional token checked between segments and escalated spans
+
+        Returns:
+            TranscriptionResult with the spliced transcript
+        """
+        start_time = time.perf_counter()
+        audio_s = len(audio_data) / sample_rate
+
+        first_pass = self.fast.transcribe_segments(
+            audio_data, sample_rate, language, cancel_token=cancel_token
+        )
+        fast_ms = (time.perf_counter() - start_time) * 1000
+        segments = first_pass.segments
+
+        # Reuse the language the fast model detected so both passes agree
+        accurate_language = language
+        if (not language or language == "auto") and first_pass.language:
+            accurate_language = first_pass.language
+
+        silent = [self.is_silence(segment) for segment in segments]
+        texts = ["" if is_silent else segment.text for segment, is_silent in zip(segments, silent)]
+        escalated_audio_s = 0.0
+        escalated_segments = 0
+        accurate_ms = 0.0
+
+        for first, last in self._group_spans(segments):
+            span_start, span_end = self._span_bounds(segments, silent, first, last, audio_s)
+            span_audio = audio_data[int(span_start * sample_rate) : int(span_end * sample_rate)]
+            if len(span_audio) == 0:
+                continue
+
+            span_timer = time.perf_counter()
+            span_result = self.accurate.transcribe(
+                audio_data=span_audio,
+                sample_rate=sample_rate,
+                language=accurate_language,
+                instruction=instruction,
+                cancel_token=cancel_token,
+            )
+            accurate_ms += (time.perf_counter() - span_timer) * 1000
+
+            texts[first] = span_result.text.strip()
+            for i in range(first + 1, last + 1):
+                texts[i] = ""
+            escalated_audio_s += span_end - span_start
+            escalated_segments += last - first + 1
+
+        text = " ".join(t for t in texts if t)
+        self._record(
+            audio_s=audio_s,
+            segments=len(segments),
+            escalated_segments=escalated_segments,
+            silent_segments=sum(silent),
+            escalated_audio_s=escalated_audio_s,
+            fast_ms=fast_ms,
+            accurate_ms=accurate_ms,
+        )
+
+        if escalated_segments:
+            logger.debug(
+                f"Cascade escalated {escalated_segments}/{len(segments)} segments "
+                f"({escalated_audio_s:.1f}s of {audio_s:.1f}s)"
+            )
+
+        return TranscriptionResult(
+            text=text,
+            duration_ms=int((time.perf_counter() - start_time) * 1000),
+            language=accurate_language,
+            model_used=self.model_name,
+        )
+
+    def _record(
+        self,
+        audio_s: float,
+        segments: int,
+        escalated_segments: int,
+        silent_segments: int,
+        escalated_audio_s: float,
+        fast_ms: float,
+        accurate_ms: float,
+    ) -> None:
+        """Fold one request into the cumulative metrics."""
+        with self._metrics_lock:
+            m = self._metrics
+            if escalated_audio_s > 0:
+                rtf = accurate_ms / 1000 / escalated_audio_s
+                m.accurate_rtf = (
+                    rtf
+                    if m.accurate_rtf is None
+                    else (1 - self.RTF_SMOOTHING) * m.accurate_rtf + self.RTF_SMOOTHING * rtf
+                )
+
+            m.requests += 1
+            m.fast_ms += fast_ms
+            m.accurate_ms += accurate_ms
+            m.segments += segments
+            m.escalated_segments += escalated_segments
+            m.silent_segments += silent_segments
+            m.audio_s += audio_s
+            m.escalated_audio_s += escalated_audio_s
+            if escalated_segments:
+                m.escalated_requests += 1
+
+            # Savings can only be estimated once the accurate model's speed is known
+            if m.accurate_rtf is not None:
+                m.compared_ms += fast_ms + accurate_ms
+                m.accurate_only_ms += m.accurate_rtf * audio_s * 1000
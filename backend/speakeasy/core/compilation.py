@@ -0,0 +1,272 @@
+"""
+Opt-in torch.compile support with a persistent cache and eager fallback.
+
+torch.compile has been seen to hang on some platforms (Windows/WSL/CUDA-Python),
+so compilation never blocks model loading: the eager module is used right away
+while a background thread compiles and warms up a compiled copy. If the warm-up
+finishes within the timeout the compiled module is swapped in, otherwise the
+model simply stays eager.
+
+Python threads can't be killed, so a compile that times out keeps running: it
+is flagged as cancelled, stops at its next step and its result is dropped,
+but a torch.compile call that hangs holds its (daemon) thread until the
+process exits. Warm-ups only start while the model is idle, so they don't
+compete with requests being served.
+
+Compiled graphs are persisted through Inductor's FX graph cache under
+~/.speakeasy/compile_cache so restarts reuse earlier compilations.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPILE_TIMEOUT_S = 300.0
+
+
+class CompileStatus(str, Enum):
+    """Status of a background compilation."""
+
+    DISABLED = "disabled"
+    COMPILING = "compiling"
+    COMPILED = "compiled"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class CompileReport:
+    """Outcome of compiling one module, filled in as the background compile progresses."""
+
+    label: str
+    status: CompileStatus = CompileStatus.DISABLED
+    backend: str = "inductor"
+    device: Optional[str] = None
+    reason: Optional[str] = None
+    compile_s: Optional[float] = None
+    eager_ms: Optional[float] = None
+    compiled_ms: Optional[float] = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def used(self) -> bool:
+        """Whether the compiled module is the one serving inference."""
+        return self.status == CompileStatus.COMPILED
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Measured eager/compiled latency ratio on the warm-up input."""
+        if not self.eager_ms or not self.compiled_ms:
+            return None
+        return self.eager_ms / self.compiled_ms
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the background compile has finished (or given up)."""
+        return self._done.wait(timeout)
+
+    def finish(self, status: CompileStatus, reason: Optional[str] = None) -> None:
+        """Record the final status and wake any waiters."""
+        self.status = status
+        if reason:
+            self.reason = reason
+        self._done.set()
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "label": self.label,
+            "status": self.status.value,
+            "used": self.used,
+            "backend": self.backend,
+            "device": self.device,
+            "reason": self.reason,
+            "compile_s": round(self.compile_s, 2) if self.compile_s is not None else None,
+            "eager_ms": round(self.eager_ms, 2) if self.eager_ms is not None else None,
+            "compiled_ms": round(self.compiled_ms, 2) if self.compiled_ms is not None else None,
+            "speedup": round(self.speedup, 2) if self.speedup is not None else None,
+        }
+
+
+def get_compile_cache_dir() -> Path:
+    """Get the directory for persistent torch.compile artifacts."""
+    return Path.home() / ".speakeasy" / "compile_cache"
+
+
+_cache_configured = False
+
+
+def configure_compile_cache() -> Path:
+    """
+    Point Inductor's on-disk caches at ~/.speakeasy/compile_cache.
+
+    Environment variables are only set if the user has not set them already,
+    so a custom TORCHINDUCTOR_CACHE_DIR keeps working.
+    """
+    global _cache_configured
+
+    cache_dir = get_compile_cache_dir()
+    if _cache_configured:
+        return cache_dir
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(cache_dir))
+    os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+    os.environ.setdefault("TORCHINDUCTOR_AUTOGRAD_CACHE", "1")
+
+    try:
+        import torch._inductor.config as inductor_config
+
+        inductor_config.fx_graph_cache = True
+    except Exception as e:
+        logger.debug(f"Could not enable Inductor FX graph cache: {e}")
+
+    _cache_configured = True
+    return cache_dir
+
+
+def _timed_call(fn: Callable[[Any], Any], module: Any) -> float:
+    """Run fn(module) under inference mode and return elapsed milliseconds."""
+    import torch
+
+    start = time.perf_counter()
+    with torch.inference_mode():
+        fn(module)
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) * 1000
+
+
+def compile_in_background(
+    module: Any,
+    warmup: Callable[[Any], Any],
+    on_compiled: Callable[[Any], None],
+    label: str,
+    device: Optional[str] = None,
+    timeout_s: float = DEFAULT_COMPILE_TIMEOUT_S,
+    mode: Optional[str] = None,
+    wait_idle: Optional[Callable[[float], bool]] = None,
+) -> CompileReport:
+    """
+    Compile `module` on a background thread and hand it to `on_compiled` on success.
+
+    The warm-up callable is run once on the eager module (for the baseline
+    latency), then on the compiled module to trigger compilation, and once more
+    to measure the compiled latency. The compiled module is only handed over if
+    all of this completes within `timeout_s`; failures and timeouts leave the
+    eager module in place. A timed-out compile can't be killed: it is cancelled
+    and its module discarded whenever it finishes.
+
+    Args:
+        module: The nn.Module to compile
+        warmup: Callable that runs a representative forward pass on a module
+        on_compiled: Called with the compiled module once it is warmed up
+        label: Human readable name used in logs and reports
+        device: Device the module runs on (for reporting)
+        timeout_s: Maximum seconds to wait for compilation + warm-up
+        mode: Optional torch.compile mode (e.g. "reduce-overhead")
+        wait_idle: Optional callable that blocks until the module serves no
+            requests (up to the given seconds) and returns False if it didn't;
+            the warm-ups only start once it returns True
+
+    Returns:
+        A CompileReport that is updated in place as compilation progresses
+    """
+    report = CompileReport(label=label, device=device)
+
+    try:
+        import torch
+    except ImportError:
+        report.finish(CompileStatus.SKIPPED, "torch not installed")
+        return report
+
+    if not hasattr(torch, "compile"):
+        report.finish(CompileStatus.SKIPPED, "torch.compile requires PyTorch 2.0+")
+        return report
+
+    report.status = CompileStatus.COMPILING
+    configure_compile_cache()
+
+    def _idle() -> bool:
+        if wait_idle is None or wait_idle(timeout_s):
+            return True
+        report.finish(CompileStatus.SKIPPED, f"model still serving after {timeout_s:.0f}s")
+        logger.warning(f"[compile] {label}: skipped, the model never went idle")
+        return False
+
+    def _compile() -> None:
+        if not _idle():
+            return
+        try:
+            report.eager_ms = _timed_call(warmup, module)
+        except Exception as e:
+            report.finish(CompileStatus.SKIPPED, f"eager warm-up failed: {e}")
+            logger.warning(f"[compile] {label}: skipped, eager warm-up failed: {e}")
+            return
+
+        outcome: dict[str, Any] = {}
+        # Set on timeout; the worker can't be stopped, so it checks this between steps
+        cancelled = threading.Event()
+
+        def _compile_and_warm() -> None:
+            try:
+                compiled = torch.compile(module, mode=mode, dynamic=True)
+                if cancelled.is_set():
+                    return
+                start = time.perf_counter()
+                _timed_call(warmup, compiled)
+                compile_s = time.perf_counter() - start
+                if cancelled.is_set():
+                    return
+                compiled_ms = _timed_call(warmup, compiled)
+                # A late result is dropped rather than kept alive by `outcome`
+                if cancelled.is_set():
+                    return
+                outcome.update(compile_s=compile_s, compiled_ms=compiled_ms, module=compiled)
+            except Exception as e:
+                outcome["error"] = e
+
+        if not _idle():
+            return
+        worker = threading.Thread(
+            target=_compile_and_warm, name=f"torch-compile-{label}", daemon=True
+        )
+        worker.start()
+        worker.join(timeout_s)
+
+        if worker.is_alive():
+            cancelled.set()
+            report.finish(CompileStatus.TIMEOUT, f"no result after {timeout_s:.0f}s")
+            logger.warning(f"[compile] {label}: timed out after {timeout_s:.0f}s, staying eager")
+            return
+
+        if "error" in outcome:
+            report.finish(CompileStatus.FAILED, str(outcome["error"]))
+            logger.warning(f"[compile] {label}: failed, staying eager: {outcome['error']}")
+            return
+
+        report.compile_s = outcome["compile_s"]
+        report.compiled_ms = outcome["compiled_ms"]
+        try:
+            on_compiled(outcome["module"])
+        except Exception as e:
+            report.finish(CompileStatus.FAILED, f"could not install compiled module: {e}")
+            logger.warning(f"[compile] {label}: could not install compiled module: {e}")
+            return
+
+        report.finish(CompileStatus.COMPILED)
+        logger.info(
+            f"[compile] {label}: compiled in {report.compile_s:.1f}s, "
+            f"{report.eager_ms:.1f}ms eager -> {report.compiled_ms:.1f}ms compiled "
+            f"({report.speedup:.2f}x)"
+        )
+
+    threading.Thread(target=_compile, name=f"compile-{label}", daemon=True).start()
+    return report
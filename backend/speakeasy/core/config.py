@@ -172,8 +172,8 @@ WHISPER_ENGLISH_ONLY: list[str] = _config.get(
     ],
 )
 
-# Canary source-target language pairs
-CANARY_LANGUAGES: dict[str, list[str]] = _config.get(
+# Canary languages: a list of codes (the bundled JSON), or source -> target codes
+CANARY_LANGUAGES: list[str] | dict[str, list[str]] = _config.get(
     "canary_source_target_languages",
     {
         "en": ["en", "de", "es", "fr"],
@@ -278,9 +278,7 @@ MODEL_INFO = {
         "models": {
             "nvidia/canary-1b-v2": {"vram_gb": 6, "speed": "fast", "accuracy": "excellent"},
         },
-        "languages": list(CANARY_LANGUAGES)
-        if isinstance(CANARY_LANGUAGES, list)
-        else list(CANARY_LANGUAGES.keys()),
+        "languages": list(CANARY_LANGUAGES),
     },
     "voxtral": {
         "name": "Mistral Voxtral",
@@ -306,13 +304,24 @@ def get_languages_for_model(model_type: str, model_name: Optional[str] = None) -
     elif model_type == "parakeet":
         return PARAKEET_LANGUAGES
     elif model_type == "canary":
-        return list(CANARY_LANGUAGES.keys())
+        # Iterating the dict form gives its source languages
+        return list(CANARY_LANGUAGES)
     elif model_type == "voxtral":
         return VOXTRAL_LANGUAGES
     else:
         return ["auto", "en"]
 
 
+# Relative ordering of MODEL_INFO "speed" labels (lower is faster)
+SPEED_RANKS = {"fastest": 0, "very fast": 1, "fast": 2, "medium": 3, "slow": 4}
+
+
+def get_model_speed_rank(model_type: str, model_name: str) -> int:
+    """Get the relative speed rank of a model (lower is faster, unknown models rank as medium)."""
+    info = MODEL_INFO.get(model_type, {}).get("models", {}).get(model_name, {})
+    return SPEED_RANKS.get(info.get("speed", "medium"), SPEED_RANKS["medium"])
+
+
 def get_available_models(model_type: str) -> list[str]:
     """Get available model names for a model type."""
     if model_type == "whisper":
@@ -332,7 +341,8 @@ def get_compute_types(model_type: str) -> list[str]:
     if model_type == "whisper":
         return ["float16", "int8", "int8_float16", "float32"]
     elif model_type in ("parakeet", "canary"):
-        return ["float16", "float32"]
+        # int8 applies dynamic quantization to the encoder and is CPU-only
+        return ["float16", "float32", "int8"]
     elif model_type == "voxtral":
         return ["float16", "bfloat16", "int8", "int4"]
     else:
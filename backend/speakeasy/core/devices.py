@@ -0,0 +1,290 @@
+"""
+Cached audio input device registry with hot-plug invalidation.
+
+Querying PortAudio (and opening a PulseAudio connection for friendly names)
+on every recording start and device listing adds latency to the hotkey path.
+The registry scans once and serves lookups by id and name from dictionaries.
+
+The cache is refreshed in the background. PortAudio only sees devices
+plugged in after startup once it is reinitialized, which would break open
+streams. With pulsectl (Linux), PulseAudio source events mark PortAudio
+stale and the next device listing reinitializes it. Without hot-plug
+events, the watcher thread reinitializes and rescans on a timer instead,
+off the request path. Either way this only happens while no stream is
+open: every PortAudio call, including opening a stream (see
+portaudio_lock), is serialized by one lock.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import sounddevice as sd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL_S = 30.0
+
+
+@dataclass
+class AudioDevice:
+    """An audio input device as reported by PortAudio."""
+
+    id: int
+    name: str
+    channels: int
+    sample_rate: int  # Native (default) sample rate
+    hostapi: str
+    is_default: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "channels": self.channels,
+            "sample_rate": self.sample_rate,
+            "hostapi": self.hostapi,
+            "is_default": self.is_default,
+        }
+
+
+class DeviceRegistry:
+    """
+    Snapshot of the input devices, rescanned only when invalidated.
+
+    Lookups never touch PortAudio unless the cache is empty. Thread-safe.
+    """
+
+    def __init__(self, refresh_interval_s: float = DEFAULT_REFRESH_INTERVAL_S):
+        """
+        Initialize the registry (the first lookup scans the devices).
+
+        Args:
+            refresh_interval_s: Rescan period when hot-plug events are unavailable
+        """
+        self.refresh_interval_s = refresh_interval_s
+        self._lock = threading.Lock()
+        self._devices: Optional[dict[int, AudioDevice]] = None
+        self._by_name: dict[str, int] = {}
+        self._default_id: Optional[int] = None
+        self._derived: dict[str, Any] = {}
+        # Set by hot-plug events: PortAudio must be reinitialized to see the change
+        self._portaudio_stale = False
+        self._can_reinitialize: Optional[Callable[[], bool]] = None
+        # Held for every PortAudio call; code opening a stream holds it until the
+        # stream is visible to can_reinitialize, so PortAudio is never restarted under it
+        self.portaudio_lock = threading.RLock()
+
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.scans = 0
+
+    def refresh(self, reinitialize: bool = False) -> None:
+        """
+        Rescan the input devices.
+
+        Args:
+            reinitialize: Restart PortAudio first so hot-plugged devices appear.
+                Only safe while no stream is open.
+        """
+        with self.portaudio_lock:
+            if reinitialize:
+                sd._terminate()
+                sd._initialize()
+
+            hostapis = sd.query_hostapis()
+            default_id = sd.default.device[0]
+            devices: dict[int, AudioDevice] = {}
+            for i, dev in enumerate(sd.query_devices()):
+                if dev["max_input_channels"] > 0:
+                    devices[i] = AudioDevice(
+                        id=i,
+                        name=dev["name"],
+                        channels=dev["max_input_channels"],
+                        sample_rate=int(dev["default_samplerate"]),
+                        hostapi=hostapis[dev["hostapi"]]["name"],
+                        is_default=i == default_id,
+                    )
+
+        with self._lock:
+            self._devices = devices
+            self._by_name = {dev.name.lower(): dev.id for dev in devices.values()}
+            self._default_id = default_id if default_id in devices else None
+            self._derived.clear()
+            if reinitialize:
+                self._portaudio_stale = False
+            self.scans += 1
+        logger.debug(f"Scanned {len(devices)} input devices")
+
+    def invalidate(self, hotplug: bool = False) -> None:
+        """
+        Drop the cached devices; the next lookup rescans.
+
+        Args:
+            hotplug: A device was added or removed (PortAudio must be reinitialized)
+        """
+        with self._lock:
+            self._devices = None
+            self._derived.clear()
+            if hotplug:
+                self._portaudio_stale = True
+
+    def _snapshot(self) -> dict[int, AudioDevice]:
+        """Get the cached devices, scanning if needed."""
+        devices = self._devices
+        if devices is None:
+            self.refresh()
+            devices = self._devices
+        return devices
+
+    def get(self, device_id: int) -> Optional[AudioDevice]:
+        """Look up an input device by PortAudio index."""
+        return self._snapshot().get(device_id)
+
+    def default_input(self) -> Optional[AudioDevice]:
+        """The system default input device, if it has input channels."""
+        devices = self._snapshot()
+        return devices.get(self._default_id) if self._default_id is not None else None
+
+    def find(self, name: str) -> Optional[AudioDevice]:
+        """
+        Find an input device by name (exact, else case-insensitive substring).
+
+        Args:
+            name: Device name or part of it
+        """
+        devices = self._snapshot()
+        name_lower = name.lower()
+        device_id = self._by_name.get(name_lower)
+        if device_id is not None:
+            return devices.get(device_id)
+        for dev in devices.values():
+            if name_lower in dev.name.lower():
+                return dev
+        return None
+
+    def list_inputs(self, rescan: bool = False) -> list[dict]:
+        """
+        List the input devices.
+
+        After a hot-plug event (or when asked to rescan) PortAudio is
+        reinitialized here first, if no stream is open, so newly connected
+        devices are listed.
+
+        Args:
+            rescan: Reinitialize PortAudio even without a hot-plug event
+        """
+        if rescan or self._portaudio_stale:
+            with self.portaudio_lock:
+                # Checked again under the lock: a stream may have opened meanwhile
+                if (rescan or self._portaudio_stale) and self._idle():
+                    try:
+                        self.refresh(reinitialize=True)
+                    except Exception as e:
+                        logger.warning(f"Could not reinitialize PortAudio: {e}")
+        return [dev.to_dict() for dev in self._snapshot().values()]
+
+    def _idle(self) -> bool:
+        """Whether no stream is open, so PortAudio may be reinitialized (hold portaudio_lock)."""
+        return self._can_reinitialize is None or self._can_reinitialize()
+
+    def cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Cache a derived device listing (e.g. PulseAudio sources) until the next invalidation.
+
+        Args:
+            key: Cache key
+            loader: Builds the value on a miss
+        """
+        with self._lock:
+            if key in self._derived:
+                return self._derived[key]
+        value = loader()
+        with self._lock:
+            self._derived[key] = value
+        return value
+
+    def start_watching(self, can_reinitialize: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Refresh the cache in the background on hot-plug events (or periodically).
+
+        Args:
+            can_reinitialize: Returns True while no input stream is open
+        """
+        self._can_reinitialize = can_reinitialize
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="device-registry", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background refresh."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def _watch(self) -> None:
+        """Watcher thread: PulseAudio events if available, else a timer."""
+        try:
+            self._watch_pulse()
+            return
+        except ImportError:
+            logger.debug("pulsectl not available, refreshing devices periodically")
+        except Exception as e:
+            logger.warning(f"PulseAudio device events unavailable ({e}), refreshing periodically")
+
+        while not self._stop.wait(self.refresh_interval_s):
+            # A rescan alone misses new devices, so PortAudio is restarted here while
+            # idle (a tick with a stream open is skipped)
+            with self.portaudio_lock:
+                if not self._idle():
+                    continue
+                before = self._devices
+                try:
+                    self.refresh(reinitialize=True)
+                except Exception as e:
+                    logger.warning(f"Device refresh failed: {e}")
+                    continue
+            if before is not None and self._devices != before:
+                logger.info("Audio devices changed")
+
+    def _watch_pulse(self) -> None:
+        """Invalidate the cache when PulseAudio sources are added, removed or the default changes."""
+        import pulsectl
+
+        changed = threading.Event()
+
+        def on_event(event) -> None:
+            # Sources come and go; server changes include a new default source
+            if event.facility == "server" or event.t in ("new", "remove"):
+                changed.set()
+                raise pulsectl.PulseLoopStop
+
+        with pulsectl.Pulse("speakeasy-device-watch") as pulse:
+            pulse.event_mask_set("source", "server")
+            pulse.event_callback_set(on_event)
+            logger.info("Watching PulseAudio for device changes")
+            while not self._stop.is_set():
+                pulse.event_listen(timeout=1.0)
+                if changed.is_set():
+                    changed.clear()
+                    logger.info("Audio devices changed")
+                    self.invalidate(hotplug=True)
+
+
+_registry: Optional[DeviceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_device_registry() -> DeviceRegistry:
+    """Get the process-wide device registry (created on first use)."""
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            _registry = DeviceRegistry()
+        return _registry
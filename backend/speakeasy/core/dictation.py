@@ -0,0 +1,193 @@
+"""
+Pipelined dictation: transcribe stopped recordings in the background, in order.
+
+Recording and transcription used to share one state machine, so the hotkey
+was blocked until the previous utterance had been transcribed. With the
+dictation queue, stopping a recording hands its audio to a FIFO worker and
+the service is immediately ready to record again. The worker transcribes one
+utterance at a time, so results are delivered (and pasted) in the order they
+were spoken.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .cancellation import CancellationToken, TranscriptionCancelledError
+from .models import TranscriptionResult
+
+if TYPE_CHECKING:
+    from .transcriber import RecordingResult, TranscriberService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Utterance:
+    """A stopped recording waiting for (or undergoing) transcription."""
+
+    id: int
+    recording: "RecordingResult"
+    language: Optional[str]
+    instruction: Optional[str]
+    on_done: Optional["UtteranceCallback"] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    cancel_token: CancellationToken = field(default_factory=CancellationToken)
+
+
+# Called on the queue's worker thread, in submission order:
+# (utterance, result or None, error or None) -> None
+UtteranceCallback = Callable[[Utterance, Optional[TranscriptionResult], Optional[Exception]], None]
+
+
+class DictationQueue:
+    """
+    FIFO of utterances transcribed by a single background worker.
+
+    The worker blocks on each utterance's callback before taking the next
+    one, so callbacks that save or paste the text keep dictation order.
+    """
+
+    def __init__(self, service: "TranscriberService"):
+        """
+        Initialize the queue; the worker thread starts with the first utterance.
+
+        Args:
+            service: The service whose model (and inference queue) transcribes utterances
+        """
+        self._service = service
+        self._queue: deque[Utterance] = deque()
+        self._current: Optional[Utterance] = None
+        self._cond = threading.Condition()
+        self._ids = itertools.count(1)
+        self._running = True
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of utterances queued or being transcribed."""
+        with self._cond:
+            return len(self._queue) + (1 if self._current else 0)
+
+    def submit(
+        self,
+        recording: "RecordingResult",
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        on_done: Optional[UtteranceCallback] = None,
+    ) -> Utterance:
+        """
+        Queue a stopped recording for transcription.
+
+        Args:
+            recording: The captured audio
+            language: Language code or 'auto'
+            instruction: Optional instruction
+            on_done: Called with the result (or error) once the utterance is transcribed
+
+        Returns:
+            The queued Utterance
+        """
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("Dictation queue is closed")
+            utterance = Utterance(
+                id=next(self._ids),
+                recording=recording,
+                language=language,
+                instruction=instruction,
+                on_done=on_done,
+            )
+            self._queue.append(utterance)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="dictation-queue", daemon=True
+                )
+                self._worker.start()
+            self._cond.notify()
+
+        logger.debug(f"Queued utterance {utterance.id} ({recording.duration_seconds:.1f}s)")
+        return utterance
+
+    def cancel_all(self) -> int:
+        """
+        Cancel the utterance being transcribed and every queued one.
+
+        Their callbacks still run (with TranscriptionCancelledError), in order.
+
+        Returns:
+            Number of utterances cancelled
+        """
+        with self._cond:
+            utterances = list(self._queue) + ([self._current] if self._current else [])
+        for utterance in utterances:
+            utterance.cancel_token.cancel("Dictation cancelled")
+        return len(utterances)
+
+    def close(self) -> None:
+        """Cancel pending utterances and stop the worker."""
+        self.cancel_all()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+
+    def _run(self) -> None:
+        """Worker loop: transcribe utterances one at a time."""
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                self._current = self._queue.popleft()
+            try:
+                self._process(self._current)
+            finally:
+                with self._cond:
+                    self._current = None
+
+    def _process(self, utterance: Utterance) -> None:
+        """Transcribe one utterance and hand the outcome to its callback."""
+        result: Optional[TranscriptionResult] = None
+        error: Optional[Exception] = None
+        recording = utterance.recording
+
+        try:
+            transcribed = self._service.transcribe(
+                audio_data=recording.audio_data,
+                sample_rate=recording.sample_rate,
+                language=utterance.language,
+                instruction=utterance.instruction,
+                cancel_token=utterance.cancel_token,
+                update_state=False,
+                trim_silence=True,
+            )
+            # Report the spoken duration, like stop_and_transcribe()
+            result = TranscriptionResult(
+                text=transcribed.text,
+                duration_ms=int(recording.duration_seconds * 1000),
+                language=transcribed.language,
+                model_used=transcribed.model_used,
+                processing_ms=transcribed.duration_ms,
+                trimmed_ms=transcribed.trimmed_ms,
+            )
+            wait_ms = (time.monotonic() - utterance.enqueued_at) * 1000
+            logger.debug(f"Utterance {utterance.id} transcribed {wait_ms:.0f}ms after stop")
+        except TranscriptionCancelledError as e:
+            error = e
+            logger.info(f"Utterance {utterance.id} cancelled")
+        except Exception as e:
+            error = e
+            logger.error(f"Utterance {utterance.id} failed: {e}")
+
+        if utterance.on_done:
+            try:
+                utterance.on_done(utterance, result, error)
+            except Exception as e:
+                logger.error(f"Error in dictation callback: {e}")
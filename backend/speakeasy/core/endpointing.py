@@ -0,0 +1,188 @@
+"""
+Streaming end-of-speech detection (endpointing) for hands-free dictation.
+
+An energy-based voice activity detector runs on every block the microphone
+delivers. Once speech has been heard and is followed by a configurable window
+of silence, the utterance is considered finished: the recording is stopped
+and transcribed without a second hotkey press, and the trailing silence is
+trimmed so it never reaches the model.
+
+The speech threshold adapts to the room: a frame is speech when it is louder
+than both an absolute floor and the tracked noise floor plus a margin. The
+floor is calibrated on the first frames and capped, so a user who starts
+talking straight away isn't learned as the room's noise.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_SILENCE_MS = 700.0
+DEFAULT_THRESHOLD_DB = -45.0
+DEFAULT_MIN_SPEECH_MS = 200.0
+DEFAULT_SPEECH_MARGIN_DB = 10.0
+# Calibrated noise floors above this are taken to be speech, not the room
+DEFAULT_MAX_NOISE_DB = -30.0
+# Audio kept after the end of speech so trailing consonants aren't clipped
+DEFAULT_TAIL_MS = 200.0
+
+FRAME_MS = 20
+# The first frames after the hotkey set the room's noise floor (their minimum
+# level, capped at max_noise_db in case the user is already talking)
+CALIBRATION_FRAMES = 10
+# The noise floor follows quieter frames quickly and louder ones slowly (about
+# 10s to adapt to a louder room), so speech barely moves it
+NOISE_FALL = 0.2
+NOISE_RISE = 0.005
+
+
+@dataclass
+class EndpointConfig:
+    """Tunable thresholds of the end-of-speech detector."""
+
+    silence_ms: float = DEFAULT_SILENCE_MS  # Trailing silence that ends an utterance
+    threshold_db: float = DEFAULT_THRESHOLD_DB  # Frames quieter than this are never speech
+    min_speech_ms: float = DEFAULT_MIN_SPEECH_MS  # Speech needed before endpointing arms
+    speech_margin_db: float = DEFAULT_SPEECH_MARGIN_DB  # Required level above the noise floor
+    max_noise_db: float = DEFAULT_MAX_NOISE_DB  # Cap on the calibrated noise floor
+    tail_ms: float = DEFAULT_TAIL_MS  # Audio kept after the end of speech
+
+
+@dataclass
+class EndpointDecision:
+    """Where the detector found the end of an utterance, and how long it took."""
+
+    speech_start_s: float  # Position in the recording
+    speech_end_s: float
+    detected_at_s: float  # Position at which the trailing silence window was complete
+    decided_at: float = field(default_factory=time.monotonic)
+    finalize_ms: Optional[float] = None  # Decision to transcript (set after transcription)
+
+    @property
+    def detection_ms(self) -> float:
+        """Audio time from the end of speech to the decision."""
+        return (self.detected_at_s - self.speech_end_s) * 1000
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "speech_start_s": round(self.speech_start_s, 3),
+            "speech_end_s": round(self.speech_end_s, 3),
+            "detected_at_s": round(self.detected_at_s, 3),
+            "detection_ms": round(self.detection_ms, 1),
+            "finalize_ms": round(self.finalize_ms, 1) if self.finalize_ms is not None else None,
+        }
+
+
+class EndpointDetector:
+    """
+    Frame-level voice activity detector that reports the end of speech once.
+
+    Feed it consecutive blocks of one recording with process(); it returns an
+    EndpointDecision the first time the trailing silence window is complete.
+    """
+
+    def __init__(self, config: Optional[EndpointConfig] = None, sample_rate: int = 16000):
+        """
+        Initialize the detector.
+
+        Args:
+            config: Thresholds (defaults if None)
+            sample_rate: Sample rate of the audio that will be fed
+        """
+        self.config = config or EndpointConfig()
+        self.reset(sample_rate)
+
+    def reset(self, sample_rate: int) -> None:
+        """Start a new recording."""
+        self.sample_rate = sample_rate
+        self._frame_len = max(1, sample_rate * FRAME_MS // 1000)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._frames = 0
+        self._noise_db = self.config.threshold_db - self.config.speech_margin_db
+        self._speech_run = 0
+        self._silence_run = 0
+        self._speech_start: Optional[int] = None  # Frame index
+        self._speech_end: Optional[int] = None
+        self._decided = False
+
+    @property
+    def in_speech(self) -> bool:
+        """Whether speech has been detected and not yet followed by enough silence."""
+        return self._speech_start is not None and not self._decided
+
+    @property
+    def noise_floor_db(self) -> float:
+        """Current noise floor estimate."""
+        return self._noise_db
+
+    def process(self, samples: np.ndarray) -> Optional[EndpointDecision]:
+        """
+        Analyse the next block of audio.
+
+        Args:
+            samples: Float32 mono samples following the previous block
+
+        Returns:
+            The decision when the utterance has just ended, otherwise None
+        """
+        if self._decided:
+            return None
+
+        data = np.concatenate((self._pending, samples)) if len(self._pending) else samples
+        usable = len(data) - len(data) % self._frame_len
+        self._pending = data[usable:].copy()
+        if not usable:
+            return None
+
+        frames = data[:usable].reshape(-1, self._frame_len)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        levels_db = 20 * np.log10(rms + 1e-10)
+
+        cfg = self.config
+        min_speech_frames = max(1, int(cfg.min_speech_ms // FRAME_MS))
+        silence_frames = max(1, int(cfg.silence_ms // FRAME_MS))
+
+        for level in levels_db:
+            index = self._frames
+            self._frames += 1
+
+            if index < CALIBRATION_FRAMES:
+                floor = min(float(level), cfg.max_noise_db)
+                self._noise_db = floor if index == 0 else min(self._noise_db, floor)
+                threshold = max(cfg.threshold_db, self._noise_db + cfg.speech_margin_db)
+            else:
+                threshold = max(cfg.threshold_db, self._noise_db + cfg.speech_margin_db)
+                rate = NOISE_FALL if level < self._noise_db else NOISE_RISE
+                self._noise_db += rate * (float(level) - self._noise_db)
+
+            if level > threshold:
+                self._speech_run += 1
+                self._silence_run = 0
+                if self._speech_start is None and self._speech_run >= min_speech_frames:
+                    self._speech_start = index - self._speech_run + 1
+                if self._speech_start is not None:
+                    self._speech_end = index + 1
+                continue
+
+            self._speech_run = 0
+            if self._speech_start is None:
+                continue
+
+            self._silence_run += 1
+            if self._silence_run >= silence_frames:
+                self._decided = True
+                decision = EndpointDecision(
+                    speech_start_s=self._seconds(self._speech_start),
+                    speech_end_s=self._seconds(self._speech_end),
+                    detected_at_s=self._seconds(index + 1),
+                )
+                return decision
+
+        return None
+
+    def _seconds(self, frame_index: int) -> float:
+        """Position of a frame boundary in seconds."""
+        return frame_index * self._frame_len / self.sample_rate
@@ -5,14 +5,16 @@ Provides a unified interface for loading and running different model types.
 """
 
 import atexit
+import functools
 import hashlib
 import json
 import logging
 import os
 import pickle
 import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Optional, Set
@@ -21,6 +23,14 @@ import torch  # Ensure torch is imported for serialization
 import numpy as np
 import torch
 
+from .cancellation import CancellationToken, TranscriptionCancelledError
+from .compilation import (
+    DEFAULT_COMPILE_TIMEOUT_S,
+    CompileReport,
+    CompileStatus,
+    compile_in_background,
+)
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -77,6 +87,49 @@ atexit.register(_cleanup_temp_files_at_exit)
 logger = logging.getLogger(__name__)
 
 
+def get_model_cache_dir() -> Path:
+    """Get the directory used for serialized/optimized model artifacts."""
+    cache_dir = Path.home() / ".speakeasy" / "model_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def module_nbytes(module) -> int:
+    """
+    Estimate the in-memory size of a module's weights in bytes.
+
+    Walks the state dict rather than parameters() so that dynamically
+    quantized Linear layers (whose packed int8 weights are not parameters)
+    are counted too.
+    """
+
+    def _nbytes(value) -> int:
+        if isinstance(value, torch.Tensor):
+            return value.element_size() * value.nelement()
+        if isinstance(value, (tuple, list)):
+            return sum(_nbytes(v) for v in value)
+        return 0
+
+    return sum(_nbytes(v) for v in module.state_dict().values())
+
+
+def _serving(method):
+    """Count calls of a ModelWrapper method as requests in flight (see wait_idle)."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._idle:
+            self._requests_in_flight += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            with self._idle:
+                self._requests_in_flight -= 1
+                self._idle.notify_all()
+
+    return wrapper
+
+
 class ModelType(str, Enum):
     """Supported ASR model types."""
 
@@ -86,6 +139,17 @@ class ModelType(str, Enum):
     VOXTRAL = "voxtral"
 
 
+@dataclass
+class TranscriptionSegment:
+    """A timed segment of a transcript with the decoder's confidence scores."""
+
+    start: float  # Seconds from the start of the audio
+    end: float
+    text: str
+    avg_logprob: Optional[float] = None
+    no_speech_prob: Optional[float] = None
+
+
 @dataclass
 class TranscriptionResult:
     """Result from a transcription operation."""
@@ -95,6 +159,9 @@ class TranscriptionResult:
     language: Optional[str] = None
     model_used: Optional[str] = None
     processing_ms: Optional[int] = None  # Time taken to transcribe (for debugging)
+    segments: list[TranscriptionSegment] = field(default_factory=list)
+    from_cache: bool = False  # Served from the result cache (see result_cache.py)
+    trimmed_ms: int = 0  # Leading/trailing silence removed before inference (see silence.py)
 
 
 class ModelWrapper:
@@ -114,6 +181,8 @@ class ModelWrapper:
         model_name: str,
         device: str = "cuda",
         compute_type: Optional[str] = None,
+        use_torch_compile: bool = False,
+        compile_timeout_s: float = DEFAULT_COMPILE_TIMEOUT_S,
     ):
         """
         Initialize the model wrapper.
@@ -123,22 +192,54 @@ class ModelWrapper:
             model_name: Model name or HuggingFace repo ID
             device: Device to run on ('cuda' or 'cpu')
             compute_type: Compute precision ('float16', 'int8', etc.)
+            use_torch_compile: Compile the encoder/audio tower in the background
+                after loading (falls back to eager on failure or timeout)
+            compile_timeout_s: Maximum seconds to wait for compilation
         """
         self.model_type = ModelType(model_type.lower())
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
+        self.use_torch_compile = use_torch_compile
+        self.compile_timeout_s = compile_timeout_s
 
         self._model = None
         self._processor = None
         self._transcription_request_cls = None
         self._loaded = False
+        # Transcriptions running now; background compilation waits for none
+        self._requests_in_flight = 0
+        self._idle = threading.Condition()
+
+        # Populated when CPU int8 quantization is applied to a NeMo encoder
+        self.quantization_info: Optional[dict] = None
+        # Outcome of the opt-in torch.compile pass (None until load)
+        self.compile_report: Optional[CompileReport] = None
 
     @property
     def is_loaded(self) -> bool:
         """Check if model is currently loaded."""
         return self._loaded
 
+    @property
+    def batches_requests(self) -> bool:
+        """Check if transcribe_batch runs several clips in one model call (NeMo only)."""
+        return self.model_type in (ModelType.PARAKEET, ModelType.CANARY)
+
+    @property
+    def uses_cpu_quantization(self) -> bool:
+        """Check if this NeMo model should be dynamically quantized to int8 on CPU."""
+        return (
+            self.model_type in (ModelType.PARAKEET, ModelType.CANARY)
+            and self.device == "cpu"
+            and self.compute_type == "int8"
+        )
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no transcription is running; False if the timeout passed first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._requests_in_flight == 0, timeout)
+
     def load(
         self,
         progress_callback: Optional[ProgressCallback] = None,
@@ -184,6 +285,8 @@ class ModelWrapper:
         self._load_duration = time.time() - self._load_start_time
         logger.info(f"Model {self.model_name} loaded successfully in {self._load_duration:.2f}s")
 
+        self.compile_report = self._start_torch_compile()
+
         if self._load_duration > 20:
             logger.warning(
                 f"Model loading took {self._load_duration:.2f}s (target: <15s for cached)"
@@ -387,8 +490,7 @@ class ModelWrapper:
         # ---------------------------------------------------------------------
         # Optimization: Serialization Cache (Pickle/Dill)
         # ---------------------------------------------------------------------
-        cache_dir = Path.home() / ".speakeasy" / "model_cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_dir = get_model_cache_dir()
 
         # Create a hash of the model name to use as filename
         model_hash = hashlib.md5(self.model_name.encode()).hexdigest()
@@ -550,24 +652,15 @@ class ModelWrapper:
                 # Enable cudnn benchmarking for faster convolutions
                 torch.backends.cudnn.benchmark = True
 
-                # Try to use torch.compile for PyTorch 2.0+ (if available)
-                # Disabled due to potential hangs on Windows/WSL/CUDA-Python
-                if False and hasattr(torch, "compile") and hasattr(self._model, "encoder"):
-                    logger.info("Attempting torch.compile optimization...")
-                    try:
-                        # Compile encoder for faster inference
-                        # Note: This adds initial overhead but speeds up repeated calls
-                        # We only compile if we haven't already (pickle might save compiled state? No, usually not)
-                        # But re-compiling is safe.
-                        self._model.encoder = torch.compile(self._model.encoder)
-                        logger.info("Encoder compiled with torch.compile")
-                    except Exception as e:
-                        logger.debug(f"torch.compile skipped: {e}")
+                # torch.compile is opt-in (use_torch_compile) and runs in the
+                # background after load(), see _start_torch_compile()
 
                 logger.info("CUDA optimizations applied")
             except Exception as e:
                 logger.warning(f"Failed to apply some CUDA optimizations: {e}")
 
+        self._apply_cpu_quantization()
+
         total_duration = time.time() - load_start
         logger.info(f"Total Parakeet load time: {total_duration:.2f}s")
 
@@ -605,9 +698,202 @@ class ModelWrapper:
             torch.backends.cudnn.benchmark = True
             self._model = self._model.to(self.device)
 
+        self._apply_cpu_quantization()
+
         total_duration = time.time() - load_start
         logger.info(f"Total Canary load time: {total_duration:.2f}s")
 
+    def _checkpoint_fingerprint(self) -> Optional[str]:
+        """
+        Identify the checkpoint files the model was loaded from.
+
+        Combines the Hub snapshot revision with the size and mtime of each file
+        in it (a local checkpoint path is used as is). Returns None if the
+        checkpoint isn't on disk.
+        """
+        path = Path(self.model_name)
+        if not path.exists():
+            try:
+                from huggingface_hub import snapshot_download
+
+                path = Path(
+                    snapshot_download(
+                        repo_id=self.model_name, repo_type="model", local_files_only=True
+                    )
+                )
+            except Exception:
+                return None
+
+        root = path if path.is_dir() else path.parent
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        if not files:
+            return None
+        # The snapshot directory is named after the revision; its files link to
+        # the blobs, so stat() describes the weights themselves
+        parts = [path.name]
+        for file in files:
+            st = file.stat()
+            parts.append(f"{file.relative_to(root).as_posix()}:{st.st_size}:{st.st_mtime_ns}")
+        return ";".join(parts)
+
+    def _apply_cpu_quantization(self) -> None:
+        """
+        Apply PyTorch dynamic int8 quantization to a NeMo encoder on CPU.
+
+        Only the encoder's Linear layers are quantized (weights stored as int8,
+        activations quantized on the fly), which is where FastConformer spends
+        most of its CPU time. The quantized encoder is cached on disk, keyed by
+        the checkpoint it was made from, so later loads skip the quantization
+        pass. Opt-in via device="cpu" and compute_type="int8"; any failure
+        falls back to the fp32 encoder.
+        """
+        if self.compute_type == "int8" and self.device != "cpu":
+            if self.model_type in (ModelType.PARAKEET, ModelType.CANARY):
+                logger.warning(
+                    "int8 dynamic quantization is CPU-only for NeMo models; "
+                    f"keeping default precision on {self.device}"
+                )
+            return
+
+        if not self.uses_cpu_quantization or not hasattr(self._model, "encoder"):
+            return
+
+        # An updated checkpoint under the same name must not reuse stale weights,
+        # so without a checkpoint identity the cache is not used at all
+        checkpoint = self._checkpoint_fingerprint()
+        cache_path = None
+        if checkpoint is not None:
+            model_hash = hashlib.md5(f"{self.model_name}:{checkpoint}".encode()).hexdigest()
+            torch_version = torch.__version__.split("+")[0]
+            cache_path = (
+                get_model_cache_dir()
+                / f"{self.model_type.value}_{model_hash}_encoder_int8_torch{torch_version}.pt"
+            )
+        else:
+            logger.info("Checkpoint files not found, not caching the quantized encoder")
+
+        fp32_bytes = module_nbytes(self._model.encoder)
+        quant_start = time.time()
+        cached = False
+        quantized_encoder = None
+
+        if cache_path is not None and cache_path.exists() and cache_path.stat().st_size > 0:
+            try:
+                quantized_encoder = torch.load(cache_path, map_location="cpu", weights_only=False)
+                cached = True
+                logger.info(f"Loaded int8 encoder from cache: {cache_path}")
+            except Exception as e:
+                logger.warning(f"Failed to load quantized encoder cache: {e}. Re-quantizing.")
+                safe_delete(str(cache_path))
+
+        try:
+            if quantized_encoder is None:
+                logger.info("Applying dynamic int8 quantization to encoder Linear layers...")
+                quantized_encoder = torch.ao.quantization.quantize_dynamic(
+                    self._model.encoder.cpu().eval(),
+                    {torch.nn.Linear},
+                    dtype=torch.qint8,
+                )
+                if cache_path is not None:
+                    try:
+                        torch.save(quantized_encoder, cache_path)
+                        logger.info(f"Cached int8 encoder at {cache_path}")
+                    except Exception as e:
+                        logger.warning(f"Could not cache quantized encoder: {e}")
+                        safe_delete(str(cache_path))
+
+            self._model.encoder = quantized_encoder.eval()
+        except Exception as e:
+            logger.warning(f"Dynamic int8 quantization failed, using fp32 encoder: {e}")
+            return
+
+        int8_bytes = module_nbytes(self._model.encoder)
+        self.quantization_info = {
+            "mode": "dynamic_int8",
+            "scope": "encoder.Linear",
+            "from_cache": cached,
+            "duration_s": round(time.time() - quant_start, 2),
+            "fp32_encoder_mb": round(fp32_bytes / (1024**2), 1),
+            "int8_encoder_mb": round(int8_bytes / (1024**2), 1),
+        }
+        logger.info(
+            f"Encoder quantized: {self.quantization_info['fp32_encoder_mb']}MB (fp32) -> "
+            f"{self.quantization_info['int8_encoder_mb']}MB (int8) "
+            f"in {self.quantization_info['duration_s']:.2f}s"
+        )
+
+    def _start_torch_compile(self) -> CompileReport:
+        """
+        Kick off background torch.compile of the model's heaviest torch module.
+
+        NeMo models compile their encoder, Voxtral compiles its audio tower.
+        Whisper runs on CTranslate2 and is never compiled.
+
+        Returns:
+            CompileReport describing whether compilation is used (updated in
+            place once the background compile finishes)
+        """
+        label = f"{self.model_type.value}:{self.model_name}"
+
+        if not self.use_torch_compile:
+            return CompileReport(label=label, device=self.device)
+
+        if self.model_type == ModelType.WHISPER:
+            report = CompileReport(label=label, device=self.device)
+            report.finish(CompileStatus.SKIPPED, "CTranslate2 models cannot be torch-compiled")
+            return report
+
+        target = self._model
+        if self.model_type in (ModelType.PARAKEET, ModelType.CANARY):
+            attr = "encoder"
+            module = getattr(target, attr, None)
+            feat_in = getattr(module, "_feat_in", None)
+            if module is None or feat_in is None:
+                report = CompileReport(label=label, device=self.device)
+                report.finish(CompileStatus.SKIPPED, "encoder input size unknown")
+                return report
+
+            def warmup(encoder):
+                # ~10s of 10ms feature frames
+                signal = torch.randn(1, feat_in, 1000, device=self.device)
+                length = torch.tensor([1000], device=self.device)
+                encoder(audio_signal=signal, length=length)
+
+        elif self.model_type == ModelType.VOXTRAL:
+            attr = "audio_tower"
+            module = getattr(target, attr, None)
+            if module is None:
+                report = CompileReport(label=label, device=self.device)
+                report.finish(CompileStatus.SKIPPED, "model has no audio_tower")
+                return report
+            num_mel_bins = getattr(self._processor.feature_extractor, "feature_size", 128)
+
+            def warmup(audio_tower):
+                # One 30s Whisper-style window of log-mel features
+                features = torch.randn(
+                    1, num_mel_bins, 3000, device=target.device, dtype=target.dtype
+                )
+                audio_tower(features)
+
+        else:
+            return CompileReport(label=label, device=self.device)
+
+        def install(compiled) -> None:
+            if self._model is not target:
+                raise RuntimeError("model was unloaded before compilation finished")
+            setattr(target, attr, compiled)
+
+        logger.info(f"Compiling {attr} of {self.model_name} in the background...")
+        return compile_in_background(
+            module,
+            warmup=warmup,
+            on_compiled=install,
+            label=label,
+            device=self.device,
+            timeout_s=self.compile_timeout_s,
+            wait_idle=self.wait_idle,
+        )
+
     def _load_voxtral(
         self,
         progress_callback: Optional[ProgressCallback] = None,
@@ -670,12 +956,14 @@ class ModelWrapper:
                 device_map="cuda",
             ).eval()
 
+    @_serving
     def transcribe(
         self,
         audio_data: "NDArray[np.float32]",
         sample_rate: int = 16000,
         language: Optional[str] = None,
         instruction: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> TranscriptionResult:
         """
         Transcribe audio data and return result.
@@ -685,26 +973,37 @@ class ModelWrapper:
             sample_rate: Sample rate in Hz (default 16000)
             language: Language code or 'auto' for auto-detection
             instruction: Optional instruction or system prompt
+            cancel_token: Optional token checked between Whisper segments and
+                Voxtral chunks (Parakeet and Canary run in one call)
 
         Returns:
             TranscriptionResult with transcribed text and metadata
+
+        Raises:
+            TranscriptionCancelledError: If the token is cancelled or its deadline passes
         """
         if not self._loaded:
             raise RuntimeError("Model not loaded. Call load() first.")
+        if cancel_token:
+            cancel_token.check()
 
         import time
 
         start_time = time.perf_counter()
+        # Filled in by engines that detect the language themselves
+        details: dict = {}
 
         try:
             if self.model_type == ModelType.WHISPER:
-                text = self._transcribe_whisper(audio_data, language)
+                text = self._transcribe_whisper(audio_data, language, details, cancel_token)
             elif self.model_type == ModelType.PARAKEET:
                 text = self._transcribe_parakeet(audio_data, sample_rate)
             elif self.model_type == ModelType.CANARY:
                 text = self._transcribe_canary(audio_data, sample_rate, language)
             elif self.model_type == ModelType.VOXTRAL:
-                text = self._transcribe_voxtral(audio_data, sample_rate, language, instruction)
+                text = self._transcribe_voxtral(
+                    audio_data, sample_rate, language, instruction, cancel_token
+                )
             else:
                 raise ValueError(f"Unknown model type: {self.model_type}")
 
@@ -713,25 +1012,260 @@ class ModelWrapper:
             return TranscriptionResult(
                 text=text.strip(),
                 duration_ms=duration_ms,
-                language=language,
+                language=details.get("language") or language,
                 model_used=self.model_name,
             )
 
+        except TranscriptionCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             raise
 
-    def _transcribe_whisper(
-        self, audio_data: "NDArray[np.float32]", language: Optional[str]
-    ) -> str:
-        """Transcribe using Faster-Whisper."""
-        segments, _ = self._model.transcribe(
+    @_serving
+    def transcribe_batch(
+        self,
+        audio_batch: list["NDArray[np.float32]"],
+        sample_rate: int = 16000,
+        languages: Optional[list[Optional[str]]] = None,
+        cancel_tokens: Optional[list[Optional[CancellationToken]]] = None,
+    ) -> list[TranscriptionResult | TranscriptionCancelledError]:
+        """
+        Transcribe several independent clips in as few model calls as possible.
+
+        Parakeet and Canary run each batch through a single NeMo transcribe()
+        call (Canary once per language pair). Whisper (CTranslate2) and Voxtral
+        have no cross-request batching here and are transcribed one clip at a time.
+
+        A NeMo call can't be interrupted, so cancel tokens are checked before
+        each call (each language pair for Canary, each clip otherwise): a clip
+        cancelled by then is left out and gets its TranscriptionCancelledError.
+
+        Args:
+            audio_batch: List of audio arrays (float32, mono)
+            sample_rate: Sample rate in Hz shared by all clips
+            languages: Optional per-clip language codes (defaults to auto)
+            cancel_tokens: Optional per-clip cancellation tokens
+
+        Returns:
+            One TranscriptionResult (or TranscriptionCancelledError) per clip, in input order
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        languages = languages or [None] * len(audio_batch)
+        if len(languages) != len(audio_batch):
+            raise ValueError("languages must have one entry per clip")
+        cancel_tokens = cancel_tokens or [None] * len(audio_batch)
+        if len(cancel_tokens) != len(audio_batch):
+            raise ValueError("cancel_tokens must have one entry per clip")
+
+        outcomes: list[Optional[TranscriptionResult | TranscriptionCancelledError]]
+        outcomes = [None] * len(audio_batch)
+
+        def live(indices: list[int]) -> list[int]:
+            """Clips still wanted; the others get their cancellation error."""
+            kept = []
+            for i in indices:
+                try:
+                    if cancel_tokens[i]:
+                        cancel_tokens[i].check()
+                    kept.append(i)
+                except TranscriptionCancelledError as e:
+                    outcomes[i] = e
+            return kept
+
+        if not self.batches_requests or len(audio_batch) < 2:
+            for i in range(len(audio_batch)):
+                if not live([i]):
+                    continue
+                # Only passed when set, like the scheduler does
+                kwargs = {"cancel_token": cancel_tokens[i]} if cancel_tokens[i] else {}
+                try:
+                    outcomes[i] = self.transcribe(
+                        audio_batch[i], sample_rate=sample_rate, language=languages[i], **kwargs
+                    )
+                except TranscriptionCancelledError as e:
+                    outcomes[i] = e
+            return outcomes
+
+        start_time = time.perf_counter()
+        texts: list[str] = [""] * len(audio_batch)
+
+        # Canary takes one source/target pair per call, so batch per language
+        groups: dict[tuple[str, str], list[int]] = {}
+        for i, language in enumerate(languages):
+            pair = self._canary_langs(language) if self.model_type == ModelType.CANARY else ()
+            groups.setdefault(pair, []).append(i)
+        for pair, indices in groups.items():
+            indices = live(indices)
+            if not indices:
+                continue
+            langs = dict(zip(("source_lang", "target_lang"), pair))
+            group_texts = self._transcribe_nemo_batch(
+                [audio_batch[i] for i in indices], sample_rate, **langs
+            )
+            for i, text in zip(indices, group_texts):
+                texts[i] = text
+
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
+        return [
+            outcome
+            if outcome is not None
+            else TranscriptionResult(
+                text=text.strip(),
+                duration_ms=duration_ms,
+                language=language,
+                model_used=self.model_name,
+            )
+            for outcome, text, language in zip(outcomes, texts, languages)
+        ]
+
+    def _transcribe_nemo_batch(
+        self,
+        audio_batch: list["NDArray[np.float32]"],
+        sample_rate: int,
+        **transcribe_kwargs,
+    ) -> list[str]:
+        """Transcribe several clips with one NeMo transcribe() call over a shared manifest."""
+        import soundfile as sf
+
+        temp_wav_paths: list[str] = []
+        temp_manifest_path = None
+        try:
+            manifest_data = []
+            for audio_data in audio_batch:
+                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+                    temp_wav_paths.append(f.name)
+                    sf.write(f.name, audio_data, sample_rate)
+                manifest_data.append(
+                    {
+                        "audio_filepath": f.name,
+                        "text": "",
+                        "duration": len(audio_data) / sample_rate,
+                    }
+                )
+            temp_manifest_path = safe_write_manifest(manifest_data)
+
+            with torch.inference_mode():
+                out = self._model.transcribe(
+                    temp_manifest_path, batch_size=len(audio_batch), **transcribe_kwargs
+                )
+            texts = [hyp.text if hasattr(hyp, "text") else str(hyp) for hyp in (out or [])]
+            return texts + [""] * (len(audio_batch) - len(texts))
+
+        finally:
+            for path in temp_wav_paths:
+                safe_delete(path)
+            safe_delete(temp_manifest_path)
+
+    def transcribe_segments(
+        self,
+        audio_data: "NDArray[np.float32]",
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe audio and keep per-segment timings and confidence scores.
+
+        Only Whisper exposes avg_logprob/no_speech_prob, so this is limited
+        to Whisper models.
+
+        Args:
+            audio_data: Numpy array of audio samples (float32, mono, 16kHz)
+            sample_rate: Sample rate in Hz (default 16000)
+            language: Language code or 'auto' for auto-detection
+            cancel_token: Optional token checked between decoded segments
+
+        Returns:
+            TranscriptionResult with segments and the detected language
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load() first.")
+        if self.model_type != ModelType.WHISPER:
+            raise ValueError(f"Segment confidence is not available for {self.model_type.value}")
+
+        start_time = time.perf_counter()
+        segments, detected_language = self._whisper_segments(audio_data, language, cancel_token)
+
+        return TranscriptionResult(
+            text=" ".join(s.text for s in segments if s.text).strip(),
+            duration_ms=int((time.perf_counter() - start_time) * 1000),
+            language=detected_language,
+            model_used=self.model_name,
+            segments=segments,
+        )
+
+    def detect_language(
+        self, audio_data: "NDArray[np.float32]"
+    ) -> tuple[Optional[str], float]:
+        """
+        Identify the spoken language with Whisper's language-ID head.
+
+        Only the first 30s window is used, so callers should pass a short clip.
+
+        Args:
+            audio_data: Numpy array of audio samples (float32, mono, 16kHz)
+
+        Returns:
+            Tuple of (language code or None, probability)
+        """
+        if not self._loaded:
+            raise RuntimeError("Model not loaded. Call load() first.")
+        if self.model_type != ModelType.WHISPER:
+            raise ValueError(f"Language detection is not available for {self.model_type.value}")
+
+        if hasattr(self._model, "detect_language"):
+            language, probability, _ = self._model.detect_language(audio_data)
+            return language, float(probability)
+
+        # Older faster-whisper: transcribe() detects the language before decoding lazily
+        _, info = self._model.transcribe(audio_data, beam_size=1, without_timestamps=True)
+        return info.language, float(info.language_probability)
+
+    def _whisper_segments(
+        self,
+        audio_data: "NDArray[np.float32]",
+        language: Optional[str],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> tuple[list[TranscriptionSegment], Optional[str]]:
+        """Run Faster-Whisper and return (segments, detected language)."""
+        segments, info = self._model.transcribe(
             audio_data,
             beam_size=5,
             condition_on_previous_text=False,
             language=(language if language and language != "auto" else None),
         )
-        return " ".join(segment.text.strip() for segment in segments)
+        # Faster-Whisper decodes lazily, one 30s window per step of the
+        # generator, so stopping the iteration stops the decoding
+        result = []
+        for segment in segments:
+            if cancel_token:
+                cancel_token.check()
+            result.append(
+                TranscriptionSegment(
+                    start=segment.start,
+                    end=segment.end,
+                    text=segment.text.strip(),
+                    avg_logprob=segment.avg_logprob,
+                    no_speech_prob=segment.no_speech_prob,
+                )
+            )
+        return result, getattr(info, "language", None)
+
+    def _transcribe_whisper(
+        self,
+        audio_data: "NDArray[np.float32]",
+        language: Optional[str],
+        details: Optional[dict] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> str:
+        """Transcribe using Faster-Whisper, recording the detected language in `details`."""
+        segments, detected_language = self._whisper_segments(audio_data, language, cancel_token)
+        if details is not None and detected_language:
+            details["language"] = detected_language
+        return " ".join(segment.text for segment in segments)
 
     def _transcribe_parakeet(self, audio_data: "NDArray[np.float32]", sample_rate: int) -> str:
         """Transcribe using NVIDIA Parakeet."""
@@ -764,6 +1298,14 @@ class ModelWrapper:
             safe_delete(temp_wav_path)
             safe_delete(temp_manifest_path)
 
+    @staticmethod
+    def _canary_langs(language: Optional[str]) -> tuple[str, str]:
+        """Split a Canary "source-target" language code, defaulting to English ASR."""
+        lang_parts = (language or "en-en").split("-")
+        if len(lang_parts) != 2:
+            return "en", "en"
+        return lang_parts[0], lang_parts[1]
+
     def _transcribe_canary(
         self,
         audio_data: "NDArray[np.float32]",
@@ -773,12 +1315,7 @@ class ModelWrapper:
         """Transcribe using NVIDIA Canary."""
         import soundfile as sf
 
-        lang = language or "en-en"
-        lang_parts = lang.split("-")
-        if len(lang_parts) != 2:
-            source_lang, target_lang = "en", "en"
-        else:
-            source_lang, target_lang = lang_parts
+        source_lang, target_lang = self._canary_langs(language)
 
         temp_wav_path = None
         temp_manifest_path = None
@@ -816,6 +1353,7 @@ class ModelWrapper:
         sample_rate: int,
         language: Optional[str],
         instruction: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Transcribe using Mistral Voxtral with chunking for long audio."""
         MAX_DURATION_SECONDS = 30
@@ -834,6 +1372,8 @@ class ModelWrapper:
 
             full_text = ""
             for i, chunk in enumerate(chunks):
+                if cancel_token:
+                    cancel_token.check()
                 try:
                     # Pass instruction to each chunk? Or maybe only the first?
                     # For consistency, passing to all chunks ensures style/grammar correction applies to all.
@@ -0,0 +1,272 @@
+"""
+Persistent cache of file transcripts, keyed by audio content.
+
+Batch jobs over shared drives often contain the same recording several times,
+and folders get imported again. ResultCache stores each transcript in SQLite
+(result_cache.db, next to the history database) under a key made of a
+BLAKE2 hash of the file's bytes and everything that changes the output: the
+engine (model, cascade, routing), compute type, language and instruction.
+A copy of a file, in any folder, is served from the cache.
+
+File hashes are remembered by path, size and modification time, so a file is
+read once; only the most recently hashed max_entries paths are kept. Uploads
+are hashed from the open file and not remembered. Identical requests that
+arrive while the first is still being transcribed wait for it instead of
+running the model again.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import replace
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+from .cancellation import CancellationToken
+from .models import TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when transcription changes in a way that invalidates stored results
+CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 50_000
+HASH_BLOCK_BYTES = 1024 * 1024
+# How often a request waiting on an identical one checks its own cancellation
+WAIT_POLL_S = 0.1
+
+
+class ResultCache:
+    """Transcripts of audio files in SQLite, with coalescing of identical requests."""
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite database file
+            max_entries: Results (and remembered file hashes) kept; the least
+                recently used are deleted beyond it
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from the worker threads of transcribe_file, always under _db_lock
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    digest TEXT NOT NULL
+                )
+            """)
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    duration_ms INTEGER NOT NULL,
+                    language TEXT,
+                    model_used TEXT,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used)"
+            )
+            self._db.commit()
+
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # Requests that waited for an identical one
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._db_lock:
+            self._db.close()
+
+    def content_hash(self, path: "str | BinaryIO") -> str:
+        """
+        BLAKE2 digest of a file's bytes (remembered while the file is unchanged).
+
+        An open binary file is hashed from its start and not remembered.
+        """
+        if not isinstance(path, str):
+            path.seek(0)
+            return self._digest(path)
+
+        resolved = str(Path(path).resolve())
+        st = Path(resolved).stat()
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT digest FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (resolved, st.st_size, st.st_mtime_ns),
+            ).fetchone()
+        if row:
+            return row[0]
+
+        with open(resolved, "rb") as f:
+            value = self._digest(f)
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)",
+                (resolved, st.st_size, st.st_mtime_ns, value),
+            )
+            # Rowids grow with every insert (a replaced row gets a new one)
+            self._db.execute(
+                "DELETE FROM file_hashes WHERE rowid <= (SELECT MAX(rowid) FROM file_hashes) - ?",
+                (self.max_entries,),
+            )
+            self._db.commit()
+        return value
+
+    @staticmethod
+    def _digest(f: BinaryIO) -> str:
+        """BLAKE2 digest of the rest of an open file."""
+        digest = hashlib.blake2b(digest_size=16)
+        while block := f.read(HASH_BLOCK_BYTES):
+            digest.update(block)
+        return digest.hexdigest()
+
+    def key(
+        self,
+        digest: str,
+        engine: str,
+        language: Optional[str],
+        instruction: Optional[str],
+    ) -> str:
+        """
+        Cache key of a request.
+
+        Args:
+            digest: Content hash of the audio file
+            engine: Description of the model setup (see TranscriberService)
+            language: Requested language ("auto" and None are the same request)
+            instruction: Optional instruction
+        """
+        parts = [str(CACHE_VERSION), digest, engine, language or "auto", instruction or ""]
+        return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[TranscriptionResult]:
+        """Stored result for `key` (without segments), or None."""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT text, duration_ms, language, model_used FROM results WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        text, duration_ms, language, model_used = row
+        return TranscriptionResult(
+            text=text,
+            duration_ms=duration_ms,
+            language=language,
+            model_used=model_used,
+            from_cache=True,
+        )
+
+    def put(self, key: str, result: TranscriptionResult) -> None:
+        """Store a result, deleting the least recently used beyond max_entries."""
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    result.text,
+                    result.duration_ms,
+                    result.language,
+                    result.model_used,
+                    time.time(),
+                ),
+            )
+            self._db.execute(
+                """
+                DELETE FROM results WHERE key IN (
+                    SELECT key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+    def run(
+        self,
+        key: str,
+        transcribe: Callable[[], TranscriptionResult],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> TranscriptionResult:
+        """
+        Cached result for `key`, or the result of `transcribe()`, stored.
+
+        If an identical request is already running, wait for its result
+        instead (still honouring `cancel_token`); if it fails, transcribe here.
+
+        Raises:
+            TranscriptionCancelledError: If the token is cancelled while waiting
+        """
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            with self._inflight_lock:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._inflight[key] = Future()
+
+            if leader:
+                break
+            result = self._wait(future, cancel_token)
+            if result is not None:
+                self.coalesced += 1
+                return result
+            # The first request failed or was cancelled: try again ourselves
+
+        self.misses += 1
+        try:
+            result = transcribe()
+            self.put(key, result)
+        except BaseException as e:
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.set_result(result)
+        return result
+
+    def _wait(
+        self, future: Future, cancel_token: Optional[CancellationToken]
+    ) -> Optional[TranscriptionResult]:
+        """Wait for another request's result (None if it failed)."""
+        while not future.done():
+            if cancel_token:
+                cancel_token.check()
+            wait([future], timeout=WAIT_POLL_S)
+        if future.exception() is not None:
+            return None
+        return replace(future.result(), from_cache=True)
+
+    def stats(self) -> dict:
+        """Entry count and hit counts, for the metrics endpoint."""
+        with self._db_lock:
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM results").fetchone()
+        lookups = self.hits + self.coalesced + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else None,
+        }
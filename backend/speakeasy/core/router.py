@@ -0,0 +1,272 @@
+"""
+Language-aware model router.
+
+Runs cheap language identification (Whisper tiny) on the first seconds of
+audio and sends the request to the fastest resident model that supports the
+detected language, e.g. English to Parakeet and Japanese to Whisper.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from .config import get_languages_for_model, get_model_speed_rank
+from .models import ModelType, TranscriptionResult
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .cancellation import CancellationToken
+    from .models import ModelWrapper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RouteDecision:
+    """Which model handles a request, and why."""
+
+    model: "ModelWrapper"
+    language: Optional[str]
+    reason: str  # "explicit", "rule", "fastest", "fallback", "low_confidence"
+    lid_probability: Optional[float] = None
+    lid_ms: Optional[float] = None
+
+
+@dataclass
+class RoutingMetrics:
+    """Cumulative routing statistics."""
+
+    requests: int = 0
+    lid_runs: int = 0
+    lid_ms: float = 0.0
+    by_language: Counter = field(default_factory=Counter)
+    by_model: Counter = field(default_factory=Counter)
+    by_reason: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "requests": self.requests,
+            "lid_runs": self.lid_runs,
+            "lid_avg_ms": round(self.lid_ms / self.lid_runs, 1) if self.lid_runs else None,
+            "by_language": dict(self.by_language),
+            "by_model": dict(self.by_model),
+            "by_reason": dict(self.by_reason),
+        }
+
+
+class ModelRouter:
+    """
+    Routes transcription requests between resident models by spoken language.
+
+    Routing order for a request:
+    1. An explicit (non-"auto") language skips identification.
+    2. A rule for the language (language -> model name) wins if that model is resident.
+    3. Otherwise the fastest resident model supporting the language is used.
+    4. If nothing supports it, or identification is unsure, the primary model is used.
+
+    Exposes the same transcribe() signature as ModelWrapper.
+    """
+
+    def __init__(
+        self,
+        primary: "ModelWrapper",
+        lid_model: "ModelWrapper",
+        models: Optional[list["ModelWrapper"]] = None,
+        rules: Optional[dict[str, str]] = None,
+        lid_seconds: float = 3.0,
+        min_lid_probability: float = 0.5,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            primary: The user's selected model, used as the fallback
+            lid_model: Loaded Whisper model used for language identification
+            models: Additional resident models to route between
+            rules: Mapping of language code to preferred model name ("*" matches any)
+            lid_seconds: Seconds of audio from the start used for identification
+            min_lid_probability: Below this the detection is ignored
+        """
+        if lid_model.model_type != ModelType.WHISPER:
+            raise ValueError("The language identification model must be a Whisper model")
+
+        self.primary = primary
+        self.lid_model = lid_model
+        self.models: list["ModelWrapper"] = list(models or [])
+        self.rules = dict(rules or {})
+        self.lid_seconds = lid_seconds
+        self.min_lid_probability = min_lid_probability
+
+        self._metrics = RoutingMetrics()
+        self._metrics_lock = threading.Lock()
+
+    @property
+    def model_name(self) -> str:
+        """Name of the fallback model."""
+        return self.primary.model_name
+
+    @property
+    def cache_signature(self) -> str:
+        """The models, rules and thresholds a transcript depends on (for the result cache)."""
+        models = ",".join(m.model_name for m in self.resident_models)
+        rules = ",".join(f"{k}={v}" for k, v in sorted(self.rules.items()))
+        return (
+            f"{self.model_name}:models={models}:rules={rules}:"
+            f"lid={self.lid_model.model_name}/{self.lid_seconds}/{self.min_lid_probability}"
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the primary and language identification models are loaded."""
+        return self.primary.is_loaded and self.lid_model.is_loaded
+
+    @property
+    def resident_models(self) -> list["ModelWrapper"]:
+        """Loaded models eligible for routing, primary first."""
+        candidates = [self.primary] + [m for m in self.models if m is not self.primary]
+        return [m for m in candidates if m.is_loaded]
+
+    def get_metrics(self) -> dict:
+        """Get a snapshot of the cumulative routing metrics."""
+        with self._metrics_lock:
+            return self._metrics.to_dict()
+
+    @staticmethod
+    def supports(model: "ModelWrapper", language: str) -> bool:
+        """Check whether a model supports a language code."""
+        return language in get_languages_for_model(model.model_type.value, model.model_name)
+
+    def identify_language(
+        self, audio_data: "NDArray[np.float32]", sample_rate: int
+    ) -> tuple[Optional[str], float, float]:
+        """
+        Run language identification on the start of the audio.
+
+        Returns:
+            Tuple of (language code or None, probability, elapsed ms)
+        """
+        clip = audio_data[: int(self.lid_seconds * sample_rate)]
+        start = time.perf_counter()
+        language, probability = self.lid_model.detect_language(clip)
+        return language, probability, (time.perf_counter() - start) * 1000
+
+    def route(
+        self,
+        audio_data: "NDArray[np.float32]",
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+    ) -> RouteDecision:
+        """
+        Pick the model for a request.
+
+        Args:
+            audio_data: Numpy array of audio samples (float32, mono, 16kHz)
+            sample_rate: Sample rate in Hz
+            language: Requested language code or 'auto'
+
+        Returns:
+            RouteDecision with the chosen model and language
+        """
+        if language and language != "auto":
+            return self._choose(language, reason="explicit")
+
+        detected, probability, lid_ms = self.identify_language(audio_data, sample_rate)
+        with self._metrics_lock:
+            self._metrics.lid_runs += 1
+            self._metrics.lid_ms += lid_ms
+
+        if not detected or probability < self.min_lid_probability:
+            return RouteDecision(
+                model=self.primary,
+                language=language,
+                reason="low_confidence",
+                lid_probability=probability,
+                lid_ms=lid_ms,
+            )
+
+        decision = self._choose(detected)
+        decision.lid_probability = probability
+        decision.lid_ms = lid_ms
+        return decision
+
+    def _choose(self, language: str, reason: Optional[str] = None) -> RouteDecision:
+        """Choose a resident model for a known language."""
+        resident = self.resident_models
+
+        preferred = self.rules.get(language, self.rules.get("*"))
+        if preferred:
+            for model in resident:
+                if model.model_name == preferred and self.supports(model, language):
+                    return RouteDecision(model=model, language=language, reason=reason or "rule")
+
+        supporting = [m for m in resident if self.supports(m, language)]
+        if supporting:
+            # Stable sort keeps the primary model first among equally fast models
+            fastest = min(
+                supporting, key=lambda m: get_model_speed_rank(m.model_type.value, m.model_name)
+            )
+            return RouteDecision(model=fastest, language=language, reason=reason or "fastest")
+
+        return RouteDecision(model=self.primary, language=language, reason=reason or "fallback")
+
+    def transcribe(
+        self,
+        audio_data: "NDArray[np.float32]",
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        cancel_token: Optional["CancellationToken"] = None,
+    ) -> TranscriptionResult:
+        """
+        Route the request and transcribe it with the chosen model.
+
+        Args:
+            audio_data: Numpy array of audio samples (float32, mono)
+            sample_rate: Sample rate in Hz (default 16000)
+            language: Language code or 'auto' for auto-detection
+            instruction: Optional instruction or system prompt
+            cancel_token: Optional cancellation token passed to the chosen model
+
+        Returns:
+            TranscriptionResult from the chosen model
+        """
+        decision = self.route(audio_data, sample_rate, language)
+
+        with self._metrics_lock:
+            self._metrics.requests += 1
+            self._metrics.by_language[decision.language or "unknown"] += 1
+            self._metrics.by_model[decision.model.model_name] += 1
+            self._metrics.by_reason[decision.reason] += 1
+
+        logger.debug(
+            f"Routed {len(audio_data) / sample_rate:.1f}s audio ({decision.language}, "
+            f"{decision.reason}) to {decision.model.model_name}"
+        )
+
+        return decision.model.transcribe(
+            audio_data=audio_data,
+            sample_rate=sample_rate,
+            language=self.model_language(decision.model, decision.language),
+            instruction=instruction,
+            cancel_token=cancel_token,
+        )
+
+    @staticmethod
+    def model_language(model: "ModelWrapper", language: Optional[str]) -> Optional[str]:
+        """
+        The language argument a model expects for a (detected) language code.
+
+        Canary takes "source-target" pairs and reads a bare code as English, so
+        "de" becomes "de-de" (German ASR).
+        """
+        if model.model_type == ModelType.CANARY and language and language != "auto":
+            if "-" not in language:
+                return f"{language}-{language}"
+        return language
@@ -0,0 +1,459 @@
+"""
+Priority inference queue with dynamic micro-batching for transcription requests.
+
+All callers (dictation, batch files, chunks of long recordings) submit
+requests to one queue instead of calling the model directly, so a single
+worker owns the model. Interactive requests are always served before batch
+requests; batch work is submitted in chunks, so dictation waits for at most
+one in-flight batch chunk.
+
+When batching is enabled the worker collects requests of the same priority
+for up to `max_wait_ms` (or until `max_batch_size` is reached), runs them as
+one batched model call and resolves each caller's future. A request's
+latency target closes the batching window early so batching never makes it
+late just to fill a batch. Engines that can't batch (no transcribe_batch, or
+one that runs the clips one by one, like Whisper's) skip the window: waiting
+for a batch would only add latency.
+
+Requests may carry a CancellationToken: cancelled requests are dropped from
+the queue before they reach the model, and the token is passed to the engine
+so a running request stops at its next segment or chunk (batched calls take
+one token per clip and check them before each model call).
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import numpy as np
+
+from .cancellation import CancellationToken, TranscriptionCancelledError
+from .models import TranscriptionResult
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_WAIT_MS = 20.0
+# Latency target of interactive (dictation) requests
+INTERACTIVE_LATENCY_TARGET_MS = 500.0
+
+# Number of recent requests per priority kept for percentile metrics
+LATENCY_WINDOW = 1000
+
+
+class Priority(str, Enum):
+    """Scheduling class of a request; interactive work always runs first."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+    @property
+    def rank(self) -> int:
+        """Lower ranks are served first."""
+        return 0 if self == Priority.INTERACTIVE else 1
+
+
+@dataclass
+class InferenceRequest:
+    """A queued transcription request."""
+
+    audio_data: "NDArray[np.float32]"
+    sample_rate: int
+    language: Optional[str]
+    instruction: Optional[str]
+    enqueued_at: float
+    deadline: Optional[float] = None  # time.monotonic() by which a result is wanted
+    priority: Priority = Priority.INTERACTIVE
+    cancel_token: Optional[CancellationToken] = None
+    future: Future = field(default_factory=Future)
+
+    @property
+    def batch_key(self) -> tuple:
+        """Requests can share a batch only if these match."""
+        return (self.priority, self.sample_rate, self.instruction)
+
+
+def _percentile(values: deque, q: float) -> Optional[float]:
+    """Percentile of recent values, rounded for reporting."""
+    if not values:
+        return None
+    return round(float(np.percentile(np.fromiter(values, dtype=np.float64), q)), 2)
+
+
+@dataclass
+class PriorityStats:
+    """Recent queue wait and end-to-end latency for one priority class."""
+
+    requests: int = 0
+    queue_wait_ms: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    latency_ms: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "requests": self.requests,
+            "queue_wait_p50_ms": _percentile(self.queue_wait_ms, 50),
+            "queue_wait_p95_ms": _percentile(self.queue_wait_ms, 95),
+            "latency_p50_ms": _percentile(self.latency_ms, 50),
+            "latency_p95_ms": _percentile(self.latency_ms, 95),
+        }
+
+
+@dataclass
+class SchedulerMetrics:
+    """Cumulative scheduler statistics."""
+
+    requests: int = 0
+    batches: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    audio_s: float = 0.0
+    queue_wait_ms: float = 0.0
+    inference_ms: float = 0.0
+    missed_deadlines: int = 0
+    batch_sizes: Counter = field(default_factory=Counter)
+    by_priority: dict[Priority, PriorityStats] = field(
+        default_factory=lambda: {p: PriorityStats() for p in Priority}
+    )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "avg_batch_size": round(self.requests / self.batches, 2) if self.batches else None,
+            "avg_queue_wait_ms": round(self.queue_wait_ms / self.requests, 2)
+            if self.requests
+            else None,
+            "missed_deadlines": self.missed_deadlines,
+            # Seconds of audio transcribed per second of model time
+            "throughput_x_realtime": round(self.audio_s / (self.inference_ms / 1000), 2)
+            if self.inference_ms
+            else None,
+            "batch_sizes": {str(k): v for k, v in sorted(self.batch_sizes.items())},
+            "priorities": {p.value: stats.to_dict() for p, stats in self.by_priority.items()},
+        }
+
+
+class InferenceScheduler:
+    """
+    Priority queue in front of the model that runs requests in micro-batches.
+
+    Exposes the same transcribe() signature as ModelWrapper, so it can stand
+    in for the model. The engine is looked up per batch, so the scheduler
+    keeps working across model reloads.
+    """
+
+    # Smoothing factor for the per-batch inference time estimate
+    LATENCY_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        get_engine: Callable[[], Any],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        """
+        Initialize the scheduler and start its worker thread.
+
+        Args:
+            get_engine: Returns the object that runs inference (a ModelWrapper or
+                anything with transcribe() and optionally transcribe_batch())
+            max_batch_size: Maximum number of requests per model call
+            max_wait_ms: Maximum time the first request waits for others to join
+        """
+        self._get_engine = get_engine
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+
+        self._queue: deque[InferenceRequest] = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self._batch_ms_estimate: Optional[float] = None
+
+        self._metrics = SchedulerMetrics()
+        self._metrics_lock = threading.Lock()
+
+        self._worker = threading.Thread(target=self._run, name="inference-scheduler", daemon=True)
+        self._worker.start()
+
+    @property
+    def model_name(self) -> Optional[str]:
+        """Name of the engine currently serving requests."""
+        engine = self._get_engine()
+        return engine.model_name if engine else None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying engine is loaded."""
+        engine = self._get_engine()
+        return engine is not None and engine.is_loaded
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be batched."""
+        with self._cond:
+            return len(self._queue)
+
+    def get_metrics(self) -> dict:
+        """Get a snapshot of the cumulative scheduler metrics."""
+        with self._metrics_lock:
+            data = self._metrics.to_dict()
+        with self._cond:
+            data["queue_depth"] = len(self._queue)
+            for priority in Priority:
+                data["priorities"][priority.value]["queued"] = sum(
+                    1 for r in self._queue if r.priority == priority
+                )
+        data["max_batch_size"] = self.max_batch_size
+        data["max_wait_ms"] = self.max_wait_ms
+        return data
+
+    def submit(
+        self,
+        audio_data: "NDArray[np.float32]",
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        latency_target_ms: Optional[float] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Future:
+        """
+        Queue a transcription request.
+
+        Args:
+            audio_data: Numpy array of audio samples (float32, mono)
+            sample_rate: Sample rate in Hz
+            language: Language code or 'auto'
+            instruction: Optional instruction (requests with different
+                instructions are never batched together)
+            latency_target_ms: Optional time budget for this request
+            priority: Scheduling class; interactive requests run before batch ones
+            cancel_token: Optional token; a cancelled request is dropped from the
+                queue, or stopped by the engine if it is already running
+
+        Returns:
+            Future resolving to a TranscriptionResult (TranscriptionCancelledError if cancelled)
+        """
+        now = time.monotonic()
+        request = InferenceRequest(
+            audio_data=audio_data,
+            sample_rate=sample_rate,
+            language=language,
+            instruction=instruction,
+            enqueued_at=now,
+            deadline=now + latency_target_ms / 1000 if latency_target_ms else None,
+            priority=Priority(priority),
+            cancel_token=cancel_token,
+        )
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("Scheduler is closed")
+            self._queue.append(request)
+            self._cond.notify()
+        return request.future
+
+    def transcribe(
+        self,
+        audio_data: "NDArray[np.float32]",
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        latency_target_ms: Optional[float] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> TranscriptionResult:
+        """Queue a request and block until its result is ready."""
+        return self.submit(
+            audio_data,
+            sample_rate,
+            language,
+            instruction,
+            latency_target_ms=latency_target_ms,
+            priority=priority,
+            cancel_token=cancel_token,
+        ).result()
+
+    def close(self) -> None:
+        """Stop the worker; queued requests fail with RuntimeError."""
+        with self._cond:
+            self._running = False
+            pending = list(self._queue)
+            self._queue.clear()
+            self._cond.notify_all()
+        for request in pending:
+            request.future.set_exception(RuntimeError("Scheduler is closed"))
+        self._worker.join(timeout=5)
+
+    def _batch_limit(self) -> int:
+        """Requests per model call; 1 if the engine would run a batch clip by clip."""
+        engine = self._get_engine()
+        if not hasattr(engine, "transcribe_batch"):
+            return 1
+        return self.max_batch_size if getattr(engine, "batches_requests", True) else 1
+
+    def _head(self) -> InferenceRequest:
+        """Oldest request of the most urgent priority (caller holds the lock)."""
+        return min(self._queue, key=lambda r: (r.priority.rank, r.enqueued_at))
+
+    def _window_end(self, head: InferenceRequest) -> float:
+        """When the batch led by `head` must be dispatched (caller holds the lock)."""
+        end = head.enqueued_at + self.max_wait_ms / 1000
+        expected_s = (self._batch_ms_estimate or 0.0) / 1000
+        for request in self._queue:
+            if request.batch_key == head.batch_key and request.deadline is not None:
+                end = min(end, request.deadline - expected_s)
+        return end
+
+    def _take_batch(self) -> Optional[list[InferenceRequest]]:
+        """Wait for a batch to form and remove it from the queue."""
+        with self._cond:
+            while self._running and not self._queue:
+                self._cond.wait()
+            if not self._running:
+                return None
+
+            # Re-evaluated after every wake-up, so an interactive request that
+            # arrives while a batch-priority batch is forming takes over
+            while self._running:
+                limit = self._batch_limit()
+                head = self._head()
+                key = head.batch_key
+                compatible = sum(1 for r in self._queue if r.batch_key == key)
+                remaining = self._window_end(head) - time.monotonic()
+                if compatible >= limit or remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+
+            batch: list[InferenceRequest] = []
+            kept: deque[InferenceRequest] = deque()
+            while self._queue:
+                request = self._queue.popleft()
+                if request.cancel_token and request.cancel_token.cancelled:
+                    self._drop(request)
+                elif request.batch_key == key and len(batch) < limit:
+                    batch.append(request)
+                else:
+                    kept.append(request)
+            self._queue = kept
+            return batch
+
+    def _drop(self, request: InferenceRequest) -> None:
+        """Fail a cancelled request without running it."""
+        try:
+            request.cancel_token.check()
+        except TranscriptionCancelledError as e:
+            request.future.set_exception(e)
+        with self._metrics_lock:
+            self._metrics.cancelled += 1
+
+    def _run(self) -> None:
+        """Worker loop: form batches and execute them."""
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            # Empty when every request of the batch was cancelled while queued
+            if batch:
+                self._execute(batch)
+
+    def _execute(self, batch: list[InferenceRequest]) -> None:
+        """Run one batch on the engine and resolve its futures."""
+        started = time.monotonic()
+        engine = self._get_engine()
+        first = batch[0]
+        outcomes: list[Any] = []
+
+        try:
+            if engine is None:
+                raise RuntimeError("No model loaded")
+            if len(batch) > 1 and first.instruction is None and hasattr(engine, "transcribe_batch"):
+                # Tokens are only passed when set, so engines without cancellation still work
+                tokens = [r.cancel_token for r in batch]
+                kwargs = {"cancel_tokens": tokens} if any(tokens) else {}
+                try:
+                    outcomes = engine.transcribe_batch(
+                        [r.audio_data for r in batch],
+                        sample_rate=first.sample_rate,
+                        languages=[r.language for r in batch],
+                        **kwargs,
+                    )
+                except Exception as e:
+                    # Retry one by one so a single bad clip doesn't fail the others
+                    logger.warning(f"Batched inference failed, retrying individually: {e}")
+                    outcomes = []
+            if not outcomes:
+                for r in batch:
+                    # Only passed when set, so engines without cancellation still work
+                    kwargs = {"cancel_token": r.cancel_token} if r.cancel_token else {}
+                    try:
+                        outcomes.append(
+                            engine.transcribe(
+                                audio_data=r.audio_data,
+                                sample_rate=r.sample_rate,
+                                language=r.language,
+                                instruction=r.instruction,
+                                **kwargs,
+                            )
+                        )
+                    except Exception as e:
+                        outcomes.append(e)
+        except Exception as e:
+            outcomes = [e] * len(batch)
+
+        finished = time.monotonic()
+        batch_ms = (finished - started) * 1000
+        self._record(batch, outcomes, started, finished, batch_ms)
+
+        for request, outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                request.future.set_exception(outcome)
+            else:
+                request.future.set_result(outcome)
+
+    def _record(
+        self,
+        batch: list[InferenceRequest],
+        outcomes: list[Any],
+        started: float,
+        finished: float,
+        batch_ms: float,
+    ) -> None:
+        """Fold one batch into the metrics and the latency estimate."""
+        self._batch_ms_estimate = (
+            batch_ms
+            if self._batch_ms_estimate is None
+            else (1 - self.LATENCY_SMOOTHING) * self._batch_ms_estimate
+            + self.LATENCY_SMOOTHING * batch_ms
+        )
+        with self._metrics_lock:
+            m = self._metrics
+            m.batches += 1
+            m.requests += len(batch)
+            m.batch_sizes[len(batch)] += 1
+            m.inference_ms += batch_ms
+            for request, outcome in zip(batch, outcomes):
+                wait_ms = (started - request.enqueued_at) * 1000
+                m.queue_wait_ms += wait_ms
+                stats = m.by_priority[request.priority]
+                stats.requests += 1
+                stats.queue_wait_ms.append(wait_ms)
+                stats.latency_ms.append((finished - request.enqueued_at) * 1000)
+                m.audio_s += len(request.audio_data) / request.sample_rate
+                if isinstance(outcome, TranscriptionCancelledError):
+                    m.cancelled += 1
+                elif isinstance(outcome, Exception):
+                    m.failed += 1
+                if request.deadline is not None and finished > request.deadline:
+                    m.missed_deadlines += 1
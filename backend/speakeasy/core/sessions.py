@@ -0,0 +1,163 @@
+"""
+Concurrent recording sessions sharing one resident model.
+
+Each session is a TranscriberService with its own capture buffer, input device
+and state. Sessions never load a model: they are created from the main
+service and transcribe through its inference queue, so every session shares
+the one loaded model. The main service itself is the "default" session.
+"""
+
+import logging
+import threading
+import uuid
+from functools import partial
+from typing import Callable, Optional
+
+from .transcriber import TranscriberService, TranscriberState
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_ID = "default"
+DEFAULT_MAX_SESSIONS = 16
+
+# Callback for session state changes: (session_id, state) -> None
+SessionStateCallback = Callable[[str, TranscriberState], None]
+
+
+class SessionManager:
+    """
+    Registry of recording sessions keyed by session id.
+
+    The default session id (or None) always resolves to the main service, so
+    single-recorder clients keep working without knowing about sessions.
+    """
+
+    def __init__(
+        self,
+        transcriber: TranscriberService,
+        on_state_change: Optional[SessionStateCallback] = None,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ):
+        """
+        Initialize the session manager.
+
+        Args:
+            transcriber: The main service that owns the loaded model
+            on_state_change: Called with (session_id, state) when a session's state changes
+            max_sessions: Maximum number of sessions besides the default one
+        """
+        self._transcriber = transcriber
+        self._on_state_change = on_state_change
+        self.max_sessions = max_sessions
+
+        self._sessions: dict[str, TranscriberService] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Optional[str] = None) -> Optional[TranscriberService]:
+        """
+        Get a session by id.
+
+        Args:
+            session_id: Session id, or None for the default session
+
+        Returns:
+            The session's service, or None if there is no such session
+        """
+        if not session_id or session_id == DEFAULT_SESSION_ID:
+            return self._transcriber
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def create(
+        self, session_id: Optional[str] = None, device_name: Optional[str] = None
+    ) -> tuple[str, TranscriberService]:
+        """
+        Create a recording session.
+
+        Args:
+            session_id: Id for the new session, or None to generate one
+            device_name: Input device for this session, or None for the default device
+
+        Returns:
+            Tuple of (session id, session service)
+
+        Raises:
+            ValueError: If the id is taken or the device does not exist
+            RuntimeError: If the session limit is reached
+        """
+        session_id = session_id or uuid.uuid4().hex
+        if session_id == DEFAULT_SESSION_ID:
+            raise ValueError("The default session always exists")
+
+        callback = partial(self._on_state_change, session_id) if self._on_state_change else None
+        session = TranscriberService(on_state_change=callback, shared_from=self._transcriber)
+        if device_name:
+            session.set_device(device_name)
+
+        with self._lock:
+            if session_id in self._sessions:
+                raise ValueError(f"Session already exists: {session_id}")
+            if len(self._sessions) >= self.max_sessions:
+                raise RuntimeError(f"Too many recording sessions (max {self.max_sessions})")
+            self._sessions[session_id] = session
+
+        logger.info(f"Created recording session {session_id}")
+        return session_id, session
+
+    def get_or_create(self, session_id: Optional[str] = None) -> TranscriberService:
+        """Get a session, creating it with the default device if it does not exist."""
+        session = self.get(session_id)
+        if session is not None:
+            return session
+        try:
+            return self.create(session_id)[1]
+        except ValueError:
+            # Created concurrently by another request
+            return self.get(session_id)
+
+    def close(self, session_id: str) -> bool:
+        """
+        Close a session, discarding any recording in progress.
+
+        Args:
+            session_id: The session to close
+
+        Returns:
+            True if closed, False if not found (the default session cannot be closed)
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+
+        session.cleanup()
+        logger.info(f"Closed recording session {session_id}")
+        return True
+
+    @property
+    def streams_open(self) -> bool:
+        """Whether any session has an input stream open (recording or warm microphone)."""
+        with self._lock:
+            services = [self._transcriber] + list(self._sessions.values())
+        return any(s.is_recording or s.warm_mic_enabled for s in services)
+
+    def list_sessions(self) -> list[dict]:
+        """Describe all sessions, default first."""
+        with self._lock:
+            sessions = [(DEFAULT_SESSION_ID, self._transcriber)] + list(self._sessions.items())
+        return [
+            {
+                "session_id": session_id,
+                "state": session.state.value,
+                "recording": session.is_recording,
+                "device": session.device_name,
+            }
+            for session_id, session in sessions
+        ]
+
+    def cleanup(self) -> None:
+        """Close all sessions except the default one."""
+        with self._lock:
+            session_ids = list(self._sessions)
+        for session_id in session_ids:
+            self.close(session_id)
@@ -0,0 +1,128 @@
+"""
+Trimming of leading and trailing silence before inference.
+
+Recordings start and end with the time it takes to press the hotkey: often a
+second or more of room noise that the model transcribes for nothing (and
+sometimes hallucinates text in). SilenceTrimmer measures the RMS level of
+every 20ms frame in one vectorized pass, cuts the audio to the first and last
+frame above a threshold (plus a little padding so soft onsets and trailing
+consonants survive), and reports recordings without any speech so the model
+isn't run at all.
+"""
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_TRIM_THRESHOLD_DB = -50.0
+# Audio kept before the first and after the last speech frame
+DEFAULT_TRIM_PADDING_MS = 200.0
+# Loud frames needed for a recording to count as speech (a click is one or two)
+MIN_SPEECH_MS = 60.0
+FRAME_MS = 20
+
+
+@dataclass
+class TrimResult:
+    """Where speech was found in a recording."""
+
+    start: int  # First sample kept
+    end: int  # One past the last sample kept
+    total: int  # Samples before trimming
+    sample_rate: int
+
+    @property
+    def silent(self) -> bool:
+        """Whether no speech was found (nothing is kept)."""
+        return self.end <= self.start
+
+    @property
+    def offset_s(self) -> float:
+        """Position of the kept audio in the original recording."""
+        return self.start / self.sample_rate
+
+    @property
+    def trimmed_ms(self) -> int:
+        """Audio removed, in milliseconds."""
+        kept = max(0, self.end - self.start)
+        return int((self.total - kept) * 1000 / self.sample_rate)
+
+
+def frame_levels_db(audio: np.ndarray, frame_len: int) -> np.ndarray:
+    """RMS level in dBFS of each whole frame of `audio`."""
+    frames = len(audio) // frame_len
+    if frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    blocks = np.asarray(audio[: frames * frame_len], dtype=np.float32).reshape(frames, frame_len)
+    power = np.einsum("ij,ij->i", blocks, blocks) / frame_len
+    return 10 * np.log10(power + 1e-12)
+
+
+class SilenceTrimmer:
+    """Energy-based trimming of leading and trailing silence, with totals for metrics."""
+
+    def __init__(
+        self,
+        threshold_db: float = DEFAULT_TRIM_THRESHOLD_DB,
+        padding_ms: float = DEFAULT_TRIM_PADDING_MS,
+    ):
+        """
+        Initialize the trimmer.
+
+        Args:
+            threshold_db: Frames quieter than this are silence
+            padding_ms: Audio kept around the detected speech
+        """
+        self.threshold_db = threshold_db
+        self.padding_ms = padding_ms
+        self._lock = threading.Lock()
+        self._recordings = 0
+        self._silent = 0
+        self._input_s = 0.0
+        self._trimmed_s = 0.0
+
+    def find_speech(self, audio: np.ndarray, sample_rate: int) -> TrimResult:
+        """
+        Locate the speech in `audio`.
+
+        A recording shorter than one frame is kept whole.
+        """
+        total = len(audio)
+        frame_len = max(1, sample_rate * FRAME_MS // 1000)
+        levels = frame_levels_db(audio, frame_len)
+        if len(levels) == 0:
+            return TrimResult(0, total, total, sample_rate)
+
+        loud = np.flatnonzero(levels > self.threshold_db)
+        if len(loud) * FRAME_MS < MIN_SPEECH_MS:
+            return TrimResult(0, 0, total, sample_rate)
+
+        padding = int(self.padding_ms * sample_rate / 1000)
+        start = max(0, int(loud[0]) * frame_len - padding)
+        end = min(total, (int(loud[-1]) + 1) * frame_len + padding)
+        return TrimResult(start, end, total, sample_rate)
+
+    def trim(self, audio: np.ndarray, sample_rate: int) -> tuple[np.ndarray, TrimResult]:
+        """Trim `audio` and count it; returns the kept samples (a view) and where they were."""
+        found = self.find_speech(audio, sample_rate)
+        with self._lock:
+            self._recordings += 1
+            self._silent += found.silent
+            self._input_s += found.total / sample_rate
+            self._trimmed_s += found.trimmed_ms / 1000
+        return audio[found.start : max(found.start, found.end)], found
+
+    def get_metrics(self) -> dict:
+        """Totals since startup, for the metrics endpoint."""
+        with self._lock:
+            return {
+                "threshold_db": self.threshold_db,
+                "recordings": self._recordings,
+                "skipped_silent": self._silent,
+                "input_seconds": round(self._input_s, 1),
+                "trimmed_seconds": round(self._trimmed_s, 1),
+                "trimmed_percent": (
+                    round(100 * self._trimmed_s / self._input_s, 1) if self._input_s else None
+                ),
+            }
@@ -0,0 +1,217 @@
+"""
+Disk-backed storage for long recordings.
+
+A recording normally lives in RAM as float32 blocks, and is concatenated and
+resampled in one piece when it stops, so memory grows with its duration.
+With spilling enabled, blocks older than a short window are appended to an
+int16 PCM file at the device's native rate (half the size of float32) while
+recording. The stopped recording is returned as SpilledAudio, which reads
+and resamples only the range that is sliced, through a memory map, so the
+chunked transcription path never holds more than a chunk in memory.
+
+If a write fails (e.g. the disk fills up), the file keeps the blocks written
+so far and the rest of the recording stays in RAM as the view's tail.
+"""
+
+import contextlib
+import logging
+import os
+import tempfile
+import weakref
+from math import gcd
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Audio kept in RAM while spilling (previews and endpointing look at recent audio)
+SPILL_KEEP_S = 30.0
+DEFAULT_SPILL_AFTER_S = 60.0
+INT16_SCALE = 32767.0
+
+
+def _remove(path: str) -> None:
+    """Delete a spill file (finalizer)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove spill file {path}: {e}")
+
+
+def unwritten_chunks(chunks: list[np.ndarray], written: int) -> list[np.ndarray]:
+    """The blocks of `chunks` left after a failed SpillWriter.write() wrote `written` samples."""
+    unwritten = []
+    for chunk in chunks:
+        if written >= len(chunk):
+            written -= len(chunk)
+        else:
+            unwritten.append(chunk)
+    return unwritten
+
+
+class SpillWriter:
+    """Appends a recording's samples to an int16 file."""
+
+    def __init__(self, samplerate: int, directory: Optional[str | Path] = None):
+        """
+        Create the spill file.
+
+        Args:
+            samplerate: Sample rate of the samples written
+            directory: Where to create the file (default: the system temp directory)
+        """
+        self.samplerate = samplerate
+        fd, self.path = tempfile.mkstemp(prefix="speakeasy-rec-", suffix=".pcm", dir=directory)
+        # Unbuffered, so `samples` always matches what is on disk
+        self._file = os.fdopen(fd, "wb", buffering=0)
+        self._finalizer = weakref.finalize(self, _remove, self.path)
+        self.samples = 0
+        self.peak = 0.0
+
+    def write(self, chunks: list[np.ndarray]) -> None:
+        """
+        Append float32 blocks (converted to int16).
+
+        Raises OSError if a write fails; `samples` then counts the blocks that
+        were written completely, and the blocks after them were not written.
+        """
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            pcm = (np.clip(chunk, -1.0, 1.0) * INT16_SCALE).astype(np.int16)
+            data = memoryview(pcm.tobytes())
+            try:
+                while data:
+                    data = data[self._file.write(data) :]
+            except OSError:
+                # Drop a partly written block so the file stays aligned with `samples`
+                self._file.seek(self.bytes_written)
+                with contextlib.suppress(OSError):
+                    self._file.truncate()
+                raise
+            self.peak = max(self.peak, float(np.abs(chunk).max()))
+            self.samples += len(chunk)
+
+    def finish(
+        self,
+        target_rate: int,
+        limit_samples: Optional[int] = None,
+        tail: Optional[np.ndarray] = None,
+    ) -> "SpilledAudio":
+        """
+        Close the file and return a view of it resampled to `target_rate`.
+
+        Args:
+            target_rate: Sample rate the view's slices are returned at
+            limit_samples: Keep only this many samples (at the file's rate)
+            tail: float32 samples (at the file's rate) that follow the file's,
+                for a recording whose last blocks could not be written
+        """
+        self._file.close()
+        if tail is not None and len(tail):
+            self.peak = max(self.peak, float(np.abs(tail).max()))
+        total = self.samples + (len(tail) if tail is not None else 0)
+        samples = total if limit_samples is None else min(limit_samples, total)
+        if tail is not None:
+            tail = tail[: max(0, samples - self.samples)]
+        # The view owns the file from here on
+        self._finalizer.detach()
+        return SpilledAudio(self.path, self.samplerate, target_rate, samples, tail)
+
+    def discard(self) -> None:
+        """Close and delete the file."""
+        self._file.close()
+        self._finalizer()
+
+    @property
+    def bytes_written(self) -> int:
+        """Size of the spill file."""
+        return self.samples * 2
+
+
+class SpilledAudio:
+    """
+    Read-only float32 view of a spilled recording at `sample_rate`.
+
+    Supports len() and slicing like a numpy array; each slice is read through
+    a memory map (held only for the read) and resampled on access. The file
+    is deleted when the view is garbage collected (or on close()).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        file_rate: int,
+        sample_rate: int,
+        file_samples: int,
+        tail: Optional[np.ndarray] = None,
+    ):
+        """
+        Wrap a spill file.
+
+        Args:
+            path: int16 PCM file
+            file_rate: Sample rate of the file
+            sample_rate: Sample rate of the returned audio
+            file_samples: Number of samples (at file_rate) to use, tail included
+            tail: float32 samples at file_rate that follow the file's
+        """
+        self.path = path
+        self.file_rate = file_rate
+        self.sample_rate = sample_rate
+        self.file_samples = file_samples
+        self._tail = tail if tail is not None else np.zeros(0, dtype=np.float32)
+        self._on_disk = file_samples - len(self._tail)
+        self._length = round(file_samples * sample_rate / file_rate)
+        divisor = gcd(sample_rate, file_rate)
+        self._up, self._down = sample_rate // divisor, file_rate // divisor
+        self._finalizer = weakref.finalize(self, _remove, path)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration of the recording."""
+        return self.file_samples / self.file_rate
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Read samples [start:stop] (at sample_rate) as float32."""
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("SpilledAudio only supports contiguous slices")
+        start, stop, _ = key.indices(self._length)
+        if stop <= start:
+            return np.zeros(0, dtype=np.float32)
+
+        file_start = start * self.file_rate // self.sample_rate
+        file_stop = min(self.file_samples, -(-stop * self.file_rate // self.sample_rate))
+        audio = self._read(file_start, file_stop)
+        if self._up != self._down:
+            import scipy.signal
+
+            audio = scipy.signal.resample_poly(audio, self._up, self._down).astype(np.float32)
+        return audio[: stop - start]
+
+    def _read(self, start: int, stop: int) -> np.ndarray:
+        """Samples [start:stop] at the file's rate, from the file and then the tail."""
+        parts = []
+        if start < self._on_disk:
+            pcm = np.memmap(self.path, dtype=np.int16, mode="r", shape=(self._on_disk,))
+            parts.append(pcm[start : min(stop, self._on_disk)].astype(np.float32) / INT16_SCALE)
+            del pcm
+        if stop > self._on_disk:
+            parts.append(self._tail[max(start, self._on_disk) - self._on_disk : stop - self._on_disk])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        """Load the whole recording (for short spilled recordings)."""
+        audio = self[:]
+        return audio if dtype is None else audio.astype(dtype)
+
+    def close(self) -> None:
+        """Delete the spill file."""
+        self._finalizer()
@@ -8,33 +8,89 @@ Performance optimizations:
 - Minimal buffer copies in audio callback (only copy, no redundant astype)
 - Pre-allocated buffer concatenation using np.concatenate
 - Chunked transcription for long recordings (>5 min) with progress reporting
+- All inference goes through one priority queue, so live dictation is served
+  before queued batch work
+- Transcriptions take a CancellationToken (with an optional deadline) that is
+  checked between chunks, so a cancelled request releases the model quickly
+- Pipelined dictation (stop_and_enqueue): a stopped recording is transcribed in
+  the background while the next one is already being captured
+- Optional endpointing: a streaming VAD on the microphone stops and transcribes
+  the recording after a trailing-silence window, with the silence trimmed. It
+  runs on a worker thread fed by the audio callback, not in the callback
+- Optional warm microphone: the input stream stays open between recordings, so
+  starting one skips device queries and stream setup and includes a pre-roll
+- The audio callback takes no locks and does no logging (it runs on PortAudio's
+  real-time thread); it records telemetry that is reported at stop
+- Optional capture process: the always-open stream runs in a child process and
+  writes into shared memory, so inference load here can't make it drop audio
+- Optional disk spill: long recordings move to an int16 file while recording and
+  are transcribed chunk by chunk from it, so memory stays flat
+- Long audio files are decoded as a stream (AudioFileStream) and transcribed
+  chunk by chunk while decoding, instead of being loaded whole
+- Batch files can be decoded once into an on-disk cache (DecodedAudioCache),
+  so retries and re-runs with another model skip decoding
+- Transcripts of files are cached by content hash and model setup
+  (ResultCache), and identical concurrent requests share one inference
+- Optional silence trimming: leading and trailing silence is cut from recordings
+  (and, opt-in, files) before inference (SilenceTrimmer), and silent recordings skip the model
 """
 
-import asyncio
 import gc
 import logging
+import queue
 import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, BinaryIO, Callable, Optional
 
 import numpy as np
 import sounddevice as sd
 import torch
 
-from .models import ProgressCallback, TranscriptionResult
+from .audio_cache import DecodedAudioCache
+from .audio_file import AudioFileStream
+from .cancellation import CancellationToken, TranscriptionCancelledError
+from .capture import CaptureTelemetry
+from .capture_process import CaptureProcess
+from .devices import get_device_registry
+from .endpointing import EndpointConfig, EndpointDecision, EndpointDetector
+from .models import ProgressCallback, TranscriptionResult, TranscriptionSegment
+from .result_cache import ResultCache
+from .scheduler import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_MS,
+    INTERACTIVE_LATENCY_TARGET_MS,
+    InferenceScheduler,
+    Priority,
+)
+from .silence import DEFAULT_TRIM_PADDING_MS, DEFAULT_TRIM_THRESHOLD_DB, SilenceTrimmer, TrimResult
+from .spill import (
+    DEFAULT_SPILL_AFTER_S,
+    SPILL_KEEP_S,
+    SpilledAudio,
+    SpillWriter,
+    unwritten_chunks,
+)
+from .warm_mic import DEFAULT_PRE_ROLL_MS, WarmMicrophone
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+    from .cascade import CascadeTranscriber
+    from .dictation import DictationQueue, Utterance, UtteranceCallback
     from .models import ModelWrapper
+    from .router import ModelRouter
 
 logger = logging.getLogger(__name__)
 
 # Type alias for transcription progress callback: (current_chunk, total_chunks, chunk_text) -> None
 TranscriptionProgressCallback = Callable[[int, int, str], None]
 
+# Type alias for automatic finalization: (decision, queued utterance) -> None
+EndpointCallback = Callable[[EndpointDecision, "Utterance"], None]
+
 
 class TranscriberState(str, Enum):
     """State of the transcriber service."""
@@ -51,7 +107,7 @@ class TranscriberState(str, Enum):
 class RecordingResult:
     """Result of a recording session."""
 
-    audio_data: "NDArray[np.float32]"
+    audio_data: "NDArray[np.float32] | SpilledAudio"
     sample_rate: int
     duration_seconds: float
 
@@ -71,27 +127,68 @@ class TranscriberService:
 
     SAMPLE_RATE = 16000  # Required by most ASR models
     CHANNELS = 1  # Mono
-    MAX_RECORDING_SECONDS = 600  # 10 minutes max
+    MAX_RECORDING_SECONDS = 600  # 10 minutes max in RAM (longer ones spill, see configure_spill)
+    SPILL_INTERVAL_S = 1.0  # How often old audio is moved to disk while spilling
+    # Queued chunks of one chunked transcription, so chunks read from disk aren't all loaded
+    MAX_CHUNKS_IN_FLIGHT = 8
 
     def __init__(
         self,
         on_state_change: Optional[Callable[[TranscriberState], None]] = None,
+        shared_from: Optional["TranscriberService"] = None,
     ):
         """
         Initialize the transcriber service.
 
         Args:
-            on_state_change: Callback when state changes
+            on_state_change: Callback when state changes (called on the changing thread)
+            shared_from: Service whose loaded model and inference queue this one
+                uses. Set for additional recording sessions (see sessions.py),
+                which have their own capture buffer, device and state but never
+                load a model themselves.
         """
-        self._state = TranscriberState.IDLE
+        self._shared_from = shared_from
+        self._state = (
+            TranscriberState.READY
+            if shared_from is not None and shared_from.is_model_loaded
+            else TranscriberState.IDLE
+        )
         self._on_state_change = on_state_change
 
         # Model
         self._model: Optional[ModelWrapper] = None
-
-        # Audio recording
+        # Optional fast-first cascade wrapping self._model (see enable_cascade)
+        self._cascade: Optional["CascadeTranscriber"] = None
+        # Optional language router in front of self._model (see enable_routing)
+        self._router: Optional["ModelRouter"] = None
+        # Arguments of the enabled cascade and router, restored by reload_model
+        self._cascade_args: Optional[dict] = None
+        self._routing_args: Optional[dict] = None
+        # Priority inference queue in front of the engine, created on first use
+        # (micro-batching is configured on it, see configure_batching)
+        self._scheduler: Optional[InferenceScheduler] = None
+        self._scheduler_lock = threading.Lock()
+
+        # Audio recording. The stream callback appends to the buffer without a lock:
+        # list.append, slice copies and slice deletion are atomic in CPython, so
+        # the list is a safe single-producer/single-consumer queue.
         self._audio_buffer: list[np.ndarray] = []
         self._stream: Optional[sd.InputStream] = None
+        # InputStream blocksize (0 = PortAudio's choice) and latency (see configure_capture)
+        self._blocksize = 0
+        self._latency: Optional[str | float] = None
+        # Statistics of the current (or last) recording's callbacks
+        self._telemetry = CaptureTelemetry()
+        # Disk spill for long recordings (see configure_spill); None = disabled
+        self._spill_after_s: Optional[float] = None
+        self._spill_dir: Optional[str] = None
+        self._spill_writer: Optional[SpillWriter] = None
+        self._spill_thread: Optional[threading.Thread] = None
+        self._spill_stop = threading.Event()
+        # Decoded audio of batch files (see configure_audio_cache); None = disabled
+        self._audio_cache: Optional[DecodedAudioCache] = None
+        # Transcripts of files by content (see configure_result_cache); None = disabled
+        self._result_cache: Optional[ResultCache] = None
         self._recording_start_time: Optional[float] = None
         self._lock = threading.Lock()
         self._state_lock = threading.Lock()  # Dedicated lock for state transitions
@@ -100,12 +197,34 @@ class TranscriberService:
         self._device_name: Optional[str] = None
         self._device_id: Optional[int] = None
         self._recording_samplerate: Optional[int] = None  # Native rate of device during recording
-
-        # Asyncio loop for thread-safe callbacks
-        try:
-            self._loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self._loop = None
+        self._external_recording = False  # Audio arrives via push_audio() (remote clients)
+        self._external_samples = 0  # Samples pushed into the current external recording
+        # Always-open input stream with pre-roll (see configure_warm_mic)
+        self._warm_mic: Optional[WarmMicrophone | CaptureProcess] = None
+        # Hotkey-to-first-audio latency of the last microphone recording
+        self._start_requested_at: Optional[float] = None
+        self._start_latency_ms: Optional[float] = None
+
+        # Token of the live transcription in progress (see cancel_transcription)
+        self._active_token: Optional[CancellationToken] = None
+        # Background queue for pipelined dictation, created on first use
+        self._dictation: Optional["DictationQueue"] = None
+
+        # End-of-speech detection on microphone recordings (see configure_endpointing)
+        self._endpointer: Optional[EndpointDetector] = None
+        self._endpoint_language: Optional[str] = None
+        self._endpoint_instruction: Optional[str] = None
+        self._on_endpoint: Optional[EndpointCallback] = None
+        self._on_endpoint_done: Optional["UtteranceCallback"] = None
+        # Audio blocks from the audio callback (and per-recording reset markers), run
+        # through the detector and finalized by a long-lived worker thread
+        self._endpoint_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._endpoint_thread: Optional[threading.Thread] = None
+        # Counts microphone recordings, so late decisions can't stop a newer one
+        self._endpoint_recording = 0
+        # Trimming of silence before inference (see configure_silence_trimming); None = disabled
+        self._silence_trimmer: Optional[SilenceTrimmer] = None
+        self._trim_files = False
 
     @property
     def state(self) -> TranscriberState:
@@ -113,21 +232,24 @@ class TranscriberService:
         return self._state
 
     def _set_state(self, state: TranscriberState) -> None:
-        """Set state and notify callback."""
+        """
+        Set state and notify callback.
+
+        The callback runs on the calling thread (often a worker thread), so it
+        must be thread-safe; the server's publishes to its event bus.
+        """
         self._state = state
         if self._on_state_change:
             try:
-                # Thread-safe callback dispatch
-                if self._loop and self._loop.is_running():
-                    self._loop.call_soon_threadsafe(self._on_state_change, state)
-                else:
-                    self._on_state_change(state)
+                self._on_state_change(state)
             except Exception as e:
                 logger.error(f"State change callback error: {e}")
 
     @property
     def is_model_loaded(self) -> bool:
         """Check if a model is loaded."""
+        if self._shared_from is not None:
+            return self._shared_from.is_model_loaded
         return self._model is not None and self._model.is_loaded
 
     @property
@@ -135,6 +257,16 @@ class TranscriberService:
         """Check if currently recording."""
         return self._state == TranscriberState.RECORDING
 
+    @property
+    def is_external_recording(self) -> bool:
+        """Check if currently recording audio fed through push_audio()."""
+        return self.is_recording and self._external_recording
+
+    @property
+    def device_name(self) -> Optional[str]:
+        """Name of the selected input device, or None for the system default."""
+        return self._device_name
+
     def load_model(
         self,
         model_type: str,
@@ -142,6 +274,8 @@ class TranscriberService:
         device: str = "cuda",
         compute_type: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        use_torch_compile: bool = False,
+        compile_timeout_s: Optional[float] = None,
     ) -> None:
         """
         Load an ASR model.
@@ -154,7 +288,12 @@ class TranscriberService:
             progress_callback: Optional callback for download progress tracking
                 that receives (downloaded_bytes, total_bytes) and returns
                 True to continue or False to cancel
+            use_torch_compile: Compile the model in the background after loading
+            compile_timeout_s: Maximum seconds to wait for compilation
         """
+        if self._shared_from is not None:
+            raise RuntimeError("Recording sessions use the model of the service they belong to")
+
         # Save args for reload
         self._last_load_args = {
             "model_type": model_type,
@@ -162,6 +301,8 @@ class TranscriberService:
             "device": device,
             "compute_type": compute_type,
             "progress_callback": progress_callback,
+            "use_torch_compile": use_torch_compile,
+            "compile_timeout_s": compile_timeout_s,
         }
 
         self._set_state(TranscriberState.LOADING)
@@ -175,14 +316,24 @@ class TranscriberService:
             from .models import ModelWrapper
 
             # Create and load new model
+            compile_kwargs = {"use_torch_compile": use_torch_compile}
+            if compile_timeout_s is not None:
+                compile_kwargs["compile_timeout_s"] = compile_timeout_s
             self._model = ModelWrapper(
                 model_type=model_type,
                 model_name=model_name,
                 device=device,
                 compute_type=compute_type,
+                **compile_kwargs,
             )
             self._model.load(progress_callback=progress_callback)
 
+            # Keep an active cascade pointed at the newly loaded model
+            if self._cascade:
+                self._cascade.accurate = self._model
+            if self._router:
+                self._router.primary = self._model
+
             self._set_state(TranscriberState.READY)
             logger.info(f"Model loaded: {model_type}/{model_name}")
 
@@ -194,12 +345,15 @@ class TranscriberService:
     def reload_model(self) -> None:
         """
         Reload the current model to recover from errors (e.g. CUDA).
+
+        An enabled cascade or language router is reloaded with it.
         """
         if not hasattr(self, "_last_load_args") or not self._last_load_args:
             logger.warning("Cannot reload model: no model loaded yet")
             return
 
         logger.info("Reloading model...")
+        cascade_args, routing_args = self._cascade_args, self._routing_args
         self.unload_model()
 
         # Force cleanup
@@ -209,9 +363,590 @@ class TranscriberService:
 
         # Re-load
         self.load_model(**self._last_load_args)
+        if cascade_args:
+            try:
+                self.enable_cascade(**cascade_args)
+            except Exception as e:
+                logger.error(f"Failed to restore the cascade after reloading: {e}")
+        if routing_args:
+            try:
+                self.enable_routing(**routing_args)
+            except Exception as e:
+                logger.error(f"Failed to restore language routing after reloading: {e}")
+
+    def enable_cascade(
+        self,
+        fast_model_name: str,
+        device: str = "cuda",
+        compute_type: Optional[str] = None,
+        logprob_threshold: Optional[float] = None,
+        no_speech_threshold: Optional[float] = None,
+    ) -> None:
+        """
+        Transcribe with a fast Whisper model first and re-decode only
+        low-confidence segments with the loaded model.
+
+        Args:
+            fast_model_name: Whisper model for the first pass (e.g. "base")
+            device: Device for the fast model
+            compute_type: Compute precision for the fast model
+            logprob_threshold: Escalate segments with avg_logprob below this
+            no_speech_threshold: Drop segments with no_speech_prob above this (and a
+                low avg_logprob) as silence
+        """
+        if not self.is_model_loaded:
+            raise RuntimeError("No model loaded")
+
+        from .cascade import CascadeTranscriber
+        from .models import ModelWrapper
+
+        args = {
+            "fast_model_name": fast_model_name,
+            "device": device,
+            "compute_type": compute_type,
+            "logprob_threshold": logprob_threshold,
+            "no_speech_threshold": no_speech_threshold,
+        }
+        thresholds = {}
+        if logprob_threshold is not None:
+            thresholds["logprob_threshold"] = logprob_threshold
+        if no_speech_threshold is not None:
+            thresholds["no_speech_threshold"] = no_speech_threshold
+
+        current = self._cascade
+        if (
+            current
+            and current.fast.model_name == fast_model_name
+            and current.fast.device == device
+            and current.fast.compute_type == compute_type
+        ):
+            # Same fast model: keep it (and the accumulated metrics)
+            current.accurate = self._model
+            for name, value in thresholds.items():
+                setattr(current, name, value)
+            self._cascade_args = args
+            return
+
+        fast = ModelWrapper(
+            model_type="whisper",
+            model_name=fast_model_name,
+            device=device,
+            compute_type=compute_type,
+        )
+        fast.load()
+        if current:
+            current.fast.unload()
+
+        self._cascade = CascadeTranscriber(fast=fast, accurate=self._model, **thresholds)
+        self._cascade_args = args
+        logger.info(f"Cascade enabled: {fast_model_name} -> {self._model.model_name}")
+
+    def disable_cascade(self) -> None:
+        """Stop using the cascade and unload its fast model."""
+        if self._cascade:
+            self._cascade.fast.unload()
+            self._cascade = None
+            logger.info("Cascade disabled")
+        self._cascade_args = None
+
+    @property
+    def cascade_metrics(self) -> Optional[dict]:
+        """Cumulative cascade metrics, or None if the cascade is not enabled."""
+        return self._cascade.get_metrics() if self._cascade else None
+
+    def enable_routing(
+        self,
+        lid_model_name: str = "tiny",
+        models: Optional[list[dict]] = None,
+        rules: Optional[dict[str, str]] = None,
+        device: str = "cuda",
+        compute_type: Optional[str] = None,
+        lid_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Route "auto" language requests to the fastest resident model for the
+        detected language.
+
+        Args:
+            lid_model_name: Whisper model used for language identification
+            models: Extra models to keep resident, as dicts with model_type,
+                model_name and optional compute_type
+            rules: Mapping of language code to preferred model name
+            device: Device for the identification and extra models
+            compute_type: Compute precision for the identification model
+            lid_seconds: Seconds of audio used for identification
+        """
+        if not self.is_model_loaded:
+            raise RuntimeError("No model loaded")
+
+        from .models import ModelWrapper
+        from .router import ModelRouter
+
+        args = {
+            "lid_model_name": lid_model_name,
+            "models": models,
+            "rules": rules,
+            "device": device,
+            "compute_type": compute_type,
+            "lid_seconds": lid_seconds,
+        }
+        current = self._router
+        loaded: dict[tuple[str, str], ModelWrapper] = {}
+        if current:
+            for m in [current.lid_model] + current.models:
+                loaded[(m.model_type.value, m.model_name)] = m
+
+        def get_or_load(model_type: str, model_name: str, model_compute_type: Optional[str]):
+            key = (model_type, model_name)
+            if key not in loaded:
+                wrapper = ModelWrapper(
+                    model_type=model_type,
+                    model_name=model_name,
+                    device=device,
+                    compute_type=model_compute_type,
+                )
+                wrapper.load()
+                loaded[key] = wrapper
+            return loaded[key]
+
+        lid_model = get_or_load("whisper", lid_model_name, compute_type)
+        extra = []
+        for spec in models or []:
+            if (
+                spec["model_type"] == self._model.model_type.value
+                and spec["model_name"] == self._model.model_name
+            ):
+                continue
+            try:
+                extra.append(
+                    get_or_load(spec["model_type"], spec["model_name"], spec.get("compute_type"))
+                )
+            except Exception as e:
+                logger.warning(f"Skipping routing model {spec['model_name']}: {e}")
+
+        # Unload models the new configuration no longer uses
+        in_use = {id(lid_model)} | {id(m) for m in extra}
+        for wrapper in loaded.values():
+            if id(wrapper) not in in_use:
+                wrapper.unload()
+
+        router_kwargs = {"lid_seconds": lid_seconds} if lid_seconds is not None else {}
+        self._router = ModelRouter(
+            primary=self._model,
+            lid_model=lid_model,
+            models=extra,
+            rules=rules,
+            **router_kwargs,
+        )
+        self._routing_args = args
+        logger.info(
+            f"Language routing enabled across "
+            f"{[m.model_name for m in self._router.resident_models]}"
+        )
+
+    def disable_routing(self) -> None:
+        """Stop routing and unload the identification and extra models."""
+        if self._router:
+            for wrapper in [self._router.lid_model] + self._router.models:
+                wrapper.unload()
+            self._router = None
+            logger.info("Language routing disabled")
+        self._routing_args = None
+
+    @property
+    def routing_metrics(self) -> Optional[dict]:
+        """Cumulative routing metrics, or None if routing is not enabled."""
+        return self._router.get_metrics() if self._router else None
+
+    def configure_batching(
+        self,
+        enabled: bool,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ) -> None:
+        """
+        Enable or disable micro-batching of concurrent transcription requests.
+
+        With batching disabled the queue still orders requests by priority,
+        it just runs them one at a time.
+
+        Args:
+            enabled: Whether requests of the same priority are batched together
+            max_batch_size: Maximum requests per model call
+            max_wait_ms: Maximum time a request waits for a batch to fill
+        """
+        scheduler = self._get_scheduler()
+        # Limits are read on every batch, so they can change in place
+        if not enabled:
+            scheduler.max_batch_size = 1
+            scheduler.max_wait_ms = 0.0
+            logger.info("Micro-batching disabled")
+            return
+
+        scheduler.max_batch_size = max(1, max_batch_size or DEFAULT_MAX_BATCH_SIZE)
+        scheduler.max_wait_ms = max(
+            0.0, max_wait_ms if max_wait_ms is not None else DEFAULT_MAX_WAIT_MS
+        )
+        logger.info(
+            f"Micro-batching enabled (max batch {scheduler.max_batch_size}, "
+            f"max wait {scheduler.max_wait_ms:.0f}ms)"
+        )
+
+    def configure_endpointing(
+        self,
+        enabled: bool,
+        silence_ms: Optional[float] = None,
+        threshold_db: Optional[float] = None,
+        min_speech_ms: Optional[float] = None,
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        on_endpoint: Optional[EndpointCallback] = None,
+        on_done: Optional["UtteranceCallback"] = None,
+    ) -> None:
+        """
+        Enable or disable automatic end-of-speech detection.
+
+        When enabled, microphone recordings are stopped and queued for
+        transcription (with stop_and_enqueue) once speech has been followed by
+        `silence_ms` of silence, so no second hotkey press is needed. The
+        trailing silence is trimmed before transcription. Takes effect from the
+        next recording.
+
+        Args:
+            enabled: Whether recordings end automatically
+            silence_ms: Trailing silence that ends an utterance
+            threshold_db: Frames quieter than this (dBFS) are never speech
+            min_speech_ms: Speech required before the silence window counts
+            language: Language code or 'auto' for the automatic transcription
+            instruction: Optional instruction for the automatic transcription
+            on_endpoint: Called on a worker thread with (decision, utterance) as
+                soon as a recording has been stopped and queued
+            on_done: Called on the dictation worker with (utterance, result or
+                None, error or None) once it is transcribed, after on_endpoint
+        """
+        if not enabled:
+            self._endpointer = None
+            self._on_endpoint = None
+            self._on_endpoint_done = None
+            self._stop_endpoint_worker()
+            logger.info("Endpointing disabled")
+            return
+
+        defaults = EndpointConfig()
+        config = EndpointConfig(
+            silence_ms=max(100.0, silence_ms if silence_ms is not None else defaults.silence_ms),
+            threshold_db=threshold_db if threshold_db is not None else defaults.threshold_db,
+            min_speech_ms=max(
+                0.0, min_speech_ms if min_speech_ms is not None else defaults.min_speech_ms
+            ),
+        )
+        self._endpoint_language = language
+        self._endpoint_instruction = instruction
+        self._on_endpoint = on_endpoint
+        self._on_endpoint_done = on_done
+        self._endpointer = EndpointDetector(config, self.SAMPLE_RATE)
+        if self._endpoint_thread is None:
+            self._endpoint_thread = threading.Thread(
+                target=self._endpoint_loop, name="endpoint-finalize", daemon=True
+            )
+            self._endpoint_thread.start()
+        logger.info(
+            f"Endpointing enabled (silence {config.silence_ms:.0f}ms, "
+            f"threshold {config.threshold_db:.0f}dB, min speech {config.min_speech_ms:.0f}ms)"
+        )
+
+    @property
+    def endpointing_enabled(self) -> bool:
+        """Whether microphone recordings end automatically after trailing silence."""
+        return self._endpointer is not None
+
+    def configure_silence_trimming(
+        self,
+        enabled: bool,
+        threshold_db: Optional[float] = None,
+        padding_ms: Optional[float] = None,
+        files: bool = False,
+    ) -> None:
+        """
+        Enable or disable trimming of silence before inference.
+
+        Leading and trailing audio quieter than `threshold_db` is cut from
+        in-memory recordings (microphone, streamed and dictation audio) before
+        it reaches the model, and a recording without any speech returns an
+        empty transcript without running the model. Sessions sharing this
+        service's model use the same setting.
+
+        Args:
+            enabled: Whether to trim
+            threshold_db: Frame level (dBFS) below which audio is silence
+            padding_ms: Audio kept before and after the detected speech
+            files: Also trim audio files (transcribe_file) decoded into memory
+        """
+        self._trim_files = enabled and files
+        if not enabled:
+            self._silence_trimmer = None
+            logger.info("Silence trimming disabled")
+            return
+
+        self._silence_trimmer = SilenceTrimmer(
+            threshold_db=threshold_db if threshold_db is not None else DEFAULT_TRIM_THRESHOLD_DB,
+            padding_ms=padding_ms if padding_ms is not None else DEFAULT_TRIM_PADDING_MS,
+        )
+        logger.info(
+            f"Silence trimming enabled (threshold {self._silence_trimmer.threshold_db:.0f}dB)"
+        )
+
+    @property
+    def silence_trim_metrics(self) -> Optional[dict]:
+        """Audio trimmed and recordings skipped as silent, or None if trimming is disabled."""
+        trimmer = self._silence_trimmer
+        return trimmer.get_metrics() if trimmer else None
+
+    def _silent_result(self, language: Optional[str], trim: TrimResult) -> TranscriptionResult:
+        """Empty transcript of audio in which no speech was found."""
+        logger.info(
+            f"No speech in {trim.total / trim.sample_rate:.2f}s of audio, skipping the model"
+        )
+        return TranscriptionResult(
+            text="",
+            duration_ms=0,
+            language=language if language and language != "auto" else None,
+            model_used=self._base_engine().model_name,
+            trimmed_ms=trim.trimmed_ms,
+        )
+
+    @staticmethod
+    def _untrim(result: TranscriptionResult, trim: TrimResult) -> TranscriptionResult:
+        """Report the trimmed audio and move segment times back to the untrimmed audio."""
+        offset = trim.offset_s
+        segments = result.segments
+        if offset and segments:
+            segments = [replace(s, start=s.start + offset, end=s.end + offset) for s in segments]
+        return replace(result, segments=segments, trimmed_ms=trim.trimmed_ms)
+
+    def configure_warm_mic(
+        self, enabled: bool, pre_roll_ms: Optional[float] = None, isolated: bool = False
+    ) -> None:
+        """
+        Keep the microphone open between recordings (or stop doing so).
+
+        With a warm microphone, start_recording() only attaches to the running
+        stream, and each recording starts with `pre_roll_ms` of audio captured
+        before the call. The stream uses the selected device and is reopened
+        when the device changes.
+
+        Args:
+            enabled: Whether the input stream stays open
+            pre_roll_ms: Audio from before start_recording() included in each recording
+            isolated: Run the stream in a child process (see capture_process.py)
+
+        Raises:
+            RuntimeError: If called while recording
+        """
+        if self.is_recording:
+            raise RuntimeError("Cannot change the microphone mode while recording")
+
+        if self._warm_mic is not None:
+            self._warm_mic.close()
+            self._warm_mic = None
+        if not enabled:
+            return
+
+        pre_roll_ms = DEFAULT_PRE_ROLL_MS if pre_roll_ms is None else pre_roll_ms
+        native_samplerate = self._query_input_device()
+        source = CaptureProcess if isolated else WarmMicrophone
+        warm_mic = source(
+            self._device_id,
+            native_samplerate,
+            self.CHANNELS,
+            pre_roll_s=pre_roll_ms / 1000,
+            blocksize=self._blocksize,
+            latency=self._latency,
+        )
+        # Held until warm_mic_enabled reports the open stream to the device registry
+        with get_device_registry().portaudio_lock:
+            warm_mic.open()
+            self._warm_mic = warm_mic
+
+    def configure_capture(
+        self, blocksize: Optional[int] = None, latency: Optional[str | float] = None
+    ) -> None:
+        """
+        Set the input stream's block size and latency.
+
+        Smaller blocks and "low" latency shorten the delay to the first audio
+        but leave less headroom before the input overflows. Takes effect from
+        the next stream opened (a warm microphone is reopened).
+
+        Args:
+            blocksize: Frames per callback (0 or None lets PortAudio choose)
+            latency: "low", "high" or seconds (None for sounddevice's default)
+        """
+        self._blocksize = max(0, blocksize or 0)
+        self._latency = latency
+        logger.info(f"Capture blocksize {self._blocksize or 'auto'}, latency {latency or 'default'}")
+        self._reopen_warm_mic()
+
+    def configure_spill(
+        self,
+        enabled: bool,
+        after_s: float = DEFAULT_SPILL_AFTER_S,
+        directory: Optional[str] = None,
+    ) -> None:
+        """
+        Move long recordings to disk while they are recorded.
+
+        Once a recording is longer than `after_s`, all but its last
+        SPILL_KEEP_S seconds are appended to an int16 file every
+        SPILL_INTERVAL_S. Its RecordingResult then holds a SpilledAudio,
+        which transcribe() reads chunk by chunk, so memory use doesn't grow
+        with the duration. Takes effect from the next recording.
+
+        Args:
+            enabled: Whether long recordings spill to disk
+            after_s: Recording length at which spilling starts
+            directory: Directory for the spill files (default: system temp)
+        """
+        self._spill_after_s = max(SPILL_KEEP_S, after_s) if enabled else None
+        self._spill_dir = directory
+        if enabled:
+            logger.info(f"Recordings longer than {self._spill_after_s:.0f}s spill to disk")
+
+    def configure_audio_cache(self, max_mb: float, directory: Optional[str] = None) -> None:
+        """
+        Cache decoded audio of files transcribed with `cache_audio=True`.
+
+        Args:
+            max_mb: Disk budget in MB (0 disables the cache)
+            directory: Cache directory (default: ~/.speakeasy/audio_cache)
+        """
+        if max_mb <= 0:
+            self._audio_cache = None
+            return
+        self._audio_cache = DecodedAudioCache(directory, max_bytes=int(max_mb * 1024**2))
+        logger.info(f"Decoded audio cache: {self._audio_cache.directory} ({max_mb:.0f} MB)")
+
+    @property
+    def audio_cache_metrics(self) -> Optional[dict]:
+        """Statistics of the decoded audio cache, or None if it is disabled."""
+        return self._audio_cache.stats() if self._audio_cache else None
+
+    def configure_result_cache(self, enabled: bool, db_path: Optional[str] = None) -> None:
+        """
+        Reuse transcripts of files whose content was transcribed before.
+
+        Args:
+            enabled: Whether transcribe_file() consults the cache
+            db_path: SQLite database of the cache (required when enabling)
+        """
+        previous, self._result_cache = self._result_cache, None
+        if previous is not None:
+            previous.close()
+        if enabled:
+            self._result_cache = ResultCache(db_path)
+            logger.info(f"Result cache: {db_path}")
+
+    @property
+    def result_cache_metrics(self) -> Optional[dict]:
+        """Hit counts of the result cache, or None if it is disabled."""
+        return self._result_cache.stats() if self._result_cache else None
+
+    def _engine_signature(self) -> str:
+        """The model setup a transcript depends on (part of the result cache key)."""
+        from .cascade import CascadeTranscriber
+        from .router import ModelRouter
+
+        engine = self._base_engine()
+        owner = self._shared_from if self._shared_from is not None else self
+        model = owner._model
+        # The engine class tells a plain model from the cascade or the router, whose
+        # thresholds, rules and resident models also change the transcript
+        name = engine.model_name
+        if isinstance(engine, (CascadeTranscriber, ModelRouter)):
+            name = engine.cache_signature
+        signature = f"{type(engine).__name__}:{name}:{model.compute_type or 'default'}"
+        # Trimmed files can lose quiet speech at their edges
+        trimmer = owner._silence_trimmer
+        if owner._trim_files and trimmer is not None:
+            signature += f":trim{trimmer.threshold_db:g}/{trimmer.padding_ms:g}"
+        return signature
+
+    @property
+    def capture_telemetry(self) -> dict:
+        """Callback statistics of the current (or last) microphone recording."""
+        telemetry = self._telemetry.to_dict()
+        if isinstance(self._warm_mic, CaptureProcess):
+            # Blocks arrive from the drain thread; the child's own stream counters
+            telemetry["process"] = self._warm_mic.stats()
+        return telemetry
+
+    @property
+    def capture_isolated(self) -> bool:
+        """Whether the microphone is captured in a child process."""
+        return isinstance(self._warm_mic, CaptureProcess)
+
+    @property
+    def warm_mic_enabled(self) -> bool:
+        """Whether the input stream stays open between recordings."""
+        return self._warm_mic is not None
+
+    @property
+    def start_latency_ms(self) -> Optional[float]:
+        """Time from the last start_recording() call until its first audio was captured."""
+        return self._start_latency_ms
+
+    @property
+    def scheduler_metrics(self) -> Optional[dict]:
+        """Inference queue metrics (batching and per-priority waits), or None if unused."""
+        return self._scheduler.get_metrics() if self._scheduler else None
+
+    def _get_scheduler(self) -> InferenceScheduler:
+        """Get the inference queue, creating it (without batching) on first use."""
+        if self._shared_from is not None:
+            return self._shared_from._get_scheduler()
+        with self._scheduler_lock:
+            if self._scheduler is None:
+                self._scheduler = InferenceScheduler(
+                    get_engine=self._base_engine, max_batch_size=1, max_wait_ms=0.0
+                )
+            return self._scheduler
+
+    @staticmethod
+    def _latency_target_ms(
+        priority: Priority, cancel_token: Optional[CancellationToken] = None
+    ) -> Optional[float]:
+        """
+        Latency target for a scheduler request, which bounds its batching window.
+
+        Interactive (dictation) requests get INTERACTIVE_LATENCY_TARGET_MS; a
+        request with a deadline, such as a batch job's per-file timeout, must
+        also finish within the time left on its token.
+        """
+        target = INTERACTIVE_LATENCY_TARGET_MS if priority == Priority.INTERACTIVE else None
+        remaining_s = cancel_token.remaining_s() if cancel_token else None
+        if remaining_s is not None:
+            target = min(target, remaining_s * 1000) if target is not None else remaining_s * 1000
+        return target
+
+    def _base_engine(self):
+        """
+        Get the model-level engine.
+
+        The language router takes precedence over the cascade, which takes
+        precedence over the plain model.
+        """
+        if self._shared_from is not None:
+            return self._shared_from._base_engine()
+        if self._router and self._router.is_loaded:
+            return self._router
+        if self._cascade and self._cascade.is_loaded:
+            return self._cascade
+        return self._model
 
     def unload_model(self) -> None:
         """Unload the current model."""
+        self.disable_routing()
+        self.disable_cascade()
         if self._model:
             self._model.unload()
             self._model = None
@@ -227,18 +962,31 @@ class TranscriberService:
         if device_name is None:
             self._device_name = None
             self._device_id = None
+            self._reopen_warm_mic()
             return
 
-        # Find device by name
-        devices = sd.query_devices()
-        for i, dev in enumerate(devices):
-            if device_name.lower() in dev["name"].lower() and dev["max_input_channels"] > 0:
-                self._device_name = dev["name"]
-                self._device_id = i
-                logger.info(f"Audio device set to: {self._device_name}")
-                return
+        # Find device by name (cached, see devices.py)
+        device = get_device_registry().find(device_name)
+        if device is None:
+            raise ValueError(f"Audio device not found: {device_name}")
 
-        raise ValueError(f"Audio device not found: {device_name}")
+        self._device_name = device.name
+        self._device_id = device.id
+        logger.info(f"Audio device set to: {self._device_name}")
+        self._reopen_warm_mic()
+
+    def _reopen_warm_mic(self) -> None:
+        """Move a warm microphone to the selected device (not while recording)."""
+        if self._warm_mic is None or self.is_recording:
+            return
+        try:
+            self.configure_warm_mic(
+                True,
+                pre_roll_ms=self._warm_mic.pre_roll_s * 1000,
+                isolated=self.capture_isolated,
+            )
+        except Exception as e:
+            logger.warning(f"Could not reopen warm microphone: {e}")
 
     def _audio_callback(
         self,
@@ -250,28 +998,38 @@ class TranscriberService:
         """
         Callback for audio stream.
 
+        Runs on PortAudio's real-time thread: no locks and no logging here.
+        Status flags and timings go into the telemetry, which is logged at stop.
+
         Performance: Since we specify dtype=np.float32 in InputStream,
         indata is already float32. We only need to copy (sounddevice reuses buffer)
         and flatten (mono channel extraction).
         """
-        if status:
-            logger.warning(f"Audio status: {status}")
+        started = time.perf_counter()
 
-        with self._lock:
-            # Optimized: indata is already float32, just copy and flatten
-            # copy() is required because sounddevice reuses the buffer
-            audio_chunk = indata.copy().flatten()
-            self._audio_buffer.append(audio_chunk)
-
-            # Log first few callbacks for debugging
-            if len(self._audio_buffer) <= 3:
-                max_amp = np.abs(audio_chunk).max() if len(audio_chunk) > 0 else 0.0
-                logger.info(
-                    f"Audio callback #{len(self._audio_buffer)}: received {len(audio_chunk)} samples, max amplitude: {max_amp:.4f}"
-                )
+        # Optimized: indata is already float32, just copy and flatten
+        # copy() is required because sounddevice reuses the buffer
+        audio_chunk = indata.copy().flatten()
+        self._audio_buffer.append(audio_chunk)
+        if self._start_latency_ms is None and self._start_requested_at is not None:
+            self._start_latency_ms = (started - self._start_requested_at) * 1000
+
+        if self._endpointer is not None:
+            # Detection (and stopping the stream, which would deadlock here) happens
+            # on the endpoint worker; SimpleQueue.put never blocks
+            self._endpoint_queue.put(audio_chunk)
+
+        self._telemetry.record(frames, status, started)
 
     def _cleanup_recording_state(self) -> None:
         """Clean up recording state (stream, buffer, timing). Called on error or cancel."""
+        # Stop the warm stream's deliveries before clearing the buffer
+        if self._warm_mic is not None:
+            self._warm_mic.detach()
+        spill = self._stop_spill()
+        if spill is not None:
+            spill.discard()
+
         # Hold both locks to ensure atomic state cleanup
         with self._state_lock:
             with self._lock:
@@ -287,6 +1045,177 @@ class TranscriberService:
                 self._audio_buffer = []
                 self._recording_start_time = None
                 self._recording_samplerate = None
+                self._external_recording = False
+
+    def _query_input_device(self) -> int:
+        """
+        Resolve the input device to open and return its native sample rate.
+
+        Falls back to the default input device (updating the device id) and,
+        if the devices can't be queried, to SAMPLE_RATE.
+        """
+        # Get device's native sample rate (critical for WASAPI shared mode).
+        # Device info comes from the registry cache, so this doesn't scan PortAudio.
+        registry = get_device_registry()
+        try:
+            # Try selected device first
+            device = registry.get(self._device_id) if self._device_id is not None else None
+            if self._device_id is not None and device is None:
+                logger.warning(
+                    f"Device {self._device_id} has no input channels, falling back to default"
+                )
+
+            # Fall back to default device if needed
+            if device is None:
+                device = registry.default_input()
+                if device is None:
+                    raise RuntimeError("No default input device")
+                self._device_id = device.id
+                logger.info(
+                    f"Using default input device: {device.name} (ID: {device.id}, native rate: {device.sample_rate}Hz)"
+                )
+            else:
+                logger.info(
+                    f"Using selected device: {device.name} (ID: {device.id}, native rate: {device.sample_rate}Hz)"
+                )
+            logger.info(f"Device host API: {device.hostapi}")
+            return device.sample_rate
+
+        except Exception as e:
+            logger.warning(f"Could not query audio devices: {e}, using fallback settings")
+            return self.SAMPLE_RATE
+
+    def _start_warm_recording(self) -> None:
+        """Start recording from the warm microphone, beginning with its pre-roll."""
+        warm_mic = self._warm_mic
+        self._recording_samplerate = warm_mic.samplerate
+        self._telemetry = CaptureTelemetry(
+            warm_mic.samplerate, self._buffer_capacity(warm_mic.samplerate)
+        )
+        if self._endpointer is not None:
+            self._reset_endpointer(warm_mic.samplerate)
+
+        with self._state_lock:
+            self._recording_start_time = time.time()
+            self._set_state(TranscriberState.RECORDING)
+
+        pre_roll = warm_mic.attach(self._audio_callback, on_pre_roll=self._push_pre_roll)
+        self._start_spill()
+        # The duration includes the pre-roll
+        self._recording_start_time -= pre_roll / warm_mic.samplerate
+        logger.info(
+            f"Recording started on warm microphone ({pre_roll / warm_mic.samplerate * 1000:.0f}ms "
+            f"pre-roll, {self._start_latency_ms or 0:.1f}ms to first audio)"
+        )
+
+    def _buffer_capacity(self, samplerate: int) -> Optional[int]:
+        """Samples a recording may keep in RAM (None while spilling to disk)."""
+        if self._spill_after_s is not None:
+            return None
+        return self.MAX_RECORDING_SECONDS * samplerate
+
+    def _start_spill(self) -> None:
+        """Start moving old audio of the new recording to disk, if enabled."""
+        if self._spill_after_s is None:
+            return
+        self._spill_stop.clear()
+        self._spill_thread = threading.Thread(
+            target=self._spill_loop, name="recording-spill", daemon=True
+        )
+        self._spill_thread.start()
+
+    def _stop_spill(self) -> Optional[SpillWriter]:
+        """Stop spilling and return the spill file, if the recording got that long."""
+        thread, self._spill_thread = self._spill_thread, None
+        if thread is not None:
+            self._spill_stop.set()
+            thread.join()
+        writer, self._spill_writer = self._spill_writer, None
+        return writer
+
+    def _spill_loop(self) -> None:
+        """Spill thread: append all but the newest SPILL_KEEP_S of the buffer to disk."""
+        samplerate = self._recording_samplerate or self.SAMPLE_RATE
+        keep = int(SPILL_KEEP_S * samplerate)
+        start_after = int(self._spill_after_s * samplerate)
+
+        while not self._spill_stop.wait(self.SPILL_INTERVAL_S):
+            with self._lock:
+                buffer = self._audio_buffer
+                buffered = sum(len(chunk) for chunk in buffer)
+                if self._spill_writer is None and buffered < start_after:
+                    continue
+                count = moved = 0
+                while count < len(buffer) and buffered - moved - len(buffer[count]) >= keep:
+                    moved += len(buffer[count])
+                    count += 1
+                # Slicing and deleting a prefix are atomic, so the callback can keep appending
+                chunks = buffer[:count]
+                del buffer[:count]
+
+            spilled = self._spill_writer.samples if self._spill_writer is not None else 0
+            try:
+                if self._spill_writer is None:
+                    self._spill_writer = SpillWriter(samplerate, self._spill_dir)
+                    logger.info(
+                        f"Recording passed {self._spill_after_s:.0f}s, "
+                        f"spilling to {self._spill_writer.path}"
+                    )
+                self._spill_writer.write(chunks)
+            except OSError as e:
+                # Put the chunks that did not reach the file back in front of the buffer
+                written = self._spill_writer.samples - spilled if self._spill_writer else 0
+                with self._lock:
+                    self._audio_buffer[:0] = unwritten_chunks(chunks, written)
+                logger.error(f"Spilling the recording to disk failed, keeping it in memory: {e}")
+                return
+
+    def _finish_spilled_recording(
+        self,
+        spill: SpillWriter,
+        chunks: list[np.ndarray],
+        duration: float,
+        trim_after_s: Optional[float],
+    ) -> RecordingResult:
+        """
+        Append the audio still in RAM to the spill file and return a view of it.
+
+        If the disk is full, the part already on disk is kept and the rest of
+        the recording stays in memory as the view's tail.
+        """
+        tail = None
+        spilled = spill.samples
+        try:
+            spill.write(chunks)
+        except OSError as e:
+            unwritten = unwritten_chunks(chunks, spill.samples - spilled)
+            tail = np.concatenate(unwritten) if unwritten else None
+            logger.error(f"Spilling the end of the recording failed, keeping it in memory: {e}")
+        recording_samplerate = self._recording_samplerate or self.SAMPLE_RATE
+        limit = int(trim_after_s * recording_samplerate) if trim_after_s is not None else None
+        total = spill.samples + (len(tail) if tail is not None else 0)
+        audio = spill.finish(self.SAMPLE_RATE, limit_samples=limit, tail=tail)
+        if (limit is not None and limit < total) or self._external_recording:
+            duration = audio.duration_seconds
+        logger.info(
+            f"Recording spilled to disk: {audio.duration_seconds:.1f}s at "
+            f"{recording_samplerate}Hz ({spill.bytes_written / 1024**2:.0f} MB), "
+            f"max amplitude: {spill.peak:.4f}"
+        )
+
+        self._recording_start_time = None
+        self._recording_samplerate = None
+        self._external_recording = False
+        logger.info(f"Recording stopped, duration: {duration:.2f}s")
+        return RecordingResult(
+            audio_data=audio, sample_rate=self.SAMPLE_RATE, duration_seconds=duration
+        )
+
+    def _push_pre_roll(self, samples: np.ndarray) -> None:
+        """Warm microphone pre-roll: buffered like a block, but not counted in the telemetry."""
+        self._audio_buffer.append(samples)
+        if self._endpointer is not None:
+            self._endpoint_queue.put(samples)
 
     def start_recording(self) -> None:
         """Start recording audio from the microphone."""
@@ -301,95 +1230,202 @@ class TranscriberService:
 
         with self._lock:
             self._audio_buffer = []
+            self._start_requested_at = time.perf_counter()
+            self._start_latency_ms = None
 
-        # Get device's native sample rate (critical for WASAPI shared mode)
-        native_samplerate = self.SAMPLE_RATE  # Default fallback
-        device_info = None
+        if self._warm_mic is not None:
+            self._start_warm_recording()
+            return
 
-        try:
-            # Try selected device first
-            if self._device_id is not None:
-                device_info = sd.query_devices(self._device_id)
-                if device_info["max_input_channels"] > 0:
-                    native_samplerate = int(device_info["default_samplerate"])
-                    logger.info(
-                        f"Using selected device: {device_info['name']} (ID: {self._device_id}, native rate: {native_samplerate}Hz)"
-                    )
-                else:
-                    logger.warning(
-                        f"Device {self._device_id} has no input channels, falling back to default"
-                    )
-                    device_info = None
+        native_samplerate = self._query_input_device()
+        self._recording_samplerate = native_samplerate
+        self._telemetry = CaptureTelemetry(
+            native_samplerate, self._buffer_capacity(native_samplerate)
+        )
+        if self._endpointer is not None:
+            self._reset_endpointer(native_samplerate)
 
-            # Fall back to default device if needed
-            if device_info is None:
-                device_info = sd.query_devices(kind="input")
-                self._device_id = sd.default.device[0]
-                native_samplerate = int(device_info["default_samplerate"])
+        # Create and start stream with native sample rate. The device registry must not
+        # restart PortAudio until the stream is open and the state says so (or it failed).
+        with get_device_registry().portaudio_lock:
+            try:
                 logger.info(
-                    f"Using default input device: {device_info['name']} (ID: {self._device_id}, native rate: {native_samplerate}Hz)"
+                    f"Creating audio stream: samplerate={native_samplerate}Hz (native), channels={self.CHANNELS}, device={self._device_id}"
                 )
+                self._stream = sd.InputStream(
+                    samplerate=native_samplerate,
+                    channels=self.CHANNELS,
+                    dtype=np.float32,
+                    device=self._device_id,
+                    blocksize=self._blocksize,
+                    latency=self._latency,
+                    callback=self._audio_callback,
+                )
+                logger.info("Starting audio stream...")
+                self._stream.start()
+                self._recording_start_time = time.time()
 
-            # Log host API for debugging
-            hostapis = sd.query_hostapis()
-            device_hostapi = hostapis[device_info["hostapi"]]
-            logger.info(f"Device host API: {device_hostapi['name']}")
+                # Set state AFTER successful stream start
+                with self._state_lock:
+                    self._set_state(TranscriberState.RECORDING)
+                self._start_spill()
 
-        except Exception as e:
-            logger.warning(f"Could not query audio devices: {e}, using fallback settings")
-            native_samplerate = self.SAMPLE_RATE
-            device_info = None
+                logger.info(f"Recording started successfully. Waiting for audio callbacks...")
+            except Exception as e:
+                # Ensure state is reset and buffer is cleared on stream creation/start failure
+                logger.error(f"Failed to start recording: {e}", exc_info=True)
+                with self._state_lock:
+                    with self._lock:
+                        self._audio_buffer = []
+                    if self._stream:
+                        try:
+                            self._stream.stop()
+                            self._stream.close()
+                        except Exception as e:
+                            logger.warning(f"Error closing stream: {e}")
+                        finally:
+                            self._stream = None
+                    self._recording_start_time = None
+                    self._recording_samplerate = None
+                    # Reset state to READY since we failed
+                    if self.is_model_loaded:
+                        self._set_state(TranscriberState.READY)
+                    else:
+                        self._set_state(TranscriberState.IDLE)
+                raise
+
+    def start_external_recording(self) -> None:
+        """
+        Start a recording fed through push_audio() instead of a local input device.
 
-        self._recording_samplerate = native_samplerate
+        Used for audio streamed by remote clients, which is already decoded to
+        16 kHz mono when it arrives. stop_recording()/stop_and_transcribe() work
+        as for microphone recordings.
 
-        # Create and start stream with native sample rate
-        try:
-            logger.info(
-                f"Creating audio stream: samplerate={native_samplerate}Hz (native), channels={self.CHANNELS}, device={self._device_id}"
-            )
-            self._stream = sd.InputStream(
-                samplerate=native_samplerate,
-                channels=self.CHANNELS,
-                dtype=np.float32,
-                device=self._device_id,
-                callback=self._audio_callback,
-            )
-            logger.info("Starting audio stream...")
-            self._stream.start()
-            self._recording_start_time = time.time()
+        Raises:
+            RuntimeError: If already recording (e.g. from the microphone) or no model is loaded
+        """
+        with self._state_lock:
+            if self._state == TranscriberState.RECORDING:
+                raise RuntimeError("Already recording")
 
-            # Set state AFTER successful stream start
-            with self._state_lock:
-                self._set_state(TranscriberState.RECORDING)
+            if not self.is_model_loaded:
+                raise RuntimeError("No model loaded")
 
-            logger.info(f"Recording started successfully. Waiting for audio callbacks...")
-        except Exception as e:
-            # Ensure state is reset and buffer is cleared on stream creation/start failure
-            logger.error(f"Failed to start recording: {e}", exc_info=True)
-            with self._state_lock:
-                with self._lock:
-                    self._audio_buffer = []
-                if self._stream:
-                    try:
-                        self._stream.stop()
-                        self._stream.close()
-                    except Exception as e:
-                        logger.warning(f"Error closing stream: {e}")
-                    finally:
-                        self._stream = None
-                self._recording_start_time = None
-                self._recording_samplerate = None
-                # Reset state to READY since we failed
-                if self.is_model_loaded:
-                    self._set_state(TranscriberState.READY)
-                else:
-                    self._set_state(TranscriberState.IDLE)
-            raise
+            with self._lock:
+                self._audio_buffer = []
+                self._recording_samplerate = self.SAMPLE_RATE
+                self._recording_start_time = time.time()
+                self._external_recording = True
+                self._external_samples = 0
 
-    def stop_recording(self) -> RecordingResult:
+            self._set_state(TranscriberState.RECORDING)
+
+        self._start_spill()
+        logger.info("External recording started")
+
+    def push_audio(self, audio_chunk: "NDArray[np.float32]") -> bool:
+        """
+        Append 16 kHz mono samples to an external recording.
+
+        Unless the recording spills to disk, it keeps at most
+        MAX_RECORDING_SECONDS of audio; samples beyond that are dropped.
+
+        Args:
+            audio_chunk: Float32 samples at SAMPLE_RATE
+
+        Returns:
+            False if samples were dropped because the recording is full
+        """
+        if self._state != TranscriberState.RECORDING or not self._external_recording:
+            raise RuntimeError("Not recording from an external source")
+        with self._lock:
+            capacity = self._buffer_capacity(self.SAMPLE_RATE)
+            room = len(audio_chunk)
+            if capacity is not None:
+                room = min(room, max(0, capacity - self._external_samples))
+            if room:
+                self._audio_buffer.append(audio_chunk[:room])
+                self._external_samples += room
+        return room == len(audio_chunk)
+
+    def preview(
+        self,
+        language: Optional[str] = None,
+        window_seconds: float = 30.0,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Optional[TranscriptionResult]:
+        """
+        Transcribe the most recent audio of a recording in progress.
+
+        The recording continues and the state is not changed, so this can be
+        called repeatedly for partial results.
+
+        Args:
+            language: Language code or 'auto'
+            window_seconds: How much recent audio to transcribe (at most)
+            start: With end, transcribe only samples [start, end) of an external
+                recording, counted as pushed (e.g. the audio new since the last preview)
+            end: See start; None for all audio pushed so far
+            priority: Scheduling class, e.g. batch so previews wait for final results
+
+        Returns:
+            TranscriptionResult, or None if there is no audio to transcribe
+        """
+        if not self.is_recording:
+            raise RuntimeError("Not recording")
+
+        with self._lock:
+            recording_samplerate = self._recording_samplerate or self.SAMPLE_RATE
+            window = int(window_seconds * recording_samplerate)
+            skip = 0  # Newest samples left out
+            if start is not None or end is not None:
+                if not self._external_recording:
+                    raise RuntimeError("Sample positions need an external recording")
+                pushed = self._external_samples
+                stop = pushed if end is None else min(end, pushed)
+                skip = pushed - stop
+                window = min(window, max(0, stop - (start or 0)))
+            chunks: list[np.ndarray] = []
+            total = 0
+            for chunk in reversed(self._audio_buffer):
+                if total >= window + skip:
+                    break
+                chunks.append(chunk)
+                total += len(chunk)
+
+        if not chunks or window == 0:
+            return None
+
+        # Older audio may have been spilled to disk: use what is still buffered
+        audio_data = np.concatenate(chunks[::-1])
+        stop = len(audio_data) - skip
+        audio_data = audio_data[max(0, stop - window) : max(0, stop)]
+        if not len(audio_data):
+            return None
+        if recording_samplerate != self.SAMPLE_RATE:
+            import scipy.signal
+
+            number_of_samples = round(len(audio_data) * self.SAMPLE_RATE / recording_samplerate)
+            audio_data = scipy.signal.resample(audio_data, number_of_samples).astype(np.float32)
+
+        return self._get_scheduler().transcribe(
+            audio_data=audio_data,
+            sample_rate=self.SAMPLE_RATE,
+            language=language,
+            latency_target_ms=self._latency_target_ms(priority),
+            priority=priority,
+        )
+
+    def stop_recording(self, trim_after_s: Optional[float] = None) -> RecordingResult:
         """
         Stop recording and return the audio data.
 
+        Args:
+            trim_after_s: Drop audio after this position (e.g. trailing silence)
+
         Returns:
             RecordingResult with audio data
         """
@@ -399,72 +1435,89 @@ class TranscriberService:
                 raise RuntimeError("Not recording")
 
         try:
-            # Stop stream
+            # Stop stream (a warm microphone keeps running, it just stops delivering)
             if self._stream:
                 self._stream.stop()
                 self._stream.close()
                 self._stream = None
+            if self._warm_mic is not None:
+                self._warm_mic.detach()
 
             # Calculate duration
             duration = time.time() - self._recording_start_time if self._recording_start_time else 0
 
-            # Concatenate audio buffer - hold lock for entire operation
+            # Take the buffer; the producer has stopped, so the concatenation
+            # and resampling below don't need the lock
+            spill = self._stop_spill()
             with self._lock:
-                buffer_count = len(self._audio_buffer)
-                logger.info(
-                    f"Stopping recording: {buffer_count} audio chunks in buffer after {duration:.2f}s"
+                chunks, self._audio_buffer = self._audio_buffer, []
+            if not self._external_recording:
+                logger.info(f"Capture: {self._telemetry.summary()}")
+            if spill is not None:
+                return self._finish_spilled_recording(spill, chunks, duration, trim_after_s)
+
+            buffer_count = len(chunks)
+            logger.info(
+                f"Stopping recording: {buffer_count} audio chunks in buffer after {duration:.2f}s"
+            )
+
+            if not chunks:
+                logger.error(
+                    f"Audio buffer is empty! Recording duration: {duration:.2f}s. Audio callback was never triggered!"
+                )
+                logger.error(
+                    "Possible causes: microphone muted, wrong device selected, permissions issue, or sounddevice error"
+                )
+                raise RuntimeError(
+                    "No audio recorded - microphone may not be working or is muted"
                 )
 
-                if not self._audio_buffer:
-                    logger.error(
-                        f"Audio buffer is empty! Recording duration: {duration:.2f}s. Audio callback was never triggered!"
-                    )
-                    logger.error(
-                        "Possible causes: microphone muted, wrong device selected, permissions issue, or sounddevice error"
-                    )
-                    raise RuntimeError(
-                        "No audio recorded - microphone may not be working or is muted"
-                    )
+            audio_data = np.concatenate(chunks)
+            recording_samplerate = self._recording_samplerate or self.SAMPLE_RATE
+            if trim_after_s is not None:
+                keep = int(trim_after_s * recording_samplerate)
+                if keep < len(audio_data):
+                    audio_data = audio_data[:keep]
+                    duration = keep / recording_samplerate
+            total_samples = len(audio_data)
+            max_amplitude = np.abs(audio_data).max()
+            logger.info(
+                f"Audio data: {total_samples} samples at {recording_samplerate}Hz ({total_samples / recording_samplerate:.2f}s), max amplitude: {max_amplitude:.4f}"
+            )
 
-                audio_data = np.concatenate(self._audio_buffer)
-                recording_samplerate = self._recording_samplerate or self.SAMPLE_RATE
-                total_samples = len(audio_data)
-                max_amplitude = np.abs(audio_data).max()
-                logger.info(
-                    f"Audio data: {total_samples} samples at {recording_samplerate}Hz ({total_samples / recording_samplerate:.2f}s), max amplitude: {max_amplitude:.4f}"
+            if max_amplitude < 0.001:
+                logger.warning(
+                    f"Audio amplitude is very low ({max_amplitude:.6f}) - microphone may be muted or input volume too low"
                 )
 
-                if max_amplitude < 0.001:
-                    logger.warning(
-                        f"Audio amplitude is very low ({max_amplitude:.6f}) - microphone may be muted or input volume too low"
-                    )
+            # Resample to target sample rate if needed
+            if recording_samplerate != self.SAMPLE_RATE:
+                logger.info(f"Resampling from {recording_samplerate}Hz to {self.SAMPLE_RATE}Hz")
+                try:
+                    import scipy.signal
+                except ImportError as e:
+                    raise RuntimeError(
+                        f"scipy is required for audio resampling from {recording_samplerate}Hz to {self.SAMPLE_RATE}Hz, but it's not installed. "
+                        "Please install it with: pip install scipy"
+                    ) from e
 
-                # Resample to target sample rate if needed
-                if recording_samplerate != self.SAMPLE_RATE:
-                    logger.info(f"Resampling from {recording_samplerate}Hz to {self.SAMPLE_RATE}Hz")
-                    try:
-                        import scipy.signal
-                    except ImportError as e:
-                        raise RuntimeError(
-                            f"scipy is required for audio resampling from {recording_samplerate}Hz to {self.SAMPLE_RATE}Hz, but it's not installed. "
-                            "Please install it with: pip install scipy"
-                        ) from e
-
-                    number_of_samples = round(
-                        len(audio_data) * float(self.SAMPLE_RATE) / recording_samplerate
-                    )
-                    audio_data = scipy.signal.resample(audio_data, number_of_samples)
-                    audio_data = audio_data.astype(np.float32)
-                    logger.info(
-                        f"Resampled to {len(audio_data)} samples ({len(audio_data) / self.SAMPLE_RATE:.2f}s)"
-                    )
+                number_of_samples = round(
+                    len(audio_data) * float(self.SAMPLE_RATE) / recording_samplerate
+                )
+                audio_data = scipy.signal.resample(audio_data, number_of_samples)
+                audio_data = audio_data.astype(np.float32)
+                logger.info(
+                    f"Resampled to {len(audio_data)} samples ({len(audio_data) / self.SAMPLE_RATE:.2f}s)"
+                )
 
-                # Clear buffer while still holding lock
-                self._audio_buffer = []
+            # Streamed audio can arrive in bursts, so its length is the duration
+            if self._external_recording:
+                duration = len(audio_data) / self.SAMPLE_RATE
 
             # Update timing vars
             self._recording_start_time = None
             self._recording_samplerate = None
+            self._external_recording = False
 
             logger.info(f"Recording stopped, duration: {duration:.2f}s")
 
@@ -488,85 +1541,201 @@ class TranscriberService:
     CHUNK_THRESHOLD_SAMPLES = 5 * 60 * SAMPLE_RATE  # 4,800,000 samples
     # Chunk size for long recordings: 2 minutes (balance between progress updates and efficiency)
     CHUNK_SIZE_SAMPLES = 2 * 60 * SAMPLE_RATE  # 1,920,000 samples
+    # Batch-priority audio uses shorter chunks: dictation waits for at most one
+    # in-flight batch chunk before it gets the model
+    BATCH_CHUNK_THRESHOLD_SAMPLES = 2 * 60 * SAMPLE_RATE
+    BATCH_CHUNK_SIZE_SAMPLES = 60 * SAMPLE_RATE
+
+    def _chunk_threshold(self, priority: Priority) -> int:
+        """Length above which audio of this priority is transcribed in chunks."""
+        if Priority(priority) == Priority.INTERACTIVE:
+            return self.CHUNK_THRESHOLD_SAMPLES
+        return self.BATCH_CHUNK_THRESHOLD_SAMPLES
 
     def transcribe(
         self,
-        audio_data: "NDArray[np.float32]",
+        audio_data: "NDArray[np.float32] | SpilledAudio | AudioFileStream",
         sample_rate: int = 16000,
         language: Optional[str] = None,
         progress_callback: Optional[TranscriptionProgressCallback] = None,
         instruction: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        cancel_token: Optional[CancellationToken] = None,
+        update_state: Optional[bool] = None,
+        trim_silence: bool = False,
     ) -> TranscriptionResult:
         """
         Transcribe audio data with optional chunked processing for long recordings.
 
         Args:
-            audio_data: Audio samples as float32 numpy array
+            audio_data: Audio samples as float32 numpy array, a recording
+                spilled to disk, or an audio file stream (both read one chunk
+                at a time)
             sample_rate: Sample rate of the audio
             language: Language code or 'auto'
             progress_callback: Optional callback for progress updates during long transcriptions.
                 Receives (current_chunk, total_chunks, chunk_text) for each completed chunk.
             instruction: Optional instruction or system prompt (e.g. for grammar correction)
+            priority: Scheduling class. Batch-priority work yields the model to
+                interactive requests between chunks and does not change the
+                service state, which only tracks live dictation.
+            cancel_token: Optional token (with an optional deadline) checked
+                before every chunk and inside the model between segments.
+                Interactive transcriptions get one automatically, so
+                cancel_transcription() can stop them.
+            update_state: Whether this is the live transcription tracked by the
+                service state (default: interactive priority only). Pipelined
+                dictation passes False so the next recording can start meanwhile.
+            trim_silence: Cut leading and trailing silence from in-memory audio
+                first, if trimming is enabled (see configure_silence_trimming)
 
         Returns:
             TranscriptionResult with transcribed text
 
+        Raises:
+            TranscriptionCancelledError: If the token is cancelled or its deadline passes
+
         Performance:
             - For recordings >5 minutes, audio is processed in 2-minute chunks
+              (batch priority: >2 minutes, in 1-minute chunks)
             - Progress callback is invoked after each chunk completes
             - Chunks are processed sequentially to maintain text order
         """
         if not self.is_model_loaded:
             raise RuntimeError("No model loaded")
 
-        self._set_state(TranscriberState.TRANSCRIBING)
+        priority = Priority(priority)
+        interactive = priority == Priority.INTERACTIVE
+        threshold = self._chunk_threshold(priority)
+        live = interactive if update_state is None else update_state
+
+        if live:
+            cancel_token = cancel_token or CancellationToken()
+            self._active_token = cancel_token
+            self._set_state(TranscriberState.TRANSCRIBING)
 
         try:
+            # Cut leading and trailing silence from in-memory audio
+            owner = self._shared_from if self._shared_from is not None else self
+            trimmer = owner._silence_trimmer if trim_silence else None
+            trim: Optional[TrimResult] = None
+            if trimmer is not None and isinstance(audio_data, np.ndarray):
+                audio_data, trim = trimmer.trim(audio_data, sample_rate)
+
+            if trim is not None and trim.silent:
+                result = self._silent_result(language, trim)
+                if progress_callback:
+                    progress_callback(1, 1, result.text)
             # Check if chunked processing is needed
-            if len(audio_data) > self.CHUNK_THRESHOLD_SAMPLES:
+            elif len(audio_data) > threshold:
                 result = self._transcribe_chunked(
                     audio_data=audio_data,
                     sample_rate=sample_rate,
                     language=language,
                     progress_callback=progress_callback,
                     instruction=instruction,
+                    priority=priority,
+                    cancel_token=cancel_token,
                 )
             else:
                 # Standard single-pass transcription
-                result = self._model.transcribe(
+                if isinstance(audio_data, AudioFileStream):
+                    audio_data = audio_data.read()
+                elif isinstance(audio_data, SpilledAudio):
+                    audio_data = audio_data[:]
+                result = self._get_scheduler().transcribe(
                     audio_data=audio_data,
                     sample_rate=sample_rate,
                     language=language,
                     instruction=instruction,
+                    latency_target_ms=self._latency_target_ms(priority, cancel_token),
+                    priority=priority,
+                    cancel_token=cancel_token,
                 )
                 # Report completion for single-pass
                 if progress_callback:
                     progress_callback(1, 1, result.text)
 
-            self._set_state(TranscriberState.READY)
+            if trim is not None and not trim.silent:
+                result = self._untrim(result, trim)
+            if live:
+                self._set_state(TranscriberState.READY)
             return result
 
+        except TranscriptionCancelledError as e:
+            logger.info(f"Transcription stopped: {e}")
+            if live:
+                self._set_state(TranscriberState.READY)
+            raise
+
         except Exception as e:
-            self._set_state(TranscriberState.ERROR)
+            if live:
+                self._set_state(TranscriberState.ERROR)
             raise
 
+        finally:
+            if live and self._active_token is cancel_token:
+                self._active_token = None
+
+    def cancel_transcription(self, reason: Optional[str] = None) -> bool:
+        """
+        Stop the live transcription in progress and any queued dictation.
+
+        The model is released at the next chunk or segment boundary.
+
+        Args:
+            reason: Optional message for the raised TranscriptionCancelledError
+
+        Returns:
+            True if a transcription was in progress
+        """
+        cancelled = self._dictation.cancel_all() if self._dictation else 0
+
+        token = self._active_token
+        if token is not None:
+            token.cancel(reason)
+            cancelled += 1
+
+        if cancelled:
+            logger.info("Transcription cancel requested")
+        return cancelled > 0
+
+    @property
+    def pending_dictations(self) -> int:
+        """Number of stopped recordings still waiting for their transcript."""
+        return self._dictation.pending if self._dictation else 0
+
+    def _get_dictation_queue(self) -> "DictationQueue":
+        """Get the dictation queue, creating it on first use."""
+        from .dictation import DictationQueue
+
+        with self._scheduler_lock:
+            if self._dictation is None:
+                self._dictation = DictationQueue(self)
+            return self._dictation
+
     def _transcribe_chunked(
         self,
-        audio_data: "NDArray[np.float32]",
+        audio_data: "NDArray[np.float32] | SpilledAudio | AudioFileStream",
         sample_rate: int,
         language: Optional[str],
         progress_callback: Optional[TranscriptionProgressCallback],
         instruction: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> TranscriptionResult:
         """
         Transcribe long audio in chunks with progress reporting.
 
         Args:
-            audio_data: Full audio data
+            audio_data: Full audio data (chunks are sliced, or decoded, as they are queued)
             sample_rate: Sample rate
             language: Language code
             progress_callback: Progress callback
             instruction: Optional instruction
+            priority: Scheduling class of every chunk
+            cancel_token: Optional token checked before every chunk; queued
+                chunks of a cancelled recording never reach the model
 
         Returns:
             Combined TranscriptionResult
@@ -575,9 +1744,14 @@ class TranscriberService:
 
         start_time = time.perf_counter()
         total_samples = len(audio_data)
-        chunk_size = self.CHUNK_SIZE_SAMPLES
+        chunk_size = (
+            self.CHUNK_SIZE_SAMPLES
+            if priority == Priority.INTERACTIVE
+            else self.BATCH_CHUNK_SIZE_SAMPLES
+        )
+        scheduler = self._get_scheduler()
 
-        # Calculate number of chunks
+        # Calculate number of chunks (estimated from the metadata for a file stream)
         num_chunks = (total_samples + chunk_size - 1) // chunk_size
 
         logger.info(
@@ -585,34 +1759,101 @@ class TranscriberService:
             f"in {num_chunks} chunks of {chunk_size / sample_rate:.0f}s each"
         )
 
-        texts = []
-        for i in range(num_chunks):
-            chunk_start = i * chunk_size
-            chunk_end = min((i + 1) * chunk_size, total_samples)
-            chunk_data = audio_data[chunk_start:chunk_end]
-
-            # Skip very short final chunks (< 0.5 seconds)
-            if len(chunk_data) < sample_rate // 2:
-                logger.debug(f"Skipping short final chunk: {len(chunk_data)} samples")
-                continue
+        # With "auto", the language detected on the first chunk that contains speech
+        # is pinned for the rest of the recording: this avoids re-running detection
+        # on every chunk and stops the language flipping mid-recording.
+        pinned_language = language if language and language != "auto" else None
 
-            # Transcribe chunk
-            chunk_result = self._model.transcribe(
-                audio_data=chunk_data,
-                sample_rate=sample_rate,
-                language=language,
-                instruction=instruction,
-            )
+        def iter_chunks():
+            # Chunks are sliced (or decoded) only when they are queued
+            if isinstance(audio_data, AudioFileStream):
+                chunks = enumerate(audio_data.chunks(chunk_size))
+            else:
+                chunks = (
+                    (i, audio_data[i * chunk_size : (i + 1) * chunk_size])
+                    for i in range(num_chunks)
+                )
+            for i, chunk in chunks:
+                # Skip very short final chunks (< 0.5 seconds)
+                if len(chunk) < sample_rate // 2:
+                    logger.debug(f"Skipping short final chunk: {len(chunk)} samples")
+                    continue
+                yield i, chunk
+
+        texts = []
+        segments: list[TranscriptionSegment] = []
 
+        def collect(i: int, chunk_result: TranscriptionResult) -> str:
             chunk_text = chunk_result.text.strip()
             if chunk_text:
                 texts.append(chunk_text)
+            # Segment times are relative to the chunk
+            offset = i * chunk_size / sample_rate
+            segments.extend(
+                replace(s, start=s.start + offset, end=s.end + offset)
+                for s in chunk_result.segments
+            )
 
-            # Report progress
+            # Report progress (a stream may hold more chunks than its metadata said)
             if progress_callback:
-                progress_callback(i + 1, num_chunks, chunk_text)
+                progress_callback(i + 1, max(num_chunks, i + 1), chunk_text)
 
             logger.debug(f"Chunk {i + 1}/{num_chunks} transcribed: {len(chunk_text)} chars")
+            return chunk_text
+
+        chunks = iter_chunks()
+        try:
+            if pinned_language is None:
+                for i, chunk in chunks:
+                    if cancel_token:
+                        cancel_token.check()
+
+                    # Transcribe chunk
+                    chunk_result = scheduler.transcribe(
+                        audio_data=chunk,
+                        sample_rate=sample_rate,
+                        language=language,
+                        instruction=instruction,
+                        latency_target_ms=self._latency_target_ms(priority, cancel_token),
+                        priority=priority,
+                        cancel_token=cancel_token,
+                    )
+
+                    if collect(i, chunk_result):
+                        if chunk_result.language not in (None, "auto"):
+                            pinned_language = chunk_result.language
+                            logger.info(
+                                f"Detected language '{pinned_language}' in chunk {i + 1}, "
+                                f"pinning it"
+                            )
+                        break
+
+            # Once the language is settled the remaining chunks are independent, so
+            # they are queued together (and batched, if micro-batching is enabled).
+            # The window is bounded, so a recording read from disk or a file being
+            # decoded is never loaded all at once.
+            in_flight = max(self.MAX_CHUNKS_IN_FLIGHT, scheduler.max_batch_size)
+            futures: deque = deque()
+            for i, chunk in chunks:
+                future = scheduler.submit(
+                    audio_data=chunk,
+                    sample_rate=sample_rate,
+                    language=pinned_language or language,
+                    instruction=instruction,
+                    latency_target_ms=self._latency_target_ms(priority, cancel_token),
+                    priority=priority,
+                    cancel_token=cancel_token,
+                )
+                futures.append((i, future))
+                if len(futures) >= in_flight:
+                    i, future = futures.popleft()
+                    collect(i, future.result())
+            while futures:
+                i, future = futures.popleft()
+                collect(i, future.result())
+        finally:
+            # Closes the file of a stream that wasn't read to the end
+            chunks.close()
 
         # Combine results
         combined_text = " ".join(texts)
@@ -621,71 +1862,138 @@ class TranscriberService:
         return TranscriptionResult(
             text=combined_text,
             duration_ms=duration_ms,
-            language=language,
-            model_used=self._model.model_name if self._model else None,
+            language=pinned_language or language,
+            model_used=self._base_engine().model_name if self.is_model_loaded else None,
+            segments=segments,
         )
 
     def transcribe_file(
         self,
-        file_path: str,
+        file_path: "str | BinaryIO",
         language: Optional[str] = None,
         progress_callback: Optional[TranscriptionProgressCallback] = None,
         instruction: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        cancel_token: Optional[CancellationToken] = None,
+        cache_audio: bool = False,
     ) -> TranscriptionResult:
         """
         Transcribe an audio file.
 
+        Files longer than the chunking threshold are decoded as a stream:
+        each chunk is queued as soon as it is decoded, so memory stays bounded
+        by the chunk size and the first text arrives before the whole file is
+        read. Shorter files are decoded up front.
+
+        With `cache_audio` (and the cache configured), the decoded audio is
+        transcribed from a memory map if it is cached; otherwise it is written
+        to the cache as it is decoded, and kept once the whole file is read.
+
+        With the result cache enabled, a file with the same content, model
+        setup, language and instruction as an earlier one gets the stored
+        transcript (`from_cache` is set), and a request identical to one in
+        progress waits for its result.
+
         Args:
-            file_path: Path to the audio file
+            file_path: Path to the audio file, or an open seekable binary file
+                (an upload, read in place)
             language: Language code or 'auto'
             progress_callback: Optional callback for progress updates
             instruction: Optional instruction
+            priority: Scheduling class (batch jobs pass Priority.BATCH)
+            cancel_token: Optional cancellation token (e.g. with a per-file deadline)
+            cache_audio: Use the decoded audio cache (batch jobs, which are
+                retried and re-run)
 
         Returns:
             TranscriptionResult with transcribed text
+
+        Raises:
+            TranscriptionCancelledError: If the token is cancelled or its deadline passes
         """
         if not self.is_model_loaded:
             raise RuntimeError("No model loaded")
 
-        try:
-            # Use faster_whisper's robust audio decoding (handles ffmpeg, resampling to 16k)
-            from faster_whisper.audio import decode_audio
+        def decode_and_transcribe() -> TranscriptionResult:
+            try:
+                # The decoded audio cache is keyed by path
+                use_cache = cache_audio and isinstance(file_path, str)
+                audio_data = self._load_cached_audio(file_path) if use_cache else None
+                if audio_data is None:
+                    # PyAV (ffmpeg) when available, soundfile otherwise; both resample to 16k
+                    audio_data = AudioFileStream(file_path, self.SAMPLE_RATE)
+                # Decode short files now, so a broken file fails before it is queued
+                # (a file without a duration in its metadata is also read whole)
+                if isinstance(audio_data, AudioFileStream):
+                    if len(audio_data) <= self._chunk_threshold(priority):
+                        audio_data = audio_data.read()
+            except Exception as e:
+                logger.error(f"Error reading audio file {file_path}: {e}")
+                raise
 
-            audio_data = decode_audio(file_path, sampling_rate=self.SAMPLE_RATE)
-        except ImportError:
-            # Fallback if faster_whisper is not importable (should be rare in prod)
-            logger.warning("faster_whisper not found, falling back to soundfile")
-            import scipy.signal
-            import soundfile as sf
+            # Decoding a long file takes a while; don't queue it if it was cancelled meanwhile
+            if cancel_token:
+                cancel_token.check()
 
-            audio, sr = sf.read(file_path, dtype="float32")
-            if len(audio.shape) > 1:
-                audio = audio.mean(axis=1)
+            owner = self._shared_from if self._shared_from is not None else self
+            return self.transcribe(
+                audio_data=audio_data,
+                sample_rate=self.SAMPLE_RATE,
+                language=language,
+                progress_callback=progress_callback,
+                instruction=instruction,
+                priority=priority,
+                cancel_token=cancel_token,
+                trim_silence=owner._trim_files,
+            )
 
-            if sr != self.SAMPLE_RATE:
-                # Resample using scipy
-                number_of_samples = round(len(audio) * float(self.SAMPLE_RATE) / sr)
-                audio_data = scipy.signal.resample(audio, number_of_samples)
-            else:
-                audio_data = audio
+        cache = self._result_cache
+        if cache is None:
+            return decode_and_transcribe()
 
-        except Exception as e:
+        try:
+            digest = cache.content_hash(file_path)
+        except OSError as e:
             logger.error(f"Error reading audio file {file_path}: {e}")
             raise
+        key = cache.key(digest, self._engine_signature(), language, instruction)
+        result = cache.run(key, decode_and_transcribe, cancel_token)
+        if result.from_cache:
+            logger.info(f"Transcript of {file_path} served from the result cache")
+            if progress_callback:
+                progress_callback(1, 1, result.text)
+        return result
 
-        return self.transcribe(
-            audio_data=audio_data,
-            sample_rate=self.SAMPLE_RATE,
-            language=language,
-            progress_callback=progress_callback,
-            instruction=instruction,
-        )
+    def _load_cached_audio(
+        self, file_path: str
+    ) -> "Optional[NDArray[np.float32] | AudioFileStream]":
+        """
+        Decoded audio of a file from the cache, or a stream that fills the cache on a miss.
+
+        Returns:
+            A memory-mapped array on a hit; on a miss, an AudioFileStream whose
+            first full decode is stored; None if the cache is disabled (the
+            caller then decodes as usual)
+        """
+        cache = self._audio_cache
+        if cache is None:
+            return None
+        audio = cache.get(file_path, self.SAMPLE_RATE)
+        if audio is not None:
+            logger.debug(f"Decoded audio of {file_path} read from the cache")
+            return audio
+
+        stream = AudioFileStream(file_path, self.SAMPLE_RATE)
+        stream.cache_writer = cache.writer(file_path, self.SAMPLE_RATE, len(stream))
+        return stream
 
     def stop_and_transcribe(
         self,
         language: Optional[str] = None,
         progress_callback: Optional[TranscriptionProgressCallback] = None,
         instruction: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        trim_after_s: Optional[float] = None,
     ) -> TranscriptionResult:
         """
         Stop recording and transcribe immediately.
@@ -697,11 +2005,13 @@ class TranscriberService:
             progress_callback: Optional callback for progress updates during long transcriptions.
                 Receives (current_chunk, total_chunks, chunk_text) for each completed chunk.
             instruction: Optional instruction
+            cancel_token: Optional cancellation token (e.g. with a deadline)
+            trim_after_s: Drop audio after this position (see stop_recording)
 
         Returns:
             TranscriptionResult with transcribed text
         """
-        recording = self.stop_recording()
+        recording = self.stop_recording(trim_after_s=trim_after_s)
 
         # Get the actual audio recording duration in milliseconds
         audio_duration_ms = int(recording.duration_seconds * 1000)
@@ -713,6 +2023,8 @@ class TranscriberService:
             language=language,
             progress_callback=progress_callback,
             instruction=instruction,
+            cancel_token=cancel_token,
+            trim_silence=True,
         )
 
         # Replace processing time with actual audio duration
@@ -723,7 +2035,131 @@ class TranscriberService:
             language=result.language,
             model_used=result.model_used,
             processing_ms=result.duration_ms,  # Keep the transcription processing time
+            trimmed_ms=result.trimmed_ms,
+        )
+
+    def stop_and_enqueue(
+        self,
+        language: Optional[str] = None,
+        instruction: Optional[str] = None,
+        on_done: Optional["UtteranceCallback"] = None,
+        trim_after_s: Optional[float] = None,
+    ) -> "Utterance":
+        """
+        Stop recording and transcribe in the background.
+
+        Returns as soon as capture has stopped: the service is READY again, so
+        the next recording can start while this one is transcribed. Utterances
+        are transcribed one at a time and `on_done` runs in the order they were
+        stopped, so results can be saved and pasted in dictation order.
+
+        Args:
+            language: Language code or 'auto'
+            instruction: Optional instruction
+            on_done: Called on the queue's worker thread with
+                (utterance, result or None, error or None)
+            trim_after_s: Drop audio after this position (see stop_recording)
+
+        Returns:
+            The queued Utterance (its id identifies the result)
+        """
+        recording = self.stop_recording(trim_after_s=trim_after_s)
+
+        with self._state_lock:
+            self._set_state(TranscriberState.READY)
+
+        return self._get_dictation_queue().submit(
+            recording, language=language, instruction=instruction, on_done=on_done
+        )
+
+    def _reset_endpointer(self, samplerate: int) -> None:
+        """Start end-of-speech detection for a new microphone recording."""
+        self._endpoint_recording += 1
+        # The worker resets the detector, after the blocks of the previous recording
+        self._endpoint_queue.put((samplerate, self._endpoint_recording))
+
+    def _endpoint_loop(self) -> None:
+        """
+        Endpoint worker: run the detector over the audio the callback queued
+        and finalize the recordings found ended.
+        """
+        recording = 0
+        while True:
+            item = self._endpoint_queue.get()
+            if item is None:
+                return
+            endpointer = self._endpointer
+            if endpointer is None:
+                continue
+            try:
+                if isinstance(item, tuple):
+                    samplerate, recording = item
+                    endpointer.reset(samplerate)
+                    continue
+                decision = endpointer.process(item)
+                if decision is not None:
+                    self._finalize_endpoint(decision, recording)
+            except Exception as e:
+                logger.error(f"Endpointing failed: {e}")
+
+    def _stop_endpoint_worker(self) -> None:
+        """Stop the endpoint worker after the decisions already queued."""
+        thread, self._endpoint_thread = self._endpoint_thread, None
+        if thread is None:
+            return
+        self._endpoint_queue.put(None)
+        # An on_endpoint callback may disable endpointing from the worker itself
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _finalize_endpoint(self, decision: EndpointDecision, recording: int) -> None:
+        """Stop and queue a recording whose end of speech was detected."""
+        # The hotkey may already have stopped it (and started the next one)
+        if (
+            self._state != TranscriberState.RECORDING
+            or self._external_recording
+            or self._endpoint_recording != recording
+        ):
+            return
+
+        logger.info(
+            f"End of speech at {decision.speech_end_s:.2f}s "
+            f"(decided {decision.detection_ms:.0f}ms later)"
         )
+        tail_s = self._endpointer.config.tail_ms / 1000 if self._endpointer else 0.0
+        on_endpoint, on_endpoint_done = self._on_endpoint, self._on_endpoint_done
+        # The transcript is only handed on once the decision has been announced
+        announced = threading.Event()
+
+        def on_done(utterance, result, error) -> None:
+            announced.wait()
+            decision.finalize_ms = (time.monotonic() - decision.decided_at) * 1000
+            if result is not None:
+                logger.info(
+                    f"Endpointed utterance {utterance.id} transcribed "
+                    f"{decision.finalize_ms:.0f}ms after the decision"
+                )
+            if on_endpoint_done:
+                on_endpoint_done(utterance, result, error)
+
+        try:
+            utterance = self.stop_and_enqueue(
+                language=self._endpoint_language,
+                instruction=self._endpoint_instruction,
+                on_done=on_done,
+                trim_after_s=decision.speech_end_s + tail_s,
+            )
+        except Exception as e:
+            logger.info(f"Endpoint finalization did not complete: {e}")
+            return
+
+        try:
+            if on_endpoint:
+                on_endpoint(decision, utterance)
+        except Exception as e:
+            logger.error(f"Error in endpoint callback: {e}")
+        finally:
+            announced.set()
 
     def cancel_recording(self) -> None:
         """Cancel the current recording without transcribing."""
@@ -746,34 +2182,35 @@ class TranscriberService:
 
     def cleanup(self) -> None:
         """Clean up all resources including model and recording state."""
-        # Hold state lock during entire cleanup
-        with self._state_lock:
-            try:
-                self._cleanup_recording_state()
-            finally:
-                self.unload_model()
-
-
-def list_audio_devices() -> list[dict]:
+        # _cleanup_recording_state() takes the state lock itself (it is not reentrant)
+        try:
+            self._cleanup_recording_state()
+        finally:
+            if self._warm_mic is not None:
+                self._warm_mic.close()
+                self._warm_mic = None
+            self._stop_endpoint_worker()
+            if self._dictation:
+                self._dictation.close()
+                self._dictation = None
+            if self._scheduler:
+                self._scheduler.close()
+                self._scheduler = None
+            if self._result_cache:
+                self._result_cache.close()
+                self._result_cache = None
+            self.unload_model()
+
+
+def list_audio_devices(rescan: bool = False) -> list[dict]:
     """
     List available audio input devices.
 
+    Args:
+        rescan: Rescan the devices (reinitializing PortAudio if no stream is open)
+            instead of using the cached list
+
     Returns:
         List of device info dictionaries
     """
-    devices = sd.query_devices()
-    input_devices = []
-
-    for i, dev in enumerate(devices):
-        if dev["max_input_channels"] > 0:
-            input_devices.append(
-                {
-                    "id": i,
-                    "name": dev["name"],
-                    "channels": dev["max_input_channels"],
-                    "sample_rate": dev["default_samplerate"],
-                    "is_default": i == sd.default.device[0],
-                }
-            )
-
-    return input_devices
+    return get_device_registry().list_inputs(rescan=rescan)
@@ -0,0 +1,192 @@
+"""
+Always-open microphone with a pre-roll ring buffer.
+
+Opening an input stream (device queries plus PortAudio stream setup) can take
+hundreds of milliseconds on PulseAudio and WASAPI, and the first syllable is
+often lost. A WarmMicrophone keeps the stream running and continuously writes
+into a small ring buffer. Starting a recording only attaches a sink: the last
+`pre_roll_s` seconds from the ring are delivered first, then every new block,
+so the recording even includes audio from just before the hotkey.
+
+The stream callback takes no locks: attach() leaves the sink for the next
+callback, which hands over the pre-roll and the new block together, so no
+audio is lost or duplicated between them.
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+import numpy as np
+import sounddevice as sd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRE_ROLL_MS = 300.0
+# Ring capacity beyond the pre-roll
+RING_HEADROOM_S = 0.5
+# Longest detach() waits for a callback in progress
+DETACH_TIMEOUT_S = 0.5
+
+# Same signature as a sounddevice input callback: (indata, frames, time_info, status)
+BlockSink = Callable[[np.ndarray, int, dict, Optional[sd.CallbackFlags]], None]
+# Receives the pre-roll (mono float32 samples) right before the first block
+PreRollSink = Callable[[np.ndarray], None]
+
+
+class WarmMicrophone:
+    """
+    Input stream that stays open between recordings.
+
+    attach()/detach() may be called from any thread while the stream delivers
+    blocks on PortAudio's thread.
+    """
+
+    def __init__(
+        self,
+        device_id: Optional[int],
+        samplerate: int,
+        channels: int = 1,
+        pre_roll_s: float = DEFAULT_PRE_ROLL_MS / 1000,
+        blocksize: int = 0,
+        latency: Optional[str | float] = None,
+    ):
+        """
+        Initialize the microphone (the stream is opened by open()).
+
+        Args:
+            device_id: PortAudio device index, or None for the default input
+            samplerate: Native sample rate of the device
+            channels: Number of input channels (the ring stores the first one)
+            pre_roll_s: Audio from before attach() delivered to each recording
+            blocksize: Frames per callback (0 lets PortAudio choose)
+            latency: Stream latency ("low", "high", seconds, or None for the default)
+        """
+        self.device_id = device_id
+        self.samplerate = samplerate
+        self.channels = channels
+        self.pre_roll_s = max(0.0, pre_roll_s)
+        self.blocksize = blocksize
+        self.latency = latency
+
+        capacity = int((self.pre_roll_s + RING_HEADROOM_S) * samplerate)
+        self._ring = np.zeros(max(1, capacity), dtype=np.float32)
+        self._written = 0  # Total samples written since open()
+        self._sink: Optional[BlockSink] = None
+        # Installed by the next callback (attribute swaps are atomic, no lock needed)
+        self._pending: Optional[tuple[BlockSink, Optional[PreRollSink]]] = None
+        self._in_callback = False
+        self._stream: Optional[sd.InputStream] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the stream is running."""
+        return self._stream is not None
+
+    def open(self) -> None:
+        """Open and start the input stream."""
+        if self._stream is not None:
+            return
+        stream = sd.InputStream(
+            samplerate=self.samplerate,
+            channels=self.channels,
+            dtype=np.float32,
+            device=self.device_id,
+            blocksize=self.blocksize,
+            latency=self.latency,
+            callback=self._callback,
+        )
+        stream.start()
+        self._stream = stream
+        logger.info(
+            f"Warm microphone open (device={self.device_id}, {self.samplerate}Hz, "
+            f"pre-roll {self.pre_roll_s * 1000:.0f}ms)"
+        )
+
+    def close(self) -> None:
+        """Stop and close the stream, detaching any sink."""
+        self.detach()
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                logger.warning(f"Error closing warm microphone: {e}")
+            logger.info("Warm microphone closed")
+
+    def attach(self, sink: BlockSink, on_pre_roll: Optional[PreRollSink] = None) -> int:
+        """
+        Start delivering audio to `sink`, beginning with the pre-roll.
+
+        Returns immediately. On the stream's next callback `on_pre_roll`
+        receives the pre-roll, then `sink` receives that block and every
+        following one.
+
+        Returns:
+            Number of pre-roll samples currently available
+        """
+        self._pending = (sink, on_pre_roll)
+        return self.pre_roll_available()
+
+    def detach(self) -> None:
+        """Stop delivering audio to the current sink (the stream keeps running)."""
+        self._pending = None
+        self._sink = None
+        # A callback in progress may still deliver one block (or install a
+        # pending sink it had already taken); wait for it, then clear again
+        deadline = time.monotonic() + DETACH_TIMEOUT_S
+        while self._in_callback and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        self._sink = None
+
+    def pre_roll_available(self) -> int:
+        """Number of pre-roll samples in the ring."""
+        return min(self._written, len(self._ring), int(self.pre_roll_s * self.samplerate))
+
+    def _read_last(self, count: int) -> np.ndarray:
+        """Copy the newest `count` samples out of the ring."""
+        if count == 0:
+            return np.zeros(0, dtype=np.float32)
+        end = self._written % len(self._ring)
+        start = end - count
+        if start >= 0:
+            return self._ring[start:end].copy()
+        return np.concatenate((self._ring[start:], self._ring[:end]))
+
+    def _write(self, samples: np.ndarray) -> None:
+        """Append samples to the ring, overwriting the oldest."""
+        size = len(self._ring)
+        if len(samples) >= size:
+            samples = samples[-size:]
+        pos = self._written % size
+        first = min(len(samples), size - pos)
+        self._ring[pos : pos + first] = samples[:first]
+        self._ring[: len(samples) - first] = samples[first:]
+        self._written += len(samples)
+
+    def _callback(
+        self,
+        indata: np.ndarray,
+        frames: int,
+        time_info: dict,
+        status: sd.CallbackFlags,
+    ) -> None:
+        """Stream callback: keep the ring current and forward to the attached sink."""
+        self._in_callback = True
+        try:
+            pending = self._pending
+            if pending is not None:
+                self._pending = None
+                sink, on_pre_roll = pending
+                available = self.pre_roll_available()
+                if on_pre_roll is not None and available:
+                    on_pre_roll(self._read_last(available))
+                self._sink = sink
+
+            self._write(indata[:, 0])
+            sink = self._sink
+            if sink is not None:
+                sink(indata, frames, time_info, status)
+        finally:
+            self._in_callback = False
@@ -5,35 +5,64 @@ Provides HTTP and WebSocket APIs for the Electron frontend.
 """
 
 import asyncio
+import json
 import logging
 import os
 import re
 from contextlib import asynccontextmanager
-from typing import Optional
-
-from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Optional
+
+from fastapi import (
+    FastAPI,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
 from pydantic import BaseModel, Field, field_validator
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
+from .core.audio_file import AudioFileStream
+from .core.audio_ingest import TARGET_SAMPLE_RATE, AudioFormat, FrameDecoder
+from .core.cancellation import (
+    CancellationToken,
+    DeadlineExceededError,
+    TranscriptionCancelledError,
+)
+from .core.capture import parse_latency
 from .core.config import (
     MODEL_INFO,
     get_available_models,
     get_compute_types,
     get_languages_for_model,
 )
-from .core.models import TranscriptionResult, get_gpu_info, recommend_model
+from .core.devices import get_device_registry
+from .core.dictation import Utterance
+from .core.endpointing import EndpointDecision
+from .core.models import TranscriptionResult, TranscriptionSegment, get_gpu_info, recommend_model
 from .core.text_cleanup import (
     TextCleanupProcessor,
     safe_cleanup,
     get_cached_processor,
     clear_cached_processor,
 )
+from .core.scheduler import Priority
+from .core.sessions import DEFAULT_SESSION_ID, SessionManager
 from .core.transcriber import TranscriberService, TranscriberState, list_audio_devices
 from .services.batch import BatchJob, BatchJobStatus, BatchService
+from .services.broadcast import TOPICS, Broadcaster, serialize
+from .services.event_bus import EventBus
 from .services.download_state import (
     DownloadStatus,
     ModelDownloadProgress,
@@ -59,9 +88,17 @@ transcriber: Optional[TranscriberService] = None
 history: Optional[HistoryService] = None
 settings_service: Optional[SettingsService] = None
 batch_service: Optional[BatchService] = None
+sessions: Optional[SessionManager] = None
 
-# WebSocket connections for real-time updates
-websocket_connections: list[WebSocket] = []
+# WebSocket connections for real-time updates, each with its own send queue
+broadcaster = Broadcaster()
+# Events from any thread, delivered to the broadcaster on the event loop
+event_bus = EventBus(broadcaster.publish)
+
+SESSION_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
+
+# Seconds of new audio between partial results on /api/ws/audio
+PARTIAL_INTERVAL_S = 1.0
 
 
 # --- Pydantic Models ---
@@ -76,6 +113,11 @@ class TranscribeStopRequest(BaseModel):
     language: Optional[str] = Field(None, max_length=10)
     instruction: Optional[str] = Field(None, max_length=1000)
     grammar_correction: bool = False
+    # Give up on the transcription after this many seconds (504)
+    timeout_s: Optional[float] = Field(None, gt=0, le=24 * 3600)
+    # Return 202 at once and transcribe in the background (results arrive in
+    # order as "transcription" events), so the next recording can start
+    pipeline: bool = False
 
 
 class TranscribeStopResponse(BaseModel):
@@ -84,6 +126,12 @@ class TranscribeStopResponse(BaseModel):
     duration_ms: int
     model_used: Optional[str]
     language: Optional[str]
+    session_id: str = DEFAULT_SESSION_ID
+
+
+class SessionCreateRequest(BaseModel):
+    session_id: Optional[str] = Field(None, pattern=SESSION_ID_PATTERN)
+    device_name: Optional[str] = Field(None, max_length=200)
 
 
 class HistoryListResponse(BaseModel):
@@ -98,7 +146,35 @@ class SettingsUpdateRequest(BaseModel):
     compute_type: Optional[str] = Field(None, max_length=20)
     device: Optional[str] = Field(None, pattern=r"^(cuda|cpu)$")
     language: Optional[str] = Field(None, max_length=10)
+    enable_torch_compile: Optional[bool] = None
+    torch_compile_timeout_s: Optional[float] = Field(None, gt=0, le=3600)
+    cascade_fast_model: Optional[str] = Field(None, max_length=200)
+    cascade_logprob_threshold: Optional[float] = Field(None, ge=-10, le=0)
+    cascade_no_speech_threshold: Optional[float] = Field(None, ge=0, le=1)
+    enable_language_routing: Optional[bool] = None
+    routing_lid_model: Optional[str] = Field(None, max_length=200)
+    routing_models: Optional[list[dict[str, str]]] = Field(None, max_length=4)
+    routing_rules: Optional[dict[str, str]] = None
+    enable_batching: Optional[bool] = None
+    batch_max_size: Optional[int] = Field(None, ge=1, le=64)
+    batch_max_wait_ms: Optional[float] = Field(None, ge=0, le=1000)
+    enable_endpointing: Optional[bool] = None
+    endpointing_silence_ms: Optional[float] = Field(None, ge=100, le=10000)
+    endpointing_threshold_db: Optional[float] = Field(None, ge=-90, le=0)
+    endpointing_min_speech_ms: Optional[float] = Field(None, ge=0, le=5000)
+    trim_silence: Optional[bool] = None
+    trim_silence_threshold_db: Optional[float] = Field(None, ge=-90, le=0)
+    trim_silence_files: Optional[bool] = None
     device_name: Optional[str] = Field(None, max_length=200)
+    warm_microphone: Optional[bool] = None
+    pre_roll_ms: Optional[float] = Field(None, ge=0, le=2000)
+    spill_to_disk: Optional[bool] = None
+    spill_after_s: Optional[float] = Field(None, ge=30, le=3600)
+    capture_process: Optional[bool] = None
+    audio_cache_max_mb: Optional[int] = Field(None, ge=0, le=1_000_000)
+    enable_result_cache: Optional[bool] = None
+    capture_blocksize: Optional[int] = Field(None, ge=0, le=16384)
+    capture_latency: Optional[str] = Field(None, pattern=r"^(low|high|\d+(\.\d+)?)$")
     hotkey: Optional[str] = Field(None, max_length=50)
     hotkey_mode: Optional[str] = Field(None, pattern=r"^(toggle|push-to-talk)$")
     auto_paste: Optional[bool] = None
@@ -139,35 +215,187 @@ class HealthResponse(BaseModel):
     gpu_vram_gb: Optional[float]
 
 
+# --- Cascade ---
+
+
+def apply_cascade_settings(settings: AppSettings) -> None:
+    """Enable or disable the fast-first cascade to match settings."""
+    if not transcriber or not transcriber.is_model_loaded:
+        return
+
+    if not settings.cascade_fast_model:
+        transcriber.disable_cascade()
+        return
+
+    try:
+        transcriber.enable_cascade(
+            fast_model_name=settings.cascade_fast_model,
+            device=settings.device,
+            compute_type="int8" if settings.device == "cpu" else "int8_float16",
+            logprob_threshold=settings.cascade_logprob_threshold,
+            no_speech_threshold=settings.cascade_no_speech_threshold,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to enable cascade with {settings.cascade_fast_model}: {e}")
+        transcriber.disable_cascade()
+
+
+def apply_routing_settings(settings: AppSettings) -> None:
+    """Enable or disable language routing to match settings."""
+    if not transcriber or not transcriber.is_model_loaded:
+        return
+
+    if not settings.enable_language_routing:
+        transcriber.disable_routing()
+        return
+
+    try:
+        transcriber.enable_routing(
+            lid_model_name=settings.routing_lid_model,
+            models=settings.routing_models,
+            rules=settings.routing_rules,
+            device=settings.device,
+            compute_type="int8" if settings.device == "cpu" else "int8_float16",
+        )
+    except Exception as e:
+        logger.warning(f"Failed to enable language routing: {e}")
+        transcriber.disable_routing()
+
+
+def apply_model_extras(settings: AppSettings) -> None:
+    """Apply settings for the models that run alongside the main model."""
+    if settings.cascade_fast_model and settings.enable_language_routing:
+        # Rejected by the settings API; only an edited settings file gets here
+        logger.warning("The cascade and language routing are both enabled, using routing only")
+        settings = settings.model_copy(update={"cascade_fast_model": None})
+    apply_cascade_settings(settings)
+    apply_routing_settings(settings)
+
+
+def apply_warm_mic(settings: AppSettings) -> None:
+    """Open or close the default session's always-on microphone (or capture process)."""
+    if transcriber is None:
+        return
+    try:
+        # The capture process keeps the stream open too; the pre-roll is opt-in
+        transcriber.configure_warm_mic(
+            settings.warm_microphone or settings.capture_process,
+            pre_roll_ms=settings.pre_roll_ms if settings.warm_microphone else 0,
+            isolated=settings.capture_process,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to configure warm microphone: {e}")
+
+
+def apply_capture(settings: AppSettings) -> None:
+    """Apply the input stream's block size and latency to the default session."""
+    if transcriber is None:
+        return
+    try:
+        transcriber.configure_capture(
+            settings.capture_blocksize, latency=parse_latency(settings.capture_latency)
+        )
+    except Exception as e:
+        logger.warning(f"Failed to configure audio capture: {e}")
+
+
+def apply_result_cache(settings: AppSettings) -> None:
+    """Enable or disable the transcript cache (result_cache.db, next to the history database)."""
+    if transcriber is None:
+        return
+    try:
+        transcriber.configure_result_cache(
+            settings.enable_result_cache,
+            db_path=str(get_default_db_path().parent / "result_cache.db"),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to open the result cache: {e}")
+
+
+def apply_endpointing(settings: AppSettings, loop: asyncio.AbstractEventLoop) -> None:
+    """Apply the endpointing settings to the default session's microphone recordings."""
+    if transcriber is None:
+        return
+    if not settings.enable_endpointing:
+        transcriber.configure_endpointing(False)
+        return
+
+    def on_endpoint(decision, utterance) -> None:
+        future = asyncio.run_coroutine_threadsafe(announce_endpoint(decision, utterance), loop)
+        future.result()
+
+    def on_done(utterance, result, error) -> None:
+        # Like the hotkey's pipelined stops, block the dictation worker until
+        # the utterance is saved and pasted
+        current = settings_service.get() if settings_service else None
+        auto_paste = current is None or current.auto_paste
+        future = asyncio.run_coroutine_threadsafe(
+            deliver_utterance(utterance.id, result, error, DEFAULT_SESSION_ID, auto_paste), loop
+        )
+        future.result()
+
+    transcriber.configure_endpointing(
+        True,
+        silence_ms=settings.endpointing_silence_ms,
+        threshold_db=settings.endpointing_threshold_db,
+        min_speech_ms=settings.endpointing_min_speech_ms,
+        language=settings.language,
+        on_endpoint=on_endpoint,
+        on_done=on_done,
+    )
+
+
 # --- WebSocket broadcast ---
 
 
 async def broadcast(event_type: str, data: dict) -> None:
-    """Broadcast an event to all connected WebSocket clients."""
-    message = {"type": event_type, **data}
+    """
+    Broadcast an event to all connected WebSocket clients.
 
-    disconnected = []
-    for ws in websocket_connections:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            disconnected.append(ws)
+    The event goes through the event bus, in order with events published by
+    worker threads, and is queued for each subscribed client (see
+    Broadcaster); this returns without waiting for any of them. Events
+    carrying a session_id skip connections subscribed to another session.
+    Code running outside the event loop calls event_bus.publish() directly.
+    """
+    event_bus.publish(event_type, data)
 
-    for ws in disconnected:
-        websocket_connections.remove(ws)
+
+def on_session_state_change(session_id: str, state: TranscriberState) -> None:
+    """Handle state changes of a recording session (called on any thread)."""
+    event_bus.publish(
+        "status",
+        {
+            "state": state.value,
+            "recording": state == TranscriberState.RECORDING,
+            "session_id": session_id,
+        },
+    )
 
 
 def on_state_change(state: TranscriberState) -> None:
     """Handle transcriber state changes."""
-    asyncio.create_task(
-        broadcast(
-            "status",
-            {
-                "state": state.value,
-                "recording": state == TranscriberState.RECORDING,
-            },
-        )
-    )
+    on_session_state_change(DEFAULT_SESSION_ID, state)
+
+
+def get_session(session_id: Optional[str], create: bool = False) -> TranscriberService:
+    """
+    Resolve a recording session for a /api/transcribe request.
+
+    Args:
+        session_id: Session id from the request, or None for the default session
+        create: Create the session if it does not exist yet
+    """
+    if not transcriber or not sessions:
+        raise HTTPException(status_code=503, detail="Transcriber not initialized")
+
+    try:
+        session = sessions.get_or_create(session_id) if create else sessions.get(session_id)
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
+    return session
 
 
 # --- Lifespan ---
@@ -176,9 +404,10 @@ def on_state_change(state: TranscriberState) -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    global transcriber, history, settings_service, batch_service
+    global transcriber, history, settings_service, batch_service, sessions
 
     logger.info("Starting SpeakEasy backend...")
+    event_bus.attach(asyncio.get_running_loop())
 
     # Initialize settings
     settings_service = SettingsService(get_default_settings_path())
@@ -195,6 +424,26 @@ async def lifespan(app: FastAPI):
 
     # Initialize transcriber
     transcriber = TranscriberService(on_state_change=on_state_change)
+    sessions = SessionManager(transcriber, on_state_change=on_session_state_change)
+    transcriber.configure_batching(
+        settings.enable_batching,
+        max_batch_size=settings.batch_max_size,
+        max_wait_ms=settings.batch_max_wait_ms,
+    )
+    transcriber.configure_spill(settings.spill_to_disk, after_s=settings.spill_after_s)
+    transcriber.configure_audio_cache(settings.audio_cache_max_mb)
+    apply_result_cache(settings)
+    transcriber.configure_silence_trimming(
+        settings.trim_silence,
+        threshold_db=settings.trim_silence_threshold_db,
+        files=settings.trim_silence_files,
+    )
+    apply_endpointing(settings, asyncio.get_running_loop())
+    apply_capture(settings)
+    # Keep the cached device list current (PortAudio restarts only while no stream is open)
+    get_device_registry().start_watching(can_reinitialize=lambda: not sessions.streams_open)
+    if settings.warm_microphone or settings.capture_process:
+        await asyncio.to_thread(apply_warm_mic, settings)
 
     # Auto-load model if configured
     if settings.model_name:
@@ -203,14 +452,18 @@ async def lifespan(app: FastAPI):
             # Run in a separate thread to not block startup
             import threading
 
-            threading.Thread(
-                target=lambda: transcriber.load_model(
+            def auto_load() -> None:
+                transcriber.load_model(
                     model_type=settings.model_type,
                     model_name=settings.model_name,
                     device=settings.device,
                     compute_type=settings.compute_type,
+                    use_torch_compile=settings.enable_torch_compile,
+                    compile_timeout_s=settings.torch_compile_timeout_s,
                 )
-            ).start()
+                apply_model_extras(settings)
+
+            threading.Thread(target=auto_load).start()
         except Exception as e:
             logger.warning(f"Failed to auto-load model: {e}")
 
@@ -223,6 +476,11 @@ async def lifespan(app: FastAPI):
     # Cleanup
     logger.info("Shutting down SpeakEasy backend...")
 
+    get_device_registry().stop_watching()
+
+    if sessions:
+        sessions.cleanup()
+
     if transcriber:
         transcriber.cleanup()
 
@@ -232,6 +490,8 @@ async def lifespan(app: FastAPI):
     if batch_service:
         await batch_service.close()
 
+    event_bus.detach()
+    await broadcaster.close_all()
     logger.info("SpeakEasy backend stopped")
 
 
@@ -347,12 +607,73 @@ async def health_check():
     )
 
 
-@app.post("/api/transcribe/start", response_model=TranscribeStartResponse)
-async def transcribe_start():
-    """Start recording audio."""
-    if not transcriber:
+@app.get("/api/metrics")
+async def metrics():
+    """Get runtime performance metrics."""
+    return {
+        "cascade": transcriber.cascade_metrics if transcriber else None,
+        "routing": transcriber.routing_metrics if transcriber else None,
+        "scheduler": transcriber.scheduler_metrics if transcriber else None,
+        "audio_cache": transcriber.audio_cache_metrics if transcriber else None,
+        "result_cache": transcriber.result_cache_metrics if transcriber else None,
+        "silence_trim": transcriber.silence_trim_metrics if transcriber else None,
+        "websocket": broadcaster.stats(),
+        "events": event_bus.stats(),
+        "capture": {
+            "warm_microphone": transcriber.warm_mic_enabled,
+            "isolated": transcriber.capture_isolated,
+            "start_latency_ms": transcriber.start_latency_ms,
+            "telemetry": transcriber.capture_telemetry,
+        }
+        if transcriber
+        else None,
+    }
+
+
+@app.get("/api/sessions")
+async def sessions_list():
+    """List recording sessions."""
+    if not sessions:
+        raise HTTPException(status_code=503, detail="Transcriber not initialized")
+
+    return {"sessions": sessions.list_sessions()}
+
+
+@app.post("/api/sessions")
+async def sessions_create(body: SessionCreateRequest):
+    """Create a recording session with its own capture buffer, device and state."""
+    if not sessions:
+        raise HTTPException(status_code=503, detail="Transcriber not initialized")
+
+    try:
+        session_id, session = sessions.create(body.session_id, device_name=body.device_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    return {"session_id": session_id, "state": session.state.value, "device": session.device_name}
+
+
+@app.delete("/api/sessions/{session_id}")
+async def sessions_delete(session_id: str):
+    """Close a recording session, discarding any recording in progress."""
+    if not sessions:
         raise HTTPException(status_code=503, detail="Transcriber not initialized")
 
+    if not sessions.close(session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return {"deleted": True}
+
+
+@app.post("/api/transcribe/start", response_model=TranscribeStartResponse)
+async def transcribe_start(
+    session_id: Optional[str] = Query(None, pattern=SESSION_ID_PATTERN),
+):
+    """Start recording audio (in the given session, created on first use)."""
+    session = get_session(session_id, create=True)
+
     # Check if model is still loading
     if transcriber.state == TranscriberState.LOADING:
         raise HTTPException(
@@ -366,7 +687,7 @@ async def transcribe_start():
         )
 
     try:
-        transcriber.start_recording()
+        session.start_recording()
         return TranscribeStartResponse(status="started")
     except RuntimeError as e:
         # Handle "No model loaded" or other runtime errors
@@ -376,14 +697,135 @@ async def transcribe_start():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def save_transcription(
+    result: TranscriptionResult, session_id: str, utterance_id: Optional[int] = None
+) -> tuple[TranscriptionRecord, str]:
+    """
+    Clean up, store and announce a finished dictation.
+
+    Args:
+        result: The transcription
+        session_id: Session that recorded it
+        utterance_id: Id of a pipelined utterance (see /api/transcribe/stop)
+
+    Returns:
+        Tuple of (history record, cleaned text)
+    """
+    settings = settings_service.get() if settings_service else None
+
+    # Apply text cleanup if enabled
+    cleaned_text = result.text
+    if settings and settings.enable_text_cleanup:
+        # Use safe_cleanup for better error handling and caching
+        cleaned_text = safe_cleanup(
+            result.text, custom_fillers=settings.custom_filler_words, use_cache=True
+        )
+
+    # Save to history
+    record = await history.add(
+        text=result.text,
+        duration_ms=result.duration_ms,
+        model_used=result.model_used,
+        language=result.language,
+    )
+
+    # Broadcast transcription event
+    event = {
+        "id": record.id,
+        "text": cleaned_text,
+        "duration_ms": result.duration_ms,
+        "session_id": session_id,
+    }
+    if utterance_id is not None:
+        event["utterance_id"] = utterance_id
+    await broadcast("transcription", event)
+
+    return record, cleaned_text
+
+
+async def deliver_utterance(
+    utterance_id: int,
+    result: Optional[TranscriptionResult],
+    error: Optional[Exception],
+    session_id: str,
+    auto_paste: bool,
+) -> None:
+    """Save, announce and paste a pipelined utterance (or report its failure)."""
+    if error is not None:
+        if not isinstance(error, TranscriptionCancelledError):
+            await broadcast(
+                "error",
+                {"message": str(error), "session_id": session_id, "utterance_id": utterance_id},
+            )
+        return
+
+    _, cleaned_text = await save_transcription(result, session_id, utterance_id)
+    if auto_paste:
+        insert_text(cleaned_text)
+
+
+async def announce_endpoint(decision: EndpointDecision, utterance: Utterance) -> None:
+    """
+    Announce a recording that ended on its own, as soon as capture has stopped.
+
+    Its transcript follows as a pipelined utterance (see deliver_utterance).
+    """
+    event = {
+        **decision.to_dict(),
+        "session_id": DEFAULT_SESSION_ID,
+        "utterance_id": utterance.id,
+        "duration_ms": int(utterance.recording.duration_seconds * 1000),
+    }
+    await broadcast("endpoint", event)
+
+
+def enqueue_dictation(
+    session: TranscriberService,
+    session_id: str,
+    language: Optional[str],
+    instruction: Optional[str],
+    auto_paste: bool,
+    loop: asyncio.AbstractEventLoop,
+) -> dict:
+    """
+    Stop a recording and queue it for background transcription (runs in a thread).
+
+    Returns:
+        Body of the 202 response
+    """
+
+    def on_done(utterance, result, error) -> None:
+        # Block the dictation worker until this utterance is saved and pasted,
+        # so the next one can't overtake it
+        future = asyncio.run_coroutine_threadsafe(
+            deliver_utterance(utterance.id, result, error, session_id, auto_paste), loop
+        )
+        future.result()
+
+    utterance = session.stop_and_enqueue(
+        language=language, instruction=instruction, on_done=on_done
+    )
+    return {
+        "status": "queued",
+        "utterance_id": utterance.id,
+        "pending": session.pending_dictations,
+        "duration_ms": int(utterance.recording.duration_seconds * 1000),
+        "session_id": session_id,
+    }
+
+
 @app.post("/api/transcribe/stop", response_model=TranscribeStopResponse)
 @limiter.limit("10/minute")
-async def transcribe_stop(request: Request, body: TranscribeStopRequest):
+async def transcribe_stop(
+    request: Request,
+    body: TranscribeStopRequest,
+    session_id: Optional[str] = Query(None, pattern=SESSION_ID_PATTERN),
+):
     """Stop recording and transcribe."""
-    if not transcriber:
-        raise HTTPException(status_code=503, detail="Transcriber not initialized")
+    session = get_session(session_id)
+    session_id = session_id or DEFAULT_SESSION_ID
 
-    if not transcriber.is_recording:
+    if not session.is_recording:
         raise HTTPException(status_code=400, detail="Not recording")
 
     try:
@@ -397,55 +839,47 @@ async def transcribe_stop(request: Request, body: TranscribeStopRequest):
             # Default instruction for grammar correction if not provided
             instruction = "Transcribe the audio exactly as spoken, but correct any grammatical errors. Maintain the original language."
 
+        loop = asyncio.get_running_loop()
+
+        if body.pipeline:
+            queued = await asyncio.to_thread(
+                enqueue_dictation,
+                session,
+                session_id,
+                language,
+                instruction,
+                body.auto_paste,
+                loop,
+            )
+            return JSONResponse(status_code=202, content=queued)
+
         # Create progress callback for long transcriptions
         def on_transcription_progress(
             current_chunk: int, total_chunks: int, chunk_text: str
         ) -> None:
             """Broadcast transcription progress via WebSocket."""
-            asyncio.create_task(
-                broadcast(
-                    "transcription_progress",
-                    {
-                        "current_chunk": current_chunk,
-                        "total_chunks": total_chunks,
-                        "chunk_text": chunk_text,
-                        "progress_percent": int((current_chunk / total_chunks) * 100),
-                    },
-                )
+            event_bus.publish(
+                "transcription_progress",
+                {
+                    "current_chunk": current_chunk,
+                    "total_chunks": total_chunks,
+                    "chunk_text": chunk_text,
+                    "progress_percent": int((current_chunk / total_chunks) * 100),
+                    "session_id": session_id,
+                },
             )
 
-        # Stop and transcribe with progress reporting
-        result: TranscriptionResult = transcriber.stop_and_transcribe(
+        # Stop and transcribe with progress reporting. Runs off the event loop so
+        # other sessions can start, stop and stream while this one transcribes.
+        result: TranscriptionResult = await asyncio.to_thread(
+            session.stop_and_transcribe,
             language=language,
             progress_callback=on_transcription_progress,
             instruction=instruction,
+            cancel_token=CancellationToken(body.timeout_s) if body.timeout_s else None,
         )
 
-        # Apply text cleanup if enabled
-        cleaned_text = result.text
-        if settings and settings.enable_text_cleanup:
-            # Use safe_cleanup for better error handling and caching
-            cleaned_text = safe_cleanup(
-                result.text, custom_fillers=settings.custom_filler_words, use_cache=True
-            )
-
-        # Save to history
-        record = await history.add(
-            text=result.text,
-            duration_ms=result.duration_ms,
-            model_used=result.model_used,
-            language=result.language,
-        )
-
-        # Broadcast transcription event
-        await broadcast(
-            "transcription",
-            {
-                "id": record.id,
-                "text": cleaned_text,
-                "duration_ms": result.duration_ms,
-            },
-        )
+        record, cleaned_text = await save_transcription(result, session_id)
 
         # Auto-paste if requested
         if body.auto_paste:
@@ -457,23 +891,68 @@ async def transcribe_stop(request: Request, body: TranscribeStopRequest):
             duration_ms=result.duration_ms,
             model_used=result.model_used,
             language=result.language,
+            session_id=session_id,
         )
 
+    except DeadlineExceededError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except TranscriptionCancelledError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         logger.error(f"Transcription error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/transcribe/cancel")
-async def transcribe_cancel():
-    """Cancel current recording without transcribing."""
-    if not transcriber:
-        raise HTTPException(status_code=503, detail="Transcriber not initialized")
+async def transcribe_cancel(
+    session_id: Optional[str] = Query(None, pattern=SESSION_ID_PATTERN),
+):
+    """
+    Cancel the current recording without transcribing. When not recording,
+    stop the transcription in progress (the pending /stop request fails with
+    409) and any pipelined utterances still waiting for their transcript.
+    """
+    session = get_session(session_id)
 
-    transcriber.cancel_recording()
+    if session.is_recording:
+        session.cancel_recording()
+    else:
+        session.cancel_transcription()
     return {"status": "cancelled"}
 
 
+@app.post("/api/transcribe/batch/{job_id}/pause")
+async def batch_pause(job_id: str):
+    """Pause a batch transcription job after the file in progress."""
+    if not batch_service:
+        raise HTTPException(status_code=503, detail="Batch service not initialized")
+
+    paused = await batch_service.pause_job(job_id)
+    if not paused:
+        raise HTTPException(status_code=400, detail="Job cannot be paused")
+
+    return {"status": "paused"}
+
+
+@app.post("/api/transcribe/batch/{job_id}/resume")
+async def batch_resume(job_id: str):
+    """Resume a paused batch transcription job."""
+    if not batch_service:
+        raise HTTPException(status_code=503, detail="Batch service not initialized")
+
+    resumed = await batch_service.resume_job(job_id)
+    if not resumed:
+        raise HTTPException(status_code=400, detail="Job is not paused")
+
+    # A job paused before a restart has no processing task; start a new one
+    # with the language and timeout stored on the job
+    job = await batch_service.get_job(job_id)
+    if job and job.status == BatchJobStatus.PENDING:
+        asyncio.create_task(batch_service.process_job(job.id, transcriber, history, broadcast))
+
+    return {"status": "processing"}
+
+
 # --- History ---
 
 
@@ -558,21 +1037,58 @@ async def history_export_get(
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
 
-    # Get all records
-    records, _, _ = await history.list(limit=10000, offset=0)
+    return await stream_export(export_format, include_metadata)
+
+
+def parse_export_date(value: Optional[str], field: str) -> Optional[datetime]:
+    """Parse an ISO date of an export request (400 if invalid)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {field}: {value}")
 
-    content, filename, content_type = export_service.export(
-        records, export_format, include_metadata
+
+async def stream_export(
+    export_format: ExportFormat,
+    include_metadata: bool,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    search: Optional[str] = None,
+    record_ids: Optional[list[str]] = None,
+) -> StreamingResponse:
+    """
+    Stream the history records matching the filters as an export file.
+
+    Records are read page by page while the response is sent (iterated in
+    the thread pool), so exports of any size use constant memory. The
+    records iterator holds a database connection: it is closed when the
+    response ends, also if the client disconnects.
+    """
+    count, records = await asyncio.to_thread(
+        history.export_query, start_date, end_date, search, record_ids
+    )
+    chunks, filename, content_type = export_service.stream(
+        records, export_format, include_metadata, count
     )
 
-    from fastapi.responses import Response
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in iterate_in_threadpool(chunks):
+                yield chunk
+        finally:
+            records.close()
 
-    return Response(
-        content=content.encode("utf-8"),
+    return StreamingResponse(
+        body(),
         media_type=content_type,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Export-Count": str(count),
         },
+        # Also runs after a disconnect that left body() suspended between chunks
+        background=BackgroundTask(records.close),
     )
 
 
@@ -607,7 +1123,8 @@ async def history_export_post(body: ExportRequest):
     """
     Export transcription history with filtering options.
 
-    Supports filtering by date range, search query, or specific record IDs.
+    Supports filtering by date range, search query, or specific record IDs
+    (filters combine). Dates without a timezone are UTC.
     """
     if not history:
         raise HTTPException(status_code=503, detail="History not initialized")
@@ -617,48 +1134,16 @@ async def history_export_post(body: ExportRequest):
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid format: {body.format}")
 
-    # Get records based on filters
-    if body.record_ids:
-        # Export specific records
-        records = []
-        for record_id in body.record_ids:
-            record = await history.get(record_id)
-            if record:
-                records.append(record)
-    else:
-        # Get all and filter
-        all_records, _, _ = await history.list(limit=10000, offset=0, search=body.search)
-        records = all_records
-
-        # Filter by date range if specified
-        if body.start_date or body.end_date:
-            from datetime import datetime
-
-            filtered = []
-            for r in records:
-                if body.start_date:
-                    start = datetime.fromisoformat(body.start_date.replace("Z", "+00:00"))
-                    if r.created_at < start:
-                        continue
-                if body.end_date:
-                    end = datetime.fromisoformat(body.end_date.replace("Z", "+00:00"))
-                    if r.created_at > end:
-                        continue
-                filtered.append(r)
-            records = filtered
+    start_date = parse_export_date(body.start_date, "start_date")
+    end_date = parse_export_date(body.end_date, "end_date")
 
-    content, filename, content_type = export_service.export(
-        records, export_format, body.include_metadata
-    )
-
-    from fastapi.responses import Response
-
-    return Response(
-        content=content.encode("utf-8"),
-        media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+    return await stream_export(
+        export_format,
+        body.include_metadata,
+        start_date=start_date,
+        end_date=end_date,
+        search=body.search,
+        record_ids=body.record_ids or None,
     )
 
 
@@ -741,6 +1226,8 @@ async def history_import(request: Request, body: ImportRequest):
 
 class BatchCreateRequest(BaseModel):
     file_paths: list[str] = Field(..., min_length=1)
+    # Fail any single file that takes longer than this (None: no limit)
+    file_timeout_s: Optional[float] = Field(None, gt=0, le=24 * 3600)
 
 
 class BatchJobResponse(BaseModel):
@@ -760,6 +1247,7 @@ async def batch_create(request: Request, body: BatchCreateRequest):
 
     Args:
         file_paths: List of paths to audio files to transcribe
+        file_timeout_s: Optional time limit per file
     """
     if not batch_service:
         raise HTTPException(status_code=503, detail="Batch service not initialized")
@@ -771,18 +1259,15 @@ async def batch_create(request: Request, body: BatchCreateRequest):
         if not Path(fp).exists():
             raise HTTPException(status_code=400, detail=f"File not found: {fp}")
 
-    job = await batch_service.create_job(body.file_paths)
+    # The job keeps its language and timeout, so a later resume uses the same ones
+    job = await batch_service.create_job(
+        body.file_paths,
+        language=settings_service.get().language if settings_service else "auto",
+        file_timeout_s=body.file_timeout_s,
+    )
 
     # Start processing in background
-    asyncio.create_task(
-        batch_service.process_job(
-            job.id,
-            transcriber,
-            history,
-            broadcast,
-            language=settings_service.get().language if settings_service else "auto",
-        )
-    )
+    asyncio.create_task(batch_service.process_job(job.id, transcriber, history, broadcast))
 
     return {
         "job_id": job.id,
@@ -816,7 +1301,7 @@ async def batch_get(job_id: str):
 
 @app.post("/api/transcribe/batch/{job_id}/cancel")
 async def batch_cancel(job_id: str):
-    """Cancel a batch transcription job."""
+    """Cancel a batch transcription job, stopping the file in progress."""
     if not batch_service:
         raise HTTPException(status_code=503, detail="Batch service not initialized")
 
@@ -828,12 +1313,17 @@ async def batch_cancel(job_id: str):
 
 
 @app.post("/api/transcribe/batch/{job_id}/retry")
-async def batch_retry(job_id: str, file_ids: Optional[list[str]] = None):
+async def batch_retry(
+    job_id: str,
+    file_ids: Optional[list[str]] = None,
+    file_timeout_s: Optional[float] = Query(None, gt=0, le=24 * 3600),
+):
     """
     Retry failed files in a batch job.
 
     Args:
         file_ids: Specific file IDs to retry, or None to retry all failed
+        file_timeout_s: Optional time limit per file (default: the job's)
     """
     if not batch_service:
         raise HTTPException(status_code=503, detail="Batch service not initialized")
@@ -850,7 +1340,7 @@ async def batch_retry(job_id: str, file_ids: Optional[list[str]] = None):
             transcriber,
             history,
             broadcast,
-            language=settings_service.get().language if settings_service else "auto",
+            file_timeout_s=file_timeout_s,
         )
     )
 
@@ -870,6 +1360,254 @@ async def batch_delete(job_id: str):
     return {"deleted": True}
 
 
+# --- OpenAI-compatible transcription ---
+
+OPENAI_RESPONSE_FORMATS = ("json", "text", "verbose_json")
+STREAM_FORMATS = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}
+MAX_UPLOAD_BYTES = 1024**3  # 1 GiB
+# Room for the multipart boundaries and form fields around the file
+UPLOAD_FORM_OVERHEAD_BYTES = 64 * 1024
+UPLOAD_PATHS = frozenset({"/v1/audio/transcriptions"})
+
+
+class UploadLimitMiddleware:
+    """
+    Reject uploads larger than MAX_UPLOAD_BYTES.
+
+    The Content-Length is checked before the multipart body is received, so
+    an oversized upload is never spooled to disk. The body is also counted
+    while Starlette reads it, so a request sending more than it declared is
+    cut off with a 413 too.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] in UPLOAD_PATHS:
+            length = dict(scope["headers"]).get(b"content-length")
+            response = None
+            if length is None:
+                response = JSONResponse(
+                    status_code=411, content={"detail": "Content-Length required"}
+                )
+            elif not length.isdigit() or (
+                int(length) > MAX_UPLOAD_BYTES + UPLOAD_FORM_OVERHEAD_BYTES
+            ):
+                response = JSONResponse(
+                    status_code=413,
+                    content={"detail": f"File exceeds {MAX_UPLOAD_BYTES // 1024**2} MiB"},
+                )
+            if response is not None:
+                await response(scope, receive, send)
+                return
+            receive = self._limit_body(receive, int(length))
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _limit_body(receive, limit: int):
+        """Wrap `receive` to fail once the body exceeds `limit` bytes."""
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the form parser, which passes HTTPException through
+                    raise HTTPException(status_code=413, detail="Body exceeds Content-Length")
+            return message
+
+        return limited_receive
+
+
+app.add_middleware(UploadLimitMiddleware)
+
+
+def upload_source(upload: UploadFile) -> BinaryIO:
+    """
+    The uploaded file, for the decoder to read in place.
+
+    Starlette has already spooled the multipart body (to disk past 1 MiB)
+    while UploadLimitMiddleware counted it, so the file is not copied again.
+    The size limit is checked once more for the file itself.
+    """
+    if upload.size is not None and upload.size > MAX_UPLOAD_BYTES:
+        raise ValueError(f"File exceeds {MAX_UPLOAD_BYTES // 1024**2} MiB")
+    return upload.file
+
+
+def verbose_transcription(result: TranscriptionResult, duration: float) -> dict:
+    """
+    OpenAI verbose_json body for a transcription.
+
+    Engines without timed segments (and results from the result cache) get
+    one segment spanning the whole audio.
+    """
+    segments = result.segments
+    if not segments and result.text:
+        segments = [TranscriptionSegment(start=0.0, end=duration, text=result.text)]
+    return {
+        "task": "transcribe",
+        "language": result.language,
+        "duration": round(duration, 3),
+        "text": result.text,
+        "segments": [
+            {
+                "id": i,
+                "seek": 0,
+                "start": round(s.start, 3),
+                "end": round(s.end, 3),
+                "text": s.text,
+                "tokens": [],
+                "temperature": 0.0,
+                "avg_logprob": s.avg_logprob,
+                "no_speech_prob": s.no_speech_prob,
+            }
+            for i, s in enumerate(segments)
+        ],
+    }
+
+
+def format_stream_event(stream_format: str, event: dict) -> str:
+    """Encode one streamed event as an SSE message or an NDJSON line."""
+    if stream_format == "sse":
+        return f"data: {json.dumps(event)}\n\n"
+    return json.dumps(event) + "\n"
+
+
+@app.post("/v1/audio/transcriptions")
+@limiter.limit("30/minute")
+async def openai_transcriptions(
+    request: Request,
+    file: UploadFile = File(...),
+    model: str = Form("whisper-1"),
+    language: Optional[str] = Form(None, max_length=10),
+    prompt: Optional[str] = Form(None),
+    response_format: str = Form("json"),
+    temperature: Optional[float] = Form(None),
+    stream: bool = Form(False),
+    stream_format: str = Form("sse"),
+):
+    """
+    Transcribe an uploaded audio file (OpenAI audio.transcriptions compatible).
+
+    The loaded model is always used; `model`, `prompt` and `temperature` are
+    accepted so existing OpenAI clients work unchanged. Files are transcribed
+    at batch priority, so live dictation on this host stays responsive.
+
+    With stream=true, results are sent while decoding: one event per chunk
+    (transcript.text.delta) and a final transcript.text.done, as Server-Sent
+    Events (stream_format=sse, OpenAI style) or NDJSON (stream_format=ndjson).
+    """
+    if not transcriber:
+        raise HTTPException(status_code=503, detail="Transcriber not initialized")
+
+    if not transcriber.is_model_loaded:
+        raise HTTPException(status_code=400, detail="No model loaded")
+
+    if response_format not in OPENAI_RESPONSE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported response_format, use one of: {', '.join(OPENAI_RESPONSE_FORMATS)}",
+        )
+
+    if stream and stream_format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail="stream_format must be 'sse' or 'ndjson'")
+
+    try:
+        source = upload_source(file)
+    except ValueError as e:
+        await file.close()
+        raise HTTPException(status_code=413, detail=str(e))
+
+    if not language:
+        language = settings_service.get().language if settings_service else "auto"
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    cancel_token = CancellationToken()
+
+    def on_progress(current_chunk: int, total_chunks: int, chunk_text: str) -> None:
+        segment = {"id": current_chunk - 1, "total": total_chunks, "text": chunk_text}
+        loop.call_soon_threadsafe(events.put_nowait, segment)
+
+    duration = 0.0
+
+    def transcribe() -> TranscriptionResult:
+        nonlocal duration
+        if response_format == "verbose_json" and not stream:
+            try:
+                duration = AudioFileStream(source).duration_seconds
+            except Exception:
+                pass  # transcribe_file reports unreadable files
+        return transcriber.transcribe_file(
+            source,
+            language,
+            on_progress,
+            priority=Priority.BATCH,
+            cancel_token=cancel_token,
+        )
+
+    async def run() -> TranscriptionResult:
+        try:
+            return await asyncio.to_thread(transcribe)
+        finally:
+            await file.close()
+
+    if not stream:
+        try:
+            result = await run()
+        except Exception as e:
+            logger.error(f"File transcription error: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+        if response_format == "text":
+            return PlainTextResponse(result.text)
+        if response_format == "verbose_json":
+            if not duration and result.segments:
+                # The container didn't report a duration
+                duration = result.segments[-1].end
+            return verbose_transcription(result, duration)
+        return {"text": result.text}
+
+    task = asyncio.create_task(run())
+    task.add_done_callback(lambda _: events.put_nowait(None))
+
+    async def generate():
+        try:
+            while (segment := await events.get()) is not None:
+                if segment["text"]:
+                    yield format_stream_event(
+                        stream_format,
+                        {
+                            "type": "transcript.text.delta",
+                            "delta": segment["text"] + " ",
+                            "segment": segment["id"],
+                            "total_segments": segment["total"],
+                        },
+                    )
+        finally:
+            # Client went away mid-stream: release the model at the next chunk
+            if not task.done():
+                cancel_token.cancel("Client disconnected")
+
+        try:
+            result = task.result()
+        except Exception as e:
+            logger.error(f"File transcription error: {e}")
+            yield format_stream_event(stream_format, {"type": "error", "message": str(e)})
+            return
+
+        yield format_stream_event(
+            stream_format,
+            {"type": "transcript.text.done", "text": result.text, "language": result.language},
+        )
+
+    return StreamingResponse(generate(), media_type=STREAM_FORMATS[stream_format])
+
+
 # --- Settings ---
 
 
@@ -896,6 +1634,14 @@ async def settings_update(request: Request, body: SettingsUpdateRequest):
         return {"status": "ok", "reload_required": False}
 
     old_settings = settings_service.get()
+    # The router picks the model per request, so it has no place for the cascade
+    if updates.get("cascade_fast_model", old_settings.cascade_fast_model) and updates.get(
+        "enable_language_routing", old_settings.enable_language_routing
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="The cascade and language routing can't be enabled together",
+        )
     new_settings = settings_service.update(**updates)
 
     # Check if model reload is required
@@ -904,7 +1650,52 @@ async def settings_update(request: Request, body: SettingsUpdateRequest):
         or updates.get("model_name") != old_settings.model_name
         or updates.get("device") != old_settings.device
         or updates.get("compute_type") != old_settings.compute_type
-    ) and any(k in updates for k in ["model_type", "model_name", "device", "compute_type"])
+        or updates.get("enable_torch_compile") != old_settings.enable_torch_compile
+    ) and any(
+        k in updates
+        for k in ["model_type", "model_name", "device", "compute_type", "enable_torch_compile"]
+    )
+
+    batching_keys = ["enable_batching", "batch_max_size", "batch_max_wait_ms"]
+    if transcriber and any(k in updates for k in batching_keys):
+        transcriber.configure_batching(
+            new_settings.enable_batching,
+            max_batch_size=new_settings.batch_max_size,
+            max_wait_ms=new_settings.batch_max_wait_ms,
+        )
+
+    if transcriber and any(k in updates for k in ["spill_to_disk", "spill_after_s"]):
+        transcriber.configure_spill(new_settings.spill_to_disk, after_s=new_settings.spill_after_s)
+
+    if transcriber and "audio_cache_max_mb" in updates:
+        transcriber.configure_audio_cache(new_settings.audio_cache_max_mb)
+
+    if "enable_result_cache" in updates:
+        apply_result_cache(new_settings)
+
+    if transcriber and any(k.startswith("trim_silence") for k in updates):
+        transcriber.configure_silence_trimming(
+            new_settings.trim_silence,
+            threshold_db=new_settings.trim_silence_threshold_db,
+            files=new_settings.trim_silence_files,
+        )
+
+    # The automatic transcription uses the configured language
+    if any(k.startswith("endpointing_") for k in updates) or any(
+        k in updates for k in ["enable_endpointing", "language"]
+    ):
+        apply_endpointing(new_settings, asyncio.get_running_loop())
+
+    if any(k in updates for k in ["capture_blocksize", "capture_latency"]):
+        await asyncio.to_thread(apply_capture, new_settings)
+
+    if any(k in updates for k in ["warm_microphone", "pre_roll_ms", "capture_process"]):
+        await asyncio.to_thread(apply_warm_mic, new_settings)
+
+    # Apply cascade/routing changes to the loaded model right away
+    extras_prefixes = ("cascade_", "routing_", "enable_language_routing")
+    if any(k.startswith(extras_prefixes) for k in updates) and not reload_required:
+        await asyncio.to_thread(apply_model_extras, new_settings)
 
     # Clear text cleanup cache if custom fillers changed
     if "custom_filler_words" in updates:
@@ -928,6 +1719,12 @@ async def models_list():
         current_model = {
             "type": transcriber._model.model_type.value,
             "name": transcriber._model.model_name,
+            "device": transcriber._model.device,
+            "compute_type": transcriber._model.compute_type,
+            "quantization": transcriber._model.quantization_info,
+            "compile": transcriber._model.compile_report.to_dict()
+            if transcriber._model.compile_report
+            else None,
         }
 
     return {
@@ -1006,18 +1803,21 @@ async def models_load(request: Request, body: ModelLoadRequest):
                 last_broadcast_time[0] = now
                 current = download_state_manager.current_download
                 if current:
-                    # Use asyncio to broadcast from sync callback
-                    asyncio.create_task(broadcast("download_progress", current.to_dict()))
+                    # Called from the download thread
+                    event_bus.publish("download_progress", current.to_dict())
 
             return should_continue
 
         # Load model with progress tracking
+        settings = settings_service.get() if settings_service else None
         transcriber.load_model(
             model_type=body.model_type,
             model_name=body.model_name,
             device=body.device,
             compute_type=body.compute_type,
             progress_callback=progress_callback,
+            use_torch_compile=settings.enable_torch_compile if settings else False,
+            compile_timeout_s=settings.torch_compile_timeout_s if settings else None,
         )
 
         # Mark download complete
@@ -1030,14 +1830,20 @@ async def models_load(request: Request, body: ModelLoadRequest):
 
         # Update settings
         if settings_service:
-            settings_service.update(
+            settings = settings_service.update(
                 model_type=body.model_type,
                 model_name=body.model_name,
                 device=body.device,
                 compute_type=body.compute_type,
             )
+            await asyncio.to_thread(apply_model_extras, settings)
 
-        return {"status": "loaded", "model": body.model_name}
+        compile_report = transcriber._model.compile_report if transcriber._model else None
+        return {
+            "status": "loaded",
+            "model": body.model_name,
+            "compile": compile_report.to_dict() if compile_report else None,
+        }
 
     except RuntimeError as e:
         if "cancelled" in str(e).lower():
@@ -1151,9 +1957,10 @@ async def models_by_type(model_type: str):
 
 
 @app.get("/api/devices")
-async def devices_list():
-    """List available audio input devices."""
-    devices = list_audio_devices()
+async def devices_list(refresh: bool = Query(False)):
+    """List available audio input devices (cached; `refresh` rescans)."""
+    # A rescan restarts PortAudio, which can wait on the PortAudio lock
+    devices = await asyncio.to_thread(list_audio_devices, refresh)
     current = settings_service.get().device_name if settings_service else None
 
     return {
@@ -1162,6 +1969,20 @@ async def devices_list():
     }
 
 
+@app.get("/api/devices/telemetry")
+async def devices_telemetry(
+    session_id: Optional[str] = Query(None, pattern=SESSION_ID_PATTERN),
+):
+    """Audio callback statistics of the session's current (or last) recording."""
+    session = get_session(session_id)
+
+    return {
+        "session_id": session_id or DEFAULT_SESSION_ID,
+        "recording": session.is_recording,
+        "telemetry": session.capture_telemetry,
+    }
+
+
 @app.put("/api/devices/{device_name}")
 async def devices_set(device_name: str):
     """Set the audio input device."""
@@ -1183,42 +2004,297 @@ async def devices_set(device_name: str):
 # --- WebSocket ---
 
 
+def parse_topics(value: object) -> Optional[set[str]]:
+    """
+    Parse a topic subscription (comma-separated string or list of event types).
+
+    Returns None (all events) for an empty subscription.
+
+    Raises:
+        ValueError: For unknown topics
+    """
+    if value is None:
+        return None
+    items = value.split(",") if isinstance(value, str) else value
+    if not isinstance(items, list):
+        raise ValueError("topics must be a list of event types")
+    topics = {str(item).strip() for item in items if str(item).strip()}
+    unknown = topics - TOPICS
+    if unknown:
+        raise ValueError(f"Unknown topics: {', '.join(sorted(unknown))}")
+    return topics or None
+
+
 @app.websocket("/api/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time updates."""
+async def websocket_endpoint(
+    websocket: WebSocket, session_id: Optional[str] = None, topics: Optional[str] = None
+):
+    """
+    WebSocket endpoint for real-time updates.
+
+    With ?session_id=... the connection only receives that session's events
+    (plus events that are not tied to a session, such as model loading).
+    With ?topics=status,transcription it only receives those event types;
+    the subscription can be changed later by sending
+    {"type": "subscribe", "topics": [...]} (an empty list means all events).
+    """
+    if session_id is not None and not re.match(SESSION_ID_PATTERN, session_id):
+        await websocket.close(code=1008)
+        return
+    try:
+        subscribed = parse_topics(topics)
+    except ValueError:
+        await websocket.close(code=1008)
+        return
+
     await websocket.accept()
-    websocket_connections.append(websocket)
 
-    # Send initial state
-    await websocket.send_json(
-        {
-            "type": "connected",
-            "state": transcriber.state.value if transcriber else "not_initialized",
-            "model_loaded": transcriber.is_model_loaded if transcriber else False,
-        }
+    # Everything, replies included, goes through the client's send queue
+    subscriber = broadcaster.connect(websocket, session_id=session_id, topics=subscribed)
+    session = sessions.get(session_id) if sessions else None
+    subscriber.send(
+        serialize(
+            {
+                "type": "connected",
+                "state": session.state.value if session else "not_initialized",
+                "model_loaded": transcriber.is_model_loaded if transcriber else False,
+                "session_id": session_id or DEFAULT_SESSION_ID,
+            }
+        )
     )
 
     try:
-        while True:
+        while not subscriber.closed:
             try:
                 # Wait for message with 30s timeout
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                # Echo for ping/pong
-                if data == "ping":
-                    await websocket.send_text("pong")
             except asyncio.TimeoutError:
                 # Send ping to check if client is alive
+                subscriber.send("ping")
+                continue
+
+            # Echo for ping/pong
+            if data == "ping":
+                subscriber.send("pong")
+            elif data.startswith("{"):
                 try:
-                    await websocket.send_text("ping")
-                except Exception:
-                    # Client disconnected
+                    message = json.loads(data)
+                    if message.get("type") != "subscribe":
+                        continue
+                    subscriber.subscribe(parse_topics(message.get("topics")))
+                except (ValueError, AttributeError) as e:
+                    subscriber.send(serialize({"type": "error", "message": str(e)}))
+                    continue
+                subscriber.send(
+                    serialize(
+                        {
+                            "type": "subscribed",
+                            "topics": sorted(subscriber.topics or TOPICS),
+                        }
+                    )
+                )
+
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the socket was closed because the client stalled
+        pass
+    finally:
+        broadcaster.disconnect(subscriber)
+
+
+@app.websocket("/api/ws/audio")
+async def audio_stream_endpoint(
+    websocket: WebSocket,
+    audio_format: str = Query("pcm16", alias="format"),
+    sample_rate: int = TARGET_SAMPLE_RATE,
+    channels: int = 1,
+    language: Optional[str] = None,
+    session_id: Optional[str] = None,
+    partials: bool = True,
+):
+    """
+    Binary WebSocket for streaming microphone audio from a remote client.
+
+    Query parameters describe the stream: format (pcm16 or opus), sample_rate,
+    channels, language, session_id (a new session by default) and partials.
+
+    Binary messages are audio frames, decoded and resampled to 16 kHz into the
+    session's capture buffer as they arrive. Text messages are JSON controls:
+    {"type": "stop"} transcribes the utterance and replies with "final",
+    {"type": "cancel"} discards it. The server also sends "ready", "partial"
+    and "error" messages. Several utterances can be recorded per connection.
+
+    Partials transcribe only the audio received since the previous one, at batch
+    priority, and carry the text accumulated so far; "final" transcribes the
+    whole utterance. A session that is already recording (e.g. from its
+    microphone) is refused with close code 1008.
+    """
+    await websocket.accept()
+
+    async def send_error(message: str) -> None:
+        await websocket.send_json({"type": "error", "message": message})
+
+    if not transcriber or not sessions or not transcriber.is_model_loaded:
+        await send_error("No model loaded")
+        await websocket.close(code=1011)
+        return
+
+    created = False
+    try:
+        if session_id is not None and not re.match(SESSION_ID_PATTERN, session_id):
+            raise ValueError(f"Invalid session id: {session_id}")
+        decoder = FrameDecoder(AudioFormat(audio_format), sample_rate, channels)
+        session = sessions.get(session_id) if session_id else None
+        if session is None:
+            session_id, session = sessions.create(session_id)
+            created = True
+        if session.is_recording:
+            # E.g. recording from its microphone: the stream can't be pushed into it
+            raise RuntimeError(f"Session {session_id or DEFAULT_SESSION_ID} is already recording")
+        session.start_external_recording()
+    except (ValueError, RuntimeError) as e:
+        await send_error(str(e))
+        await websocket.close(code=1008)
+        if created:
+            sessions.close(session_id)
+        return
+
+    language = language or (settings_service.get().language if settings_service else "auto")
+    partial_samples = int(PARTIAL_INTERVAL_S * TARGET_SAMPLE_RATE)
+    received = 0
+    previewed = 0
+    partial_text = ""  # Partial results so far, each for the audio new since the last
+    partial_task: Optional[asyncio.Task] = None
+    limit_reported = False
+
+    def ingest(payload: bytes) -> tuple[int, bool]:
+        """Decode a frame into the session (in a worker thread); returns (samples, all kept)."""
+        if not session.is_recording:
+            # First frame of the next utterance
+            session.start_external_recording()
+        samples = decoder.decode(payload)
+        return len(samples), session.push_audio(samples)
+
+    def finish(language: str) -> TranscriptionResult:
+        """Add the decoder's held-back tail and transcribe the utterance."""
+        session.push_audio(decoder.flush())
+        return session.stop_and_transcribe(language=language)
+
+    async def send_partial(start: int, end: int) -> None:
+        """Transcribe the audio received since the last partial, behind final results."""
+        nonlocal partial_text
+        try:
+            result = await asyncio.to_thread(
+                session.preview, language, start=start, end=end, priority=Priority.BATCH
+            )
+        except Exception as e:
+            # The utterance was stopped or cancelled while the preview was queued
+            logger.debug(f"Partial transcription skipped: {e}")
+            return
+        if result and result.text.strip():
+            partial_text = f"{partial_text} {result.text.strip()}".lstrip()
+            await websocket.send_json(
+                {"type": "partial", "text": partial_text, "session_id": session_id}
+            )
+
+    await websocket.send_json(
+        {"type": "ready", "session_id": session_id, "sample_rate": TARGET_SAMPLE_RATE}
+    )
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            if message.get("bytes") is not None:
+                try:
+                    count, kept = await asyncio.to_thread(ingest, message["bytes"])
+                except RuntimeError as e:
+                    # The session started recording from elsewhere between utterances
+                    await send_error(str(e))
+                    await websocket.close(code=1008)
                     break
+                received += count
+                if not kept and not limit_reported:
+                    limit_reported = True
+                    await send_error(
+                        f"Recording limit of {session.MAX_RECORDING_SECONDS}s reached, "
+                        "further audio is dropped until stop"
+                    )
+
+                if (
+                    partials
+                    and not limit_reported
+                    and received - previewed >= partial_samples
+                    and (partial_task is None or partial_task.done())
+                ):
+                    partial_task = asyncio.create_task(send_partial(previewed, received))
+                    previewed = received
+                continue
+
+            try:
+                control = json.loads(message.get("text") or "")
+            except json.JSONDecodeError:
+                await send_error("Control messages must be JSON")
+                continue
+
+            if control.get("type") == "stop":
+                # Don't let a late partial arrive after the final result
+                if partial_task:
+                    await partial_task
+                if not session.is_recording:
+                    await send_error("Not recording")
+                    continue
+                try:
+                    result: TranscriptionResult = await asyncio.to_thread(
+                        finish, control.get("language") or language
+                    )
+                except Exception as e:
+                    logger.error(f"Streamed transcription error: {e}")
+                    await send_error(str(e))
+                    continue
+                finally:
+                    received = previewed = 0
+                    partial_text = ""
+                    limit_reported = False
+
+                record, cleaned_text = await save_transcription(result, session_id)
+                await websocket.send_json(
+                    {
+                        "type": "final",
+                        "id": record.id,
+                        "text": cleaned_text,
+                        "duration_ms": result.duration_ms,
+                        "model_used": result.model_used,
+                        "language": result.language,
+                        "session_id": session_id,
+                    }
+                )
+            elif control.get("type") == "cancel":
+                if partial_task:
+                    partial_task.cancel()
+                decoder.flush()
+                session.cancel_recording()
+                received = previewed = 0
+                partial_text = ""
+                limit_reported = False
+            else:
+                await send_error(f"Unknown control message: {control.get('type')}")
 
     except WebSocketDisconnect:
         pass
+    except Exception as e:
+        logger.error(f"Audio stream error: {e}")
+        try:
+            await send_error(str(e))
+            await websocket.close(code=1011)
+        except Exception:
+            pass
     finally:
-        if websocket in websocket_connections:
-            websocket_connections.remove(websocket)
+        if created:
+            sessions.close(session_id)
+        elif session.is_external_recording:
+            session.cancel_recording()
 
 
 # --- Run function ---
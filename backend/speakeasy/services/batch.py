@@ -6,7 +6,11 @@ Supports:
 - Sequential file processing with progress updates
 - Per-file error handling
 - WebSocket progress broadcasting
-- Job cancellation
+- Job cancellation, including the file in progress
+- Optional per-file timeouts
+- Pausing and resuming jobs between files
+- Batch-priority inference, so live dictation is served first
+- Cached results for files transcribed before (reported as cache hits)
 """
 
 import asyncio
@@ -28,6 +32,7 @@ class BatchJobStatus(str, Enum):
 
     PENDING = "pending"
     PROCESSING = "processing"
+    PAUSED = "paused"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
     FAILED = "failed"
@@ -54,6 +59,7 @@ class BatchFile:
     status: BatchFileStatus = BatchFileStatus.PENDING
     error: Optional[str] = None
     transcription_id: Optional[str] = None  # Links to history after completion
+    cached: bool = False  # Transcript came from the result cache
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -65,6 +71,7 @@ class BatchFile:
             "status": self.status.value,
             "error": self.error,
             "transcription_id": self.transcription_id,
+            "cached": self.cached,
         }
 
 
@@ -78,9 +85,14 @@ class BatchJob:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
     current_file_index: int = 0
+    # Options the job was created with, reused when it is resumed or retried
+    language: str = "auto"
+    file_timeout_s: Optional[float] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        completed = sum(1 for f in self.files if f.status == BatchFileStatus.COMPLETED)
+        cache_hits = sum(1 for f in self.files if f.cached)
         return {
             "id": self.id,
             "status": self.status.value,
@@ -88,10 +100,14 @@ class BatchJob:
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "current_file_index": self.current_file_index,
+            "language": self.language,
+            "file_timeout_s": self.file_timeout_s,
             "total_files": len(self.files),
-            "completed_count": sum(1 for f in self.files if f.status == BatchFileStatus.COMPLETED),
+            "completed_count": completed,
             "failed_count": sum(1 for f in self.files if f.status == BatchFileStatus.FAILED),
             "skipped_count": sum(1 for f in self.files if f.status == BatchFileStatus.SKIPPED),
+            "cache_hits": cache_hits,
+            "cache_hit_rate": round(cache_hits / completed, 3) if completed else None,
         }
 
 
@@ -104,6 +120,7 @@ class BatchService:
     - Sequential file processing
     - Progress broadcasting via WebSocket
     - Cancellation support
+    - Pause/resume between files
     - SQLite persistence
     """
 
@@ -118,7 +135,11 @@ class BatchService:
         self._db: Optional[aiosqlite.Connection] = None
         self._jobs: dict[str, BatchJob] = {}
         self._cancel_flags: dict[str, bool] = {}
+        # Cancellation token of the file each job is transcribing
+        self._file_tokens: dict[str, Any] = {}
         self._processing_locks: dict[str, asyncio.Lock] = {}
+        # Cleared while a job is paused; the processing loop waits on it between files
+        self._resume_events: dict[str, asyncio.Event] = {}
 
     async def initialize(self) -> None:
         """Initialize the database and create tables if needed."""
@@ -134,7 +155,9 @@ class BatchService:
                 status TEXT NOT NULL DEFAULT 'pending',
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 completed_at DATETIME,
-                current_file_index INTEGER DEFAULT 0
+                current_file_index INTEGER DEFAULT 0,
+                language TEXT NOT NULL DEFAULT 'auto',
+                file_timeout_s REAL
             )
         """)
 
@@ -158,12 +181,43 @@ class BatchService:
         """)
 
         await self._db.commit()
+        await self._migrate_schema()
 
         # Load existing jobs into memory
         await self._load_jobs_from_db()
 
         logger.info(f"Batch service initialized at {self.db_path}")
 
+    async def _migrate_schema(self) -> None:
+        """Run schema migrations for existing databases."""
+        if not self._db:
+            return
+
+        cursor = await self._db.execute("PRAGMA table_info(batch_files)")
+        columns = await cursor.fetchall()
+        column_names = {col[1] for col in columns}
+
+        if "cached" not in column_names:
+            logger.info("Migrating batch database: adding cached column")
+            await self._db.execute("""
+                ALTER TABLE batch_files ADD COLUMN cached INTEGER NOT NULL DEFAULT 0
+            """)
+            await self._db.commit()
+
+        cursor = await self._db.execute("PRAGMA table_info(batch_jobs)")
+        columns = await cursor.fetchall()
+        column_names = {col[1] for col in columns}
+
+        if "language" not in column_names:
+            logger.info("Migrating batch database: adding job options columns")
+            await self._db.execute("""
+                ALTER TABLE batch_jobs ADD COLUMN language TEXT NOT NULL DEFAULT 'auto'
+            """)
+            await self._db.execute("""
+                ALTER TABLE batch_jobs ADD COLUMN file_timeout_s REAL
+            """)
+            await self._db.commit()
+
     async def _load_jobs_from_db(self) -> None:
         """Load jobs from database into memory."""
         if not self._db:
@@ -181,6 +235,8 @@ class BatchService:
                 if row["completed_at"]
                 else None,
                 current_file_index=row["current_file_index"],
+                language=row["language"],
+                file_timeout_s=row["file_timeout_s"],
             )
 
             # Load files for this job
@@ -199,10 +255,21 @@ class BatchService:
                     status=BatchFileStatus(fr["status"]),
                     error=fr["error"],
                     transcription_id=fr["transcription_id"],
+                    cached=bool(fr["cached"]),
                 )
                 for fr in file_rows
             ]
 
+            # A job that was processing or paused lost its processing task when
+            # the backend stopped: keep it paused so resume_job restarts it
+            if job.status in (BatchJobStatus.PROCESSING, BatchJobStatus.PAUSED):
+                job.status = BatchJobStatus.PAUSED
+                await self._update_job_status(job)
+                for bf in job.files:
+                    if bf.status == BatchFileStatus.PROCESSING:
+                        bf.status = BatchFileStatus.PENDING
+                        await self._update_file_status(bf)
+
             self._jobs[job.id] = job
 
     async def close(self) -> None:
@@ -211,12 +278,19 @@ class BatchService:
             await self._db.close()
             self._db = None
 
-    async def create_job(self, file_paths: list[str]) -> BatchJob:
+    async def create_job(
+        self,
+        file_paths: list[str],
+        language: str = "auto",
+        file_timeout_s: Optional[float] = None,
+    ) -> BatchJob:
         """
         Create a new batch transcription job.
 
         Args:
             file_paths: List of paths to audio files
+            language: Language for transcription
+            file_timeout_s: Optional time limit per file
 
         Returns:
             The created BatchJob
@@ -228,7 +302,7 @@ class BatchService:
             raise ValueError("At least one file path is required")
 
         job_id = str(uuid.uuid4())
-        job = BatchJob(id=job_id)
+        job = BatchJob(id=job_id, language=language, file_timeout_s=file_timeout_s)
 
         # Create files for the job
         for file_path in file_paths:
@@ -245,10 +319,18 @@ class BatchService:
         # Persist to database
         await self._db.execute(
             """
-            INSERT INTO batch_jobs (id, status, created_at, current_file_index)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO batch_jobs
+                (id, status, created_at, current_file_index, language, file_timeout_s)
+            VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (job.id, job.status.value, job.created_at, job.current_file_index),
+            (
+                job.id,
+                job.status.value,
+                job.created_at,
+                job.current_file_index,
+                job.language,
+                job.file_timeout_s,
+            ),
         )
 
         for bf in job.files:
@@ -319,8 +401,11 @@ class BatchService:
         ):
             return False
 
-        # Set cancel flag
+        # Set cancel flag and stop the file in progress at its next chunk
         self._cancel_flags[job_id] = True
+        token = self._file_tokens.get(job_id)
+        if token is not None:
+            token.cancel("Batch job cancelled")
 
         # Mark remaining pending files as skipped
         for bf in job.files:
@@ -332,10 +417,72 @@ class BatchService:
         job.completed_at = datetime.now(timezone.utc)
         await self._update_job_status(job)
 
+        # Wake a paused job so its processing loop can see the cancel flag
+        if job_id in self._resume_events:
+            self._resume_events[job_id].set()
+
         logger.info(f"Cancelled batch job {job_id}")
 
         return True
 
+    async def pause_job(self, job_id: str) -> bool:
+        """
+        Pause a processing job after the file currently being transcribed.
+
+        Args:
+            job_id: The job ID to pause
+
+        Returns:
+            True if paused, False if not found or not processing
+        """
+        job = self._jobs.get(job_id)
+        if not job or job.status != BatchJobStatus.PROCESSING:
+            return False
+
+        self._resume_events.setdefault(job_id, asyncio.Event()).clear()
+
+        job.status = BatchJobStatus.PAUSED
+        await self._update_job_status(job)
+
+        logger.info(f"Paused batch job {job_id}")
+
+        return True
+
+    async def resume_job(self, job_id: str) -> bool:
+        """
+        Resume a paused job.
+
+        A job paused before a restart has no processing task left; it is set
+        back to PENDING so the caller starts process_job for it again.
+
+        Args:
+            job_id: The job ID to resume
+
+        Returns:
+            True if resumed, False if not found or not paused
+        """
+        job = self._jobs.get(job_id)
+        if not job or job.status != BatchJobStatus.PAUSED:
+            return False
+
+        lock = self._processing_locks.get(job_id)
+        if lock is None or not lock.locked():
+            self._resume_events.pop(job_id, None)
+            job.status = BatchJobStatus.PENDING
+            await self._update_job_status(job)
+            logger.info(f"Requeued batch job {job_id}")
+            return True
+
+        job.status = BatchJobStatus.PROCESSING
+        await self._update_job_status(job)
+
+        if job_id in self._resume_events:
+            self._resume_events[job_id].set()
+
+        logger.info(f"Resumed batch job {job_id}")
+
+        return True
+
     async def _update_job_status(self, job: BatchJob) -> None:
         """Update job status in database."""
         if not self._db:
@@ -344,10 +491,18 @@ class BatchService:
         await self._db.execute(
             """
             UPDATE batch_jobs 
-            SET status = ?, completed_at = ?, current_file_index = ?
+            SET status = ?, completed_at = ?, current_file_index = ?,
+                language = ?, file_timeout_s = ?
             WHERE id = ?
             """,
-            (job.status.value, job.completed_at, job.current_file_index, job.id),
+            (
+                job.status.value,
+                job.completed_at,
+                job.current_file_index,
+                job.language,
+                job.file_timeout_s,
+                job.id,
+            ),
         )
         await self._db.commit()
 
@@ -359,10 +514,10 @@ class BatchService:
         await self._db.execute(
             """
             UPDATE batch_files 
-            SET status = ?, error = ?, transcription_id = ?
+            SET status = ?, error = ?, transcription_id = ?, cached = ?
             WHERE id = ?
             """,
-            (bf.status.value, bf.error, bf.transcription_id, bf.id),
+            (bf.status.value, bf.error, bf.transcription_id, int(bf.cached), bf.id),
         )
         await self._db.commit()
 
@@ -372,7 +527,8 @@ class BatchService:
         transcriber: Any,
         history_service: Any,
         broadcast_fn: Callable,
-        language: str = "auto",
+        language: Optional[str] = None,
+        file_timeout_s: Optional[float] = None,
     ) -> None:
         """
         Process a batch job by transcribing all files.
@@ -382,8 +538,17 @@ class BatchService:
             transcriber: TranscriberService instance
             history_service: HistoryService instance
             broadcast_fn: Async function for WebSocket broadcasting
-            language: Language for transcription
+            language: Language for transcription; None keeps the job's
+            file_timeout_s: Optional time limit per file; files that exceed it
+                fail without a retry and the job moves on. None keeps the job's.
+                Options given here are stored on the job for later runs.
         """
+        from ..core.cancellation import (
+            CancellationToken,
+            DeadlineExceededError,
+            TranscriptionCancelledError,
+        )
+
         job = self._jobs.get(job_id)
         if not job:
             raise ValueError(f"Job not found: {job_id}")
@@ -396,6 +561,10 @@ class BatchService:
             self._processing_locks[job_id] = asyncio.Lock()
 
         async with self._processing_locks[job_id]:
+            if language is not None:
+                job.language = language
+            if file_timeout_s is not None:
+                job.file_timeout_s = file_timeout_s
             job.status = BatchJobStatus.PROCESSING
             await self._update_job_status(job)
 
@@ -410,20 +579,51 @@ class BatchService:
                     "total_files": len(job.files),
                     "completed": 0,
                     "failed": 0,
+                    "cache_hits": 0,
                 },
             )
 
             completed_count = 0
             failed_count = 0
+            cache_hits = 0  # Files served from the result cache
 
             for index, bf in enumerate(job.files):
+                # Files finished before a retry or restart are not transcribed again
+                if bf.status == BatchFileStatus.COMPLETED:
+                    completed_count += 1
+                    cache_hits += bf.cached
+                    continue
+
                 # Check for cancellation
                 if self._cancel_flags.get(job_id, False):
                     logger.info(f"Job {job_id} cancelled at file {index}")
                     break
 
+                # Wait here while the job is paused
+                resume = self._resume_events.get(job_id)
+                if resume is not None and not resume.is_set():
+                    logger.info(f"Job {job_id} paused at file {index}")
+                    await broadcast_fn(
+                        "batch_progress",
+                        {
+                            "job_id": job_id,
+                            "status": job.status.value,
+                            "current_file": None,
+                            "current_index": index,
+                            "total_files": len(job.files),
+                            "completed": completed_count,
+                            "failed": failed_count,
+                            "cache_hits": cache_hits,
+                        },
+                    )
+                    await resume.wait()
+                    if self._cancel_flags.get(job_id, False):
+                        logger.info(f"Job {job_id} cancelled while paused")
+                        break
+
                 job.current_file_index = index
                 bf.status = BatchFileStatus.PROCESSING
+                bf.cached = False
                 await self._update_file_status(bf)
 
                 # Broadcast file start
@@ -437,6 +637,7 @@ class BatchService:
                         "total_files": len(job.files),
                         "completed": completed_count,
                         "failed": failed_count,
+                        "cache_hits": cache_hits,
                     },
                 )
 
@@ -444,13 +645,22 @@ class BatchService:
                 max_retries = 1
                 last_error = None
 
+                # One deadline per file, shared by its retries
+                token = CancellationToken(job.file_timeout_s)
+                self._file_tokens[job_id] = token
+
                 for attempt in range(max_retries + 1):
                     try:
-                        # Transcribe the file
+                        # Transcribe the file at batch priority: it is chunked and
+                        # queued behind any live dictation. Its decoded audio is
+                        # cached, so retries and re-runs skip decoding.
                         result = await asyncio.to_thread(
                             transcriber.transcribe_file,
                             bf.file_path,
-                            language,
+                            job.language,
+                            priority="batch",
+                            cancel_token=token,
+                            cache_audio=True,
                         )
 
                         # Save to history
@@ -464,11 +674,26 @@ class BatchService:
                         bf.status = BatchFileStatus.COMPLETED
                         bf.transcription_id = record.id
                         bf.error = None  # Clear any previous error from retry
+                        bf.cached = bool(result.from_cache)
                         completed_count += 1
+                        cache_hits += bf.cached
 
                         logger.debug(f"Completed transcription for {bf.filename}")
                         break  # Success, exit retry loop
 
+                    except DeadlineExceededError as e:
+                        logger.warning(f"Transcription of {bf.filename} timed out: {e}")
+                        bf.status = BatchFileStatus.FAILED
+                        bf.error = str(e)
+                        failed_count += 1
+                        break
+
+                    except TranscriptionCancelledError as e:
+                        logger.info(f"Transcription of {bf.filename} cancelled")
+                        bf.status = BatchFileStatus.SKIPPED
+                        bf.error = str(e)
+                        break
+
                     except Exception as e:
                         # Check for CUDA/GPU errors - Immediate failure & reload
                         error_msg = str(e)
@@ -507,6 +732,7 @@ class BatchService:
                             bf.error = str(e)
                             failed_count += 1
 
+                self._file_tokens.pop(job_id, None)
                 await self._update_file_status(bf)
 
                 # Broadcast file completion
@@ -520,6 +746,7 @@ class BatchService:
                         "total_files": len(job.files),
                         "completed": completed_count,
                         "failed": failed_count,
+                        "cache_hits": cache_hits,
                         "file_status": bf.status.value,
                     },
                 )
@@ -534,6 +761,7 @@ class BatchService:
 
             job.completed_at = datetime.now(timezone.utc)
             await self._update_job_status(job)
+            self._resume_events.pop(job_id, None)
 
             # Final broadcast
             await broadcast_fn(
@@ -546,11 +774,13 @@ class BatchService:
                     "total_files": len(job.files),
                     "completed": completed_count,
                     "failed": failed_count,
+                    "cache_hits": cache_hits,
                 },
             )
 
             logger.info(
-                f"Batch job {job_id} completed: {completed_count} succeeded, {failed_count} failed"
+                f"Batch job {job_id} completed: {completed_count} succeeded "
+                f"({cache_hits} from the result cache), {failed_count} failed"
             )
 
     async def retry_failed(self, job_id: str, file_ids: Optional[list[str]] = None) -> BatchJob:
@@ -612,6 +842,7 @@ class BatchService:
         del self._jobs[job_id]
         self._cancel_flags.pop(job_id, None)
         self._processing_locks.pop(job_id, None)
+        self._resume_events.pop(job_id, None)
 
         logger.info(f"Deleted batch job {job_id}")
 
@@ -0,0 +1,304 @@
+"""
+WebSocket fan-out of server events.
+
+Each event is serialized once and put on a bounded send queue per connected
+client; every client has its own sender task, so a slow or half-dead client
+only delays itself. A client whose queue fills up, or whose socket doesn't
+take a message within SEND_TIMEOUT_S, is disconnected (it can reconnect and
+fetch the current state).
+
+Progress events that are superseded before they are sent (a newer
+download_progress for the same download, batch_progress for the same job,
+with the same status) replace the pending one, so a client that falls behind
+gets the latest progress instead of a backlog. Status changes and per-file
+results are never coalesced.
+
+Clients can subscribe to topics (event types) and to one recording session.
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from itertools import count
+from typing import Iterable, Optional
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+# Event types a client can subscribe to
+TOPICS = frozenset(
+    {
+        "status",
+        "transcription",
+        "transcription_progress",
+        "download_progress",
+        "batch_progress",
+        "endpoint",
+        "error",
+    }
+)
+# Progress events that a newer one with the same id (and status) supersedes
+COALESCE_FIELDS = {"download_progress": "download_id", "batch_progress": "job_id"}
+
+DEFAULT_MAX_PENDING = 256
+SEND_TIMEOUT_S = 10.0
+# Close code for clients that can't keep up ("try again later")
+STALLED_CLOSE_CODE = 1013
+# Close code for clients disconnected at shutdown
+GOING_AWAY_CLOSE_CODE = 1001
+
+
+def serialize(message: dict) -> str:
+    """Encode a message like WebSocket.send_json does."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def coalesce_key(event_type: str, data: dict) -> Optional[str]:
+    """Key shared by events that supersede each other, or None if this one must be sent."""
+    field = COALESCE_FIELDS.get(event_type)
+    if field is None or data.get(field) is None or "file_status" in data:
+        return None
+    return f"{event_type}:{data[field]}:{data.get('status')}"
+
+
+class Subscriber:
+    """One WebSocket client: its subscriptions and its queue of messages to send."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        session_id: Optional[str] = None,
+        topics: Optional[Iterable[str]] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """
+        Initialize the subscriber (start() starts sending).
+
+        Args:
+            websocket: The accepted connection
+            session_id: Only receive this session's events (plus events without a session)
+            topics: Event types to receive (None for all)
+            max_pending: Queued messages after which the client counts as stalled
+        """
+        self.websocket = websocket
+        self.session_id = session_id
+        self.topics: Optional[frozenset[str]] = None
+        self.subscribe(topics)
+        self.max_pending = max_pending
+        self.sent = 0
+        self.coalesced = 0
+        self.closed = False
+        self.stalled = False  # Disconnected for not keeping up
+        self._pending: OrderedDict[int, str] = OrderedDict()
+        self._keys: dict[str, int] = {}  # Coalescing key -> pending message
+        self._key_of: dict[int, str] = {}
+        self._ids = count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._close_task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Messages queued and not yet sent."""
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the sender task (on the running event loop)."""
+        self._task = asyncio.create_task(self._send_loop())
+
+    def subscribe(self, topics: Optional[Iterable[str]]) -> None:
+        """Receive only these event types from now on (None or empty for all)."""
+        self.topics = frozenset(topics) if topics else None
+
+    def wants(self, event_type: str, session_id: Optional[str]) -> bool:
+        """Whether this client subscribed to an event."""
+        if self.topics is not None and event_type not in self.topics:
+            return False
+        return not (session_id and self.session_id and self.session_id != session_id)
+
+    def send(self, text: str, key: Optional[str] = None) -> bool:
+        """
+        Queue a serialized message.
+
+        A pending message with the same `key` is dropped in favour of this one.
+        Returns False (and disconnects the client) if the queue is full.
+        """
+        if self.closed:
+            return False
+        if key is not None:
+            superseded = self._keys.pop(key, None)
+            if superseded is not None:
+                del self._pending[superseded]
+                del self._key_of[superseded]
+                self.coalesced += 1
+        if len(self._pending) >= self.max_pending:
+            logger.warning(f"WebSocket client stalled ({len(self._pending)} messages queued)")
+            self.close(STALLED_CLOSE_CODE)
+            return False
+
+        message_id = next(self._ids)
+        self._pending[message_id] = text
+        if key is not None:
+            self._keys[key] = message_id
+            self._key_of[message_id] = key
+        self._wakeup.set()
+        return True
+
+    def close(self, code: Optional[int] = None) -> None:
+        """Stop sending; with a code, also close the socket."""
+        if self.closed:
+            return
+        self.closed = True
+        self.stalled = code == STALLED_CLOSE_CODE
+        self._pending.clear()
+        self._keys.clear()
+        self._key_of.clear()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if code is not None:
+            self._close_task = asyncio.create_task(self._close_socket(code))
+
+    async def wait_closed(self) -> None:
+        """Wait (after close()) for the sender task and the socket close to finish."""
+        tasks = [t for t in (self._task, self._close_task) if t is not None]
+        if tasks:
+            await asyncio.wait(tasks, timeout=SEND_TIMEOUT_S)
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code), SEND_TIMEOUT_S)
+        except Exception:
+            pass
+
+    async def _send_loop(self) -> None:
+        """Send queued messages in order until the client is closed or stalls."""
+        try:
+            while not self.closed:
+                if not self._pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                message_id, text = self._pending.popitem(last=False)
+                key = self._key_of.pop(message_id, None)
+                if key is not None:
+                    del self._keys[key]
+                try:
+                    await self._send(text)
+                except asyncio.TimeoutError:
+                    logger.warning("WebSocket client stopped reading, disconnecting it")
+                    self.close(STALLED_CLOSE_CODE)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    # Disconnected; the endpoint's receive loop cleans up
+                    self.close()
+                else:
+                    self.sent += 1
+        except asyncio.CancelledError:
+            self.closed = True
+            raise
+
+    async def _send(self, text: str) -> None:
+        """
+        Send one message, raising asyncio.TimeoutError after SEND_TIMEOUT_S.
+
+        asyncio.wait_for() on Python 3.10/3.11 can swallow a cancel() that
+        arrives as the send completes, which would leave the loop waiting
+        forever; asyncio.wait() always lets the cancellation through.
+        """
+        send = asyncio.ensure_future(self.websocket.send_text(text))
+        try:
+            done, _ = await asyncio.wait({send}, timeout=SEND_TIMEOUT_S)
+        except asyncio.CancelledError:
+            send.cancel()
+            raise
+        if not done:
+            send.cancel()
+            raise asyncio.TimeoutError
+        send.result()
+
+
+class Broadcaster:
+    """The connected WebSocket clients, and fan-out of events to them."""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            max_pending: Per-client queue size (see Subscriber)
+        """
+        self.max_pending = max_pending
+        self._subscribers: list[Subscriber] = []
+        self.published = 0
+        self.dropped_clients = 0
+        # Totals of clients that have disconnected
+        self._sent = 0
+        self._coalesced = 0
+
+    def connect(
+        self,
+        websocket: WebSocket,
+        session_id: Optional[str] = None,
+        topics: Optional[Iterable[str]] = None,
+    ) -> Subscriber:
+        """Register an accepted connection and start sending to it."""
+        subscriber = Subscriber(websocket, session_id, topics, self.max_pending)
+        subscriber.start()
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def disconnect(self, subscriber: Subscriber) -> None:
+        """Unregister a connection (its socket is already closed or closing)."""
+        subscriber.close()
+        self._remove(subscriber)
+
+    async def close_all(self) -> None:
+        """Disconnect every client (at shutdown) and wait for their sender tasks to end."""
+        subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.close(GOING_AWAY_CLOSE_CODE)
+            self._remove(subscriber)
+        await asyncio.gather(*(s.wait_closed() for s in subscribers))
+
+    def _remove(self, subscriber: Subscriber) -> None:
+        """Forget a closed subscriber, counting it if it stalled."""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+            self.dropped_clients += subscriber.stalled
+            self._sent += subscriber.sent
+            self._coalesced += subscriber.coalesced
+
+    def publish(self, event_type: str, data: dict) -> None:
+        """
+        Queue an event for every client subscribed to it, without waiting.
+
+        Must be called on the event loop. Events carrying a session_id skip
+        clients subscribed to another session.
+        """
+        session_id = data.get("session_id")
+        text: Optional[str] = None
+        key = coalesce_key(event_type, data)
+        self.published += 1
+
+        for subscriber in list(self._subscribers):
+            if not subscriber.closed and subscriber.wants(event_type, session_id):
+                if text is None:
+                    text = serialize({"type": event_type, **data})
+                subscriber.send(text, key)
+            if subscriber.closed:
+                self._remove(subscriber)
+
+    def stats(self) -> dict:
+        """Client and queue counts, for the metrics endpoint."""
+        subscribers = [s for s in self._subscribers if not s.closed]
+        return {
+            "clients": len(subscribers),
+            "published": self.published,
+            "sent": self._sent + sum(s.sent for s in self._subscribers),
+            "coalesced": self._coalesced + sum(s.coalesced for s in self._subscribers),
+            "queued": sum(s.pending for s in subscribers),
+            "dropped_clients": self.dropped_clients,
+        }
@@ -0,0 +1,134 @@
+"""
+Thread-safe hand-off of server events to the event loop.
+
+State changes and progress are reported from worker threads (model loading,
+transcription, the dictation queue) as well as from the event loop. publish()
+can be called from any thread: it appends the event to a queue under a lock
+and, if no drain is scheduled yet, schedules one on the loop with
+call_soon_threadsafe. The loop then hands all queued events to the sink (the
+WebSocket broadcaster) in one batch, in the order they were published.
+
+Under backpressure (max_pending events waiting) queued events that a newer
+one supersedes are dropped: progress of the same download, or of the same
+batch job with the same status, as decided by broadcast.coalesce_key. Other
+events (state changes, transcription chunks, per-file results) are never
+dropped; the queue grows past max_pending instead.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from .broadcast import coalesce_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 1024
+
+EventSink = Callable[[str, dict], None]
+
+
+class EventBus:
+    """Queue of events from any thread, drained on the event loop in batches."""
+
+    def __init__(self, sink: EventSink, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Initialize the bus (attach() a loop to start delivering).
+
+        Args:
+            sink: Called on the loop with (event_type, data) for every event
+            max_pending: Events waiting for the loop before superseded ones are dropped
+        """
+        self._sink = sink
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        # (event_type, data, coalescing key)
+        self._pending: deque[tuple[str, dict, Optional[str]]] = deque()
+        # Queue length at which superseded events are dropped next
+        self._compact_at = max_pending
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scheduled = False
+        self.published = 0
+        self.dropped = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Deliver events on `loop` (including those published before)."""
+        with self._lock:
+            self._loop = loop
+            self._scheduled = False
+        self._schedule()
+
+    def detach(self) -> None:
+        """Stop delivering; events published afterwards wait for the next attach()."""
+        with self._lock:
+            self._loop = None
+
+    def publish(self, event_type: str, data: dict) -> None:
+        """Queue an event for the sink. Safe to call from any thread; never blocks on I/O."""
+        key = coalesce_key(event_type, data)
+        with self._lock:
+            if len(self._pending) >= self._compact_at:
+                self._drop_superseded(key)
+                # If little was superseded, don't rescan the queue on every event
+                self._compact_at = max(self.max_pending, 2 * len(self._pending))
+            self._pending.append((event_type, data, key))
+            self.published += 1
+        self._schedule()
+
+    def _drop_superseded(self, key: Optional[str]) -> None:
+        """Drop queued events that a newer one (or the event with `key`) replaces (lock held)."""
+        seen = {key} if key is not None else set()
+        kept: deque[tuple[str, dict, Optional[str]]] = deque()
+        for item in reversed(self._pending):
+            queued_key = item[2]
+            if queued_key is not None:
+                if queued_key in seen:
+                    self.dropped += 1
+                    continue
+                seen.add(queued_key)
+            kept.appendleft(item)
+        self._pending = kept
+
+    def _schedule(self) -> None:
+        """Schedule a drain on the loop unless one is already pending."""
+        with self._lock:
+            loop = self._loop
+            if loop is None or self._scheduled or not self._pending:
+                return
+            self._scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # The loop has closed (shutdown)
+            with self._lock:
+                self._scheduled = False
+
+    def _drain(self) -> None:
+        """Hand every queued event to the sink (on the loop)."""
+        with self._lock:
+            batch, self._pending = self._pending, deque()
+            self._compact_at = self.max_pending
+            self._scheduled = False
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for event_type, data, _ in batch:
+            try:
+                self._sink(event_type, data)
+            except Exception as e:
+                logger.error(f"Error delivering {event_type} event: {e}")
+
+    def stats(self) -> dict:
+        """Event counts, for the metrics endpoint."""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "published": self.published,
+            "dropped": self.dropped,
+            "pending": pending,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+        }
@@ -9,7 +9,7 @@ import io
 import json
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from .history import TranscriptionRecord
 
@@ -33,6 +33,9 @@ CONTENT_TYPES = {
     ExportFormat.VTT: "text/vtt",
 }
 
+# Output is streamed in chunks of about this many characters
+STREAM_CHUNK_BYTES = 64 * 1024
+
 # File extensions
 FILE_EXTENSIONS = {
     ExportFormat.TXT: "txt",
@@ -80,22 +83,71 @@ def _format_timestamp(
 class ExportService:
     """
     Service for exporting transcription records to various formats.
+
+    Each format has a generator (iter_txt, iter_json, ...) that yields the
+    document a record at a time, so exports of any size can be streamed;
+    to_txt, to_json, ... join its output.
     """
 
-    def to_txt(self, records: list[TranscriptionRecord]) -> str:
+    def iter_txt(self, records: Iterable[TranscriptionRecord]) -> Iterator[str]:
         """
-        Export records to plain text format.
+        Export records to plain text format, incrementally.
 
         Each record is separated by a blank line with timestamp header.
         """
-        lines = []
+        separator = ""
         for record in records:
             timestamp = record.created_at.strftime("%Y-%m-%d %H:%M:%S")
-            lines.append(f"[{timestamp}]")
-            lines.append(record.text)
-            lines.append("")  # Blank line separator
+            yield f"{separator}[{timestamp}]\n{record.text}"
+            separator = "\n\n"
+
+    def to_txt(self, records: list[TranscriptionRecord]) -> str:
+        """
+        Export records to plain text format.
+
+        Each record is separated by a blank line with timestamp header.
+        """
+        return "".join(self.iter_txt(records)).rstrip()
 
-        return "\n".join(lines).rstrip()
+    def iter_json(
+        self,
+        records: Iterable[TranscriptionRecord],
+        include_metadata: bool = True,
+        count: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Export records to JSON format, incrementally.
+
+        Produces the same document as to_json(). The count comes first in
+        the document, so it must be given unless `records` is a list.
+
+        Args:
+            records: Transcription records
+            include_metadata: Include full metadata or just text
+            count: Number of records
+        """
+        if count is None:
+            count = len(records)
+        header = {"exported_at": datetime.now(timezone.utc).isoformat(), "count": count}
+        # The header without its closing brace, followed by the opening of the list
+        yield json.dumps(header, indent=2, ensure_ascii=False)[:-2] + ',\n  "transcriptions": ['
+
+        separator = "\n"
+        for record in records:
+            if include_metadata:
+                item = record.to_dict()
+            else:
+                item = {
+                    "id": record.id,
+                    "text": record.text,
+                    "created_at": record.created_at.isoformat(),
+                }
+            # Strings in the output are escaped, so every line can be indented
+            text = json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+            yield f"{separator}    {text}"
+            separator = ",\n"
+
+        yield "\n  ]\n}" if separator != "\n" else "]\n}"
 
     def to_json(
         self,
@@ -109,38 +161,18 @@ class ExportService:
             records: List of transcription records
             include_metadata: Include full metadata or just text
         """
-        if include_metadata:
-            data = {
-                "exported_at": datetime.now(timezone.utc).isoformat(),
-                "count": len(records),
-                "transcriptions": [record.to_dict() for record in records],
-            }
-        else:
-            data = {
-                "exported_at": datetime.now(timezone.utc).isoformat(),
-                "count": len(records),
-                "transcriptions": [
-                    {
-                        "id": record.id,
-                        "text": record.text,
-                        "created_at": record.created_at.isoformat(),
-                    }
-                    for record in records
-                ],
-            }
-
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return "".join(self.iter_json(records, include_metadata))
 
-    def to_csv(
+    def iter_csv(
         self,
-        records: list[TranscriptionRecord],
+        records: Iterable[TranscriptionRecord],
         include_metadata: bool = True,
-    ) -> str:
+    ) -> Iterator[str]:
         """
-        Export records to CSV format.
+        Export records to CSV format, incrementally.
 
         Args:
-            records: List of transcription records
+            records: Transcription records
             include_metadata: Include full metadata columns
         """
         output = io.StringIO()
@@ -151,7 +183,16 @@ class ExportService:
             fieldnames = ["id", "text", "created_at"]
 
         writer = csv.DictWriter(output, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+
+        def take() -> str:
+            """Rows written since the last call."""
+            text = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            return text
+
         writer.writeheader()
+        yield take()
 
         for record in records:
             if include_metadata:
@@ -173,12 +214,25 @@ class ExportService:
                         "created_at": record.created_at.isoformat(),
                     }
                 )
+            yield take()
 
-        return output.getvalue()
+    def to_csv(
+        self,
+        records: list[TranscriptionRecord],
+        include_metadata: bool = True,
+    ) -> str:
+        """
+        Export records to CSV format.
 
-    def to_srt(self, records: list[TranscriptionRecord]) -> str:
+        Args:
+            records: List of transcription records
+            include_metadata: Include full metadata columns
         """
-        Export records to SRT (SubRip) subtitle format.
+        return "".join(self.iter_csv(records, include_metadata))
+
+    def iter_srt(self, records: Iterable[TranscriptionRecord]) -> Iterator[str]:
+        """
+        Export records to SRT (SubRip) subtitle format, incrementally.
 
         Format:
         1
@@ -187,7 +241,6 @@ class ExportService:
 
         Uses sequential numbering and calculates timestamps from duration_ms.
         """
-        lines = []
         current_time_ms = 0
 
         for index, record in enumerate(records, start=1):
@@ -195,18 +248,22 @@ class ExportService:
             end_time_ms = current_time_ms + record.duration_ms
             end_time = _format_timestamp(end_time_ms, use_comma=True, always_hours=True)
 
-            lines.append(str(index))
-            lines.append(f"{start_time} --> {end_time}")
-            lines.append(record.text)
-            lines.append("")  # Blank line separator
+            separator = "\n\n" if index > 1 else ""
+            yield f"{separator}{index}\n{start_time} --> {end_time}\n{record.text}"
 
             current_time_ms = end_time_ms
 
-        return "\n".join(lines).rstrip()
+    def to_srt(self, records: list[TranscriptionRecord]) -> str:
+        """
+        Export records to SRT (SubRip) subtitle format.
 
-    def to_vtt(self, records: list[TranscriptionRecord]) -> str:
+        See iter_srt() for the format.
         """
-        Export records to WebVTT subtitle format.
+        return "".join(self.iter_srt(records)).rstrip()
+
+    def iter_vtt(self, records: Iterable[TranscriptionRecord]) -> Iterator[str]:
+        """
+        Export records to WebVTT subtitle format, incrementally.
 
         Format:
         WEBVTT
@@ -214,7 +271,7 @@ class ExportService:
         00:00.000 --> 00:05.123
         First transcription text
         """
-        lines = ["WEBVTT", ""]  # Header and blank line
+        yield "WEBVTT"
         current_time_ms = 0
 
         for record in records:
@@ -222,13 +279,60 @@ class ExportService:
             end_time_ms = current_time_ms + record.duration_ms
             end_time = _format_timestamp(end_time_ms, use_comma=False, always_hours=False)
 
-            lines.append(f"{start_time} --> {end_time}")
-            lines.append(record.text)
-            lines.append("")  # Blank line separator
+            yield f"\n\n{start_time} --> {end_time}\n{record.text}"
 
             current_time_ms = end_time_ms
 
-        return "\n".join(lines).rstrip()
+    def to_vtt(self, records: list[TranscriptionRecord]) -> str:
+        """
+        Export records to WebVTT subtitle format.
+
+        See iter_vtt() for the format.
+        """
+        return "".join(self.iter_vtt(records)).rstrip()
+
+    def stream(
+        self,
+        records: Iterable[TranscriptionRecord],
+        format: ExportFormat,
+        include_metadata: bool = True,
+        count: Optional[int] = None,
+    ) -> tuple[Iterator[bytes], str, str]:
+        """
+        Export records to the specified format as a stream of UTF-8 chunks.
+
+        Records are consumed as the chunks are read, and output is grouped
+        into chunks of about STREAM_CHUNK_BYTES, so memory use doesn't depend
+        on the number of records. The document is the same as export()'s,
+        including the trailing whitespace trimmed from TXT, SRT and VTT.
+
+        Args:
+            records: Transcription records (e.g. from HistoryService.export_query)
+            format: Export format
+            include_metadata: Include metadata for JSON/CSV formats
+            count: Number of records (required for JSON unless `records` is a list)
+
+        Returns:
+            Tuple of (chunk iterator, filename, content_type)
+        """
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        filename = f"speakeasy_export_{timestamp}.{FILE_EXTENSIONS[format]}"
+        content_type = CONTENT_TYPES[format]
+
+        if format == ExportFormat.TXT:
+            parts = _rstripped(self.iter_txt(records))
+        elif format == ExportFormat.JSON:
+            parts = self.iter_json(records, include_metadata, count)
+        elif format == ExportFormat.CSV:
+            parts = self.iter_csv(records, include_metadata)
+        elif format == ExportFormat.SRT:
+            parts = _rstripped(self.iter_srt(records))
+        elif format == ExportFormat.VTT:
+            parts = _rstripped(self.iter_vtt(records))
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        return _encode_chunks(parts), filename, content_type
 
     def export(
         self,
@@ -267,5 +371,32 @@ class ExportService:
         return content, filename, content_type
 
 
+def _rstripped(parts: Iterator[str]) -> Iterator[str]:
+    """Pieces of a document without its trailing whitespace (like "".join(parts).rstrip())."""
+    pending = ""  # Whitespace that is only kept if more text follows
+    for part in parts:
+        text = part.rstrip()
+        if text:
+            yield pending + text
+            pending = part[len(text) :]
+        else:
+            pending += part
+
+
+def _encode_chunks(parts: Iterator[str]) -> Iterator[bytes]:
+    """Join small pieces of a document into UTF-8 chunks of about STREAM_CHUNK_BYTES."""
+    buffer: list[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= STREAM_CHUNK_BYTES:
+            yield "".join(buffer).encode("utf-8")
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
 # Singleton instance
 export_service = ExportService()
@@ -3,11 +3,15 @@ History service for storing and retrieving transcription records.
 
 Uses SQLite with FTS5 for full-text search.
 Supports cursor-based pagination and field projection.
+Exports walk the table in keyset-paginated pages with the filters in SQL.
 """
 
 import base64
+import json
 import logging
+import sqlite3
 import uuid
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, fields as dataclass_fields
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +21,9 @@ import aiosqlite
 
 logger = logging.getLogger(__name__)
 
+# Rows read per query when walking the history for an export
+EXPORT_PAGE_SIZE = 500
+
 
 @dataclass
 class TranscriptionRecord:
@@ -67,6 +74,36 @@ class TranscriptionRecord:
             return all_data
         return {k: v for k, v in all_data.items() if k in fields}
 
+    @classmethod
+    def from_row(cls, row) -> "TranscriptionRecord":
+        """Create a record from a transcriptions table row."""
+        return cls(
+            id=row["id"],
+            text=row["text"],
+            duration_ms=row["duration_ms"],
+            model_used=row["model_used"],
+            language=row["language"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            original_text=row["original_text"] if "original_text" in row.keys() else None,
+        )
+
+
+def fts_phrase(search: str) -> str:
+    """
+    Quote a search string as an FTS5 phrase.
+
+    Double quotes are escaped and the whole query is matched as a literal
+    phrase, so quotes and FTS5 keywords can't cause syntax errors.
+    """
+    return '"{}"'.format(search.replace('"', '""'))
+
+
+def _db_timestamp(value: datetime) -> str:
+    """A datetime in the form created_at is stored in (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(" ")
+
 
 def encode_cursor(created_at: datetime, record_id: str) -> str:
     """Encode cursor from timestamp and ID."""
@@ -293,15 +330,7 @@ class HistoryService:
         if not row:
             return None
 
-        return TranscriptionRecord(
-            id=row["id"],
-            text=row["text"],
-            duration_ms=row["duration_ms"],
-            model_used=row["model_used"],
-            language=row["language"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            original_text=row["original_text"] if "original_text" in row.keys() else None,
-        )
+        return TranscriptionRecord.from_row(row)
 
     async def list(
         self,
@@ -341,10 +370,7 @@ class HistoryService:
 
         if search:
             # Sanitize search query for FTS5
-            # Escape double quotes and wrap in double quotes to treat as a literal string/phrase
-            # This prevents syntax errors with single quotes or FTS5 keywords
-            sanitized = search.replace('"', '""')
-            search_query = f'"{sanitized}"'
+            search_query = fts_phrase(search)
 
             # Use FTS5 for full-text search
             count_cursor_db = await self._db.execute(
@@ -409,18 +435,7 @@ class HistoryService:
                 )
 
         rows = await db_cursor.fetchall()
-        records = [
-            TranscriptionRecord(
-                id=row["id"],
-                text=row["text"],
-                duration_ms=row["duration_ms"],
-                model_used=row["model_used"],
-                language=row["language"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                original_text=row["original_text"] if "original_text" in row.keys() else None,
-            )
-            for row in rows
-        ]
+        records = [TranscriptionRecord.from_row(row) for row in rows]
 
         # Generate next cursor if there are more records
         next_cursor: Optional[str] = None
@@ -430,6 +445,95 @@ class HistoryService:
 
         return records, total, next_cursor
 
+    def export_query(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        search: Optional[str] = None,
+        record_ids: Optional[Sequence[str]] = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> tuple[int, Iterator[TranscriptionRecord]]:
+        """
+        Count and iterate the records matching export filters, newest first.
+
+        Runs synchronously on a separate read-only connection, so a long
+        export (e.g. in StreamingResponse's thread pool) neither blocks the
+        event loop nor holds up the service's connection. All filters are
+        applied in SQL and rows are read one page at a time (keyset
+        pagination on created_at, id), so memory use doesn't depend on the
+        number of records. Records added after the call are not included.
+
+        Args:
+            start_date: Only records created at or after this time (naive = UTC)
+            end_date: Only records created at or before this time (naive = UTC)
+            search: Full-text search query
+            record_ids: Only these records
+            page_size: Rows read per query
+
+        Returns:
+            Tuple of (number of matching records, iterator over them)
+        """
+        until = datetime.now(timezone.utc)
+        if end_date is None or _db_timestamp(end_date) > _db_timestamp(until):
+            end_date = until
+
+        join = ""
+        where = ["t.created_at <= ?"]
+        params: list = [_db_timestamp(end_date)]
+        if search:
+            join = "INNER JOIN transcriptions_fts fts ON t.rowid = fts.rowid"
+            where.append("transcriptions_fts MATCH ?")
+            params.append(fts_phrase(search))
+        if start_date is not None:
+            where.append("t.created_at >= ?")
+            params.append(_db_timestamp(start_date))
+        if record_ids is not None:
+            # One JSON parameter instead of a placeholder per id (no variable limit)
+            where.append("t.id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(record_ids)))
+
+        # Iterated from whichever worker thread reads the next chunk (one at a time)
+        db = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        db.row_factory = sqlite3.Row
+        try:
+            (total,) = db.execute(
+                f"SELECT COUNT(*) FROM transcriptions t {join} WHERE {' AND '.join(where)}",
+                params,
+            ).fetchone()
+        except BaseException:
+            db.close()
+            raise
+
+        # Rows after the last one of the previous page
+        keyset = "(t.created_at < ? OR (t.created_at = ? AND t.id < ?))"
+
+        def pages() -> Iterator[TranscriptionRecord]:
+            try:
+                after: list = []
+                while True:
+                    conditions = where + [keyset] if after else where
+                    rows = db.execute(
+                        f"""
+                        SELECT t.* FROM transcriptions t {join}
+                        WHERE {' AND '.join(conditions)}
+                        ORDER BY t.created_at DESC, t.id DESC
+                        LIMIT ?
+                        """,
+                        [*params, *after, page_size],
+                    ).fetchall()
+                    for row in rows:
+                        yield TranscriptionRecord.from_row(row)
+                    if len(rows) < page_size:
+                        return
+                    last = rows[-1]
+                    after = [last["created_at"], last["created_at"], last["id"]]
+            finally:
+                db.close()
+
+        return total, pages()
+
     async def delete(self, record_id: str) -> bool:
         """
         Delete a transcription by ID.
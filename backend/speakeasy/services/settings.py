@@ -26,9 +26,102 @@ class AppSettings(BaseModel):
     compute_type: str = Field(default="float16", description="Compute precision")
     device: str = Field(default="cuda", description="Device to run on (cuda/cpu)")
     language: str = Field(default="auto", description="Language code or 'auto'")
+    enable_torch_compile: bool = Field(
+        default=False,
+        description="Compile model encoders with torch.compile in the background (falls back to eager)",
+    )
+    torch_compile_timeout_s: float = Field(
+        default=300.0, description="Seconds to wait for torch.compile before staying eager"
+    )
+
+    # Cascade: fast Whisper first, loaded model only for low-confidence segments
+    cascade_fast_model: Optional[str] = Field(
+        default=None, description="Whisper model for the cascade's first pass (None disables)"
+    )
+    cascade_logprob_threshold: float = Field(
+        default=-0.7, description="Re-decode segments with avg_logprob below this"
+    )
+    cascade_no_speech_threshold: float = Field(
+        default=0.6,
+        description="Drop segments with no_speech_prob above this (and low avg_logprob) as silence",
+    )
+
+    # Language routing: pick the fastest resident model for the detected language
+    enable_language_routing: bool = Field(
+        default=False, description="Route 'auto' language requests by detected language"
+    )
+    routing_lid_model: str = Field(
+        default="tiny", description="Whisper model used for language identification"
+    )
+    routing_models: list[dict[str, str]] = Field(
+        default_factory=list,
+        description="Extra resident models to route between ({model_type, model_name})",
+    )
+    routing_rules: dict[str, str] = Field(
+        default_factory=dict, description="Language code to preferred model name ('*' = any)"
+    )
+
+    # Micro-batching of concurrent transcription requests
+    enable_batching: bool = Field(
+        default=False, description="Batch concurrent transcription requests into one model call"
+    )
+    batch_max_size: int = Field(default=8, description="Maximum requests per batched call")
+    batch_max_wait_ms: float = Field(
+        default=20.0, description="Maximum time a request waits for a batch to fill"
+    )
+
+    # Automatic end of dictation after trailing silence (endpointing)
+    enable_endpointing: bool = Field(
+        default=False, description="Stop and transcribe automatically when speech ends"
+    )
+    endpointing_silence_ms: float = Field(
+        default=700.0, description="Trailing silence that ends an utterance"
+    )
+    endpointing_threshold_db: float = Field(
+        default=-45.0, description="Level (dBFS) below which audio is never speech"
+    )
+    endpointing_min_speech_ms: float = Field(
+        default=200.0, description="Speech required before silence can end the recording"
+    )
+    trim_silence: bool = Field(
+        default=True, description="Cut leading and trailing silence from recordings"
+    )
+    trim_silence_threshold_db: float = Field(
+        default=-50.0, description="Level (dBFS) below which leading/trailing audio is trimmed"
+    )
+    trim_silence_files: bool = Field(
+        default=False, description="Also trim silence from transcribed files and uploads"
+    )
 
     # Audio settings
     device_name: Optional[str] = Field(default=None, description="Audio input device name")
+    warm_microphone: bool = Field(
+        default=False, description="Keep the microphone open between recordings"
+    )
+    pre_roll_ms: float = Field(
+        default=300.0, description="Audio from before the hotkey included with a warm microphone"
+    )
+    spill_to_disk: bool = Field(
+        default=False, description="Move long recordings to disk while recording"
+    )
+    spill_after_s: float = Field(
+        default=60.0, description="Recording length at which audio starts spilling to disk"
+    )
+    capture_process: bool = Field(
+        default=False, description="Capture audio in a separate high-priority process"
+    )
+    audio_cache_max_mb: int = Field(
+        default=2048, description="Disk budget for decoded batch audio in MB (0 disables it)"
+    )
+    enable_result_cache: bool = Field(
+        default=True, description="Reuse transcripts of files with identical audio content"
+    )
+    capture_blocksize: int = Field(
+        default=0, description="Frames per audio callback (0 lets the audio backend choose)"
+    )
+    capture_latency: Optional[str] = Field(
+        default=None, description='Input latency: "low", "high" or seconds (default if unset)'
+    )
 
     # Hotkey settings
     hotkey: str = Field(default="ctrl+shift+space", description="Global hotkey combination")
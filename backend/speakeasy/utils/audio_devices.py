@@ -21,26 +21,12 @@ def list_audio_devices() -> list[dict]:
         - name: Device name
         - channels: Number of input channels
         - sample_rate: Default sample rate
+        - hostapi: Host API name
         - is_default: Whether this is the default device
     """
-    import sounddevice as sd
+    from ..core.devices import get_device_registry
 
-    devices = sd.query_devices()
-    input_devices = []
-
-    for i, dev in enumerate(devices):
-        if dev["max_input_channels"] > 0:
-            input_devices.append(
-                {
-                    "id": i,
-                    "name": dev["name"],
-                    "channels": dev["max_input_channels"],
-                    "sample_rate": int(dev["default_samplerate"]),
-                    "is_default": i == sd.default.device[0],
-                }
-            )
-
-    return input_devices
+    return get_device_registry().list_inputs()
 
 
 def get_default_device() -> Optional[dict]:
@@ -81,7 +67,8 @@ def list_audio_devices_linux() -> list[dict]:
     """
     List audio devices using PulseAudio (Linux).
 
-    This provides more user-friendly names on Linux systems.
+    This provides more user-friendly names on Linux systems. The listing is
+    cached in the device registry until the devices change.
 
     Returns:
         List of device info dictionaries
@@ -89,6 +76,13 @@ def list_audio_devices_linux() -> list[dict]:
     if platform.system() != "Linux":
         return list_audio_devices()
 
+    from ..core.devices import get_device_registry
+
+    return get_device_registry().cached("pulse_sources", _list_pulse_sources)
+
+
+def _list_pulse_sources() -> list[dict]:
+    """List PulseAudio sources, falling back to sounddevice."""
     try:
         import pulsectl
 
@@ -0,0 +1,128 @@
+"""
+Entry point of the audio capture process (see speakeasy.core.capture_process).
+
+Kept outside speakeasy.core so the child process only imports numpy and
+sounddevice, not the models and torch.
+
+Shared memory layout: a header of HEADER_LEN int64 counters followed by a
+float32 ring of the first input channel. The callback writes the samples
+first and publishes them by advancing header[WRITTEN] last, so a reader never
+sees a position whose samples aren't written yet.
+"""
+
+import logging
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Header counters
+WRITTEN = 0  # Total samples written
+CALLBACKS = 1
+OVERFLOWS = 2
+UNDERFLOWS = 3
+HEADER_LEN = 4
+
+# Windows process priority class (SetPriorityClass)
+HIGH_PRIORITY_CLASS = 0x80
+
+
+def buffer_views(buf, ring_len: int) -> tuple[np.ndarray, np.ndarray]:
+    """Header and ring arrays over a shared memory buffer."""
+    header = np.ndarray((HEADER_LEN,), dtype=np.int64, buffer=buf)
+    ring = np.ndarray((ring_len,), dtype=np.float32, buffer=buf, offset=HEADER_LEN * 8)
+    return header, ring
+
+
+def write_block(header: np.ndarray, ring: np.ndarray, samples: np.ndarray) -> None:
+    """Append samples to the ring and publish them (single writer)."""
+    size = len(ring)
+    written = int(header[WRITTEN])
+    count = len(samples)
+    if count > size:
+        samples = samples[-size:]
+    pos = (written + count - len(samples)) % size
+    first = min(len(samples), size - pos)
+    ring[pos : pos + first] = samples[:first]
+    ring[: len(samples) - first] = samples[first:]
+    header[WRITTEN] = written + count
+
+
+class RingWriter:
+    """The stream callback's views of the shared memory, released before it is closed."""
+
+    def __init__(self, buf, ring_len: int):
+        self.header, self.ring = buffer_views(buf, ring_len)
+
+    def callback(self, indata, frames, time_info, status) -> None:
+        """sounddevice input callback: count xruns and append the first channel."""
+        header = self.header
+        if header is None:
+            return
+        if status:
+            if status.input_overflow:
+                header[OVERFLOWS] += 1
+            if status.input_underflow:
+                header[UNDERFLOWS] += 1
+        header[CALLBACKS] += 1
+        write_block(header, self.ring, indata[:, 0])
+
+    def release(self) -> None:
+        """Drop the views (SharedMemory.close() fails while they exist)."""
+        self.header = self.ring = None
+
+
+def raise_priority() -> None:
+    """Ask the OS to schedule this process ahead of the backend (best effort)."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), HIGH_PRIORITY_CLASS)
+        else:
+            os.nice(-10)
+    except Exception as e:
+        # Raising priority needs privileges on Linux; the isolation still helps
+        logger.debug(f"Could not raise capture process priority: {e}")
+
+
+def capture_main(
+    shm_name: str,
+    ring_len: int,
+    device_id,
+    samplerate: int,
+    channels: int,
+    blocksize: int,
+    latency,
+    ready,
+    stop,
+    errors,
+) -> None:
+    """Run the input stream until `stop` is set, writing into shared memory."""
+    raise_priority()
+    # The parent owns (and unlinks) the segment; a spawned child shares its resource tracker
+    shm = shared_memory.SharedMemory(name=shm_name)
+    writer = RingWriter(shm.buf, ring_len)
+    try:
+        import sounddevice as sd
+
+        with sd.InputStream(
+            samplerate=samplerate,
+            channels=channels,
+            dtype=np.float32,
+            device=device_id,
+            blocksize=blocksize,
+            latency=latency,
+            callback=writer.callback,
+        ):
+            ready.set()
+            stop.wait()
+    except Exception as e:
+        errors.put(f"{type(e).__name__}: {e}")
+    finally:
+        writer.release()
+        shm.close()
@@ -0,0 +1,83 @@
+"""
+Test for AudioFileStream.chunks
+Test suite for streaming decode of audio files into fixed-size chunks.
+"""
+
+import pytest
+import numpy as np
+import scipy.signal
+import soundfile as sf
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.audio_file import AudioFileStream, StreamingResampler
+
+
+@pytest.fixture
+def stereo_file(tmp_path):
+    """Write 5s of stereo noise at 44.1kHz."""
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal((5 * 44100 + 123, 2)) * 0.1).astype(np.float32)
+    path = tmp_path / "noise.wav"
+    sf.write(path, audio, 44100, subtype="FLOAT")
+    return path, audio
+
+
+def open_stream(path):
+    """Open a file with the soundfile decoder (PyAV resamples differently)."""
+    stream = AudioFileStream(str(path), 16000)
+    stream.backend = "soundfile"
+    return stream
+
+
+class TestAudioFileStreamChunks:
+    """Tests for AudioFileStream.chunks"""
+
+    def test_chunks_match_whole_file_decode(self, stereo_file):
+        """Test that chunks concatenate to the whole-file downmix and resample."""
+        path, audio = stereo_file
+        expected = scipy.signal.resample_poly(audio.mean(axis=1), 160, 441)
+
+        chunks = list(open_stream(path).chunks(16000))
+
+        assert [len(c) for c in chunks[:-1]] == [16000] * (len(chunks) - 1)
+        assert 0 < len(chunks[-1]) <= 16000
+        np.testing.assert_allclose(np.concatenate(chunks), expected, atol=1e-5)
+
+    def test_length_from_metadata(self, stereo_file):
+        """Test that len() is known before anything is decoded."""
+        path, audio = stereo_file
+
+        stream = open_stream(path)
+
+        assert len(stream) == round(len(audio) * 16000 / 44100)
+
+    def test_native_rate_is_passed_through(self, tmp_path):
+        """Test that 16kHz mono audio comes back unchanged."""
+        audio = np.linspace(-0.5, 0.5, 40000, dtype=np.float32)
+        path = tmp_path / "ramp.wav"
+        sf.write(path, audio, 16000, subtype="FLOAT")
+
+        chunks = list(open_stream(path).chunks(16000))
+
+        assert [len(c) for c in chunks] == [16000, 16000, 8000]
+        np.testing.assert_array_equal(np.concatenate(chunks), audio)
+
+    def test_resampler_blocks_match_resample_poly(self):
+        """Test that resampling block by block gives the same samples as in one piece."""
+        rng = np.random.default_rng(1)
+        audio = rng.standard_normal(48000 * 2 + 7).astype(np.float32)
+        resampler = StreamingResampler(48000, 16000)
+
+        blocks = [resampler.process(audio[i : i + 1000]) for i in range(0, len(audio), 1000)]
+        blocks.append(resampler.flush())
+
+        np.testing.assert_allclose(
+            np.concatenate(blocks), scipy.signal.resample_poly(audio, 1, 3), atol=1e-5
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""
+Test for BatchService.cancel_job
+Test suite for cancelling batch jobs mid-file and per-file timeouts.
+"""
+
+import pytest
+import asyncio
+import threading
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+import sys
+import tempfile
+import os
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.services.batch import (
+    BatchService,
+    BatchJobStatus,
+    BatchFileStatus,
+)
+
+
+@pytest.fixture
+async def initialized_service_with_job():
+    """Create and initialize a BatchService with a job."""
+    temp_dir = tempfile.mkdtemp()
+    db_path = Path(temp_dir) / "test_batch.db"
+    service = BatchService(db_path=db_path)
+    await service.initialize()
+
+    job = await service.create_job(["/path/to/audio.wav", "/path/to/audio2.wav"])
+
+    yield service, job
+
+    # Cleanup
+    await service.close()
+    if db_path.exists():
+        db_path.unlink()
+    if temp_dir:
+        os.rmdir(temp_dir)
+
+
+def _blocking_transcriber(started: threading.Event):
+    """Transcriber that runs until its cancellation token fires."""
+    mock_transcriber = Mock()
+
+    def transcribe_file(file_path, language, priority=None, cancel_token=None, cache_audio=False):
+        started.set()
+        while True:
+            cancel_token.check()
+            threading.Event().wait(0.01)
+
+    mock_transcriber.transcribe_file.side_effect = transcribe_file
+    return mock_transcriber
+
+
+class TestBatchServiceCancelJob:
+    """Tests for BatchService.cancel_job"""
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_file_in_progress(self, initialized_service_with_job):
+        """Test that cancelling a job stops the file being transcribed."""
+        service, job = initialized_service_with_job
+        started = threading.Event()
+        mock_transcriber = _blocking_transcriber(started)
+        mock_history = Mock()
+        mock_history.add = AsyncMock()
+
+        task = asyncio.create_task(
+            service.process_job(job.id, mock_transcriber, mock_history, AsyncMock())
+        )
+        await asyncio.to_thread(started.wait, 5)
+        assert await service.cancel_job(job.id)
+        await asyncio.wait_for(task, timeout=5)
+
+        assert job.status == BatchJobStatus.CANCELLED
+        assert [f.status for f in job.files] == [BatchFileStatus.SKIPPED] * 2
+        assert mock_transcriber.transcribe_file.call_count == 1
+        mock_history.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_file_timeout_fails_file_and_continues(self, initialized_service_with_job):
+        """Test that a file past its timeout fails without a retry and the job goes on."""
+        service, job = initialized_service_with_job
+        mock_transcriber = _blocking_transcriber(threading.Event())
+        mock_history = Mock()
+        mock_history.add = AsyncMock()
+
+        await asyncio.wait_for(
+            service.process_job(
+                job.id, mock_transcriber, mock_history, AsyncMock(), file_timeout_s=0.05
+            ),
+            timeout=5,
+        )
+
+        assert job.status == BatchJobStatus.FAILED
+        assert [f.status for f in job.files] == [BatchFileStatus.FAILED] * 2
+        assert "timed out" in job.files[0].error
+        # No retry after a timeout
+        assert mock_transcriber.transcribe_file.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,212 @@
+"""
+Test for BatchService.pause_job
+Test suite for pausing and resuming batch jobs between files.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+from pathlib import Path
+import sys
+import tempfile
+import os
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.services.batch import (
+    BatchService,
+    BatchJobStatus,
+    BatchFileStatus,
+)
+
+
+@pytest.fixture
+async def initialized_service_with_job():
+    """Create and initialize a BatchService with a job."""
+    temp_dir = tempfile.mkdtemp()
+    db_path = Path(temp_dir) / "test_batch.db"
+    service = BatchService(db_path=db_path)
+    await service.initialize()
+
+    job = await service.create_job(["/path/to/audio.wav", "/path/to/audio2.wav"])
+
+    yield service, job
+
+    # Cleanup
+    await service.close()
+    if db_path.exists():
+        db_path.unlink()
+    if temp_dir:
+        os.rmdir(temp_dir)
+
+
+def _mock_transcriber():
+    """Transcriber whose transcribe_file returns a fixed result."""
+    mock_transcriber = Mock()
+    mock_result = Mock()
+    mock_result.text = "Transcribed text"
+    mock_result.duration_ms = 5000
+    mock_result.model_used = "test-model"
+    mock_result.language = "en"
+    mock_transcriber.transcribe_file.return_value = mock_result
+    return mock_transcriber
+
+
+async def _wait_for_status(job, status, timeout=5):
+    """Wait until a job reaches the given status."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while job.status != status and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+
+class TestBatchServicePauseJob:
+    """Tests for BatchService.pause_job"""
+
+    @pytest.mark.asyncio
+    async def test_pause_requires_processing_job(self, initialized_service_with_job):
+        """Test that only processing jobs can be paused or resumed."""
+        service, job = initialized_service_with_job
+
+        assert await service.pause_job(job.id) is False
+        assert await service.resume_job(job.id) is False
+        assert await service.pause_job("non-existent-id") is False
+
+    @pytest.mark.asyncio
+    async def test_paused_job_waits_between_files(self, initialized_service_with_job):
+        """Test that a paused job stops after the current file and continues on resume."""
+        service, job = initialized_service_with_job
+
+        mock_transcriber = _mock_transcriber()
+        mock_history = Mock()
+        mock_history.add = AsyncMock(return_value=Mock(id="record-id"))
+        mock_broadcast = AsyncMock()
+
+        async def broadcast(event, data):
+            # Pause as soon as the first file has finished
+            if data.get("file_status") and data["current_index"] == 1:
+                assert await service.pause_job(job.id)
+
+        mock_broadcast.side_effect = broadcast
+
+        task = asyncio.create_task(
+            service.process_job(job.id, mock_transcriber, mock_history, mock_broadcast)
+        )
+        await _wait_for_status(job, BatchJobStatus.PAUSED)
+
+        assert job.status == BatchJobStatus.PAUSED
+        assert mock_transcriber.transcribe_file.call_count == 1
+        assert job.files[1].status == BatchFileStatus.PENDING
+
+        assert await service.resume_job(job.id)
+        await asyncio.wait_for(task, timeout=5)
+
+        assert job.status == BatchJobStatus.COMPLETED
+        assert mock_transcriber.transcribe_file.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_paused(self, initialized_service_with_job):
+        """Test that cancelling a paused job ends its processing loop."""
+        service, job = initialized_service_with_job
+
+        mock_transcriber = _mock_transcriber()
+        mock_history = Mock()
+        mock_history.add = AsyncMock(return_value=Mock(id="record-id"))
+
+        async def broadcast(event, data):
+            if data.get("file_status") and data["current_index"] == 1:
+                await service.pause_job(job.id)
+
+        task = asyncio.create_task(
+            service.process_job(
+                job.id, mock_transcriber, mock_history, AsyncMock(side_effect=broadcast)
+            )
+        )
+        await _wait_for_status(job, BatchJobStatus.PAUSED)
+
+        assert await service.cancel_job(job.id)
+        await asyncio.wait_for(task, timeout=5)
+
+        assert job.status == BatchJobStatus.CANCELLED
+        assert mock_transcriber.transcribe_file.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_job_paused_before_restart_is_processed_on_resume(
+        self, initialized_service_with_job
+    ):
+        """Test that a job reloaded as paused restarts and skips finished files."""
+        service, job = initialized_service_with_job
+
+        mock_transcriber = _mock_transcriber()
+        mock_history = Mock()
+        mock_history.add = AsyncMock(return_value=Mock(id="record-id"))
+
+        # Simulate a backend that stopped mid-job with the first file done
+        job.status = BatchJobStatus.PROCESSING
+        await service._update_job_status(job)
+        job.files[0].status = BatchFileStatus.COMPLETED
+        await service._update_file_status(job.files[0])
+        job.files[1].status = BatchFileStatus.PROCESSING
+        await service._update_file_status(job.files[1])
+
+        restarted = BatchService(db_path=service.db_path)
+        await restarted.initialize()
+        try:
+            reloaded = await restarted.get_job(job.id)
+            assert reloaded.status == BatchJobStatus.PAUSED
+            assert reloaded.files[1].status == BatchFileStatus.PENDING
+
+            assert await restarted.resume_job(job.id)
+            assert reloaded.status == BatchJobStatus.PENDING
+
+            await restarted.process_job(job.id, mock_transcriber, mock_history, AsyncMock())
+        finally:
+            await restarted.close()
+
+        assert reloaded.status == BatchJobStatus.COMPLETED
+        assert mock_transcriber.transcribe_file.call_count == 1
+        assert mock_transcriber.transcribe_file.call_args.args[0] == "/path/to/audio2.wav"
+
+    @pytest.mark.asyncio
+    async def test_job_resumed_after_restart_keeps_its_options(
+        self, initialized_service_with_job
+    ):
+        """Test that a resumed job uses the language and timeout it was created with."""
+        service, _ = initialized_service_with_job
+        job = await service.create_job(["/path/to/audio.wav"], language="de", file_timeout_s=600)
+        job.status = BatchJobStatus.PROCESSING
+        await service._update_job_status(job)
+
+        mock_transcriber = _mock_transcriber()
+        mock_history = Mock()
+        mock_history.add = AsyncMock(return_value=Mock(id="record-id"))
+
+        restarted = BatchService(db_path=service.db_path)
+        await restarted.initialize()
+        try:
+            assert await restarted.resume_job(job.id)
+            await restarted.process_job(job.id, mock_transcriber, mock_history, AsyncMock())
+        finally:
+            await restarted.close()
+
+        call = mock_transcriber.transcribe_file.call_args
+        assert call.args[1] == "de"
+        assert call.kwargs["cancel_token"].timeout_s == 600
+
+    @pytest.mark.asyncio
+    async def test_files_are_transcribed_at_batch_priority(self, initialized_service_with_job):
+        """Test that batch files are queued behind live dictation."""
+        service, job = initialized_service_with_job
+
+        mock_transcriber = _mock_transcriber()
+        mock_history = Mock()
+        mock_history.add = AsyncMock(return_value=Mock(id="record-id"))
+
+        await service.process_job(job.id, mock_transcriber, mock_history, AsyncMock())
+
+        for call in mock_transcriber.transcribe_file.call_args_list:
+            assert call.kwargs["priority"] == "batch"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
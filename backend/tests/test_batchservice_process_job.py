@@ -163,6 +163,34 @@ class TestBatchServiceProcessJob:
         for file in job.files:
             assert file.status == BatchJobStatus.FAILED
 
+    @pytest.mark.asyncio
+    async def test_process_job_reports_cache_hits(self, initialized_service_with_job):
+        """Test that files served from the result cache are counted in the job summary."""
+        service, job = initialized_service_with_job
+
+        mock_transcriber = Mock()
+        mock_transcriber.transcribe_file.side_effect = [
+            Mock(text="a", duration_ms=1, model_used="m", language="en", from_cache=False),
+            Mock(text="a", duration_ms=1, model_used="m", language="en", from_cache=True),
+        ]
+        mock_history = Mock()
+        mock_history.add = AsyncMock(return_value=Mock(id="record-id"))
+        mock_broadcast = AsyncMock()
+
+        await service.process_job(job.id, mock_transcriber, mock_history, mock_broadcast)
+
+        summary = job.to_dict()
+        assert [f.cached for f in job.files] == [False, True]
+        assert summary["cache_hits"] == 1
+        assert summary["cache_hit_rate"] == 0.5
+        assert mock_broadcast.call_args.args[1]["cache_hits"] == 1
+
+        # The flag is persisted with the file
+        reloaded = BatchService(db_path=service.db_path)
+        await reloaded.initialize()
+        assert (await reloaded.get_job(job.id)).to_dict()["cache_hits"] == 1
+        await reloaded.close()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
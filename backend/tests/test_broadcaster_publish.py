@@ -0,0 +1,162 @@
+"""
+Test for Broadcaster.publish
+Test suite for fanning events out to WebSocket clients through per-client queues.
+"""
+
+import pytest
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.services.broadcast import GOING_AWAY_CLOSE_CODE, STALLED_CLOSE_CODE, Broadcaster
+
+
+class FakeWebSocket:
+    """Records sent messages; sending blocks while `blocked` is set."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed_with = None
+        self.unblocked = asyncio.Event()
+        self.unblocked.set()
+
+    async def send_text(self, text):
+        await self.unblocked.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def settle():
+    """Let the sender tasks run."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestBroadcasterPublish:
+    """Tests for Broadcaster.publish"""
+
+    async def test_slow_client_does_not_delay_others(self):
+        """Test that a client that isn't reading doesn't hold up the rest."""
+        broadcaster = Broadcaster()
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        slow.unblocked.clear()
+        broadcaster.connect(slow)
+        broadcaster.connect(fast)
+
+        broadcaster.publish("status", {"state": "recording"})
+        await settle()
+
+        assert fast.sent == [{"type": "status", "state": "recording"}]
+        assert slow.sent == []
+        slow.unblocked.set()
+        await settle()
+        assert slow.sent == fast.sent
+
+    async def test_superseded_progress_is_coalesced(self):
+        """Test that queued progress of a download is replaced by newer progress."""
+        broadcaster = Broadcaster()
+        ws = FakeWebSocket()
+        ws.unblocked.clear()
+        broadcaster.connect(ws)
+        broadcaster.publish("status", {"state": "loading"})
+        await settle()  # The sender is now blocked sending the first message
+
+        for percent in (0.1, 0.2, 0.3, 0.4):
+            broadcaster.publish(
+                "download_progress",
+                {"download_id": "d", "status": "downloading", "progress_percent": percent},
+            )
+        broadcaster.publish("download_progress", {"download_id": "d", "status": "completed"})
+        ws.unblocked.set()
+        await settle()
+
+        assert [(m.get("status"), m.get("progress_percent")) for m in ws.sent[1:]] == [
+            ("downloading", 0.4),
+            ("completed", None),
+        ]
+        assert broadcaster.stats()["coalesced"] == 3
+
+    async def test_batch_file_results_are_not_coalesced(self):
+        """Test that per-file batch events all arrive, in order."""
+        broadcaster = Broadcaster()
+        ws = FakeWebSocket()
+        ws.unblocked.clear()
+        broadcaster.connect(ws)
+        broadcaster.publish("status", {"state": "ready"})
+        await settle()
+
+        events = [
+            {"job_id": "j", "status": "processing", "current_index": 0},
+            {"job_id": "j", "status": "processing", "current_index": 1, "file_status": "completed"},
+            {"job_id": "j", "status": "processing", "current_index": 1},
+            {"job_id": "j", "status": "processing", "current_index": 2, "file_status": "failed"},
+        ]
+        for event in events:
+            broadcaster.publish("batch_progress", event)
+        ws.unblocked.set()
+        await settle()
+
+        # The start of file 0 is superseded by the start of file 1, after file 0's result
+        assert [(m["current_index"], m.get("file_status")) for m in ws.sent[1:]] == [
+            (1, "completed"),
+            (1, None),
+            (2, "failed"),
+        ]
+
+    async def test_stalled_client_is_dropped(self):
+        """Test that a client whose queue fills up is disconnected."""
+        broadcaster = Broadcaster(max_pending=3)
+        stalled, healthy = FakeWebSocket(), FakeWebSocket()
+        stalled.unblocked.clear()
+        broadcaster.connect(stalled)
+        broadcaster.connect(healthy)
+
+        for i in range(6):
+            broadcaster.publish("transcription", {"id": str(i)})
+            await settle()
+
+        assert stalled.closed_with == STALLED_CLOSE_CODE
+        assert len(healthy.sent) == 6
+        assert broadcaster.stats()["clients"] == 1
+        assert broadcaster.stats()["dropped_clients"] == 1
+
+    async def test_subscriptions_filter_events(self):
+        """Test that clients only get their topics and their session's events."""
+        broadcaster = Broadcaster()
+        everything, status_only, session_b = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        broadcaster.connect(everything)
+        broadcaster.connect(status_only, topics=["status"])
+        broadcaster.connect(session_b, session_id="b")
+
+        broadcaster.publish("status", {"state": "recording", "session_id": "a"})
+        broadcaster.publish("download_progress", {"download_id": "d", "status": "pending"})
+        await settle()
+
+        assert [m["type"] for m in everything.sent] == ["status", "download_progress"]
+        assert [m["type"] for m in status_only.sent] == ["status"]
+        assert [m["type"] for m in session_b.sent] == ["download_progress"]
+
+    async def test_close_all_disconnects_clients(self):
+        """Test that close_all() closes every socket and ends the sender tasks."""
+        broadcaster = Broadcaster()
+        idle, sending = FakeWebSocket(), FakeWebSocket()
+        sending.unblocked.clear()
+        subscribers = [broadcaster.connect(idle), broadcaster.connect(sending)]
+        broadcaster.publish("status", {"state": "ready"})
+        await settle()
+
+        await broadcaster.close_all()
+
+        assert idle.closed_with == GOING_AWAY_CLOSE_CODE
+        assert sending.closed_with == GOING_AWAY_CLOSE_CODE
+        assert all(s._task.done() for s in subscribers)
+        assert broadcaster.stats()["clients"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+"""
+Test for CaptureProcess._deliver
+Test suite for draining the capture process's shared memory ring.
+"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.capture_process import CaptureProcess
+from speakeasy.utils.capture_child import OVERFLOWS, write_block
+
+SAMPLE_RATE = 16000
+BLOCK = 160
+
+
+@pytest.fixture
+def capture():
+    """Create a capture process with its shared buffer but no child (blocks are written here)."""
+    capture = CaptureProcess(None, SAMPLE_RATE, pre_roll_s=0.1, ring_s=1.0)
+    capture._create_buffer()
+    yield capture
+    capture.close()
+
+
+def write(capture, start, count):
+    """Write a ramp of `count` samples as the child would."""
+    for pos in range(start, start + count, BLOCK):
+        block = np.arange(pos, min(pos + BLOCK, start + count), dtype=np.float32)
+        write_block(capture._header, capture._ring, block)
+
+
+class TestCaptureProcessDeliver:
+    """Tests for CaptureProcess._deliver"""
+
+    def test_pre_roll_then_new_samples(self, capture):
+        """Test that a sink gets the pre-roll and then every new sample, contiguously."""
+        write(capture, 0, SAMPLE_RATE // 2)
+        capture._deliver()  # Nobody attached: samples are consumed for the pre-roll only
+        pre_rolls, blocks = [], []
+
+        available = capture.attach(
+            lambda indata, *args: blocks.append(indata[:, 0].copy()), on_pre_roll=pre_rolls.append
+        )
+        write(capture, SAMPLE_RATE // 2, BLOCK * 5)
+        capture._deliver()
+
+        assert available == int(0.1 * SAMPLE_RATE)
+        audio = np.concatenate(pre_rolls + blocks)
+        np.testing.assert_array_equal(
+            audio, np.arange(SAMPLE_RATE // 2 - available, SAMPLE_RATE // 2 + BLOCK * 5)
+        )
+
+    def test_detach_stops_delivery(self, capture):
+        """Test that samples written after detach() don't reach the sink."""
+        received = []
+        capture.attach(lambda indata, *args: received.append(len(indata)))
+        write(capture, 0, BLOCK)
+        capture._deliver()
+        capture.detach()
+        write(capture, BLOCK, BLOCK)
+        capture._deliver()
+
+        assert received == [BLOCK]
+
+    def test_stall_longer_than_ring_is_counted(self, capture):
+        """Test that audio overwritten before it was drained is reported as dropped."""
+        statuses = []
+        capture.attach(lambda indata, frames, time_info, status: statuses.append(status))
+        capture._deliver()
+
+        write(capture, 0, capture.ring_len + BLOCK * 3)
+        capture._deliver()
+
+        assert capture.dropped == BLOCK * 3
+        assert statuses[-1].input_overflow
+        assert capture.stats()["dropped_samples"] == BLOCK * 3
+
+    def test_child_overflows_flag_blocks(self, capture):
+        """Test that overflows reported by the child's stream reach the sink's status."""
+        statuses = []
+        capture.attach(lambda indata, frames, time_info, status: statuses.append(status))
+        write(capture, 0, BLOCK)
+        capture._header[OVERFLOWS] += 1
+        capture._deliver()
+        write(capture, BLOCK, BLOCK)
+        capture._deliver()
+
+        assert [bool(s) for s in statuses] == [True, False]
+        assert capture.stats()["overflows"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
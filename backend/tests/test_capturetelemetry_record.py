@@ -0,0 +1,85 @@
+"""
+Test for CaptureTelemetry.record
+Test suite for the audio callback statistics.
+"""
+
+import pytest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.capture import CaptureTelemetry, parse_latency
+
+SAMPLE_RATE = 16000
+BLOCK = 160  # 10ms
+
+
+class Flags:
+    """Stand-in for sounddevice.CallbackFlags."""
+
+    def __init__(self, overflow=False, underflow=False):
+        self.input_overflow = overflow
+        self.input_underflow = underflow
+
+    def __bool__(self):
+        return self.input_overflow or self.input_underflow
+
+
+class TestCaptureTelemetryRecord:
+    """Tests for CaptureTelemetry.record"""
+
+    def test_counts_blocks_and_status_flags(self):
+        """Test that callbacks, samples and overflows/underflows are counted."""
+        telemetry = CaptureTelemetry(SAMPLE_RATE, max_samples=SAMPLE_RATE * 10)
+
+        flags = {10: Flags(overflow=True), 20: Flags(overflow=True), 30: Flags(underflow=True)}
+        for i in range(100):
+            telemetry.record(BLOCK, flags.get(i), started=0.0)
+
+        stats = telemetry.to_dict()
+        assert stats["callbacks"] == 100
+        assert stats["captured_seconds"] == pytest.approx(1.0)
+        assert stats["overflows"] == 2
+        assert stats["underflows"] == 1
+        assert stats["buffer_fill_percent"] == pytest.approx(10.0)
+
+    def test_jitter_against_block_period(self):
+        """Test that jitter is the deviation of block arrivals from the block duration."""
+        telemetry = CaptureTelemetry(SAMPLE_RATE)
+        arrivals = [0.0, 0.010, 0.020, 0.035, 0.045]  # One block 5ms late
+
+        with patch("speakeasy.core.capture.time.perf_counter", side_effect=arrivals):
+            for started in arrivals:
+                telemetry.record(BLOCK, None, started=started)
+
+        stats = telemetry.to_dict()
+        assert stats["jitter_max_ms"] == pytest.approx(5.0)
+        assert stats["jitter_avg_ms"] == pytest.approx(1.25)
+        assert stats["buffer_fill_percent"] is None
+
+    def test_slow_callbacks(self):
+        """Test that callbacks taking over half the block period are flagged."""
+        telemetry = CaptureTelemetry(SAMPLE_RATE)
+
+        with patch("speakeasy.core.capture.time.perf_counter", side_effect=[0.001, 1.008]):
+            telemetry.record(BLOCK, None, started=0.0)  # 1ms of a 10ms block
+            telemetry.record(BLOCK, None, started=1.0)  # 8ms
+
+        stats = telemetry.to_dict()
+        assert stats["slow_callbacks"] == 1
+        assert stats["callback_max_us"] == pytest.approx(8000, rel=1e-3)
+        assert "2 blocks" in telemetry.summary()
+
+    def test_parse_latency(self):
+        """Test the latency setting conversion."""
+        assert parse_latency(None) is None
+        assert parse_latency("low") == "low"
+        assert parse_latency("0.05") == pytest.approx(0.05)
+        with pytest.raises(ValueError):
+            parse_latency("0")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+"""
+Test for CascadeTranscriber.transcribe
+Test suite for confidence-gated re-decoding with a larger model.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.cascade import CascadeTranscriber
+from speakeasy.core.models import ModelType, TranscriptionResult, TranscriptionSegment
+
+SAMPLE_RATE = 16000
+
+
+def _make_models(segments, language="en"):
+    """Create mock fast/accurate models; the fast one returns the given segments."""
+    fast = Mock()
+    fast.model_type = ModelType.WHISPER
+    fast.model_name = "base"
+    fast.transcribe_segments.return_value = TranscriptionResult(
+        text=" ".join(s.text for s in segments),
+        duration_ms=10,
+        language=language,
+        segments=segments,
+    )
+
+    accurate = Mock()
+    accurate.model_type = ModelType.PARAKEET
+    accurate.model_name = "nvidia/parakeet-tdt-0.6b-v3"
+    accurate.transcribe.return_value = TranscriptionResult(text="accurate text", duration_ms=50)
+    return fast, accurate
+
+
+class TestCascadeTranscriberTranscribe:
+    """Tests for CascadeTranscriber.transcribe"""
+
+    def test_confident_segments_are_not_escalated(self):
+        """Test that the accurate model is skipped when the fast model is confident."""
+        segments = [
+            TranscriptionSegment(0.0, 2.0, "hello there", avg_logprob=-0.2, no_speech_prob=0.01),
+            TranscriptionSegment(2.0, 4.0, "general", avg_logprob=-0.3, no_speech_prob=0.02),
+        ]
+        fast, accurate = _make_models(segments)
+        cascade = CascadeTranscriber(fast, accurate)
+
+        result = cascade.transcribe(np.zeros(4 * SAMPLE_RATE, dtype=np.float32))
+
+        assert result.text == "hello there general"
+        accurate.transcribe.assert_not_called()
+        assert cascade.get_metrics()["escalated_fraction"] == 0.0
+
+    def test_low_confidence_span_is_spliced(self):
+        """Test that only the low-confidence segment is re-decoded and spliced back."""
+        segments = [
+            TranscriptionSegment(0.0, 2.0, "first", avg_logprob=-0.2, no_speech_prob=0.01),
+            TranscriptionSegment(2.0, 4.0, "mumble", avg_logprob=-1.5, no_speech_prob=0.1),
+            TranscriptionSegment(4.0, 6.0, "last", avg_logprob=-0.1, no_speech_prob=0.01),
+        ]
+        fast, accurate = _make_models(segments)
+        cascade = CascadeTranscriber(fast, accurate, padding_s=0.0)
+        audio = np.zeros(6 * SAMPLE_RATE, dtype=np.float32)
+
+        result = cascade.transcribe(audio)
+
+        assert result.text == "first accurate text last"
+        accurate.transcribe.assert_called_once()
+        span = accurate.transcribe.call_args.kwargs["audio_data"]
+        assert len(span) == 2 * SAMPLE_RATE
+        assert result.model_used == "base+nvidia/parakeet-tdt-0.6b-v3"
+
+    def test_padding_stops_at_kept_neighbours(self):
+        """Test that padding doesn't re-decode the audio of segments that are kept."""
+        segments = [
+            TranscriptionSegment(0.0, 2.0, "first", avg_logprob=-0.2, no_speech_prob=0.01),
+            TranscriptionSegment(2.0, 4.0, "mumble", avg_logprob=-1.5, no_speech_prob=0.1),
+            TranscriptionSegment(4.5, 6.0, "last", avg_logprob=-0.1, no_speech_prob=0.01),
+        ]
+        fast, accurate = _make_models(segments)
+        cascade = CascadeTranscriber(fast, accurate, padding_s=1.0)
+        audio = np.zeros(6 * SAMPLE_RATE, dtype=np.float32)
+
+        result = cascade.transcribe(audio)
+
+        assert result.text == "first accurate text last"
+        # Not into "first" (ends at 2.0), but 0.5s into the gap before "last" (at 4.5)
+        span = accurate.transcribe.call_args.kwargs["audio_data"]
+        assert len(span) == int(2.5 * SAMPLE_RATE)
+        assert cascade.get_metrics()["escalated_audio_s"] == 2.5
+
+    def test_adjacent_low_confidence_segments_are_merged(self):
+        """Test that consecutive uncertain segments are re-decoded in one call."""
+        segments = [
+            TranscriptionSegment(0.0, 1.0, "a", avg_logprob=-1.2, no_speech_prob=0.1),
+            TranscriptionSegment(1.0, 2.0, "b", avg_logprob=-0.9, no_speech_prob=0.2),
+            TranscriptionSegment(2.0, 3.0, "c", avg_logprob=-0.1, no_speech_prob=0.0),
+        ]
+        fast, accurate = _make_models(segments)
+        cascade = CascadeTranscriber(fast, accurate, padding_s=0.0)
+
+        result = cascade.transcribe(np.zeros(3 * SAMPLE_RATE, dtype=np.float32))
+
+        assert result.text == "accurate text c"
+        accurate.transcribe.assert_called_once()
+        assert cascade.get_metrics()["escalated_segments"] == 2
+
+    def test_silent_segments_are_dropped_not_escalated(self):
+        """Test that high no_speech_prob with low avg_logprob is skipped as silence."""
+        segments = [
+            TranscriptionSegment(0.0, 1.0, "hello", avg_logprob=-0.2, no_speech_prob=0.01),
+            TranscriptionSegment(1.0, 3.0, "thank you", avg_logprob=-1.1, no_speech_prob=0.9),
+            TranscriptionSegment(3.0, 4.0, "world", avg_logprob=-0.3, no_speech_prob=0.8),
+        ]
+        fast, accurate = _make_models(segments)
+        cascade = CascadeTranscriber(fast, accurate)
+
+        result = cascade.transcribe(np.zeros(4 * SAMPLE_RATE, dtype=np.float32))
+
+        assert result.text == "hello world"
+        accurate.transcribe.assert_not_called()
+        assert cascade.get_metrics()["silent_segments"] == 1
+
+    def test_detected_language_is_passed_to_accurate_model(self):
+        """Test that auto language uses the fast model's detection for re-decoding."""
+        segments = [TranscriptionSegment(0.0, 1.0, "hola", avg_logprob=-2.0, no_speech_prob=0.1)]
+        fast, accurate = _make_models(segments, language="es")
+        cascade = CascadeTranscriber(fast, accurate)
+
+        cascade.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32), language="auto")
+
+        assert accurate.transcribe.call_args.kwargs["language"] == "es"
+
+    def test_metrics_report_escalated_fraction_and_savings(self):
+        """Test that escalated audio fraction and estimated savings are reported."""
+        segments = [
+            TranscriptionSegment(0.0, 1.0, "unsure", avg_logprob=-1.5, no_speech_prob=0.1),
+            TranscriptionSegment(1.0, 4.0, "sure", avg_logprob=-0.1, no_speech_prob=0.0),
+        ]
+        fast, accurate = _make_models(segments)
+        cascade = CascadeTranscriber(fast, accurate, padding_s=0.0)
+
+        cascade.transcribe(np.zeros(4 * SAMPLE_RATE, dtype=np.float32))
+        metrics = cascade.get_metrics()
+
+        assert metrics["requests"] == 1
+        assert metrics["escalated_requests"] == 1
+        assert metrics["escalated_fraction"] == pytest.approx(0.25)
+        assert metrics["accurate_rtf"] is not None
+        assert metrics["latency_saved_ms"] is not None
+
+    def test_requires_whisper_fast_model(self):
+        """Test that a non-Whisper fast model is rejected."""
+        fast, accurate = _make_models([])
+        fast.model_type = ModelType.PARAKEET
+
+        with pytest.raises(ValueError):
+            CascadeTranscriber(fast, accurate)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+"""
+Test for compilation.compile_in_background
+Test suite for background torch.compile with timeout and eager fallback.
+"""
+
+import pytest
+import threading
+import time
+import torch
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.compilation import CompileReport, CompileStatus, compile_in_background
+
+
+def _make_module():
+    """Create a small module to compile."""
+    return torch.nn.Sequential(torch.nn.Linear(16, 32), torch.nn.ReLU(), torch.nn.Linear(32, 4))
+
+
+def _warmup(module):
+    return module(torch.randn(2, 16))
+
+
+class TestCompileInBackground:
+    """Tests for compilation.compile_in_background"""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Keep compile artifacts out of the real home directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        monkeypatch.setenv("TORCHINDUCTOR_CACHE_DIR", str(tmp_path / "inductor"))
+
+    def test_installs_compiled_module_on_success(self):
+        """Test that a successful compile hands the compiled module to the callback."""
+        module = _make_module()
+        installed = []
+
+        with patch("torch.compile", side_effect=lambda m, **kwargs: m):
+            report = compile_in_background(module, _warmup, installed.append, label="test")
+            assert report.wait(timeout=30)
+
+        assert report.status == CompileStatus.COMPILED
+        assert report.used is True
+        assert installed == [module]
+        assert report.eager_ms is not None
+        assert report.compiled_ms is not None
+        assert report.speedup is not None
+
+    def test_compile_error_stays_eager(self):
+        """Test that a compile error leaves the eager module in place."""
+        installed = []
+
+        with patch("torch.compile", side_effect=RuntimeError("inductor exploded")):
+            report = compile_in_background(
+                _make_module(), _warmup, installed.append, label="test"
+            )
+            assert report.wait(timeout=30)
+
+        assert report.status == CompileStatus.FAILED
+        assert "inductor exploded" in report.reason
+        assert report.used is False
+        assert installed == []
+
+    def test_timeout_stays_eager(self):
+        """Test that a hanging compile is abandoned after the timeout."""
+        release = threading.Event()
+        finished = threading.Event()
+        installed = []
+        warmups = []
+
+        def hanging_compile(module, **kwargs):
+            release.wait(10)
+            finished.set()
+            return module
+
+        with patch("torch.compile", side_effect=hanging_compile):
+            report = compile_in_background(
+                _make_module(), warmups.append, installed.append, label="test", timeout_s=0.2
+            )
+            assert report.wait(timeout=30)
+            release.set()
+            assert finished.wait(timeout=5)
+
+        assert report.status == CompileStatus.TIMEOUT
+        assert installed == []
+        # Only the eager warm-up: the cancelled worker stops once compile returns
+        time.sleep(0.1)
+        assert len(warmups) == 1
+
+    def test_waits_for_idle_model(self):
+        """Test that compilation is skipped while the model keeps serving requests."""
+        wait_idle = Mock(return_value=False)
+
+        with patch("torch.compile") as mock_compile:
+            report = compile_in_background(
+                _make_module(), _warmup, lambda m: None, label="t", wait_idle=wait_idle
+            )
+            assert report.wait(timeout=30)
+            mock_compile.assert_not_called()
+
+        assert report.status == CompileStatus.SKIPPED
+        assert "serving" in report.reason
+        wait_idle.assert_called_once()
+
+    def test_eager_warmup_failure_skips(self):
+        """Test that a broken warm-up input skips compilation entirely."""
+
+        def bad_warmup(module):
+            return module(torch.randn(2, 3))
+
+        with patch("torch.compile") as mock_compile:
+            report = compile_in_background(_make_module(), bad_warmup, lambda m: None, label="t")
+            assert report.wait(timeout=30)
+            mock_compile.assert_not_called()
+
+        assert report.status == CompileStatus.SKIPPED
+
+    def test_report_to_dict(self):
+        """Test that reports serialize for API responses."""
+        report = CompileReport(label="encoder", eager_ms=10.0, compiled_ms=4.0)
+        report.finish(CompileStatus.COMPILED)
+
+        data = report.to_dict()
+
+        assert data["status"] == "compiled"
+        assert data["used"] is True
+        assert data["speedup"] == 2.5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Test for DecodedAudioCache.store
+Test suite for caching decoded audio files with a size budget.
+"""
+
+import os
+import time
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.audio_cache import DecodedAudioCache
+
+SECOND = 16000
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Create three source files (their content doesn't matter to the cache)."""
+    paths = []
+    for name in ["a.mp3", "b.mp3", "c.mp3"]:
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(str(path))
+    return paths
+
+
+def blocks(seconds, value):
+    """One-second blocks of a constant."""
+    return [np.full(SECOND, value, dtype=np.float32) for _ in range(seconds)]
+
+
+class TestDecodedAudioCacheStore:
+    """Tests for DecodedAudioCache.store"""
+
+    def test_stored_audio_is_returned_mapped(self, tmp_path, sources):
+        """Test that stored blocks come back from get() as one memory-mapped array."""
+        cache = DecodedAudioCache(tmp_path / "cache", max_bytes=10 * 1024**2)
+
+        stored = cache.store(sources[0], SECOND, blocks(3, 0.5))
+        cached = cache.get(sources[0], SECOND)
+
+        assert isinstance(cached, np.memmap)
+        np.testing.assert_array_equal(cached, stored)
+        np.testing.assert_array_equal(cached, np.full(3 * SECOND, 0.5, dtype=np.float32))
+        assert cache.stats()["hits"] == 1
+
+    def test_modified_source_misses(self, tmp_path, sources):
+        """Test that a changed file isn't served from the cache."""
+        cache = DecodedAudioCache(tmp_path / "cache", max_bytes=10 * 1024**2)
+        cache.store(sources[0], SECOND, blocks(1, 0.5))
+
+        Path(sources[0]).write_bytes(b"edited, longer")
+
+        assert cache.get(sources[0], SECOND) is None
+        assert cache.get(sources[0], 8000) is None
+        assert cache.stats()["misses"] == 2
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path, sources):
+        """Test that the oldest unused entry goes when the budget is exceeded."""
+        cache = DecodedAudioCache(tmp_path / "cache", max_bytes=2 * 4 * SECOND + 1024)
+        cache.store(sources[0], SECOND, blocks(1, 0.1))
+        cache.store(sources[1], SECOND, blocks(1, 0.2))
+        # Entries are ordered by mtime: age both, then use the older one
+        for age, source in [(200, sources[0]), (100, sources[1])]:
+            os.utime(cache._entry(source, SECOND), (time.time() - age,) * 2)
+        assert cache.get(sources[0], SECOND) is not None
+
+        cache.store(sources[2], SECOND, blocks(1, 0.3))
+
+        assert cache.get(sources[0], SECOND) is not None
+        assert cache.get(sources[1], SECOND) is None
+        assert cache.get(sources[2], SECOND) is not None
+        assert cache.stats()["entries"] == 2
+
+    def test_file_over_budget_is_not_cached(self, tmp_path, sources):
+        """Test that a file larger than the budget is skipped without consuming its blocks."""
+        cache = DecodedAudioCache(tmp_path / "cache", max_bytes=4 * SECOND)
+
+        def never_decoded():
+            raise AssertionError("decoded")
+            yield
+
+        assert cache.store(sources[0], SECOND, never_decoded(), expected_samples=2 * SECOND) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_file_without_length_over_budget_is_dropped(self, tmp_path, sources):
+        """Test that a file with no length estimate is dropped once it outgrows the budget."""
+        cache = DecodedAudioCache(tmp_path / "cache", max_bytes=3 * 4 * SECOND)
+        cache.store(sources[0], SECOND, blocks(2, 0.1))
+
+        assert cache.store(sources[1], SECOND, blocks(4, 0.2)) is None
+
+        assert cache.get(sources[0], SECOND) is not None
+        assert cache.get(sources[1], SECOND) is None
+        assert list((tmp_path / "cache").glob("*.tmp")) == []
+
+    def test_entry_larger_than_rest_of_budget_evicts_older_ones(self, tmp_path, sources):
+        """Test that the budget holds after an entry of unknown length is committed."""
+        cache = DecodedAudioCache(tmp_path / "cache", max_bytes=3 * 4 * SECOND + 1024)
+        cache.store(sources[0], SECOND, blocks(2, 0.1))
+
+        assert cache.store(sources[1], SECOND, blocks(2, 0.2)) is not None
+
+        assert cache.get(sources[0], SECOND) is None
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["size_mb"] * 1024**2 <= cache.max_bytes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,145 @@
+"""
+Test for DeviceRegistry.refresh
+Test suite for the cached input device list and its invalidation.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.devices import DeviceRegistry
+
+
+def _device(name, inputs, rate=48000.0):
+    return {"name": name, "max_input_channels": inputs, "default_samplerate": rate, "hostapi": 0}
+
+
+@pytest.fixture
+def fake_sd():
+    """Patch sounddevice with two microphones and a speaker."""
+    sd = Mock()
+    sd.query_devices.return_value = [
+        _device("Built-in Microphone", 1, 44100.0),
+        _device("Speakers", 0),
+        _device("USB Headset Mic", 2),
+    ]
+    sd.query_hostapis.return_value = [{"name": "Core Audio"}]
+    sd.default.device = (2, 1)
+    with patch("speakeasy.core.devices.sd", sd):
+        yield sd
+
+
+class TestDeviceRegistryRefresh:
+    """Tests for DeviceRegistry.refresh"""
+
+    def test_lookups_use_one_scan(self, fake_sd):
+        """Test that lookups after the first are served from the cache."""
+        registry = DeviceRegistry()
+
+        assert registry.default_input().name == "USB Headset Mic"
+        assert registry.get(0).sample_rate == 44100
+        assert registry.get(1) is None  # Output only
+        assert registry.find("usb headset mic").id == 2
+        assert registry.find("built-in").id == 0
+        assert registry.find("missing") is None
+        assert [d["id"] for d in registry.list_inputs()] == [0, 2]
+
+        assert fake_sd.query_devices.call_count == 1
+        assert registry.scans == 1
+
+    def test_invalidate_rescans(self, fake_sd):
+        """Test that invalidation makes the next lookup pick up changes."""
+        registry = DeviceRegistry()
+        assert registry.find("webcam") is None
+
+        fake_sd.query_devices.return_value.append(_device("Webcam Mic", 1, 16000.0))
+        assert registry.find("webcam") is None  # Still cached
+        registry.invalidate()
+
+        assert registry.find("webcam").sample_rate == 16000
+        assert registry.scans == 2
+
+    def test_hotplug_reinitializes_only_when_idle(self, fake_sd):
+        """Test that PortAudio is restarted on listing after a hot-plug, only without open streams."""
+        registry = DeviceRegistry()
+        streams_open = True
+        registry._can_reinitialize = lambda: not streams_open
+
+        registry.invalidate(hotplug=True)
+        registry.list_inputs()
+        fake_sd._terminate.assert_not_called()
+
+        streams_open = False
+        registry.list_inputs()
+        fake_sd._terminate.assert_called_once()
+        fake_sd._initialize.assert_called_once()
+
+        # Reinitialized once per hot-plug
+        registry.list_inputs()
+        fake_sd._terminate.assert_called_once()
+
+    def test_listing_rechecks_streams_under_lock(self, fake_sd):
+        """Test that a stream opened while a listing waits for the lock prevents the restart."""
+        registry = DeviceRegistry()
+        streams_open = False
+        registry._can_reinitialize = lambda: not streams_open
+        registry.invalidate(hotplug=True)
+
+        with registry.portaudio_lock:
+            listing = threading.Thread(target=registry.list_inputs)
+            listing.start()
+            time.sleep(0.05)
+            streams_open = True  # Stream opened while holding the lock
+        listing.join(timeout=5)
+
+        fake_sd._terminate.assert_not_called()
+
+    def test_timer_fallback_reinitializes_in_background(self, fake_sd):
+        """Test that without PulseAudio events the watcher restarts PortAudio, not the listing."""
+        registry = DeviceRegistry(refresh_interval_s=0.01)
+        with patch.object(registry, "_watch_pulse", side_effect=ImportError):
+            registry.start_watching(can_reinitialize=lambda: True)
+            try:
+                deadline = time.monotonic() + 5
+                while not fake_sd._terminate.called and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                registry.stop_watching()
+
+        restarts = fake_sd._terminate.call_count
+        assert restarts >= 1
+        assert not registry._portaudio_stale
+        registry.list_inputs()
+        assert fake_sd._terminate.call_count == restarts
+
+    def test_timer_fallback_skips_ticks_with_open_streams(self, fake_sd):
+        """Test that the watcher leaves PortAudio alone while a stream is open."""
+        registry = DeviceRegistry(refresh_interval_s=0.01)
+        with patch.object(registry, "_watch_pulse", side_effect=ImportError):
+            registry.start_watching(can_reinitialize=lambda: False)
+            time.sleep(0.1)
+            registry.stop_watching()
+
+        fake_sd._terminate.assert_not_called()
+
+    def test_cached_listing_cleared_on_invalidate(self, fake_sd):
+        """Test that derived listings are rebuilt after invalidation."""
+        registry = DeviceRegistry()
+        loader = Mock(side_effect=[["first"], ["second"]])
+
+        assert registry.cached("pulse_sources", loader) == ["first"]
+        assert registry.cached("pulse_sources", loader) == ["first"]
+        registry.invalidate()
+
+        assert registry.cached("pulse_sources", loader) == ["second"]
+        assert loader.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+"""
+Test for EndpointDetector.process
+Test suite for streaming end-of-speech detection on synthetic audio.
+"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.endpointing import EndpointConfig, EndpointDetector
+
+SAMPLE_RATE = 48000
+BLOCK = 480  # 10ms callbacks, like a typical input stream
+
+
+def tone(seconds, amplitude=0.2):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def noise(seconds, amplitude, seed=0):
+    rng = np.random.default_rng(seed)
+    return (amplitude * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def feed(detector, audio, block=BLOCK):
+    """Feed audio in blocks and collect every decision."""
+    decisions = []
+    for start in range(0, len(audio), block):
+        decision = detector.process(audio[start : start + block])
+        if decision is not None:
+            decisions.append(decision)
+    return decisions
+
+
+class TestEndpointDetectorProcess:
+    """Tests for EndpointDetector.process"""
+
+    @pytest.mark.parametrize("noise_amplitude", [0.0005, 0.02])
+    def test_detects_end_of_speech(self, noise_amplitude):
+        """Test that speech followed by the silence window is endpointed once."""
+        audio = np.concatenate(
+            [
+                noise(0.5, noise_amplitude),
+                tone(1.0) + noise(1.0, noise_amplitude, seed=1),
+                noise(2.0, noise_amplitude, seed=2),
+            ]
+        )
+        detector = EndpointDetector(EndpointConfig(silence_ms=700), SAMPLE_RATE)
+
+        decisions = feed(detector, audio)
+
+        assert len(decisions) == 1
+        decision = decisions[0]
+        assert decision.speech_start_s == pytest.approx(0.5, abs=0.04)
+        assert decision.speech_end_s == pytest.approx(1.5, abs=0.04)
+        assert decision.detection_ms == pytest.approx(700, abs=20)
+        assert not detector.in_speech
+
+    def test_noise_only_never_endpoints(self):
+        """Test that steady room noise is learned as the noise floor, not speech."""
+        detector = EndpointDetector(sample_rate=SAMPLE_RATE)
+
+        assert feed(detector, noise(10.0, 0.05)) == []
+        assert detector.noise_floor_db > -30
+
+    def test_speech_from_first_frame_is_not_learned_as_noise(self):
+        """Test that talking straight after the hotkey is still detected as speech."""
+        audio = np.concatenate([tone(1.0), silence(2.0)])
+        detector = EndpointDetector(EndpointConfig(silence_ms=700), SAMPLE_RATE)
+
+        decisions = feed(detector, audio)
+
+        assert len(decisions) == 1
+        assert decisions[0].speech_start_s == pytest.approx(0.0, abs=0.04)
+        assert decisions[0].speech_end_s == pytest.approx(1.0, abs=0.04)
+
+    def test_short_click_is_ignored(self):
+        """Test that sounds shorter than min_speech_ms don't arm the detector."""
+        audio = np.concatenate([silence(1.0), tone(0.06), silence(2.0)])
+        detector = EndpointDetector(EndpointConfig(min_speech_ms=200), SAMPLE_RATE)
+
+        assert feed(detector, audio) == []
+
+    def test_block_size_does_not_change_decision(self):
+        """Test that odd callback sizes give the same decision as frame-aligned ones."""
+        audio = np.concatenate([silence(0.5), tone(1.0), silence(1.0)])
+
+        aligned = feed(EndpointDetector(sample_rate=SAMPLE_RATE), audio, block=960)
+        odd = feed(EndpointDetector(sample_rate=SAMPLE_RATE), audio, block=317)
+
+        assert aligned[0].to_dict() == odd[0].to_dict()
+
+    def test_reset_starts_new_recording(self):
+        """Test that reset() re-arms the detector at a new sample rate."""
+        detector = EndpointDetector(sample_rate=SAMPLE_RATE)
+        audio = np.concatenate([silence(0.5), tone(1.0), silence(1.0)])
+        assert len(feed(detector, audio)) == 1
+
+        detector.reset(16000)
+        speech = np.concatenate([silence(0.5)[::3], tone(1.0)[::3], silence(1.0)[::3]])
+
+        decisions = feed(detector, speech, block=160)
+        assert len(decisions) == 1
+        assert decisions[0].speech_end_s == pytest.approx(1.5, abs=0.04)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,107 @@
+"""
+Test for EventBus.publish
+Test suite for handing events from worker threads to the event loop.
+"""
+
+import pytest
+import asyncio
+import threading
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.services.event_bus import EventBus
+
+
+async def settle():
+    """Let scheduled drains run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestEventBusPublish:
+    """Tests for EventBus.publish"""
+
+    async def test_events_from_threads_reach_the_loop_in_order(self):
+        """Test that events published on worker threads are delivered on the loop."""
+        delivered = []
+        loop_thread = threading.get_ident()
+        bus = EventBus(lambda t, d: delivered.append((t, d["n"], threading.get_ident())))
+        bus.attach(asyncio.get_running_loop())
+
+        def worker():
+            for n in range(100):
+                bus.publish("status", {"n": n})
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        await asyncio.to_thread(thread.join)
+        await settle()
+
+        assert [n for _, n, _ in delivered] == list(range(100))
+        assert {ident for _, _, ident in delivered} == {loop_thread}
+        stats = bus.stats()
+        assert stats["published"] == 100
+        assert stats["batches"] < 100  # Drained in batches, not one callback per event
+
+    async def test_events_before_attach_are_kept(self):
+        """Test that events published before the loop is attached are delivered once it is."""
+        delivered = []
+        bus = EventBus(lambda t, d: delivered.append(t))
+
+        bus.publish("status", {})
+        await settle()
+        assert delivered == []
+
+        bus.attach(asyncio.get_running_loop())
+        await settle()
+        assert delivered == ["status"]
+
+    async def test_backpressure_drops_only_superseded_progress(self):
+        """Test that a full queue drops progress a newer event replaces, and nothing else."""
+        delivered = []
+        bus = EventBus(lambda t, d: delivered.append((t, d["n"])), max_pending=3)
+
+        bus.publish("status", {"n": 0})
+        for n in range(1, 5):
+            bus.publish("download_progress", {"n": n, "download_id": "a", "status": "downloading"})
+        bus.publish("transcription_progress", {"n": 5, "chunk_text": "one"})
+        bus.publish("transcription_progress", {"n": 6, "chunk_text": "two"})
+        bus.publish("batch_progress", {"n": 7, "job_id": "j", "file_status": "completed"})
+        bus.publish("batch_progress", {"n": 8, "job_id": "j", "file_status": "failed"})
+        bus.publish("error", {"n": 9})
+        bus.attach(asyncio.get_running_loop())
+        await settle()
+
+        assert delivered == [
+            ("status", 0),
+            ("download_progress", 4),
+            ("transcription_progress", 5),
+            ("transcription_progress", 6),
+            ("batch_progress", 7),
+            ("batch_progress", 8),
+            ("error", 9),
+        ]
+        assert bus.stats()["dropped"] == 3
+
+    async def test_sink_errors_do_not_stop_delivery(self):
+        """Test that an exception in the sink doesn't lose the following events."""
+        delivered = []
+
+        def sink(event_type, data):
+            if event_type == "bad":
+                raise RuntimeError("sink failed")
+            delivered.append(event_type)
+
+        bus = EventBus(sink)
+        bus.attach(asyncio.get_running_loop())
+        bus.publish("bad", {})
+        bus.publish("status", {})
+        await settle()
+
+        assert delivered == ["status"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""
+Test for ExportService.stream
+Test suite for streaming exports chunk by chunk.
+"""
+
+import pytest
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.services.export import ExportFormat, ExportService
+from speakeasy.services.history import TranscriptionRecord
+
+
+def make_records(count):
+    return [
+        TranscriptionRecord(
+            id=f"id{i}",
+            text=f'Line {i} with "quotes", a comma\nand ümlauts',
+            duration_ms=1500,
+            model_used="whisper-small",
+            language="en",
+            created_at=datetime(2024, 1, 1, 12, 0, i % 60, tzinfo=timezone.utc),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def service():
+    return ExportService()
+
+
+def streamed(service, records, format, include_metadata=True):
+    chunks, filename, content_type = service.stream(
+        iter(records), format, include_metadata, count=len(records)
+    )
+    return b"".join(chunks).decode("utf-8")
+
+
+class TestExportServiceStream:
+    """Tests for ExportService.stream"""
+
+    @pytest.mark.parametrize("format", [ExportFormat.TXT, ExportFormat.SRT, ExportFormat.VTT])
+    def test_matches_whole_document(self, service, format):
+        """Test that streamed text formats are identical to the complete export."""
+        records = make_records(5)
+        content, _, _ = service.export(records, format)
+
+        assert streamed(service, records, format) == content
+
+    @pytest.mark.parametrize("format", [ExportFormat.TXT, ExportFormat.SRT, ExportFormat.VTT])
+    def test_trailing_whitespace_is_trimmed_like_whole_document(self, service, format):
+        """Test that whitespace at the end of the last record is trimmed from the stream too."""
+        records = make_records(3)
+        records[-1].text = "Last line \n\n"
+        records[-2].text = "Kept  \n"
+        content, _, _ = service.export(records, format)
+
+        assert streamed(service, records, format) == content
+        assert content.endswith("Last line")
+
+    @pytest.mark.parametrize("include_metadata", [True, False])
+    def test_csv_matches_whole_document(self, service, include_metadata):
+        """Test that a streamed CSV is identical to the complete export."""
+        records = make_records(5)
+
+        assert streamed(service, records, ExportFormat.CSV, include_metadata) == service.to_csv(
+            records, include_metadata
+        )
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_json_is_valid(self, service, count):
+        """Test that a streamed JSON export parses, with the count and every record."""
+        records = make_records(count)
+
+        data = json.loads(streamed(service, records, ExportFormat.JSON))
+
+        assert data["count"] == count
+        assert [t["id"] for t in data["transcriptions"]] == [r.id for r in records]
+        assert [t["text"] for t in data["transcriptions"]] == [r.text for r in records]
+
+    def test_large_export_is_chunked(self, service):
+        """Test that records are consumed lazily and grouped into bounded chunks."""
+        consumed = []
+
+        def records():
+            for record in make_records(5000):
+                consumed.append(record.id)
+                yield record
+
+        chunks, _, _ = service.stream(records(), ExportFormat.JSON, count=5000)
+        first = next(chunks)
+
+        assert len(consumed) < 5000
+        assert len(first) < 2 * 64 * 1024
+        data = json.loads(first + b"".join(chunks))
+        assert len(data["transcriptions"]) == 5000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""
+Test for FrameDecoder.decode
+Test suite for decoding audio frames streamed by remote clients.
+"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.audio_ingest import AudioFormat, FrameDecoder
+
+
+def _pcm16(samples):
+    return (np.asarray(samples) * 32767).astype("<i2").tobytes()
+
+
+class TestFrameDecoderDecode:
+    """Tests for FrameDecoder.decode"""
+
+    def test_pcm16_mono_at_target_rate(self):
+        """Test that 16 kHz mono PCM16 is converted to float32 unchanged."""
+        decoder = FrameDecoder(AudioFormat.PCM16, sample_rate=16000)
+
+        samples = decoder.decode(_pcm16([0.0, 0.5, -0.5]))
+
+        assert samples.dtype == np.float32
+        np.testing.assert_allclose(samples, [0.0, 0.5, -0.5], atol=1e-4)
+
+    def test_stereo_is_mixed_down(self):
+        """Test that interleaved stereo frames are averaged to mono."""
+        decoder = FrameDecoder(AudioFormat.PCM16, sample_rate=16000, channels=2)
+
+        samples = decoder.decode(_pcm16([0.5, 0.1, -0.5, -0.1]))
+
+        np.testing.assert_allclose(samples, [0.3, -0.3], atol=1e-4)
+
+    def test_split_samples_are_carried_over(self):
+        """Test that a sample split across two messages is decoded once complete."""
+        decoder = FrameDecoder(AudioFormat.PCM16, sample_rate=16000)
+        payload = _pcm16([0.25, 0.75])
+
+        first = decoder.decode(payload[:3])
+        second = decoder.decode(payload[3:])
+
+        assert len(first) == 1
+        assert len(second) == 1
+        np.testing.assert_allclose(np.concatenate([first, second]), [0.25, 0.75], atol=1e-4)
+
+    def test_resampled_to_16khz_on_arrival(self):
+        """Test that 48 kHz frames come out at 16 kHz."""
+        decoder = FrameDecoder(AudioFormat.PCM16, sample_rate=48000)
+        t = np.arange(4800) / 48000
+        tone = 0.5 * np.sin(2 * np.pi * 440 * t)
+
+        samples = np.concatenate([decoder.decode(_pcm16(tone)), decoder.flush()])
+
+        assert len(samples) == 1600
+        assert np.abs(samples).max() == pytest.approx(0.5, abs=0.05)
+
+    def test_resampling_is_continuous_across_frames(self):
+        """Test that 20ms frames resample exactly like the whole signal at once."""
+        import scipy.signal
+
+        decoder = FrameDecoder(AudioFormat.PCM16, sample_rate=48000)
+        t = np.arange(48000) / 48000
+        payload = _pcm16(0.5 * np.sin(2 * np.pi * 440 * t))
+        expected = scipy.signal.resample_poly(
+            np.frombuffer(payload, dtype="<i2") / 32768.0, 1, 3
+        )
+
+        frames = [decoder.decode(payload[i : i + 1920]) for i in range(0, len(payload), 1920)]
+        samples = np.concatenate(frames + [decoder.flush()])
+
+        assert len(samples) == 16000
+        np.testing.assert_allclose(samples, expected, atol=1e-5)
+
+    def test_invalid_parameters(self):
+        """Test that unsupported stream parameters are rejected."""
+        with pytest.raises(ValueError):
+            FrameDecoder(AudioFormat.PCM16, sample_rate=100)
+        with pytest.raises(ValueError):
+            FrameDecoder(AudioFormat.PCM16, channels=0)
+        with pytest.raises(ValueError):
+            FrameDecoder("mp3")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+"""
+Test for HistoryService.export_query
+Test suite for reading filtered export records page by page.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.services.history import HistoryService
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+async def make_service(tmp_path, count):
+    """Create a service with `count` records, one day apart (same-second ties included)."""
+    service = HistoryService(db_path=tmp_path / "history.db")
+    await service.initialize()
+    for i in range(count):
+        word = "alpha" if i % 2 else "beta"
+        record = await service.add(text=f"note {i} {word}", duration_ms=1000)
+        created_at = BASE + timedelta(days=i // 2)
+        await service._db.execute(
+            "UPDATE transcriptions SET created_at = ? WHERE id = ?", (created_at, record.id)
+        )
+    await service._db.commit()
+    return service
+
+
+class TestHistoryServiceExportQuery:
+    """Tests for HistoryService.export_query"""
+
+    async def test_pages_cover_every_record_once_newest_first(self, tmp_path):
+        """Test that keyset pages return all records in order, including timestamp ties."""
+        service = await make_service(tmp_path, 25)
+        try:
+            total, records = service.export_query(page_size=4)
+            records = list(records)
+        finally:
+            await service.close()
+
+        assert total == 25
+        assert len({r.id for r in records}) == 25
+        keys = [(r.created_at, r.id) for r in records]
+        assert keys == sorted(keys, reverse=True)
+
+    async def test_filters_are_combined(self, tmp_path):
+        """Test that date range, search and ids all narrow the export."""
+        service = await make_service(tmp_path, 10)
+        try:
+            total, records = service.export_query(
+                start_date=BASE + timedelta(days=1),
+                end_date=(BASE + timedelta(days=3)).replace(tzinfo=None),
+                search="alpha",
+                page_size=2,
+            )
+            texts = [r.text for r in records]
+            _, all_records = service.export_query()
+            ids = [r.id for r in all_records][:3]
+            id_total, by_id = service.export_query(record_ids=ids + ["missing"])
+            by_id = [r.id for r in by_id]
+        finally:
+            await service.close()
+
+        assert total == len(texts) == 3
+        assert texts == ["note 7 alpha", "note 5 alpha", "note 3 alpha"]
+        assert id_total == 3
+        assert by_id == ids
+
+    async def test_no_matches(self, tmp_path):
+        """Test that an export without matching records is empty."""
+        service = await make_service(tmp_path, 3)
+        try:
+            total, records = service.export_query(search="nothing")
+            records = list(records)
+        finally:
+            await service.close()
+
+        assert total == 0
+        assert records == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,229 @@
+"""
+Test for InferenceScheduler.submit
+Test suite for micro-batching concurrent transcription requests.
+"""
+
+import pytest
+import threading
+import time
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.models import TranscriptionResult
+from speakeasy.core.scheduler import InferenceScheduler, Priority
+
+
+class FakeEngine:
+    """Engine that records the size of every batched call."""
+
+    model_name = "fake"
+    is_loaded = True
+
+    def __init__(self, fail_batch=False, bad_marker=None):
+        self.batch_sizes = []
+        self.single_calls = 0
+        self.fail_batch = fail_batch
+        self.bad_marker = bad_marker
+
+    def transcribe_batch(self, audio_batch, sample_rate=16000, languages=None):
+        self.batch_sizes.append(len(audio_batch))
+        if self.fail_batch:
+            raise RuntimeError("batch failed")
+        return [TranscriptionResult(text=f"clip {a[0]:.0f}", duration_ms=1) for a in audio_batch]
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, instruction=None):
+        self.single_calls += 1
+        if self.bad_marker is not None and audio_data[0] == self.bad_marker:
+            raise ValueError("bad clip")
+        return TranscriptionResult(text=f"clip {audio_data[0]:.0f}", duration_ms=1)
+
+
+def _clip(marker):
+    return np.full(1600, marker, dtype=np.float32)
+
+
+class TestInferenceSchedulerSubmit:
+    """Tests for InferenceScheduler.submit"""
+
+    @pytest.fixture
+    def make_scheduler(self):
+        schedulers = []
+
+        def make(engine, **kwargs):
+            scheduler = InferenceScheduler(lambda: engine, **kwargs)
+            schedulers.append(scheduler)
+            return scheduler
+
+        yield make
+        for scheduler in schedulers:
+            scheduler.close()
+
+    def test_concurrent_requests_share_a_batch(self, make_scheduler):
+        """Test that requests arriving within the wait window are batched together."""
+        engine = FakeEngine()
+        scheduler = make_scheduler(engine, max_batch_size=8, max_wait_ms=200)
+
+        futures = [scheduler.submit(_clip(i)) for i in range(4)]
+        results = [f.result(timeout=5) for f in futures]
+
+        assert [r.text for r in results] == ["clip 0", "clip 1", "clip 2", "clip 3"]
+        assert engine.batch_sizes == [4]
+        assert scheduler.get_metrics()["avg_batch_size"] == 4
+
+    def test_max_batch_size_is_respected(self, make_scheduler):
+        """Test that a full batch is dispatched without waiting and never exceeds the limit."""
+        engine = FakeEngine()
+        scheduler = make_scheduler(engine, max_batch_size=2, max_wait_ms=200)
+
+        futures = [scheduler.submit(_clip(i)) for i in range(5)]
+        for f in futures:
+            f.result(timeout=5)
+
+        assert max(engine.batch_sizes) <= 2
+        assert sum(engine.batch_sizes) + engine.single_calls == 5
+
+    def test_single_request_dispatched_after_max_wait(self, make_scheduler):
+        """Test that a lone request is not held longer than the wait window."""
+        engine = FakeEngine()
+        scheduler = make_scheduler(engine, max_wait_ms=20)
+
+        start = time.monotonic()
+        result = scheduler.transcribe(_clip(7))
+
+        assert result.text == "clip 7"
+        assert time.monotonic() - start < 1.0
+
+    def test_latency_target_closes_window_early(self, make_scheduler):
+        """Test that a tight latency target is not delayed by a long wait window."""
+        engine = FakeEngine()
+        scheduler = make_scheduler(engine, max_wait_ms=2000)
+
+        start = time.monotonic()
+        scheduler.submit(_clip(1), latency_target_ms=50).result(timeout=5)
+
+        assert time.monotonic() - start < 1.0
+
+    def test_engine_without_real_batching_skips_the_window(self, make_scheduler):
+        """Test that an engine running batches clip by clip gets requests without waiting."""
+        engine = FakeEngine()
+        engine.batches_requests = False
+        scheduler = make_scheduler(engine, max_batch_size=8, max_wait_ms=2000)
+
+        start = time.monotonic()
+        futures = [scheduler.submit(_clip(i)) for i in range(3)]
+        for f in futures:
+            f.result(timeout=5)
+
+        assert time.monotonic() - start < 1.0
+        assert engine.batch_sizes == []
+        assert engine.single_calls == 3
+
+    def test_failed_batch_retries_individually(self, make_scheduler):
+        """Test that one bad clip fails only its own request."""
+        engine = FakeEngine(fail_batch=True, bad_marker=2)
+        scheduler = make_scheduler(engine, max_wait_ms=200)
+
+        futures = [scheduler.submit(_clip(i)) for i in range(3)]
+
+        assert futures[0].result(timeout=5).text == "clip 0"
+        assert futures[1].result(timeout=5).text == "clip 1"
+        with pytest.raises(ValueError, match="bad clip"):
+            futures[2].result(timeout=5)
+        assert scheduler.get_metrics()["failed"] == 1
+
+    def test_different_instructions_are_not_batched(self, make_scheduler):
+        """Test that requests with different instructions run separately."""
+        engine = FakeEngine()
+        scheduler = make_scheduler(engine, max_wait_ms=100)
+
+        futures = [
+            scheduler.submit(_clip(0), instruction="fix grammar"),
+            scheduler.submit(_clip(1)),
+        ]
+        for f in futures:
+            f.result(timeout=5)
+
+        assert engine.batch_sizes == []
+        assert engine.single_calls == 2
+
+    def test_interactive_requests_run_before_queued_batch_work(self, make_scheduler):
+        """Test that dictation jumps ahead of batch chunks already waiting in the queue."""
+        release = threading.Event()
+        order = []
+
+        class BlockingEngine(FakeEngine):
+            def transcribe(self, audio_data, sample_rate=16000, language=None, instruction=None):
+                if audio_data[0] == 0:
+                    release.wait(5)
+                order.append(int(audio_data[0]))
+                return super().transcribe(audio_data, sample_rate, language, instruction)
+
+        scheduler = make_scheduler(BlockingEngine(), max_batch_size=1, max_wait_ms=0)
+
+        running = scheduler.submit(_clip(0), priority=Priority.BATCH)
+        time.sleep(0.05)
+        futures = [scheduler.submit(_clip(i), priority=Priority.BATCH) for i in (1, 2)]
+        futures.append(scheduler.submit(_clip(3), priority=Priority.INTERACTIVE))
+        release.set()
+        for f in [running] + futures:
+            f.result(timeout=5)
+
+        assert order == [0, 3, 1, 2]
+
+    def test_priorities_are_not_batched_together(self, make_scheduler):
+        """Test that batch and interactive requests never share a model call."""
+        engine = FakeEngine()
+        scheduler = make_scheduler(engine, max_batch_size=8, max_wait_ms=100)
+
+        futures = [
+            scheduler.submit(_clip(0), priority=Priority.BATCH),
+            scheduler.submit(_clip(1), priority=Priority.BATCH),
+            scheduler.submit(_clip(2)),
+        ]
+        for f in futures:
+            f.result(timeout=5)
+
+        assert engine.batch_sizes == [2]
+        assert engine.single_calls == 1
+
+    def test_metrics_report_waits_per_priority(self, make_scheduler):
+        """Test that queue waits and latency percentiles are reported per priority."""
+        scheduler = make_scheduler(FakeEngine(), max_batch_size=1, max_wait_ms=0)
+
+        scheduler.transcribe(_clip(0))
+        scheduler.transcribe(_clip(1), priority=Priority.BATCH)
+        scheduler.transcribe(_clip(2), priority=Priority.BATCH)
+
+        priorities = scheduler.get_metrics()["priorities"]
+        assert priorities["interactive"]["requests"] == 1
+        assert priorities["batch"]["requests"] == 2
+        assert priorities["batch"]["queued"] == 0
+        assert priorities["interactive"]["queue_wait_p95_ms"] >= 0
+        assert priorities["batch"]["latency_p95_ms"] >= 0
+
+    def test_close_fails_queued_requests(self):
+        """Test that closing the scheduler fails requests still waiting in the queue."""
+        release = threading.Event()
+        engine = Mock()
+        engine.transcribe_batch = None
+        del engine.transcribe_batch
+        engine.transcribe.side_effect = lambda **kwargs: release.wait(5)
+        scheduler = InferenceScheduler(lambda: engine, max_batch_size=1, max_wait_ms=0)
+
+        first = scheduler.submit(_clip(0))
+        time.sleep(0.05)
+        queued = scheduler.submit(_clip(1))
+        threading.Timer(0.1, release.set).start()
+        scheduler.close()
+
+        first.result(timeout=5)
+        with pytest.raises(RuntimeError):
+            queued.result(timeout=5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Test for ModelRouter.transcribe
+Test suite for routing requests to resident models by detected language.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.models import ModelType, TranscriptionResult
+from speakeasy.core.router import ModelRouter
+
+SAMPLE_RATE = 16000
+
+
+def _make_model(model_type, model_name):
+    """Create a mock resident model."""
+    model = Mock()
+    model.model_type = model_type
+    model.model_name = model_name
+    model.is_loaded = True
+    model.transcribe.return_value = TranscriptionResult(text=model_name, duration_ms=1)
+    return model
+
+
+def _make_lid(language, probability=0.95):
+    """Create a mock Whisper tiny that always detects the given language."""
+    lid = _make_model(ModelType.WHISPER, "tiny")
+    lid.detect_language.return_value = (language, probability)
+    return lid
+
+
+@pytest.fixture
+def audio():
+    return np.zeros(10 * SAMPLE_RATE, dtype=np.float32)
+
+
+class TestModelRouterTranscribe:
+    """Tests for ModelRouter.transcribe"""
+
+    def test_english_goes_to_fastest_supporting_model(self, audio):
+        """Test that English is sent to Parakeet rather than Whisper large."""
+        whisper = _make_model(ModelType.WHISPER, "large-v3")
+        parakeet = _make_model(ModelType.PARAKEET, "nvidia/parakeet-tdt-0.6b-v3")
+        router = ModelRouter(whisper, _make_lid("en"), models=[parakeet])
+
+        result = router.transcribe(audio, language="auto")
+
+        assert result.text == "nvidia/parakeet-tdt-0.6b-v3"
+        assert parakeet.transcribe.call_args.kwargs["language"] == "en"
+        whisper.transcribe.assert_not_called()
+
+    @pytest.mark.parametrize("language", ["auto", "fr"])
+    def test_resident_canary_is_routed_to(self, audio, language):
+        """Test that a Canary model in `models` can be checked for languages and chosen."""
+        whisper = _make_model(ModelType.WHISPER, "large-v3")
+        canary = _make_model(ModelType.CANARY, "nvidia/canary-1b-v2")
+        router = ModelRouter(whisper, _make_lid("fr"), models=[canary])
+
+        result = router.transcribe(audio, language=language)
+
+        assert result.text == "nvidia/canary-1b-v2"
+        whisper.transcribe.assert_not_called()
+
+    def test_detected_language_reaches_canary_as_asr_pair(self, audio):
+        """Test that German routed to Canary is decoded as German, not English."""
+        whisper = _make_model(ModelType.WHISPER, "large-v3")
+        canary = _make_model(ModelType.CANARY, "nvidia/canary-1b-v2")
+        router = ModelRouter(whisper, _make_lid("de"), models=[canary], rules={"de": canary.model_name})
+
+        router.transcribe(audio, language="auto")
+
+        assert canary.transcribe.call_args.kwargs["language"] == "de-de"
+        assert router.get_metrics()["by_language"] == {"de": 1}
+
+    def test_unsupported_language_falls_back_to_primary(self, audio):
+        """Test that Japanese stays on Whisper since Parakeet does not support it."""
+        whisper = _make_model(ModelType.WHISPER, "large-v3")
+        parakeet = _make_model(ModelType.PARAKEET, "nvidia/parakeet-tdt-0.6b-v3")
+        router = ModelRouter(parakeet, _make_lid("ja"), models=[whisper])
+
+        router.transcribe(audio, language="auto")
+
+        whisper.transcribe.assert_called_once()
+        parakeet.transcribe.assert_not_called()
+
+    def test_identification_uses_only_first_seconds(self, audio):
+        """Test that language identification only sees the configured clip length."""
+        lid = _make_lid("en")
+        router = ModelRouter(_make_model(ModelType.WHISPER, "small"), lid, lid_seconds=2.0)
+
+        router.transcribe(audio, language="auto")
+
+        clip = lid.detect_language.call_args.args[0]
+        assert len(clip) == 2 * SAMPLE_RATE
+
+    def test_explicit_language_skips_identification(self, audio):
+        """Test that a fixed language does not run language identification."""
+        lid = _make_lid("en")
+        router = ModelRouter(_make_model(ModelType.WHISPER, "small"), lid)
+
+        router.transcribe(audio, language="de")
+
+        lid.detect_language.assert_not_called()
+        assert router.get_metrics()["by_reason"] == {"explicit": 1}
+
+    def test_rule_overrides_fastest(self, audio):
+        """Test that a routing rule picks the named resident model."""
+        whisper = _make_model(ModelType.WHISPER, "large-v3")
+        parakeet = _make_model(ModelType.PARAKEET, "nvidia/parakeet-tdt-0.6b-v3")
+        router = ModelRouter(parakeet, _make_lid("en"), models=[whisper], rules={"en": "large-v3"})
+
+        router.transcribe(audio, language="auto")
+
+        whisper.transcribe.assert_called_once()
+
+    def test_low_confidence_detection_uses_primary(self, audio):
+        """Test that an unsure detection keeps the primary model and auto language."""
+        whisper = _make_model(ModelType.WHISPER, "large-v3")
+        parakeet = _make_model(ModelType.PARAKEET, "nvidia/parakeet-tdt-0.6b-v3")
+        router = ModelRouter(whisper, _make_lid("en", probability=0.2), models=[parakeet])
+
+        router.transcribe(audio, language="auto")
+
+        assert whisper.transcribe.call_args.kwargs["language"] == "auto"
+        assert router.get_metrics()["by_reason"] == {"low_confidence": 1}
+
+    def test_metrics_count_languages_and_models(self, audio):
+        """Test that routing metrics are recorded per language and model."""
+        parakeet = _make_model(ModelType.PARAKEET, "nvidia/parakeet-tdt-0.6b-v3")
+        router = ModelRouter(parakeet, _make_lid("en"))
+
+        router.transcribe(audio, language="auto")
+        router.transcribe(audio, language="auto")
+        metrics = router.get_metrics()
+
+        assert metrics["requests"] == 2
+        assert metrics["lid_runs"] == 2
+        assert metrics["by_language"] == {"en": 2}
+        assert metrics["by_model"] == {"nvidia/parakeet-tdt-0.6b-v3": 2}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
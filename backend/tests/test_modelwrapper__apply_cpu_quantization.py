@@ -0,0 +1,150 @@
+"""
+Test for ModelWrapper._apply_cpu_quantization
+Test suite for dynamic int8 quantization of NeMo encoders on CPU.
+"""
+
+import pytest
+import torch
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.models import ModelWrapper, module_nbytes
+
+
+def _make_fake_nemo_model():
+    """Create a stand-in for a NeMo model with a Linear-heavy encoder."""
+    model = Mock()
+    model.encoder = torch.nn.Sequential(
+        torch.nn.Linear(64, 256),
+        torch.nn.ReLU(),
+        torch.nn.Linear(256, 64),
+    )
+    return model
+
+
+class TestModelWrapperApplyCpuQuantization:
+    """Tests for ModelWrapper._apply_cpu_quantization"""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Point the home directory (and thus the model cache) at a temp dir."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        return tmp_path / ".speakeasy" / "model_cache"
+
+    @pytest.fixture
+    def checkpoint(self, tmp_path):
+        """A local checkpoint file to load the (fake) model from."""
+        path = tmp_path / "parakeet.nemo"
+        path.write_bytes(b"weights v1")
+        return path
+
+    def test_quantizes_encoder_linear_layers(self, cache_dir):
+        """Test that int8 on CPU swaps encoder Linear layers for dynamic quantized ones."""
+        wrapper = ModelWrapper("parakeet", "nvidia/parakeet-tdt-0.6b-v3", "cpu", "int8")
+        wrapper._model = _make_fake_nemo_model()
+
+        wrapper._apply_cpu_quantization()
+
+        linear_types = {type(m).__name__ for m in wrapper._model.encoder.modules()}
+        assert "Linear" in linear_types
+        assert any(
+            isinstance(m, torch.ao.nn.quantized.dynamic.Linear)
+            for m in wrapper._model.encoder.modules()
+        )
+        assert wrapper.quantization_info["mode"] == "dynamic_int8"
+        assert wrapper.quantization_info["from_cache"] is False
+
+    def test_quantized_encoder_is_smaller(self, cache_dir):
+        """Test that the quantized encoder reports a smaller weight footprint."""
+        wrapper = ModelWrapper("canary", "nvidia/canary-1b-v2", "cpu", "int8")
+        wrapper._model = _make_fake_nemo_model()
+        fp32_bytes = module_nbytes(wrapper._model.encoder)
+
+        wrapper._apply_cpu_quantization()
+
+        assert module_nbytes(wrapper._model.encoder) < fp32_bytes
+
+    def test_second_load_uses_disk_cache(self, cache_dir, checkpoint):
+        """Test that the quantized encoder is cached and reused."""
+        first = ModelWrapper("parakeet", str(checkpoint), "cpu", "int8")
+        first._model = _make_fake_nemo_model()
+        first._apply_cpu_quantization()
+        assert list(cache_dir.glob("parakeet_*_encoder_int8_*.pt"))
+
+        second = ModelWrapper("parakeet", str(checkpoint), "cpu", "int8")
+        second._model = _make_fake_nemo_model()
+        with patch("torch.ao.quantization.quantize_dynamic") as mock_quantize:
+            second._apply_cpu_quantization()
+            mock_quantize.assert_not_called()
+
+        assert second.quantization_info["from_cache"] is True
+
+    def test_updated_checkpoint_is_requantized(self, cache_dir, checkpoint):
+        """Test that a checkpoint replaced under the same name doesn't reuse the cache."""
+        first = ModelWrapper("parakeet", str(checkpoint), "cpu", "int8")
+        first._model = _make_fake_nemo_model()
+        first._apply_cpu_quantization()
+
+        checkpoint.write_bytes(b"weights v2, retrained")
+        second = ModelWrapper("parakeet", str(checkpoint), "cpu", "int8")
+        second._model = _make_fake_nemo_model()
+        second._apply_cpu_quantization()
+
+        assert second.quantization_info["from_cache"] is False
+        assert len(list(cache_dir.glob("parakeet_*_encoder_int8_*.pt"))) == 2
+
+    def test_unknown_checkpoint_is_not_cached(self, cache_dir):
+        """Test that without checkpoint files on disk the quantized encoder isn't cached."""
+        wrapper = ModelWrapper("parakeet", "nvidia/parakeet-tdt-0.6b-v3", "cpu", "int8")
+        wrapper._model = _make_fake_nemo_model()
+
+        with patch.object(wrapper, "_checkpoint_fingerprint", return_value=None):
+            wrapper._apply_cpu_quantization()
+
+        assert wrapper.quantization_info["from_cache"] is False
+        assert not list(cache_dir.glob("*.pt"))
+
+    def test_quantized_output_close_to_fp32(self, cache_dir):
+        """Test that quantization keeps encoder outputs close to fp32."""
+        wrapper = ModelWrapper("parakeet", "nvidia/parakeet-tdt-0.6b-v3", "cpu", "int8")
+        wrapper._model = _make_fake_nemo_model()
+        x = torch.randn(4, 64)
+        expected = wrapper._model.encoder(x)
+
+        wrapper._apply_cpu_quantization()
+
+        assert torch.allclose(wrapper._model.encoder(x), expected, atol=0.1)
+
+    def test_skipped_on_cuda(self, cache_dir):
+        """Test that dynamic quantization is not applied on CUDA."""
+        wrapper = ModelWrapper("parakeet", "nvidia/parakeet-tdt-0.6b-v3", "cuda", "int8")
+        wrapper._model = _make_fake_nemo_model()
+        original = wrapper._model.encoder
+
+        wrapper._apply_cpu_quantization()
+
+        assert wrapper._model.encoder is original
+        assert wrapper.quantization_info is None
+
+    def test_skipped_for_float_compute_type(self, cache_dir):
+        """Test that fp32/fp16 CPU loads are left untouched."""
+        wrapper = ModelWrapper("parakeet", "nvidia/parakeet-tdt-0.6b-v3", "cpu", "float32")
+        wrapper._model = _make_fake_nemo_model()
+        original = wrapper._model.encoder
+
+        wrapper._apply_cpu_quantization()
+
+        assert wrapper._model.encoder is original
+
+    def test_skipped_for_whisper(self, cache_dir):
+        """Test that Whisper int8 is left to CTranslate2."""
+        wrapper = ModelWrapper("whisper", "small", "cpu", "int8")
+        assert wrapper.uses_cpu_quantization is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,6 +11,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from speakeasy.core.cancellation import CancellationToken, TranscriptionCancelledError
 from speakeasy.core.models import ModelWrapper, ModelType, TranscriptionResult
 
 
@@ -40,6 +41,22 @@ class TestModelWrapperTranscribe:
         assert isinstance(result, TranscriptionResult)
         assert result.text == "Hello world"
 
+    def test_model_is_not_idle_while_transcribing(self):
+        """Test that wait_idle (used by background compilation) waits for transcriptions."""
+        wrapper = ModelWrapper(model_type="whisper", model_name="small")
+        wrapper._loaded = True
+        idle_during = []
+
+        def transcribe_whisper(*args):
+            idle_during.append(wrapper.wait_idle(timeout=0.01))
+            return "Hello"
+
+        with patch.object(wrapper, "_transcribe_whisper", side_effect=transcribe_whisper):
+            wrapper.transcribe(np.zeros(160, dtype=np.float32))
+
+        assert idle_during == [False]
+        assert wrapper.wait_idle(timeout=0) is True
+
     def test_transcribe_returns_result_with_metadata(self):
         """Test that transcribe returns result with proper metadata."""
         wrapper = ModelWrapper(model_type="whisper", model_name="small")
@@ -67,6 +84,20 @@ class TestModelWrapperTranscribe:
 
         assert result.language == "es"
 
+    def test_transcribe_whisper_returns_detected_language(self):
+        """Test that auto language reports the language Whisper detected."""
+        wrapper = ModelWrapper(model_type="whisper", model_name="small")
+        wrapper._loaded = True
+        wrapper._model = Mock()
+        segment = Mock(start=0.0, end=1.0, text=" Bonjour", avg_logprob=-0.2, no_speech_prob=0.0)
+        wrapper._model.transcribe.return_value = ([segment], Mock(language="fr"))
+
+        audio_data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        result = wrapper.transcribe(audio_data, language="auto")
+
+        assert result.text == "Bonjour"
+        assert result.language == "fr"
+
     def test_transcribe_with_instruction(self):
         """Test transcribe with instruction parameter."""
         wrapper = ModelWrapper(model_type="whisper", model_name="small")
@@ -93,5 +124,46 @@ class TestModelWrapperTranscribe:
                 wrapper.transcribe(audio_data)
 
 
+    def test_transcribe_whisper_stops_between_segments(self):
+        """Test that a cancelled token stops Whisper's lazy segment decoding."""
+        wrapper = ModelWrapper(model_type="whisper", model_name="small")
+        wrapper._loaded = True
+        wrapper._model = Mock()
+        token = CancellationToken()
+        decoded = []
+
+        def segments():
+            for i in range(5):
+                decoded.append(i)
+                if i == 1:
+                    token.cancel()
+                yield Mock(start=i, end=i + 1, text=f" s{i}", avg_logprob=0.0, no_speech_prob=0.0)
+
+        wrapper._model.transcribe.return_value = (segments(), Mock(language="en"))
+        audio_data = np.zeros(16000, dtype=np.float32)
+
+        with pytest.raises(TranscriptionCancelledError):
+            wrapper.transcribe(audio_data, cancel_token=token)
+
+        assert decoded == [0, 1]
+
+    def test_transcribe_voxtral_stops_between_chunks(self):
+        """Test that Voxtral's 30s chunk loop checks the token."""
+        wrapper = ModelWrapper(model_type="voxtral", model_name="voxtral")
+        wrapper._loaded = True
+        token = CancellationToken()
+
+        def chunk(*args):
+            token.cancel()
+            return "text"
+
+        audio_data = np.zeros(90 * 16000, dtype=np.float32)
+        with patch.object(wrapper, "_transcribe_voxtral_chunk", side_effect=chunk) as mock_chunk:
+            with pytest.raises(TranscriptionCancelledError):
+                wrapper.transcribe(audio_data, cancel_token=token)
+
+        assert mock_chunk.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
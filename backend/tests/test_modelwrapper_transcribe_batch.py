@@ -0,0 +1,103 @@
+"""
+Test for ModelWrapper.transcribe_batch
+Test suite for batched transcription of independent clips.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.cancellation import CancellationToken, TranscriptionCancelledError
+from speakeasy.core.models import ModelWrapper, TranscriptionResult
+
+
+def _clips(n):
+    return [np.zeros(16000, dtype=np.float32) for _ in range(n)]
+
+
+class TestModelWrapperTranscribeBatch:
+    """Tests for ModelWrapper.transcribe_batch"""
+
+    def test_not_loaded_raises_error(self):
+        """Test that batching requires a loaded model."""
+        wrapper = ModelWrapper(model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3")
+
+        with pytest.raises(RuntimeError, match="Model not loaded"):
+            wrapper.transcribe_batch(_clips(2))
+
+    def test_parakeet_uses_one_model_call(self):
+        """Test that Parakeet transcribes the whole batch with a single NeMo call."""
+        wrapper = ModelWrapper(model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3")
+        wrapper._loaded = True
+        wrapper._model = Mock()
+        wrapper._model.transcribe.return_value = [Mock(text="one"), Mock(text="two")]
+
+        results = wrapper.transcribe_batch(_clips(2))
+
+        wrapper._model.transcribe.assert_called_once()
+        assert wrapper._model.transcribe.call_args.kwargs["batch_size"] == 2
+        assert [r.text for r in results] == ["one", "two"]
+
+    def test_canary_batches_per_language_pair(self):
+        """Test that Canary groups clips by source/target language."""
+        wrapper = ModelWrapper(model_type="canary", model_name="nvidia/canary-1b-v2")
+        wrapper._loaded = True
+        wrapper._model = Mock()
+        wrapper._model.transcribe.side_effect = lambda manifest, batch_size, **kwargs: [
+            Mock(text=kwargs["source_lang"]) for _ in range(batch_size)
+        ]
+
+        results = wrapper.transcribe_batch(_clips(3), languages=["de-de", "en-en", "de-de"])
+
+        assert wrapper._model.transcribe.call_count == 2
+        assert [r.text for r in results] == ["de", "en", "de"]
+        assert [r.language for r in results] == ["de-de", "en-en", "de-de"]
+
+    def test_cancelled_clip_is_left_out_of_the_model_call(self):
+        """Test that a clip cancelled before the NeMo call gets its error, not a transcript."""
+        wrapper = ModelWrapper(model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3")
+        wrapper._loaded = True
+        wrapper._model = Mock()
+        wrapper._model.transcribe.return_value = [Mock(text="one"), Mock(text="three")]
+        cancelled = CancellationToken()
+        cancelled.cancel("Stopped")
+
+        results = wrapper.transcribe_batch(
+            _clips(3), cancel_tokens=[CancellationToken(), cancelled, None]
+        )
+
+        assert wrapper._model.transcribe.call_args.kwargs["batch_size"] == 2
+        assert results[0].text == "one"
+        assert isinstance(results[1], TranscriptionCancelledError)
+        assert results[2].text == "three"
+
+    def test_whisper_falls_back_to_sequential(self):
+        """Test that Whisper clips are transcribed one at a time."""
+        wrapper = ModelWrapper(model_type="whisper", model_name="small")
+        wrapper._loaded = True
+
+        with patch.object(
+            wrapper,
+            "transcribe",
+            return_value=TranscriptionResult(text="hi", duration_ms=1),
+        ) as mock_transcribe:
+            results = wrapper.transcribe_batch(_clips(3))
+
+        assert mock_transcribe.call_count == 3
+        assert len(results) == 3
+
+    def test_languages_length_mismatch_raises(self):
+        """Test that per-clip languages must match the batch size."""
+        wrapper = ModelWrapper(model_type="parakeet", model_name="nvidia/parakeet-tdt-0.6b-v3")
+        wrapper._loaded = True
+
+        with pytest.raises(ValueError):
+            wrapper.transcribe_batch(_clips(2), languages=["en"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,56 @@
+"""
+Test for ResultCache.content_hash
+Test suite for remembering file hashes by path, size and modification time.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.result_cache import ResultCache
+
+
+class TestResultCacheContentHash:
+    """Tests for ResultCache.content_hash"""
+
+    def test_remembered_hashes_are_bounded(self, tmp_path):
+        """Test that only the most recently hashed max_entries paths are remembered."""
+        cache = ResultCache(tmp_path / "result_cache.db", max_entries=3)
+        try:
+            paths = []
+            for i in range(10):
+                path = tmp_path / f"upload-{i}.wav"
+                path.write_bytes(b"audio %d" % i)
+                paths.append(path)
+                cache.content_hash(str(path))
+            # Hashing a path again makes it the most recent
+            cache.content_hash(str(paths[6]))
+
+            remembered = {
+                Path(row[0]).name
+                for row in cache._db.execute("SELECT path FROM file_hashes").fetchall()
+            }
+        finally:
+            cache.close()
+
+        assert remembered == {"upload-8.wav", "upload-9.wav", "upload-6.wav"}
+
+    def test_changed_file_is_hashed_again(self, tmp_path):
+        """Test that a remembered hash is not used once the file changes."""
+        cache = ResultCache(tmp_path / "result_cache.db")
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"first")
+        try:
+            first = cache.content_hash(str(path))
+            path.write_bytes(b"second take")
+            second = cache.content_hash(str(path))
+        finally:
+            cache.close()
+
+        assert first != second
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,153 @@
+"""
+Test for ResultCache.run
+Test suite for reusing transcripts of identical audio and coalescing requests.
+"""
+
+import pytest
+import shutil
+import threading
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.cancellation import CancellationToken, TranscriptionCancelledError
+from speakeasy.core.models import TranscriptionResult
+from speakeasy.core.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary database."""
+    cache = ResultCache(tmp_path / "result_cache.db")
+    yield cache
+    cache.close()
+
+
+def result(text="hello"):
+    return TranscriptionResult(text=text, duration_ms=1000, language="en", model_used="small")
+
+
+class TestResultCacheRun:
+    """Tests for ResultCache.run"""
+
+    def test_second_request_is_served_from_cache(self, cache):
+        """Test that a stored result is returned without transcribing again."""
+        calls = []
+
+        def transcribe():
+            calls.append(1)
+            return result()
+
+        first = cache.run("key", transcribe)
+        second = cache.run("key", transcribe)
+
+        assert len(calls) == 1
+        assert not first.from_cache
+        assert second.from_cache
+        assert (second.text, second.language, second.model_used) == ("hello", "en", "small")
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_copies_of_a_file_share_a_key(self, cache, tmp_path):
+        """Test that the content hash ignores the path and follows the content."""
+        original = tmp_path / "a.wav"
+        original.write_bytes(b"RIFF audio")
+        copy = tmp_path / "copy" / "b.wav"
+        copy.parent.mkdir()
+        shutil.copy(original, copy)
+        other = tmp_path / "c.wav"
+        other.write_bytes(b"RIFF other")
+
+        digests = [cache.content_hash(str(p)) for p in (original, copy, other)]
+
+        assert digests[0] == digests[1] != digests[2]
+        assert cache.key(digests[0], "engine", None, None) == cache.key(
+            digests[1], "engine", "auto", None
+        )
+        assert cache.key(digests[0], "engine", "en", None) != cache.key(
+            digests[0], "engine", "de", None
+        )
+
+    def test_identical_concurrent_requests_are_coalesced(self, cache):
+        """Test that a request identical to one in progress waits for its result."""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def transcribe():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return result()
+
+        leader = threading.Thread(target=cache.run, args=("key", transcribe))
+        leader.start()
+        started.wait(5)
+        follower_results = []
+        follower = threading.Thread(
+            target=lambda: follower_results.append(cache.run("key", transcribe))
+        )
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(calls) == 1
+        assert follower_results[0].from_cache
+        assert cache.stats()["coalesced"] == 1
+
+    def test_waiting_request_transcribes_if_first_fails(self, cache):
+        """Test that a failed request doesn't fail the identical ones waiting on it."""
+        started, release = threading.Event(), threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("model error")
+
+        errors = []
+
+        def lead():
+            try:
+                cache.run("key", failing)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        started.wait(5)
+        follower_results = []
+        follower = threading.Thread(
+            target=lambda: follower_results.append(cache.run("key", lambda: result("retry")))
+        )
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(errors) == 1
+        assert follower_results[0].text == "retry"
+        assert not follower_results[0].from_cache
+
+    def test_waiting_request_honours_its_cancellation(self, cache):
+        """Test that a request waiting on an identical one can still be cancelled."""
+        started, release = threading.Event(), threading.Event()
+
+        def transcribe():
+            started.set()
+            release.wait(5)
+            return result()
+
+        leader = threading.Thread(target=cache.run, args=("key", transcribe))
+        leader.start()
+        started.wait(5)
+        token = CancellationToken()
+        token.cancel()
+
+        with pytest.raises(TranscriptionCancelledError):
+            cache.run("key", transcribe, cancel_token=token)
+        release.set()
+        leader.join(5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
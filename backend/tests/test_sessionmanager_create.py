@@ -0,0 +1,132 @@
+"""
+Test for SessionManager.create
+Test suite for concurrent recording sessions sharing one loaded model.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.devices import DeviceRegistry
+from speakeasy.core.models import TranscriptionResult
+from speakeasy.core.sessions import DEFAULT_SESSION_ID, SessionManager
+from speakeasy.core.transcriber import TranscriberService, TranscriberState
+
+
+class TestSessionManagerCreate:
+    """Tests for SessionManager.create"""
+
+    @pytest.fixture
+    def transcriber(self):
+        """Create a TranscriberService with a loaded mock model."""
+        service = TranscriberService(on_state_change=None)
+        mock_model = Mock()
+        mock_model.is_loaded = True
+        mock_model.model_name = "test-model"
+        mock_model.transcribe.return_value = TranscriptionResult(text="hello", duration_ms=1)
+        service._model = mock_model
+        service._state = TranscriberState.READY
+        yield service
+        service.cleanup()
+
+    def test_default_session_is_the_main_service(self, transcriber):
+        """Test that None and "default" resolve to the main service."""
+        manager = SessionManager(transcriber)
+
+        assert manager.get(None) is transcriber
+        assert manager.get(DEFAULT_SESSION_ID) is transcriber
+        assert manager.get("missing") is None
+
+    def test_sessions_have_their_own_state(self, transcriber):
+        """Test that a session records independently of the main service."""
+        manager = SessionManager(transcriber)
+        session_id, session = manager.create("desk-2")
+
+        assert session_id == "desk-2"
+        assert session is not transcriber
+        assert session.is_model_loaded
+        assert session.state == TranscriberState.READY
+
+        session._state = TranscriberState.RECORDING
+        assert session.is_recording
+        assert not transcriber.is_recording
+
+    def test_sessions_share_the_inference_queue(self, transcriber):
+        """Test that sessions transcribe with the main service's model and queue."""
+        manager = SessionManager(transcriber)
+        _, session = manager.create()
+
+        result = session.transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert result.text == "hello"
+        assert session._get_scheduler() is transcriber._get_scheduler()
+        transcriber._model.transcribe.assert_called_once()
+        with pytest.raises(RuntimeError, match="Recording sessions"):
+            session.load_model("whisper", "tiny")
+
+    def test_state_changes_report_the_session_id(self, transcriber):
+        """Test that the state callback receives the session id."""
+        callback = Mock()
+        manager = SessionManager(transcriber, on_state_change=callback)
+        _, session = manager.create("kiosk")
+
+        session.transcribe(np.zeros(16000, dtype=np.float32))
+
+        callback.assert_any_call("kiosk", TranscriberState.TRANSCRIBING)
+        callback.assert_any_call("kiosk", TranscriberState.READY)
+
+    def test_duplicate_and_reserved_ids_are_rejected(self, transcriber):
+        """Test that session ids are unique and "default" is reserved."""
+        manager = SessionManager(transcriber)
+        manager.create("a")
+
+        with pytest.raises(ValueError, match="already exists"):
+            manager.create("a")
+        with pytest.raises(ValueError, match="default"):
+            manager.create(DEFAULT_SESSION_ID)
+
+    def test_session_limit(self, transcriber):
+        """Test that no more than max_sessions sessions can be created."""
+        manager = SessionManager(transcriber, max_sessions=1)
+        manager.create("a")
+
+        with pytest.raises(RuntimeError, match="Too many"):
+            manager.create("b")
+
+    def test_close_removes_session(self, transcriber):
+        """Test that closing a session removes it but keeps the shared model."""
+        manager = SessionManager(transcriber)
+        manager.create("a")
+
+        assert manager.close("a") is True
+        assert manager.get("a") is None
+        assert manager.close(DEFAULT_SESSION_ID) is False
+        assert transcriber.is_model_loaded
+        assert [s["session_id"] for s in manager.list_sessions()] == [DEFAULT_SESSION_ID]
+
+    def test_create_with_device(self, transcriber):
+        """Test that a session can use its own input device."""
+        manager = SessionManager(transcriber)
+
+        with (
+            patch("speakeasy.core.devices.sd") as mock_sd,
+            patch(
+                "speakeasy.core.transcriber.get_device_registry", return_value=DeviceRegistry()
+            ),
+        ):
+            mock_sd.query_devices.return_value = [
+                {"name": "USB Mic", "max_input_channels": 1, "default_samplerate": 48000, "hostapi": 0},
+            ]
+            mock_sd.query_hostapis.return_value = [{"name": "ALSA"}]
+            _, session = manager.create("usb", device_name="usb")
+
+        assert session.device_name == "USB Mic"
+        assert transcriber.device_name is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
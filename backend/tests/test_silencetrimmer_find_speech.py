@@ -0,0 +1,83 @@
+"""
+Test for SilenceTrimmer.find_speech
+Test suite for locating speech between leading and trailing silence.
+"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.silence import SilenceTrimmer
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, amplitude=0.2):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def noise(seconds, amplitude=0.001, seed=0):
+    rng = np.random.default_rng(seed)
+    return (amplitude * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+class TestSilenceTrimmerFindSpeech:
+    """Tests for SilenceTrimmer.find_speech"""
+
+    def test_leading_and_trailing_silence_is_trimmed(self):
+        """Test that only the speech and its padding are kept."""
+        trimmer = SilenceTrimmer(padding_ms=200)
+        audio = np.concatenate([noise(1.0), tone(2.0), noise(1.5, seed=1)])
+
+        trim = trimmer.find_speech(audio, SAMPLE_RATE)
+
+        assert trim.start == pytest.approx(0.8 * SAMPLE_RATE, abs=320)
+        assert trim.end == pytest.approx(3.2 * SAMPLE_RATE, abs=320)
+        assert trim.offset_s == pytest.approx(0.8, abs=0.02)
+        assert trim.trimmed_ms == pytest.approx(2100, abs=40)
+        assert not trim.silent
+
+    def test_near_silent_audio_is_silent(self):
+        """Test that room noise and a short click contain no speech."""
+        trimmer = SilenceTrimmer()
+        audio = noise(2.0)
+        audio[8000:8320] = 0.5  # One 20ms click
+
+        trim = trimmer.find_speech(audio, SAMPLE_RATE)
+
+        assert trim.silent
+        assert trim.trimmed_ms == 2000
+
+    def test_speech_at_the_edges_is_kept(self):
+        """Test that audio that is speech throughout isn't cut."""
+        trimmer = SilenceTrimmer()
+        audio = tone(1.01)
+
+        trim = trimmer.find_speech(audio, SAMPLE_RATE)
+
+        assert (trim.start, trim.end) == (0, len(audio))
+        assert trim.trimmed_ms == 0
+
+    def test_trim_counts_metrics(self):
+        """Test that trim() returns a view of the speech and adds to the totals."""
+        trimmer = SilenceTrimmer(padding_ms=0)
+        audio = np.concatenate([noise(1.0), tone(1.0)])
+
+        kept, _ = trimmer.trim(audio, SAMPLE_RATE)
+        trimmer.trim(noise(1.0), SAMPLE_RATE)
+
+        assert len(kept) == SAMPLE_RATE
+        assert np.shares_memory(kept, audio)
+        metrics = trimmer.get_metrics()
+        assert metrics["recordings"] == 2
+        assert metrics["skipped_silent"] == 1
+        assert metrics["trimmed_seconds"] == 2.0
+        assert metrics["trimmed_percent"] == pytest.approx(66.7)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
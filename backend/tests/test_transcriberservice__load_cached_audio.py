@@ -0,0 +1,72 @@
+"""
+Test for TranscriberService._load_cached_audio
+Test suite for reading batch files from the decoded audio cache.
+"""
+
+import pytest
+import numpy as np
+import soundfile as sf
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core import transcriber as transcriber_module
+from speakeasy.core.audio_file import AudioFileStream
+from speakeasy.core.transcriber import TranscriberService
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """Write 3s of a 48kHz tone."""
+    t = np.arange(3 * 48000) / 48000
+    path = tmp_path / "tone.wav"
+    sf.write(path, (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), 48000)
+    return str(path)
+
+
+class TestTranscriberServiceLoadCachedAudio:
+    """Tests for TranscriberService._load_cached_audio"""
+
+    def test_second_load_skips_decoding(self, tmp_path, audio_file):
+        """Test that a file is cached while it is decoded, and not decoded again."""
+        service = TranscriberService()
+        service.configure_audio_cache(10, directory=str(tmp_path / "cache"))
+        stream = service._load_cached_audio(audio_file)
+        assert isinstance(stream, AudioFileStream)
+        assert service.audio_cache_metrics["entries"] == 0
+        first = np.concatenate(list(stream.chunks(16000)))
+
+        with patch.object(
+            transcriber_module, "AudioFileStream", side_effect=AssertionError("decoded")
+        ):
+            second = service._load_cached_audio(audio_file)
+
+        assert len(first) == 3 * 16000
+        np.testing.assert_array_equal(second, first)
+        assert service.audio_cache_metrics["hits"] == 1
+
+    def test_partly_decoded_file_is_not_cached(self, tmp_path, audio_file):
+        """Test that a stream closed before the end of the file leaves no entry."""
+        service = TranscriberService()
+        service.configure_audio_cache(10, directory=str(tmp_path / "cache"))
+        chunks = service._load_cached_audio(audio_file).chunks(16000)
+        next(chunks)
+        chunks.close()
+
+        assert service.audio_cache_metrics["entries"] == 0
+        assert list((tmp_path / "cache").iterdir()) == []
+        assert isinstance(service._load_cached_audio(audio_file), AudioFileStream)
+
+    def test_disabled_cache_returns_none(self, audio_file):
+        """Test that without a budget the caller decodes as usual."""
+        service = TranscriberService()
+        service.configure_audio_cache(0)
+
+        assert service._load_cached_audio(audio_file) is None
+        assert service.audio_cache_metrics is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
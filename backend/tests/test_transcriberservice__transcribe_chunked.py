@@ -0,0 +1,191 @@
+"""
+Test for TranscriberService._transcribe_chunked
+Test suite for language pinning across chunks of long recordings.
+"""
+
+import pytest
+import numpy as np
+import soundfile as sf
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.audio_file import AudioFileStream
+from speakeasy.core.spill import SpillWriter
+from speakeasy.core.models import TranscriptionSegment
+from speakeasy.core.transcriber import TranscriberService, TranscriberState, TranscriptionResult
+
+
+class TestTranscriberServiceTranscribeChunked:
+    """Tests for TranscriberService._transcribe_chunked"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with a mock model and small chunks."""
+        service = TranscriberService()
+        service.CHUNK_SIZE_SAMPLES = 16000
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._model.model_name = "small"
+        service._state = TranscriberState.READY
+        return service
+
+    def _transcribe(self, service, seconds=3, language="auto"):
+        return service._transcribe_chunked(
+            audio_data=np.zeros(seconds * 16000, dtype=np.float32),
+            sample_rate=16000,
+            language=language,
+            progress_callback=None,
+        )
+
+    def test_language_detected_once_and_pinned(self, service):
+        """Test that the first detected language is passed to later chunks."""
+        def transcribe(**kwargs):
+            detected = "de" if kwargs["language"] == "auto" else kwargs["language"]
+            return TranscriptionResult(text="hallo", duration_ms=1, language=detected)
+
+        service._model.transcribe.side_effect = transcribe
+
+        result = self._transcribe(service)
+
+        languages = [c.kwargs["language"] for c in service._model.transcribe.call_args_list]
+        assert languages == ["auto", "de", "de"]
+        assert result.language == "de"
+
+    def test_silent_chunks_do_not_pin_language(self, service):
+        """Test that detection waits for the first chunk that contains speech."""
+        results = iter(
+            [
+                TranscriptionResult(text="", duration_ms=1, language="en"),
+                TranscriptionResult(text="bonjour", duration_ms=1, language="fr"),
+                TranscriptionResult(text="merci", duration_ms=1, language="fr"),
+            ]
+        )
+        service._model.transcribe.side_effect = lambda **kwargs: next(results)
+
+        result = self._transcribe(service)
+
+        languages = [c.kwargs["language"] for c in service._model.transcribe.call_args_list]
+        assert languages == ["auto", "auto", "fr"]
+        assert result.language == "fr"
+        assert result.text == "bonjour merci"
+
+    def test_segments_are_shifted_to_the_recording(self, service):
+        """Test that chunk segments are combined with times relative to the whole audio."""
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="word",
+            duration_ms=1,
+            language="en",
+            segments=[TranscriptionSegment(start=0.25, end=0.75, text="word")],
+        )
+
+        result = self._transcribe(service, language="en")
+
+        assert [(s.start, s.end) for s in result.segments] == [
+            (0.25, 0.75),
+            (1.25, 1.75),
+            (2.25, 2.75),
+        ]
+
+    def test_explicit_language_is_kept(self, service):
+        """Test that an explicit language is used for every chunk."""
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="hola", duration_ms=1, language="es"
+        )
+
+        result = self._transcribe(service, language="es")
+
+        languages = [c.kwargs["language"] for c in service._model.transcribe.call_args_list]
+        assert languages == ["es", "es", "es"]
+        assert result.language == "es"
+
+    def test_undetected_language_stays_auto(self, service):
+        """Test that engines without detection leave the language as auto."""
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="hello", duration_ms=1, language="auto"
+        )
+
+        result = self._transcribe(service)
+
+        assert result.language == "auto"
+
+    def test_batching_queues_remaining_chunks_together(self, service):
+        """Test that chunks after the language is settled are batched by the scheduler."""
+        batch_sizes = []
+
+        def transcribe_batch(audio_batch, sample_rate=16000, languages=None):
+            batch_sizes.append(len(audio_batch))
+            return [
+                TranscriptionResult(text="mehr", duration_ms=1, language=lang) for lang in languages
+            ]
+
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="hallo", duration_ms=1, language="de"
+        )
+        service._model.transcribe_batch.side_effect = transcribe_batch
+        service.configure_batching(True, max_batch_size=8, max_wait_ms=200)
+        try:
+            result = self._transcribe(service, seconds=4)
+        finally:
+            service.configure_batching(False)
+
+        assert service._model.transcribe.call_count == 1
+        assert batch_sizes == [3]
+        assert result.text == "hallo mehr mehr mehr"
+        assert result.language == "de"
+
+    def test_spilled_recording_read_chunk_by_chunk(self, service, tmp_path):
+        """Test that a recording on disk is sliced into chunks as they are queued."""
+        writer = SpillWriter(48000, directory=tmp_path)
+        writer.write([np.full(48000, i / 100, dtype=np.float32) for i in range(20)])
+        audio = writer.finish(16000)
+        service.MAX_CHUNKS_IN_FLIGHT = 2
+        chunks = []
+
+        def transcribe(**kwargs):
+            chunks.append(kwargs["audio_data"])
+            return TranscriptionResult(text="x", duration_ms=1, language="en")
+
+        service._model.transcribe.side_effect = transcribe
+
+        result = service._transcribe_chunked(
+            audio_data=audio, sample_rate=16000, language="auto", progress_callback=None
+        )
+
+        assert result.text == " ".join(["x"] * 20)
+        assert all(isinstance(c, np.ndarray) and len(c) == 16000 for c in chunks)
+        assert [round(float(np.median(c)), 2) for c in chunks] == [i / 100 for i in range(20)]
+
+    def test_file_stream_decoded_chunk_by_chunk(self, service, tmp_path):
+        """Test that an audio file stream is decoded into chunks as they are queued."""
+        path = tmp_path / "long.wav"
+        levels = np.concatenate([np.full(48000, i / 100, dtype=np.float32) for i in range(20)])
+        sf.write(path, levels, 48000, subtype="FLOAT")
+        stream = AudioFileStream(str(path), 16000)
+        stream.backend = "soundfile"
+        service.MAX_CHUNKS_IN_FLIGHT = 2
+        chunks, progress = [], []
+
+        def transcribe(**kwargs):
+            chunks.append(kwargs["audio_data"])
+            return TranscriptionResult(text="x", duration_ms=1, language="en")
+
+        service._model.transcribe.side_effect = transcribe
+
+        result = service._transcribe_chunked(
+            audio_data=stream,
+            sample_rate=16000,
+            language="auto",
+            progress_callback=lambda current, total, text: progress.append((current, total)),
+        )
+
+        assert result.text == " ".join(["x"] * 20)
+        assert all(len(c) == 16000 for c in chunks)
+        assert [round(float(np.median(c)), 2) for c in chunks] == [i / 100 for i in range(20)]
+        assert progress[-1] == (20, 20)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Test for TranscriberService.cancel_transcription
+Test suite for cooperative cancellation and deadlines of in-flight transcriptions.
+"""
+
+import pytest
+import threading
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.cancellation import (
+    CancellationToken,
+    DeadlineExceededError,
+    TranscriptionCancelledError,
+)
+from speakeasy.core.transcriber import TranscriberService, TranscriberState, TranscriptionResult
+
+
+class TestTranscriberServiceCancelTranscription:
+    """Tests for TranscriberService.cancel_transcription"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with a mock model and 1-second chunks."""
+        service = TranscriberService()
+        service.CHUNK_THRESHOLD_SAMPLES = 16000
+        service.CHUNK_SIZE_SAMPLES = 16000
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._model.model_name = "small"
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="chunk", duration_ms=1, language="en"
+        )
+        service._state = TranscriberState.READY
+        yield service
+        service.cleanup()
+
+    def test_cancel_stops_within_one_chunk(self, service):
+        """Test that cancelling mid-recording stops before the next chunk."""
+        calls = []
+
+        def transcribe(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 2:
+                assert service.cancel_transcription() is True
+            return TranscriptionResult(text="chunk", duration_ms=1, language="en")
+
+        service._model.transcribe.side_effect = transcribe
+
+        with pytest.raises(TranscriptionCancelledError):
+            service.transcribe(np.zeros(10 * 16000, dtype=np.float32), language="en")
+
+        assert len(calls) == 2
+        assert all(isinstance(c["cancel_token"], CancellationToken) for c in calls)
+        assert service.state == TranscriberState.READY
+        assert service.cancel_transcription() is False
+
+    def test_deadline_exceeded(self, service):
+        """Test that an expired token stops the transcription with DeadlineExceededError."""
+        token = CancellationToken(timeout_s=60)
+        token.deadline = 0  # Already expired
+
+        with pytest.raises(DeadlineExceededError, match="timed out"):
+            service.transcribe(np.zeros(3 * 16000, dtype=np.float32), cancel_token=token)
+
+        service._model.transcribe.assert_not_called()
+        assert service.state == TranscriberState.READY
+
+    def test_queued_requests_are_dropped(self, service):
+        """Test that a cancelled request waiting in the queue never reaches the model."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_transcribe(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return TranscriptionResult(text="first", duration_ms=1)
+
+        service._model.transcribe.side_effect = slow_transcribe
+        scheduler = service._get_scheduler()
+
+        first = scheduler.submit(np.zeros(16000, dtype=np.float32))
+        assert started.wait(timeout=5)
+        token = CancellationToken()
+        queued = scheduler.submit(np.zeros(16000, dtype=np.float32), cancel_token=token)
+        token.cancel("no longer needed")
+        release.set()
+
+        assert first.result(timeout=5).text == "first"
+        with pytest.raises(TranscriptionCancelledError, match="no longer needed"):
+            queued.result(timeout=5)
+        assert service._model.transcribe.call_count == 1
+        assert scheduler.get_metrics()["cancelled"] == 1
+
+    def test_batch_priority_uses_caller_token(self, service):
+        """Test that batch work is only cancelled through the caller's token."""
+        token = CancellationToken()
+
+        result = service.transcribe(
+            np.zeros(16000, dtype=np.float32), priority="batch", cancel_token=token
+        )
+
+        assert result.text == "chunk"
+        assert service._model.transcribe.call_args.kwargs["cancel_token"] is token
+        # Batch work is not the live transcription
+        assert service.cancel_transcription() is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
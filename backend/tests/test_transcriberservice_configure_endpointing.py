@@ -0,0 +1,158 @@
+"""
+Test for TranscriberService.configure_endpointing
+Test suite for finalizing microphone recordings automatically when speech ends.
+"""
+
+import pytest
+import threading
+import time
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.transcriber import TranscriberService, TranscriberState, TranscriptionResult
+
+SAMPLE_RATE = 16000
+BLOCK = 512
+
+
+def utterance():
+    """0.5s silence, 1s tone, 1.5s silence."""
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    speech = (0.2 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    return np.concatenate(
+        [np.zeros(SAMPLE_RATE // 2, np.float32), speech, np.zeros(SAMPLE_RATE * 3 // 2, np.float32)]
+    )
+
+
+class TestTranscriberServiceConfigureEndpointing:
+    """Tests for TranscriberService.configure_endpointing"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with a mock model."""
+        service = TranscriberService()
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._model.model_name = "small"
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="hello", duration_ms=5, language="en"
+        )
+        service._state = TranscriberState.READY
+        yield service
+        service.cleanup()
+
+    def _record(self, service, audio):
+        """Simulate a microphone recording by driving the stream callback."""
+        service._recording_samplerate = SAMPLE_RATE
+        service._recording_start_time = time.time()
+        service._reset_endpointer(SAMPLE_RATE)
+        service._state = TranscriberState.RECORDING
+        for start in range(0, len(audio), BLOCK):
+            block = audio[start : start + BLOCK].reshape(-1, 1)
+            service._audio_callback(block, len(block), {}, None)
+
+    def test_finalizes_after_trailing_silence(self, service):
+        """Test that the recording is queued without stop, minus the trailing silence."""
+        done = threading.Event()
+        events = []
+
+        def on_endpoint(decision, utterance):
+            # Capture has stopped before the decision is announced
+            events.append(("endpoint", decision, utterance, service.state))
+
+        def on_done(utterance, result, error):
+            events.append(("done", utterance, result, error))
+            done.set()
+
+        service.configure_endpointing(
+            True, silence_ms=500, language="en", on_endpoint=on_endpoint, on_done=on_done
+        )
+        self._record(service, utterance())
+        assert done.wait(timeout=5)
+
+        (_, decision, queued, state), (_, finished, result, error) = events
+        assert state == TranscriberState.READY
+        assert finished is queued
+        assert error is None
+        assert result.text == "hello"
+        assert decision.speech_end_s == pytest.approx(1.5, abs=0.04)
+        assert decision.detection_ms == pytest.approx(500, abs=20)
+        assert decision.finalize_ms is not None
+        # Speech plus the 200ms tail, not the full 3s
+        audio = service._model.transcribe.call_args.kwargs["audio_data"]
+        assert len(audio) / SAMPLE_RATE == pytest.approx(1.7, abs=0.05)
+        assert result.duration_ms == pytest.approx(1700, abs=50)
+        assert service._model.transcribe.call_args.kwargs["language"] == "en"
+        assert service.state == TranscriberState.READY
+
+    def test_decisions_are_finalized_on_one_worker(self, service):
+        """Test that the audio callback hands decisions to a long-lived thread."""
+        threads = []
+        finalized = threading.Semaphore(0)
+
+        def on_endpoint(decision, utterance):
+            threads.append(threading.current_thread())
+            finalized.release()
+
+        service.configure_endpointing(True, silence_ms=500, on_endpoint=on_endpoint)
+        for _ in range(2):
+            self._record(service, utterance())
+            assert finalized.acquire(timeout=5)
+
+        assert threads[0] is threads[1] is service._endpoint_thread
+        service.configure_endpointing(False)
+        assert not threads[0].is_alive()
+
+    def test_detection_runs_off_the_audio_callback(self, service):
+        """Test that the callback only queues audio and the worker runs the detector."""
+        finalized = threading.Event()
+        service.configure_endpointing(
+            True, silence_ms=500, on_endpoint=lambda decision, utterance: finalized.set()
+        )
+        process = service._endpointer.process
+        threads = set()
+
+        def tracked(samples):
+            threads.add(threading.current_thread())
+            return process(samples)
+
+        service._endpointer.process = tracked
+        self._record(service, utterance())
+
+        assert finalized.wait(timeout=5)
+        assert threads == {service._endpoint_thread}
+
+    def test_disabled_keeps_recording(self, service):
+        """Test that without endpointing the recording continues through silence."""
+        service.configure_endpointing(True)
+        service.configure_endpointing(False)
+        assert not service.endpointing_enabled
+
+        service._state = TranscriberState.RECORDING
+        audio = utterance()
+        for start in range(0, len(audio), BLOCK):
+            block = audio[start : start + BLOCK].reshape(-1, 1)
+            service._audio_callback(block, len(block), {}, None)
+
+        assert service.state == TranscriberState.RECORDING
+        service._model.transcribe.assert_not_called()
+
+    def test_skips_recording_already_stopped(self, service):
+        """Test that a decision for a recording the hotkey already stopped is dropped."""
+        on_endpoint = Mock()
+        service.configure_endpointing(True, on_endpoint=on_endpoint)
+        self._record(service, np.zeros(SAMPLE_RATE, np.float32))
+        decision = Mock(speech_end_s=0.5)
+
+        service._finalize_endpoint(decision, recording=service._endpoint_recording - 1)
+
+        assert service.state == TranscriberState.RECORDING
+        on_endpoint.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
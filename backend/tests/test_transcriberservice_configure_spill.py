@@ -0,0 +1,144 @@
+"""
+Test for TranscriberService.configure_spill
+Test suite for moving long recordings to disk while they are recorded.
+"""
+
+import errno
+import os
+import time
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.spill import SPILL_KEEP_S, SpilledAudio, SpillWriter
+from speakeasy.core.transcriber import TranscriberService, TranscriberState
+
+SAMPLE_RATE = 16000
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def buffered_seconds(service):
+    return sum(len(chunk) for chunk in service._audio_buffer) / SAMPLE_RATE
+
+
+class TestTranscriberServiceConfigureSpill:
+    """Tests for TranscriberService.configure_spill"""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a service with a mock model that spills after 40s, checking often."""
+        service = TranscriberService()
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._state = TranscriberState.READY
+        service.SPILL_INTERVAL_S = 0.01
+        service.configure_spill(True, after_s=40, directory=str(tmp_path))
+        return service
+
+    def push_seconds(self, service, start, count):
+        """Push `count` one-second chunks whose value is their index / 1000."""
+        for i in range(start, start + count):
+            service.push_audio(np.full(SAMPLE_RATE, i / 1000, dtype=np.float32))
+
+    def test_short_recording_stays_in_memory(self, service, tmp_path):
+        """Test that recordings under the threshold never touch the disk."""
+        service.start_external_recording()
+        self.push_seconds(service, 0, 35)
+        time.sleep(0.1)
+        recording = service.stop_recording()
+
+        assert isinstance(recording.audio_data, np.ndarray)
+        assert len(recording.audio_data) == 35 * SAMPLE_RATE
+        assert list(tmp_path.iterdir()) == []
+
+    def test_long_recording_spills_and_keeps_window(self, service, tmp_path):
+        """Test that old audio moves to disk, leaving only the recent window in memory."""
+        service.start_external_recording()
+        self.push_seconds(service, 0, 90)
+        wait_for(lambda: buffered_seconds(service) <= SPILL_KEEP_S)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        self.push_seconds(service, 90, 10)
+        recording = service.stop_recording()
+
+        audio = recording.audio_data
+        assert isinstance(audio, SpilledAudio)
+        assert len(audio) == 100 * SAMPLE_RATE
+        assert recording.duration_seconds == pytest.approx(100)
+        seconds = [float(audio[i * SAMPLE_RATE : (i + 1) * SAMPLE_RATE].mean()) for i in range(100)]
+        assert seconds == pytest.approx([i / 1000 for i in range(100)], abs=1e-4)
+
+        path = audio.path
+        audio.close()
+        assert not os.path.exists(path)
+
+    def test_failed_spill_keeps_audio_in_memory(self, service, tmp_path):
+        """Test that audio taken for a spill that fails is put back in the buffer."""
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_bytes(b"")
+        service.configure_spill(True, after_s=40, directory=str(not_a_directory))
+        service.start_external_recording()
+        self.push_seconds(service, 0, 60)
+        wait_for(lambda: not service._spill_thread.is_alive())
+
+        recording = service.stop_recording()
+
+        audio = recording.audio_data
+        assert isinstance(audio, np.ndarray)
+        seconds = [float(audio[i * SAMPLE_RATE : (i + 1) * SAMPLE_RATE].mean()) for i in range(60)]
+        assert seconds == pytest.approx([i / 1000 for i in range(60)], abs=1e-6)
+
+    def test_disk_full_after_spilling_keeps_whole_recording(self, service, monkeypatch):
+        """Test that a write failing after earlier ones keeps the rest of the audio in memory."""
+        real_write = SpillWriter.write
+        calls = []
+
+        def write(writer, chunks):
+            calls.append(len(chunks))
+            if len(calls) > 1:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            real_write(writer, chunks)
+
+        monkeypatch.setattr(SpillWriter, "write", write)
+        service.start_external_recording()
+        self.push_seconds(service, 0, 90)
+        wait_for(lambda: buffered_seconds(service) <= SPILL_KEEP_S)
+        self.push_seconds(service, 90, 10)
+        wait_for(lambda: not service._spill_thread.is_alive())
+        self.push_seconds(service, 100, 5)
+
+        recording = service.stop_recording()
+
+        audio = recording.audio_data
+        assert len(calls) == 3
+        assert isinstance(audio, SpilledAudio)
+        assert len(audio) == 105 * SAMPLE_RATE
+        seconds = [float(audio[i * SAMPLE_RATE : (i + 1) * SAMPLE_RATE].mean()) for i in range(105)]
+        assert seconds == pytest.approx([i / 1000 for i in range(105)], abs=1e-4)
+
+    def test_cancel_discards_spill_file(self, service, tmp_path):
+        """Test that cancelling a spilled recording deletes its file."""
+        service.start_external_recording()
+        self.push_seconds(service, 0, 60)
+        wait_for(lambda: len(list(tmp_path.iterdir())) == 1)
+
+        service.cancel_recording()
+
+        assert list(tmp_path.iterdir()) == []
+        assert service._audio_buffer == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
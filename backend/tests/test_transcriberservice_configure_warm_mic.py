@@ -0,0 +1,103 @@
+"""
+Test for TranscriberService.configure_warm_mic
+Test suite for recording from an always-open microphone with pre-roll.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.transcriber import TranscriberService, TranscriberState
+from speakeasy.core.warm_mic import WarmMicrophone
+
+SAMPLE_RATE = 16000
+BLOCK = 160
+
+
+def deliver(mic, seconds, value):
+    """Drive the warm stream's callback with constant audio."""
+    audio = np.full(int(seconds * SAMPLE_RATE), value, dtype=np.float32)
+    for start in range(0, len(audio), BLOCK):
+        block = audio[start : start + BLOCK].reshape(-1, 1)
+        mic._callback(block, len(block), {}, None)
+
+
+class TestTranscriberServiceConfigureWarmMic:
+    """Tests for TranscriberService.configure_warm_mic"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with a mock model and a warm microphone that never opens a device."""
+        service = TranscriberService()
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._state = TranscriberState.READY
+        with (
+            patch.object(WarmMicrophone, "open"),
+            patch.object(TranscriberService, "_query_input_device", return_value=SAMPLE_RATE),
+        ):
+            service.configure_warm_mic(True, pre_roll_ms=300)
+            yield service
+        service.cleanup()
+
+    def test_recording_includes_pre_roll(self, service):
+        """Test that a recording starts with audio captured before start_recording."""
+        mic = service._warm_mic
+        deliver(mic, 1.0, 0.1)  # Before the hotkey
+
+        service.start_recording()
+        assert service.state == TranscriberState.RECORDING
+        deliver(mic, 0.5, 0.2)
+        assert service.start_latency_ms is not None
+        recording = service.stop_recording()
+
+        audio = recording.audio_data
+        assert len(audio) == int(0.8 * SAMPLE_RATE)
+        assert np.all(audio[: int(0.3 * SAMPLE_RATE)] == pytest.approx(0.1))
+        assert np.all(audio[int(0.3 * SAMPLE_RATE) :] == pytest.approx(0.2))
+
+    def test_stream_stays_open_between_recordings(self, service):
+        """Test that stopping detaches from the stream instead of closing it."""
+        mic = service._warm_mic
+        deliver(mic, 0.5, 0.1)
+        service.start_recording()
+        deliver(mic, 0.1, 0.2)
+        service.stop_recording()
+
+        # Blocks after stop don't reach the next recording's buffer
+        deliver(mic, 0.1, 0.9)
+        assert service._warm_mic is mic
+        assert service._audio_buffer == []
+
+    def test_pre_roll_not_counted_in_telemetry(self, service):
+        """Test that the telemetry counts stream callbacks, not the pre-roll."""
+        mic = service._warm_mic
+        deliver(mic, 1.0, 0.1)
+
+        service.start_recording()
+        deliver(mic, 0.5, 0.2)
+        service.stop_recording()
+
+        telemetry = service.capture_telemetry
+        assert telemetry["callbacks"] == int(0.5 * SAMPLE_RATE) // BLOCK
+        assert telemetry["captured_seconds"] == pytest.approx(0.5)
+        assert telemetry["overflows"] == 0
+
+    def test_cannot_reconfigure_while_recording(self, service):
+        """Test that the microphone mode can't change mid-recording."""
+        service.start_recording()
+
+        with pytest.raises(RuntimeError, match="while recording"):
+            service.configure_warm_mic(False)
+
+        service.cancel_recording()
+        service.configure_warm_mic(False)
+        assert not service.warm_mic_enabled
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""
+Test for TranscriberService.push_audio
+Test suite for recordings fed by audio streamed from remote clients.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.models import TranscriptionResult
+from speakeasy.core.transcriber import TranscriberService, TranscriberState
+
+
+class TestTranscriberServicePushAudio:
+    """Tests for TranscriberService.push_audio"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a TranscriberService with a loaded mock model."""
+        service = TranscriberService(on_state_change=None)
+        mock_model = Mock()
+        mock_model.is_loaded = True
+        mock_model.model_name = "test-model"
+        mock_model.transcribe.side_effect = lambda audio_data, **kwargs: TranscriptionResult(
+            text=f"{len(audio_data)} samples", duration_ms=1
+        )
+        service._model = mock_model
+        service._state = TranscriberState.READY
+        yield service
+        service.cleanup()
+
+    def test_pushed_audio_is_transcribed_on_stop(self, service):
+        """Test that streamed chunks are concatenated into the recording."""
+        service.start_external_recording()
+        service.push_audio(np.zeros(8000, dtype=np.float32))
+        service.push_audio(np.zeros(8000, dtype=np.float32))
+
+        result = service.stop_and_transcribe()
+
+        assert result.text == "16000 samples"
+        assert service.state == TranscriberState.READY
+
+    def test_push_requires_external_recording(self, service):
+        """Test that audio cannot be pushed outside an external recording."""
+        with pytest.raises(RuntimeError, match="Not recording"):
+            service.push_audio(np.zeros(160, dtype=np.float32))
+
+    def test_recording_length_is_capped(self, service):
+        """Test that audio beyond MAX_RECORDING_SECONDS is dropped when not spilling."""
+        service.MAX_RECORDING_SECONDS = 2
+        service.start_external_recording()
+
+        assert service.push_audio(np.zeros(24000, dtype=np.float32))
+        assert not service.push_audio(np.zeros(16000, dtype=np.float32))
+        assert not service.push_audio(np.zeros(160, dtype=np.float32))
+
+        assert service.stop_and_transcribe().text == "32000 samples"
+
+    def test_preview_keeps_recording(self, service):
+        """Test that a partial transcription uses recent audio and keeps recording."""
+        service.start_external_recording()
+        service.push_audio(np.zeros(16000, dtype=np.float32))
+        service.push_audio(np.zeros(16000, dtype=np.float32))
+
+        result = service.preview(window_seconds=1.5)
+
+        assert result.text == "24000 samples"
+        assert service.is_recording
+
+    def test_preview_of_new_audio_only(self, service):
+        """Test that a preview given sample positions transcribes just that audio."""
+        service.start_external_recording()
+        service.push_audio(np.zeros(16000, dtype=np.float32))
+        service.push_audio(np.zeros(16000, dtype=np.float32))
+        service.push_audio(np.zeros(8000, dtype=np.float32))
+
+        assert service.preview(start=16000, end=32000).text == "16000 samples"
+        assert service.preview(start=32000).text == "8000 samples"
+        assert service.preview(start=40000) is None
+
+    def test_external_recording_refused_while_recording(self, service):
+        """Test that a session already recording (e.g. from the microphone) is not taken over."""
+        service._state = TranscriberState.RECORDING
+
+        with pytest.raises(RuntimeError, match="Already recording"):
+            service.start_external_recording()
+
+        assert not service.is_external_recording
+
+    def test_preview_without_audio(self, service):
+        """Test that a preview before any audio returns None."""
+        service.start_external_recording()
+
+        assert service.preview() is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
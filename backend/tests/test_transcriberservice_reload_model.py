@@ -0,0 +1,67 @@
+"""
+Test for TranscriberService.reload_model
+Test suite for reloading the model after an error.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.models import ModelType
+from speakeasy.core.transcriber import TranscriberService
+
+
+def make_wrapper(model_type="whisper", model_name="small", **kwargs):
+    """A loaded mock ModelWrapper."""
+    wrapper = Mock()
+    wrapper.model_type = ModelType(model_type)
+    wrapper.model_name = model_name
+    wrapper.is_loaded = True
+    return wrapper
+
+
+class TestTranscriberServiceReloadModel:
+    """Tests for TranscriberService.reload_model"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with a (mock) model, cascade and router loaded."""
+        service = TranscriberService()
+        with patch("speakeasy.core.models.ModelWrapper", side_effect=make_wrapper):
+            service.load_model("whisper", "large-v3", device="cpu")
+            service.enable_cascade("base", device="cpu", logprob_threshold=-0.5)
+            service.enable_routing("tiny", rules={"de": "large-v3"}, device="cpu")
+        return service
+
+    def test_reload_restores_cascade_and_routing(self, service):
+        """Test that a reload brings back the cascade and router it had to unload."""
+        old_model = service._model
+
+        with patch("speakeasy.core.models.ModelWrapper", side_effect=make_wrapper):
+            service.reload_model()
+
+        assert service._model is not old_model
+        assert service._cascade is not None
+        assert service._cascade.accurate is service._model
+        assert service._cascade.logprob_threshold == -0.5
+        assert service._router is not None
+        assert service._router.primary is service._model
+        assert service._router.rules == {"de": "large-v3"}
+
+    def test_explicit_unload_forgets_cascade_and_routing(self, service):
+        """Test that unloading on purpose doesn't restore them on a later reload."""
+        service.unload_model()
+
+        with patch("speakeasy.core.models.ModelWrapper", side_effect=make_wrapper):
+            service.load_model("whisper", "large-v3", device="cpu")
+            service.reload_model()
+
+        assert service._cascade is None
+        assert service._router is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
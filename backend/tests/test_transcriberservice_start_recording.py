@@ -11,6 +11,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from speakeasy.core.devices import DeviceRegistry
 from speakeasy.core.transcriber import TranscriberService, TranscriberState
 
 
@@ -132,15 +133,27 @@ class TestTranscriberStartRecording:
         service._device_name = "Custom Mic"
         service._device_id = 1
 
-        with patch("speakeasy.core.transcriber.sd") as mock_sd:
+        # Device info comes from the (cached) device registry
+        with (
+            patch("speakeasy.core.transcriber.sd") as mock_sd,
+            patch("speakeasy.core.devices.sd", mock_sd),
+            patch(
+                "speakeasy.core.transcriber.get_device_registry", return_value=DeviceRegistry()
+            ),
+        ):
+            default_device_info = {
+                "name": "Default Mic",
+                "max_input_channels": 1,
+                "default_samplerate": 16000.0,
+                "hostapi": 0,
+            }
             mock_device_info = {
                 "name": "Custom Mic",
                 "max_input_channels": 2,
                 "default_samplerate": 44100.0,
                 "hostapi": 0,
             }
-            mock_sd.query_devices.return_value = [mock_device_info, mock_device_info]
-            mock_sd.query_devices.return_value = mock_device_info
+            mock_sd.query_devices.return_value = [default_device_info, mock_device_info]
             mock_sd.default.device = [0, 0]
             mock_sd.query_hostapis.return_value = [{"name": "MME"}]
 
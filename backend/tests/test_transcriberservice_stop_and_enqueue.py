@@ -0,0 +1,108 @@
+"""
+Test for TranscriberService.stop_and_enqueue
+Test suite for pipelined dictation: recording again while earlier utterances transcribe.
+"""
+
+import pytest
+import threading
+import numpy as np
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.cancellation import TranscriptionCancelledError
+from speakeasy.core.transcriber import TranscriberService, TranscriberState, TranscriptionResult
+
+
+class TestTranscriberServiceStopAndEnqueue:
+    """Tests for TranscriberService.stop_and_enqueue"""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service whose mock model blocks until released."""
+        service = TranscriberService()
+        service.release = threading.Event()
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._model.model_name = "small"
+
+        def transcribe(audio_data, cancel_token=None, **kwargs):
+            service.release.wait(timeout=5)
+            # Like the real engines, check the token between segments
+            if cancel_token:
+                cancel_token.check()
+            return TranscriptionResult(text=f"{len(audio_data) // 16000}s", duration_ms=1)
+
+        service._model.transcribe.side_effect = transcribe
+        service._state = TranscriberState.READY
+        yield service
+        service.release.set()
+        service.cleanup()
+
+    def _record(self, service, seconds):
+        service.start_external_recording()
+        service.push_audio(np.zeros(seconds * 16000, dtype=np.float32))
+
+    def test_returns_before_transcription(self, service):
+        """Test that the service can record again while the last utterance transcribes."""
+        self._record(service, 1)
+        utterance = service.stop_and_enqueue(language="en")
+
+        assert utterance.id == 1
+        assert service.state == TranscriberState.READY
+        assert service.pending_dictations == 1
+
+        self._record(service, 2)
+        assert service.state == TranscriberState.RECORDING
+
+    def test_results_delivered_in_order(self, service):
+        """Test that callbacks run in the order utterances were stopped."""
+        delivered = []
+        done = threading.Event()
+
+        def on_done(utterance, result, error):
+            delivered.append((utterance.id, result.text, result.duration_ms))
+            if len(delivered) == 3:
+                done.set()
+
+        for seconds in (3, 1, 2):
+            self._record(service, seconds)
+            service.stop_and_enqueue(language="en", on_done=on_done)
+
+        service.release.set()
+        assert done.wait(timeout=5)
+
+        assert delivered == [(1, "3s", 3000), (2, "1s", 1000), (3, "2s", 2000)]
+        assert service.state == TranscriberState.READY
+
+    def test_cancel_pending_utterances(self, service):
+        """Test that cancel_transcription cancels queued utterances."""
+        errors = []
+        done = threading.Event()
+
+        def on_done(utterance, result, error):
+            errors.append(error)
+            if len(errors) == 2:
+                done.set()
+
+        for seconds in (1, 1):
+            self._record(service, seconds)
+            service.stop_and_enqueue(language="en", on_done=on_done)
+
+        assert service.cancel_transcription() is True
+        service.release.set()
+        assert done.wait(timeout=5)
+
+        assert all(isinstance(e, TranscriptionCancelledError) for e in errors)
+        assert service.pending_dictations == 0
+
+    def test_requires_recording(self, service):
+        """Test that stopping without a recording raises."""
+        with pytest.raises(RuntimeError, match="Not recording"):
+            service.stop_and_enqueue()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
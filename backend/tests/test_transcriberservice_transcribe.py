@@ -11,6 +11,9 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from speakeasy.core.cancellation import CancellationToken
+from speakeasy.core.models import TranscriptionSegment
+from speakeasy.core.scheduler import INTERACTIVE_LATENCY_TARGET_MS, Priority
 from speakeasy.core.transcriber import TranscriberService, TranscriberState, TranscriptionResult
 
 
@@ -108,6 +111,66 @@ class TestTranscriberServiceTranscribe:
 
         assert service._state == TranscriberState.ERROR
 
+    def test_transcribe_passes_latency_targets_to_scheduler(self, service_with_model):
+        """Test that dictation and deadline-bound batch requests carry a latency target."""
+        service = service_with_model
+        scheduler = service._get_scheduler()
+        audio_data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+
+        with patch.object(scheduler, "submit", wraps=scheduler.submit) as submit:
+            service.transcribe(audio_data)
+            service.transcribe(
+                audio_data, priority=Priority.BATCH, cancel_token=CancellationToken(timeout_s=60)
+            )
+            service.transcribe(audio_data, priority=Priority.BATCH)
+
+        targets = [c.kwargs["latency_target_ms"] for c in submit.call_args_list]
+        assert targets[0] == INTERACTIVE_LATENCY_TARGET_MS
+        assert 59000 < targets[1] <= 60000
+        assert targets[2] is None
+
+    def test_transcribe_silent_audio_skips_model(self, service_with_model):
+        """Test that audio without speech returns an empty result without inference."""
+        service = service_with_model
+        service.configure_silence_trimming(True)
+        audio_data = np.zeros(16000, dtype=np.float32)
+
+        result = service.transcribe(audio_data, language="en", trim_silence=True)
+
+        service._model.transcribe.assert_not_called()
+        assert result.text == ""
+        assert result.language == "en"
+        assert result.trimmed_ms == 1000
+        assert service._state == TranscriberState.READY
+
+    def test_transcribe_trims_silence_before_model(self, service_with_model):
+        """Test that leading and trailing silence never reaches the model."""
+        service = service_with_model
+        service.configure_silence_trimming(True, padding_ms=0)
+        service._model.transcribe.return_value.segments = [
+            TranscriptionSegment(start=0.0, end=1.0, text="Transcribed text")
+        ]
+        t = np.arange(16000) / 16000
+        speech = (0.2 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+        silence = np.zeros(16000, dtype=np.float32)
+
+        result = service.transcribe(np.concatenate([silence, speech, silence]), trim_silence=True)
+
+        assert len(service._model.transcribe.call_args.kwargs["audio_data"]) == 16000
+        assert result.trimmed_ms == 2000
+        assert (result.segments[0].start, result.segments[0].end) == (1.0, 2.0)
+
+    def test_transcribe_keeps_silence_unless_asked_to_trim(self, service_with_model):
+        """Test that audio that isn't a recording (e.g. a file) is not trimmed by default."""
+        service = service_with_model
+        service.configure_silence_trimming(True)
+        audio_data = np.zeros(16000, dtype=np.float32)
+
+        result = service.transcribe(audio_data)
+
+        assert len(service._model.transcribe.call_args.kwargs["audio_data"]) == 16000
+        assert result.trimmed_ms == 0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Test for TranscriberService.transcribe_file
+Test suite for serving transcripts of identical files from the result cache.
+"""
+
+import pytest
+import shutil
+import numpy as np
+import soundfile as sf
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.cascade import CascadeTranscriber
+from speakeasy.core.models import ModelType
+from speakeasy.core.transcriber import TranscriberService, TranscriberState, TranscriptionResult
+
+
+class TestTranscriberServiceTranscribeFile:
+    """Tests for TranscriberService.transcribe_file"""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a service with a mock model and the result cache enabled."""
+        service = TranscriberService()
+        service._model = Mock()
+        service._model.is_loaded = True
+        service._model.model_name = "small"
+        service._model.compute_type = "int8"
+        service._model.transcribe.return_value = TranscriptionResult(
+            text="hello", duration_ms=1, language="en", model_used="small"
+        )
+        service._state = TranscriberState.READY
+        service.configure_result_cache(True, db_path=str(tmp_path / "result_cache.db"))
+        yield service
+        service.configure_result_cache(False)
+
+    @pytest.fixture
+    def audio_file(self, tmp_path):
+        """Write 1s of noise."""
+        path = tmp_path / "a.wav"
+        sf.write(path, np.random.default_rng(0).standard_normal(16000) * 0.1, 16000)
+        return path
+
+    def test_copy_of_a_file_is_not_transcribed_again(self, service, audio_file, tmp_path):
+        """Test that a file with the same content reuses the stored transcript."""
+        copy = tmp_path / "b.wav"
+        shutil.copy(audio_file, copy)
+        progress = []
+
+        first = service.transcribe_file(str(audio_file), "auto")
+        second = service.transcribe_file(
+            str(copy), "auto", lambda *args: progress.append(args)
+        )
+
+        assert service._model.transcribe.call_count == 1
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.text == "hello"
+        assert progress == [(1, 1, "hello")]
+
+    def test_different_language_is_transcribed(self, service, audio_file):
+        """Test that the requested language is part of the cache key."""
+        service.transcribe_file(str(audio_file), "en")
+        result = service.transcribe_file(str(audio_file), "de")
+
+        assert service._model.transcribe.call_count == 2
+        assert not result.from_cache
+
+    def test_changed_cascade_thresholds_are_transcribed(self, service):
+        """Test that the cascade's thresholds are part of the cache key."""
+        fast = Mock(model_type=ModelType.WHISPER, model_name="tiny", is_loaded=True)
+        service._cascade = CascadeTranscriber(fast=fast, accurate=service._model)
+        before = service._engine_signature()
+
+        service._cascade.logprob_threshold = -0.5
+
+        assert service._engine_signature() != before
+
+    def test_file_trimming_is_part_of_the_key(self, service):
+        """Test that toggling file trimming, or its threshold, changes the cache key."""
+        service.configure_silence_trimming(True)
+        recordings_only = service._engine_signature()
+        service.configure_silence_trimming(True, files=True)
+        trimmed = service._engine_signature()
+        service.configure_silence_trimming(True, threshold_db=-40, files=True)
+
+        assert len({recordings_only, trimmed, service._engine_signature()}) == 3
+        service.configure_silence_trimming(False, files=True)
+        assert service._engine_signature() == recordings_only
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,72 @@
+"""
+Test for WarmMicrophone.attach
+Test suite for the always-open microphone's pre-roll ring buffer.
+"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from speakeasy.core.warm_mic import WarmMicrophone
+
+SAMPLE_RATE = 16000
+BLOCK = 160
+
+
+def deliver(mic, audio):
+    """Drive the stream callback with consecutive blocks."""
+    for start in range(0, len(audio), BLOCK):
+        block = audio[start : start + BLOCK].reshape(-1, 1)
+        mic._callback(block, len(block), {}, None)
+
+
+class TestWarmMicrophoneAttach:
+    """Tests for WarmMicrophone.attach"""
+
+    @pytest.fixture
+    def mic(self):
+        """Create a microphone with 300ms of pre-roll (the stream is not opened)."""
+        return WarmMicrophone(device_id=None, samplerate=SAMPLE_RATE, pre_roll_s=0.3)
+
+    def test_pre_roll_is_newest_audio(self, mic):
+        """Test that the next callback delivers the last pre_roll_s seconds, then its block."""
+        ramp = np.arange(SAMPLE_RATE * 2 + BLOCK, dtype=np.float32)
+        deliver(mic, ramp[:-BLOCK])
+        pre_rolls, blocks = [], []
+
+        available = mic.attach(
+            lambda indata, *args: blocks.append(indata[:, 0].copy()), on_pre_roll=pre_rolls.append
+        )
+        assert available == int(0.3 * SAMPLE_RATE)
+        assert pre_rolls == []  # Nothing is delivered from the attaching thread
+
+        deliver(mic, ramp[-BLOCK:])
+
+        assert len(pre_rolls) == 1
+        np.testing.assert_array_equal(pre_rolls[0], ramp[-BLOCK - available : -BLOCK])
+        np.testing.assert_array_equal(blocks[0], ramp[-BLOCK:])
+
+    def test_short_history_limits_pre_roll(self, mic):
+        """Test that only audio captured since open is delivered."""
+        deliver(mic, np.ones(BLOCK * 3, dtype=np.float32))
+
+        assert mic.attach(lambda *args: None) == BLOCK * 3
+
+    def test_forwards_blocks_until_detach(self, mic):
+        """Test that new blocks reach the sink only while attached."""
+        received = []
+        assert mic.attach(lambda indata, *args: received.append(indata[:, 0].copy())) == 0
+
+        deliver(mic, np.full(BLOCK * 2, 0.5, dtype=np.float32))
+        mic.detach()
+        deliver(mic, np.full(BLOCK * 2, 0.9, dtype=np.float32))
+
+        assert len(received) == 2
+        assert all(np.all(block == 0.5) for block in received)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
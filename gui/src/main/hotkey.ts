@@ -8,6 +8,7 @@ let currentHotkey: string | null = null;
 let currentMode: "toggle" | "push-to-talk" = "toggle";
 let isRecordingActive = false;
 let isProcessing = false; // Lock to prevent concurrent operations
+let recordingGeneration = 0; // Bumped on every start, to spot stale endpoint events
 let lastHotkeyTime = 0;
 const DEBOUNCE_MS = 500; // Increased from 300 for better race condition prevention
 
@@ -158,6 +159,7 @@ export async function startRecording(): Promise<void> {
   try {
     isRecordingActive = true;
     isLocked = false;
+    recordingGeneration++;
     console.log("Starting recording");
 
     // Start lock timer for push-to-talk mode
@@ -223,16 +225,27 @@ export async function stopRecording(): Promise<void> {
     // Notify renderer immediately that recording has stopped and processing started
     sendToRenderer("recording:processing");
 
+    // Pipelined: the backend returns as soon as capture stops (202) and
+    // transcribes in the background, so the hotkey works again immediately.
+    // Results are pasted in order and arrive as "transcription" WebSocket events.
     const response = await fetch("http://127.0.0.1:8765/api/transcribe/stop", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ auto_paste: true }),
+      body: JSON.stringify({ auto_paste: true, pipeline: true }),
     });
 
+    // With endpointing the backend stops (and transcribes) by itself once
+    // speech ends, so the recording may already be finished (and queued):
+    // settle the indicator, which was just switched to processing
+    if (response.status === 400) {
+      console.log("Recording already ended by endpointing");
+      sendToRenderer("recording:complete");
+      return;
+    }
     if (!response.ok) throw new Error(`Backend returned ${response.status}`);
 
     const result = await response.json();
-    console.log("Transcription result:", result.text?.substring(0, 50));
+    console.log("Utterance queued:", result.utterance_id, "pending:", result.pending);
     sendToRenderer("recording:complete", result);
   } catch (error) {
     console.error("Failed to stop recording:", error);
@@ -242,6 +255,43 @@ export async function stopRecording(): Promise<void> {
   }
 }
 
+// The backend ended a recording by itself (endpointing). Catch up with its
+// state instead of sending a stop, which could end a recording started since.
+export async function syncRecordingState(): Promise<void> {
+  if (!isRecordingActive || isProcessing) return;
+
+  const generation = recordingGeneration;
+  try {
+    const response = await fetch("http://127.0.0.1:8765/api/health");
+    if (!response.ok) throw new Error(`Backend returned ${response.status}`);
+    const health = await response.json();
+
+    if (
+      health.state === "recording" ||
+      !isRecordingActive ||
+      isProcessing ||
+      generation !== recordingGeneration
+    ) {
+      return;
+    }
+
+    if (lockTimer) {
+      clearTimeout(lockTimer);
+      lockTimer = null;
+    }
+    isLocked = false;
+    isRecordingActive = false;
+    console.log("Recording ended by endpointing");
+
+    setTrayRecording(false);
+    // Like a pipelined stop, the utterance is already queued and its text
+    // arrives as a "transcription" event, so the recording is complete
+    sendToRenderer("recording:complete");
+  } catch (error) {
+    console.error("Failed to sync recording state:", error);
+  }
+}
+
 export async function cancelRecording(): Promise<void> {
   if (!isRecordingActive || isProcessing) return;
 
@@ -7,7 +7,7 @@
 import { ipcMain, dialog, app } from 'electron'
 import { showMainWindow, hideMainWindow, showRecordingIndicator, hideRecordingIndicator, resizeRecordingIndicator, getRecordingIndicator } from './windows'
 import { isBackendRunning, getBackendPort } from './backend'
-import { registerGlobalHotkey, unregisterGlobalHotkey, getCurrentHotkey, getHotkeyMode, cancelRecording, isRecording, startRecording, stopRecording } from './hotkey'
+import { registerGlobalHotkey, unregisterGlobalHotkey, getCurrentHotkey, getHotkeyMode, cancelRecording, isRecording, startRecording, stopRecording, syncRecordingState } from './hotkey'
 
 /**
  * Setup all IPC handlers
@@ -35,6 +35,10 @@ export function setupIpcHandlers(): void {
     await cancelRecording()
   })
 
+  ipcMain.handle('recording:sync', async () => {
+    await syncRecordingState()
+  })
+
   ipcMain.handle('recording:status', () => {
     return isRecording()
   })
@@ -21,6 +21,7 @@ const api = {
   startRecording: () => ipcRenderer.invoke('recording:start'),
   stopRecording: () => ipcRenderer.invoke('recording:stop'),
   cancelRecording: () => ipcRenderer.invoke('recording:cancel'),
+  syncRecording: () => ipcRenderer.invoke('recording:sync'),
   
   // Backend
   getBackendStatus: () => ipcRenderer.invoke('backend:status'),
@@ -193,6 +193,7 @@ declare global {
       startRecording: () => Promise<void>
       stopRecording: () => Promise<void>
       cancelRecording: () => Promise<void>
+      syncRecording: () => Promise<void>
       getRecordingStatus: () => Promise<boolean>
       getBackendStatus: () => Promise<{ running: boolean; port: number }>
       getBackendPort: () => Promise<number>
@@ -428,6 +428,18 @@ class ApiClient {
     })
   }
 
+  async pauseBatchJob(jobId: string): Promise<{ status: string }> {
+    return this.request<{ status: string }>(`/api/transcribe/batch/${jobId}/pause`, {
+      method: 'POST'
+    })
+  }
+
+  async resumeBatchJob(jobId: string): Promise<{ status: string }> {
+    return this.request<{ status: string }>(`/api/transcribe/batch/${jobId}/resume`, {
+      method: 'POST'
+    })
+  }
+
   async retryBatchJob(
     jobId: string,
     fileIds?: string[]
@@ -23,6 +23,15 @@ export interface TranscribeStartResponse {
 export interface TranscribeStopRequest {
   auto_paste?: boolean
   language?: string | null
+  pipeline?: boolean
+}
+
+export interface TranscribeQueuedResponse {
+  status: 'queued'
+  utterance_id: number
+  pending: number
+  duration_ms: number
+  session_id: string
 }
 
 export interface TranscribeStopResponse {
@@ -169,6 +178,7 @@ export type WebSocketEventType =
   | 'transcription'
   | 'download_progress'
   | 'batch_progress'
+  | 'endpoint'
   | 'error'
 
 export interface WebSocketEvent {
@@ -187,6 +197,19 @@ export interface TranscriptionEvent extends WebSocketEvent {
   id: string
   text: string
   duration_ms: number
+  utterance_id?: number
+}
+
+export interface EndpointEvent extends WebSocketEvent {
+  type: 'endpoint'
+  speech_start_s: number
+  speech_end_s: number
+  detected_at_s: number
+  detection_ms: number
+  finalize_ms: number | null
+  session_id: string
+  utterance_id: number
+  duration_ms: number
 }
 
 export interface ErrorEvent extends WebSocketEvent {
@@ -271,7 +294,7 @@ export interface ImportResponse {
 }
 
 // Batch Transcription Types
-export type BatchJobStatus = 'pending' | 'processing' | 'completed' | 'cancelled' | 'failed'
+export type BatchJobStatus = 'pending' | 'processing' | 'paused' | 'completed' | 'cancelled' | 'failed'
 export type BatchFileStatus = 'pending' | 'processing' | 'completed' | 'failed' | 'skipped'
 
 export interface BatchFile {
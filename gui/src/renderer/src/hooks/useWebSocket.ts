@@ -64,6 +64,13 @@ export function useWebSocket(options: UseWebSocketOptions = {}): {
         break
       }
       
+      case 'endpoint':
+        // The backend ended the recording after trailing silence and queued it
+        // for transcription: let the main process (which owns the hotkey state)
+        // catch up without stopping a recording the user may have started since
+        window.api?.syncRecording?.()
+        break
+        
       case 'error': {
         const errorEvent = event as ErrorEvent
         setError(errorEvent.message)